@@ -212,8 +212,95 @@ def by_signature(lib):
     print("Done with  src/awkward/_kernel_signatures.py...")
 
 
+def kernel_definitions_py(specification):
+    print("Generating src/awkward/_kernel_definitions.py...")
+
+    with open(
+        os.path.join(CURRENT_DIR, "..", "src", "awkward", "_kernel_definitions.py"),
+        "w",
+    ) as file:
+        file.write(
+            """# AUTO GENERATED ON {0}
+# DO NOT EDIT BY HAND!
+#
+# To regenerate file, run
+#
+#     python dev/generate-kernel-signatures.py
+#
+# (It is usually run as part of pip install . or localbuild.py.)
+
+# fmt: off
+
+from numpy import (
+    bool_,
+    int8,
+    uint8,
+    int16,
+    uint16,
+    int32,
+    uint32,
+    int64,
+    uint64,
+    float32,
+    float64,
+)
+
+kMaxInt64 = 9223372036854775806
+kSliceNone = kMaxInt64 + 1
+
+""".format(
+                reproducible_datetime()
+            )
+        )
+
+        signatures = []
+        for spec in specification["kernels"]:
+            # only the definitions that dev/generate-tests.py checks against
+            # the compiled kernels are trusted to give the same results
+            if "def " not in spec["definition"] or not spec["automatic-tests"]:
+                continue
+            file.write("\n" + spec["definition"] + "\n")
+
+            for childfunc in spec["specializations"]:
+                special = [repr(spec["name"])]
+                dtypelist = []
+                pointerlist = []
+                for x in childfunc["args"]:
+                    pytype = type_to_pytype(x["type"], special)
+                    typename = pytype.replace("POINTER(", "").rstrip(")")[2:]
+                    dtypelist.append(type_to_dtype[typename])
+                    pointerlist.append(repr(pytype.startswith("POINTER(")))
+                dirlist = [repr(x["dir"]) for x in childfunc["args"]]
+                signatures.append(
+                    "    out[{}] = ({}, [{}], [{}], [{}])\n".format(
+                        ", ".join(special),
+                        spec["name"],
+                        ", ".join(dirlist),
+                        ", ".join(dtypelist),
+                        ", ".join(pointerlist),
+                    )
+                )
+
+        file.write(
+            """
+
+def by_signature():
+    out = {}
+"""
+        )
+        for signature in signatures:
+            file.write(signature)
+        file.write(
+            """    return out
+"""
+        )
+
+    print("Done with  src/awkward/_kernel_definitions.py...")
+
+
 if __name__ == "__main__":
     with open(os.path.join(CURRENT_DIR, "..", "kernel-specification.yml")) as specfile:
         specification = yaml.safe_load(specfile)
         include_kernels_h(specification)
         kernel_signatures_py(specification)
+        kernel_definitions_py(specification)
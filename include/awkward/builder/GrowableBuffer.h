@@ -8,26 +8,28 @@
 #include "awkward/kernel-dispatch.h"
 
 #include <memory>
+#include <vector>
 
 namespace awkward {
   /// @class GrowableBuffer
   ///
-  /// @brief Contiguous, one-dimensional array that can grow indefinitely
-  /// by calling #append.
+  /// @brief One-dimensional array that can grow indefinitely by calling
+  /// #append.
   ///
   /// Configured by ArrayBuilderOptions, the buffer starts by reserving
   /// {@link ArrayBuilderOptions#initial ArrayBuilderOptions::initial} slots.
   /// When the number of slots used reaches the number reserved, a new
-  /// buffer is allocated that is
+  /// panel is allocated so that the total reservation is
   /// {@link ArrayBuilderOptions#resize ArrayBuilderOptions::resize} times
-  /// larger. Thus, a logarithmic number of reallocations are needed as
-  /// data grow.
+  /// larger. Thus, a logarithmic number of panels are needed as data grow.
   ///
-  /// When {@link ArrayBuilder#snapshot ArrayBuilder::snapshot} is called,
-  /// these buffers are copied to the new Content array.
-  ///
-  /// If a GrowableBuffer resizes itself by allocating a new array, it
-  /// copies the buffer it owns.
+  /// Growing never moves data that have already been appended: the full
+  /// panels are kept in a list and only the last one is written to. The
+  /// panels are concatenated into a single contiguous buffer (once) when
+  /// #ptr is requested, which happens when
+  /// {@link ArrayBuilder#snapshot ArrayBuilder::snapshot} or
+  /// {@link ArrayBuilder#to_buffers ArrayBuilder::to_buffers} copies these
+  /// buffers to the new Content array.
   template <typename T>
   class LIBAWKWARD_EXPORT_SYMBOL GrowableBuffer {
     using UniquePtrDeleter = decltype(kernel::array_deleter<T>());
@@ -93,6 +95,9 @@ namespace awkward {
     GrowableBuffer(const ArrayBuilderOptions& options);
 
     /// @brief Reference to a unique pointer to the array buffer.
+    ///
+    /// If the data are split among several panels, they are first
+    /// concatenated into one contiguous buffer.
     const GrowableBuffer::UniquePtr&
       ptr() const;
 
@@ -110,7 +115,8 @@ namespace awkward {
 
     /// @brief Changes the #length in-place and possibly reallocate.
     ///
-    /// If the `newlength` is larger than #reserved, #ptr is reallocated.
+    /// The panels are concatenated first; if the `newlength` is larger than
+    /// #reserved, #ptr is reallocated.
     void
       set_length(size_t newlength);
 
@@ -126,7 +132,8 @@ namespace awkward {
     /// The parameter only guarantees that at least `minreserved` is reserved;
     /// if an amount less than #reserved is requested, nothing changes.
     ///
-    /// If #reserved actually changes, #ptr is reallocated.
+    /// If #reserved actually changes, the panels are concatenated into a
+    /// reallocated #ptr.
     void
       set_reserved(size_t minreserved);
 
@@ -140,7 +147,7 @@ namespace awkward {
     /// reallocation.
     ///
     /// This increases the #length by 1; if the new #length is larger than
-    /// #reserved, a new #ptr will be allocated.
+    /// #reserved, a new panel will be allocated (without copying the others).
     void
       append(T datum);
 
@@ -150,9 +157,25 @@ namespace awkward {
       getitem_at_nowrap(int64_t at) const;
 
   private:
+    /// @brief Moves the (full) last panel to #panels_ and allocates a new
+    /// one with `reserve` slots.
+    void
+      add_panel(size_t reserve);
+
+    /// @brief Concatenates all panels into one contiguous #ptr_, keeping
+    /// #reserved unchanged.
+    void
+      concatenate() const;
+
     const ArrayBuilderOptions options_;
-    // @brief See #ptr.
-    UniquePtr ptr_;
+    // @brief Full panels that precede #ptr_.
+    mutable std::vector<UniquePtr> panels_;
+    // @brief Number of elements in each of the #panels_.
+    mutable std::vector<size_t> panel_lengths_;
+    // @brief The last panel, which #append writes to. See #ptr.
+    mutable UniquePtr ptr_;
+    // @brief Number of elements in all #panels_ (index of #ptr_[0]).
+    mutable size_t ptr_start_;
     // @brief See #length.
     size_t length_;
     // @brief See #reserved.
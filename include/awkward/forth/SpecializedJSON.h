@@ -6,6 +6,7 @@
 #include "awkward/common.h"
 #include "awkward/util.h"
 #include "awkward/forth/ForthOutputBuffer.h"
+#include "awkward/io/json.h"
 
 namespace awkward {
   /// @class SpecializedJSON
@@ -35,8 +36,21 @@ namespace awkward {
     int64_t
       json_position() const noexcept;
 
-    /// @brief HERE
-    bool parse_string(const char* source) noexcept;
+    /// @brief Parses a null-terminated string, returning false if it is
+    /// invalid JSON or does not fit the instructions.
+    ///
+    /// @param one_per_line If true, the string may have several JSON values,
+    /// separated by newlines (one value may span several lines), and
+    /// #length is their number; otherwise, it must have exactly one.
+    bool parse_string(const char* source, bool one_per_line = false) noexcept;
+
+    /// @brief Parses a stream that is read through `read` (see ReadFunction)
+    /// in chunks of `buffersize` bytes, like #parse_string.
+    ///
+    /// Unlike #parse_string, this may throw an exception raised by `read`.
+    bool parse_stream(const ReadFunction& read,
+                      int64_t buffersize,
+                      bool one_per_line = false);
 
     /// @brief HERE
     void reset() noexcept;
@@ -5,6 +5,7 @@
 
 #include <complex>
 #include <cstdio>
+#include <functional>
 #include <string>
 
 #include "awkward/common.h"
@@ -337,12 +338,15 @@ namespace awkward {
   /// representation in JSON format
   /// @param minus_infinity_string user-defined string for a negative
   /// infinity representation in JSON format
+  /// @param one_per_line If true, raise an error if a JSON value is followed
+  /// by another on the same line (one value may span several lines).
   LIBAWKWARD_EXPORT_SYMBOL int64_t
     FromJsonString(const char* source,
                    ArrayBuilder& builder,
                    const char* nan_string = nullptr,
                    const char* infinity_string = nullptr,
-                   const char* minus_infinity_string = nullptr);
+                   const char* minus_infinity_string = nullptr,
+                   bool one_per_line = false);
 
   /// @brief Parses a JSON-encoded file using an
   /// ArrayBuilder.
@@ -357,13 +361,91 @@ namespace awkward {
   /// representation in JSON format
   /// @param minus_infinity_string user-defined string for a negative
   /// infinity representation in JSON format
+  /// @param one_per_line If true, raise an error if a JSON value is followed
+  /// by another on the same line (one value may span several lines).
   LIBAWKWARD_EXPORT_SYMBOL int64_t
     FromJsonFile(FILE* source,
                  ArrayBuilder& builder,
                  int64_t buffersize,
                  const char* nan_string = nullptr,
                  const char* infinity_string = nullptr,
-                 const char* minus_infinity_string = nullptr);
+                 const char* minus_infinity_string = nullptr,
+                 bool one_per_line = false);
+
+  /// @brief Function that fills a buffer with the next bytes of a stream.
+  ///
+  /// It is called with the buffer and its size, and returns the number of
+  /// bytes it put in the buffer: 0 only at the end of the stream.
+  typedef std::function<int64_t(char* buffer, int64_t size)> ReadFunction;
+
+  /// @class ReadFunctionStream
+  ///
+  /// @brief rapidjson input stream (like rapidjson::FileReadStream) that
+  /// fills its buffer by calling a ReadFunction.
+  class LIBAWKWARD_EXPORT_SYMBOL ReadFunctionStream {
+  public:
+    typedef char Ch;
+
+    /// @brief Creates a ReadFunctionStream and fills its buffer.
+    ///
+    /// @param read Function that fills the buffer; it must outlive the
+    /// stream.
+    /// @param buffer Intermediate buffer of (at least) `buffersize` bytes.
+    /// @param buffersize Number of bytes to ask `read` for at a time.
+    ReadFunctionStream(const ReadFunction& read,
+                       char* buffer,
+                       size_t buffersize);
+
+    Ch Peek() const { return *current_; }
+    Ch Take();
+    size_t Tell() const {
+      return count_ + static_cast<size_t>(current_ - buffer_);
+    }
+
+    // not implemented
+    void Put(Ch);
+    void Flush();
+    Ch* PutBegin();
+    size_t PutEnd(Ch*);
+
+    const Ch* Peek4() const;
+
+  private:
+    void Read();
+
+    const ReadFunction& read_;
+    char* buffer_;
+    size_t buffersize_;
+    char* current_;
+    char* last_;
+    size_t count_;
+    bool eof_;
+  };
+
+  /// @brief Parses a JSON-encoded stream using an
+  /// ArrayBuilder.
+  ///
+  /// @param read Function that fills a buffer with the next bytes of a
+  /// stream containing any valid JSON data (see ReadFunction).
+  /// @param options Configuration options for building an array with an
+  /// ArrayBuilder.
+  /// @param buffersize Number of bytes for an intermediate buffer.
+  /// @param nan_string user-defined string for a not-a-number (NaN) value
+  /// representation in JSON format
+  /// @param infinity_string user-defined string for a positive infinity
+  /// representation in JSON format
+  /// @param minus_infinity_string user-defined string for a negative
+  /// infinity representation in JSON format
+  /// @param one_per_line If true, raise an error if a JSON value is followed
+  /// by another on the same line (one value may span several lines).
+  LIBAWKWARD_EXPORT_SYMBOL int64_t
+    FromJsonStream(const ReadFunction& read,
+                   ArrayBuilder& builder,
+                   int64_t buffersize,
+                   const char* nan_string = nullptr,
+                   const char* infinity_string = nullptr,
+                   const char* minus_infinity_string = nullptr,
+                   bool one_per_line = false);
 
 }
 
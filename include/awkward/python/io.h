@@ -5,7 +5,33 @@
 
 #include <pybind11/pybind11.h>
 
+#include "awkward/io/json.h"
+
 namespace py = pybind11;
+namespace ak = awkward;
+
+/// @class PyReadFunction
+///
+/// @brief ak::ReadFunction that reads from a Python file-like object.
+///
+/// The object's `read(size)` may return str or bytes; a text file returns
+/// `size` characters, which can be more than `size` bytes, so what doesn't
+/// fit in the buffer is kept for the next call.
+class PyReadFunction {
+public:
+  /// @brief Creates a PyReadFunction from an object with a `read` method.
+  PyReadFunction(const py::object& source);
+
+  /// @brief Fills `buffer` with up to `size` bytes, returning their number
+  /// (0 only at the end of the stream).
+  int64_t
+    operator()(char* buffer, int64_t size);
+
+private:
+  py::object read_;
+  std::string pending_;
+  size_t start_;
+};
 
 void
 make_fromjson(py::module& m, const std::string& name);
@@ -13,6 +39,9 @@ make_fromjson(py::module& m, const std::string& name);
 void
 make_fromjsonfile(py::module& m, const std::string& name);
 
+void
+make_fromjsonobj(py::module& m, const std::string& name);
+
 void
 make_uproot_issue_90(py::module& m);
 
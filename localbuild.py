@@ -72,6 +72,7 @@ if (
     or os.stat(generate_kernel_signatures).st_mtime >= localbuild_time
     or not os.path.exists(os.path.join("include", "awkward", "kernels.h"))
     or not os.path.exists(os.path.join("src", "awkward", "_kernel_signatures.py"))
+    or not os.path.exists(os.path.join("src", "awkward", "_kernel_definitions.py"))
     or os.stat("setup.py").st_mtime >= localbuild_time
     or thisstate != laststate
 ):
@@ -164,7 +164,8 @@ def tree(x):
 
 class BuildPy(setuptools.command.build_py.build_py):
     def run(self):
-        # generate include/awkward/kernels.h and src/awkward/_kernel_signatures.py
+        # generate include/awkward/kernels.h, src/awkward/_kernel_signatures.py,
+        # and src/awkward/_kernel_definitions.py
         subprocess.check_call(
             [PYTHON, os.path.join("dev", "generate-kernel-signatures.py")]
         )
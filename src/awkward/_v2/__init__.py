@@ -10,6 +10,8 @@ import awkward._v2.forms  # noqa: F401
 import awkward._v2._slicing  # noqa: F401
 import awkward._v2._broadcasting  # noqa: F401
 import awkward._v2._typetracer  # noqa: F401
+import awkward._v2._lazy  # noqa: F401
+import awkward._v2._profiling  # noqa: F401
 
 # internal
 import awkward._v2._util  # noqa: F401
@@ -19,6 +21,9 @@ import awkward._v2._connect.numpy
 import awkward._v2._connect.numexpr  # noqa: F401
 import awkward._v2.numba  # noqa: F401
 
+# partitioned arrays
+import awkward._v2.partition  # noqa: F401
+
 # high-level interface
 from awkward._v2.highlevel import Array  # noqa: F401
 from awkward._v2.highlevel import Record  # noqa: F401
@@ -38,4 +43,5 @@ from awkward._v2.operations.reducers import *  # noqa: F401, F403
 
 
 behavior = {}
+behaviors.categorical.register(behavior)  # noqa: F405 pylint: disable=E0602
 behaviors.string.register(behavior)  # noqa: F405 pylint: disable=E0602
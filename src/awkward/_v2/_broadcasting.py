@@ -98,13 +98,42 @@ def checklength(inputs, options):
             )
 
 
-def all_same_offsets(nplike, inputs):
+def _buffer_key(array):
+    return (array.ctypes.data, array.shape, array.strides, array.dtype.str)
+
+
+def same_offsets(nplike, left, right, cache=None):
+    """
+    Compares two offsets arrays, short-circuiting if they are views of the
+    same memory. If `cache` is a dict, the results of full comparisons are
+    kept in it, keyed by memory location; the dict also keeps the compared
+    arrays alive, so that their memory can't be reused for other arrays while
+    the `cache` exists (one call of #broadcast_and_apply).
+    """
+    if left is right:
+        return True
+    if not isinstance(nplike, ak.nplike.Numpy):
+        return nplike.array_equal(left, right)
+
+    left_key, right_key = _buffer_key(left), _buffer_key(right)
+    if left_key == right_key:
+        return True
+    elif cache is None:
+        return nplike.array_equal(left, right)
+
+    key = (left_key, right_key) if left_key < right_key else (right_key, left_key)
+    if key not in cache:
+        cache[key] = (nplike.array_equal(left, right), left, right)
+    return cache[key][0]
+
+
+def all_same_offsets(nplike, inputs, cache=None):
     offsets = None
     for x in inputs:
         if isinstance(x, ListOffsetArray):
             if offsets is None:
                 offsets = x.offsets.to(nplike)
-            elif not nplike.array_equal(offsets, x.offsets.to(nplike)):
+            elif not same_offsets(nplike, offsets, x.offsets.to(nplike), cache):
                 return False
 
         elif isinstance(x, ListArray):
@@ -429,12 +458,18 @@ def apply_step(
                 isinstance(x, RegularArray) or not isinstance(x, listtypes)
                 for x in inputs
             ):
-                maxsize = max(x.size for x in inputs if isinstance(x, RegularArray))
+                # as in NumPy, size 1 broadcasts to any other size (even 0)
+                sizes = [
+                    x.size
+                    for x in inputs
+                    if isinstance(x, RegularArray) and x.size != 1
+                ]
+                maxsize = max(sizes) if len(sizes) > 0 else 1
 
                 if nplike.known_data:
                     for x in inputs:
                         if isinstance(x, RegularArray):
-                            if maxsize > 1 and x.size == 1:
+                            if maxsize != 1 and x.size == 1:
                                 tmpindex = Index64(
                                     nplike.repeat(
                                         nplike.arange(x.length, dtype=np.int64), maxsize
@@ -444,7 +479,7 @@ def apply_step(
                     nextinputs = []
                     for x in inputs:
                         if isinstance(x, RegularArray):
-                            if maxsize > 1 and x.size == 1:
+                            if maxsize != 1 and x.size == 1:
                                 nextinputs.append(
                                     IndexedArray(
                                         tmpindex, x.content[: x.length * x.size]
@@ -493,15 +528,35 @@ def apply_step(
                 return tuple(RegularArray(x, maxsize, length) for x in outcontent)
 
             elif not nplike.known_data or not nplike.known_shape:
+                fcns = [
+                    ak._v2._util.custom_broadcast(x, behavior)
+                    if isinstance(x, Content)
+                    else None
+                    for x in inputs
+                ]
+                # as in the general case below, inputs with a custom broadcast
+                # (like strings) are not descended into, unless all lists are
+                secondround = not any(
+                    isinstance(x, listtypes)
+                    and not isinstance(x, RegularArray)
+                    and fcn is None
+                    for x, fcn in zip(inputs, fcns)
+                )
+
                 offsets = None
                 nextinputs = []
-                for x in inputs:
-                    if isinstance(x, ListOffsetArray):
+                for x, fcn in zip(inputs, fcns):
+                    if callable(fcn) and not secondround:
+                        nextinputs.append(None)
+                    # with data, the offsets/starts/stops would be read here
+                    elif isinstance(x, ListOffsetArray):
+                        ak._v2._typetracer.touch_data(x.offsets.data)
                         offsets = Index64(
                             nplike.empty((x.offsets.data.shape[0],), np.int64)
                         )
                         nextinputs.append(x.content)
                     elif isinstance(x, ListArray):
+                        ak._v2._typetracer.touch_data((x.starts.data, x.stops.data))
                         offsets = Index64(
                             nplike.empty((x.starts.data.shape[0] + 1,), np.int64)
                         )
@@ -512,6 +567,10 @@ def apply_step(
                         nextinputs.append(x)
                 assert offsets is not None
 
+                for i, (x, fcn) in enumerate(zip(inputs, fcns)):
+                    if callable(fcn) and not secondround:
+                        nextinputs[i] = fcn(x.typetracer, offsets)
+
                 outcontent = apply_step(
                     nplike,
                     nextinputs,
@@ -526,9 +585,14 @@ def apply_step(
 
                 return tuple(ListOffsetArray(offsets, x) for x in outcontent)
 
-            # Not all regular, but all same offsets?
+            # Not all regular, but all same offsets? (Unless some have a custom
+            # broadcast, like strings, which are not lists to broadcast into.)
             # Optimization: https://github.com/scikit-hep/awkward-1.0/issues/442
-            elif all_same_offsets(nplike, inputs):
+            elif not any(
+                isinstance(x, Content)
+                and ak._v2._util.custom_broadcast(x, behavior) is not None
+                for x in inputs
+            ) and all_same_offsets(nplike, inputs, options["offsets_cache"]):
                 lencontent, offsets, starts, stops = None, None, None, None
                 nextinputs = []
 
@@ -732,6 +796,21 @@ def broadcast_and_apply(
     regular_to_jagged=False,
     function_name=None,
 ):
+    if any(isinstance(x, ak._v2.partition.PartitionedArray) for x in inputs):
+        return ak._v2.partition.broadcast_and_apply(
+            inputs,
+            action,
+            behavior,
+            depth_context=depth_context,
+            lateral_context=lateral_context,
+            allow_records=allow_records,
+            left_broadcast=left_broadcast,
+            right_broadcast=right_broadcast,
+            numpy_to_regular=numpy_to_regular,
+            regular_to_jagged=regular_to_jagged,
+            function_name=function_name,
+        )
+
     nplike = ak.nplike.of(*inputs)
     isscalar = []
     out = apply_step(
@@ -749,6 +828,7 @@ def broadcast_and_apply(
             "numpy_to_regular": numpy_to_regular,
             "regular_to_jagged": regular_to_jagged,
             "function_name": function_name,
+            "offsets_cache": {},
         },
     )
     assert isinstance(out, tuple)
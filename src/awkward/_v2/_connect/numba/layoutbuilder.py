@@ -0,0 +1,741 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import numba
+import numba.core.typing.templates
+import numba.experimental.structref
+
+import awkward as ak
+
+numpy = ak.nplike.Numpy.instance()
+
+structref = numba.experimental.structref
+
+
+########## node types
+
+
+class BuilderType(numba.types.StructRef):
+    def preprocess_fields(self, fields):
+        return tuple((name, numba.types.unliteral(x)) for name, x in fields)
+
+
+@structref.register
+class NumpyBuilderType(BuilderType):
+    @property
+    def arraytype(self):
+        return self.field_dict["data"]
+
+
+@structref.register
+class ListOffsetBuilderType(BuilderType):
+    @property
+    def contenttype(self):
+        return self.field_dict["content"]
+
+
+@structref.register
+class RegularBuilderType(BuilderType):
+    @property
+    def contenttype(self):
+        return self.field_dict["content"]
+
+
+@structref.register
+class IndexedOptionBuilderType(BuilderType):
+    @property
+    def contenttype(self):
+        return self.field_dict["content"]
+
+
+@structref.register
+class RecordBuilderType(BuilderType):
+    def __init__(self, fields, field_names=None):
+        super().__init__(fields)
+        # the field names are only known to the type, so they're part of its name
+        self.field_names = None if field_names is None else tuple(field_names)
+        self.name = f"{self.name}[{self.field_names!r}]"
+
+    @property
+    def contenttypes(self):
+        return self.field_dict["contents"].types
+
+    def field_index(self, key):
+        if isinstance(key, numba.types.StringLiteral):
+            if self.field_names is not None and key.literal_value in self.field_names:
+                return self.field_names.index(key.literal_value)
+        elif isinstance(key, numba.types.IntegerLiteral):
+            if 0 <= key.literal_value < len(self.contenttypes):
+                return key.literal_value
+        return None
+
+
+class LayoutBuilderType(numba.types.Type):
+    """
+    A builder node as it is seen in Numba-compiled functions: only a borrowed
+    pointer to the node's storage (a BuilderType StructRef), like
+    #ak._v2.numba.ArrayBuilderType. The Python object keeps the storage alive,
+    so passing a builder around does not touch its reference count.
+    """
+
+    def __init__(self, structtype):
+        super().__init__(name=f"ak2.LayoutBuilderType({structtype.name})")
+        self.structtype = structtype
+
+    def field_type(self, attr):
+        fieldtype = self.structtype.field_dict[attr]
+        if isinstance(fieldtype, BuilderType):
+            return LayoutBuilderType(fieldtype)
+        else:
+            return fieldtype
+
+
+@numba.extending.register_model(LayoutBuilderType)
+class LayoutBuilderModel(numba.core.datamodel.models.StructModel):
+    def __init__(self, dmm, fe_type):
+        members = [("meminfo", numba.types.voidptr)]
+        super().__init__(dmm, fe_type, members)
+
+
+@numba.extending.unbox(LayoutBuilderType)
+def unbox_LayoutBuilder(buildertype, builderobj, c):
+    meminfotype = numba.types.MemInfoPointer(numba.types.voidptr)
+    meminfo_obj = c.pyapi.object_getattr_string(builderobj, "_meminfo")
+    meminfo = c.unbox(meminfotype, meminfo_obj).value
+    c.pyapi.decref(meminfo_obj)
+
+    proxyout = c.context.make_helper(c.builder, buildertype)
+    proxyout.meminfo = meminfo
+    # the reference belongs to the Python object, which outlives this call
+    c.context.nrt.decref(c.builder, meminfotype, meminfo)
+
+    is_error = numba.core.cgutils.is_not_null(c.builder, c.pyapi.err_occurred())
+    return numba.extending.NativeValue(proxyout._getvalue(), is_error)
+
+
+@numba.extending.intrinsic
+def _owned(typingctx, buildertype):
+    # a new reference to the storage, to put it in a parent node
+    if isinstance(buildertype, LayoutBuilderType):
+
+        def codegen(context, builder, sig, args):
+            return _owned_value(context, builder, sig.args[0], args[0])
+
+        return buildertype.structtype(buildertype), codegen
+
+    elif isinstance(buildertype, numba.types.BaseTuple) and all(
+        isinstance(x, LayoutBuilderType) for x in buildertype.types
+    ):
+
+        def codegen(context, builder, sig, args):
+            (tupletype,) = sig.args
+            (tupleval,) = args
+            return context.make_tuple(
+                builder,
+                sig.return_type,
+                [
+                    _owned_value(
+                        context, builder, x, builder.extract_value(tupleval, i)
+                    )
+                    for i, x in enumerate(tupletype.types)
+                ],
+            )
+
+        return (
+            numba.types.Tuple([x.structtype for x in buildertype.types])(buildertype),
+            codegen,
+        )
+
+
+def _owned_value(context, builder, buildertype, builderval):
+    proxyin = context.make_helper(builder, buildertype, builderval)
+    proxyout = context.make_helper(builder, buildertype.structtype)
+    proxyout.meminfo = proxyin.meminfo
+    out = proxyout._getvalue()
+    context.nrt.incref(builder, buildertype.structtype, out)
+    return out
+
+
+########## Python proxies
+
+
+class LayoutBuilder(structref.StructRefProxy):
+    """
+    Base class of the nodes of a builder made by #ak._v2.numba.layout_builder.
+
+    Each node owns the NumPy buffers of one node of the Form, which are
+    filled in Numba-compiled functions and handed to #ak.from_buffers
+    (without copying) by #snapshot.
+    """
+
+    def __new__(cls, form, initial=1024):
+        if ak._v2._util.isstr(form):
+            if ak._v2.types.numpytype.is_primitive(form):
+                form = ak._v2.forms.NumpyForm(form)
+            else:
+                form = ak._v2.forms.from_json(form)
+        elif isinstance(form, dict):
+            form = ak._v2.forms.from_iter(form)
+        if not isinstance(form, ak._v2.forms.Form):
+            raise TypeError(
+                "'form' argument must be a Form or its Python dict/JSON string representation"
+            )
+        if not (ak._v2._util.isint(initial) and initial > 0):
+            raise TypeError("'initial' argument must be a positive integer")
+        return from_form(form, initial)
+
+    @property
+    def form(self):
+        return self._form
+
+    @property
+    def length(self):
+        return _length(self)
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return "<{} length={} form={}>".format(
+            type(self).__name__, self.length, repr(str(self._form.type))
+        )
+
+    def snapshot(self, highlevel=True, behavior=None):
+        """
+        Args:
+            highlevel (bool): If True, return an #ak.Array; otherwise, return
+                a low-level #ak.layout.Content subclass.
+            behavior (None or dict): Custom #ak.behavior for the output array,
+                if high-level.
+
+        Returns the array that has been built so far. The array is a view of
+        the builder's buffers, so it is not copied, and since the builder only
+        writes past the end of what has been built (or into new buffers when
+        it grows), later appends do not change it.
+        """
+        container = {}
+        self._fill(container)
+        out = ak._v2.operations.convert.ak_from_buffers.reconstitute(
+            self._form, self.length, container, _getkey, numpy
+        )
+        return ak._v2._util.wrap(out, behavior, highlevel)
+
+    def _fill(self, container):
+        raise AssertionError("LayoutBuilder is an abstract class")
+
+
+def _getkey(form, attribute):
+    return (id(form), attribute)
+
+
+class NumpyBuilder(LayoutBuilder):
+    def _fill(self, container):
+        container[_getkey(self._form, "data")] = _data(self)[: self.length]
+
+
+class ListOffsetBuilder(LayoutBuilder):
+    @property
+    def content(self):
+        return self._contents[0]
+
+    def _fill(self, container):
+        length = self.length
+        offsets = _offsets(self)[: length + 1]
+        container[_getkey(self._form, "offsets")] = offsets
+        self.content._fill(container)
+
+
+class RegularBuilder(LayoutBuilder):
+    @property
+    def content(self):
+        return self._contents[0]
+
+    def _fill(self, container):
+        self.content._fill(container)
+
+
+class IndexedOptionBuilder(LayoutBuilder):
+    @property
+    def content(self):
+        return self._contents[0]
+
+    def _fill(self, container):
+        container[_getkey(self._form, "index")] = _index(self)[: self.length]
+        self.content._fill(container)
+
+
+class RecordBuilder(LayoutBuilder):
+    @property
+    def contents(self):
+        return self._contents
+
+    def content(self, index_or_field):
+        if ak._v2._util.isint(index_or_field):
+            return self._contents[index_or_field]
+        else:
+            return self._contents[self._form.field_to_index(index_or_field)]
+
+    def _fill(self, container):
+        for content in self._contents:
+            content._fill(container)
+
+
+for _typeclass, _proxyclass in [
+    (NumpyBuilderType, NumpyBuilder),
+    (ListOffsetBuilderType, ListOffsetBuilder),
+    (RegularBuilderType, RegularBuilder),
+    (IndexedOptionBuilderType, IndexedOptionBuilder),
+    (RecordBuilderType, RecordBuilder),
+]:
+    structref.define_boxing(_typeclass, _proxyclass)
+
+
+@numba.extending.typeof_impl.register(LayoutBuilder)
+def typeof_LayoutBuilder(obj, c):
+    return LayoutBuilderType(obj._type)
+
+
+@numba.njit
+def _length(builder):
+    return builder.length
+
+
+@numba.njit
+def _data(builder):
+    return builder.data
+
+
+@numba.njit
+def _offsets(builder):
+    return builder.offsets
+
+
+@numba.njit
+def _index(builder):
+    return builder.index
+
+
+########## construction
+
+
+@numba.njit
+def _new_numpy(buildertype, data):
+    out = structref.new(buildertype)
+    out.data = data
+    out.length = 0
+    return out
+
+
+@numba.njit
+def _new_listoffset(buildertype, offsets, content):
+    out = structref.new(buildertype)
+    out.offsets = offsets
+    out.length = 0
+    out.content = _owned(content)
+    return out
+
+
+@numba.njit
+def _new_regular(buildertype, size, content):
+    out = structref.new(buildertype)
+    out.size = size
+    out.length = 0
+    out.content = _owned(content)
+    return out
+
+
+@numba.njit
+def _new_indexedoption(buildertype, index, content):
+    out = structref.new(buildertype)
+    out.index = index
+    out.length = 0
+    out.content = _owned(content)
+    return out
+
+
+@numba.njit
+def _new_record(buildertype, contents):
+    out = structref.new(buildertype)
+    out.contents = _owned(contents)
+    out.length = 0
+    return out
+
+
+def _array(dtype, initial):
+    return numpy.empty(initial, dtype)
+
+
+def from_form(form, initial):
+    if isinstance(form, ak._v2.forms.NumpyForm) and form.inner_shape == ():
+        data = _array(
+            ak._v2.types.numpytype.primitive_to_dtype(form.primitive), initial
+        )
+        buildertype = NumpyBuilderType(
+            [("data", numba.typeof(data)), ("length", numba.int64)]
+        )
+        out = _new_numpy(buildertype, data)
+        contents = ()
+
+    elif isinstance(form, ak._v2.forms.ListOffsetForm):
+        content = from_form(form.content, initial)
+        offsets = _array(
+            ak._v2.operations.convert.ak_from_buffers._index_to_dtype[form.offsets],
+            initial + 1,
+        )
+        offsets[0] = 0
+        buildertype = ListOffsetBuilderType(
+            [
+                ("offsets", numba.typeof(offsets)),
+                ("length", numba.int64),
+                ("content", content._type),
+            ]
+        )
+        out = _new_listoffset(buildertype, offsets, content)
+        contents = (content,)
+
+    elif isinstance(form, ak._v2.forms.RegularForm):
+        content = from_form(form.content, initial)
+        buildertype = RegularBuilderType(
+            [
+                ("size", numba.int64),
+                ("length", numba.int64),
+                ("content", content._type),
+            ]
+        )
+        out = _new_regular(buildertype, form.size, content)
+        contents = (content,)
+
+    elif isinstance(form, ak._v2.forms.IndexedOptionForm) and form.index in (
+        "i32",
+        "i64",
+    ):
+        content = from_form(form.content, initial)
+        index = _array(
+            ak._v2.operations.convert.ak_from_buffers._index_to_dtype[form.index],
+            initial,
+        )
+        buildertype = IndexedOptionBuilderType(
+            [
+                ("index", numba.typeof(index)),
+                ("length", numba.int64),
+                ("content", content._type),
+            ]
+        )
+        out = _new_indexedoption(buildertype, index, content)
+        contents = (content,)
+
+    elif isinstance(form, ak._v2.forms.RecordForm):
+        contents = tuple(from_form(x, initial) for x in form.contents)
+        buildertype = RecordBuilderType(
+            [
+                ("contents", numba.types.Tuple([x._type for x in contents])),
+                ("length", numba.int64),
+            ],
+            None if form.is_tuple else form.fields,
+        )
+        out = _new_record(buildertype, contents)
+
+    else:
+        raise TypeError(
+            "LayoutBuilder can only be made from NumpyForm (without inner_shape), "
+            "ListOffsetForm, RegularForm, IndexedOptionForm (with a signed index), "
+            "and RecordForm nodes, not\n\n    {}".format(
+                repr(form).replace("\n", "\n    ")
+            )
+        )
+
+    out._form = form
+    out._contents = contents
+    return out
+
+
+########## typing
+
+
+def _check(name, buildertype, structtypes, args, kwargs, argtypes):
+    if not isinstance(buildertype.structtype, structtypes):
+        raise TypeError(f"{name} is not a method of {buildertype}")
+    if len(kwargs) != 0 or len(args) != len(argtypes):
+        raise TypeError(f"wrong number of arguments for {name}")
+    for arg, argtype in zip(args, argtypes):
+        if not isinstance(arg, argtype):
+            raise TypeError(f"wrong type of argument for {name}: {arg}")
+
+
+@numba.core.typing.templates.infer_getattr
+class type_methods(numba.core.typing.templates.AttributeTemplate):
+    key = LayoutBuilderType
+
+    def generic_resolve(self, buildertype, attr):
+        if attr in buildertype.structtype.field_dict and attr != "contents":
+            return buildertype.field_type(attr)
+
+    @numba.core.typing.templates.bound_function("append")
+    def resolve_append(self, buildertype, args, kwargs):
+        _check(
+            "append",
+            buildertype,
+            NumpyBuilderType,
+            args,
+            kwargs,
+            ((numba.types.Boolean, numba.types.Number),),
+        )
+        if not isinstance(
+            buildertype.structtype.arraytype.dtype,
+            (numba.types.Boolean, numba.types.Number),
+        ):
+            raise TypeError(
+                f"cannot append {args[0]} to {buildertype.structtype.arraytype}"
+            )
+        return numba.types.none(args[0])
+
+    @numba.core.typing.templates.bound_function("begin_list")
+    def resolve_begin_list(self, buildertype, args, kwargs):
+        _check(
+            "begin_list",
+            buildertype,
+            (ListOffsetBuilderType, RegularBuilderType),
+            args,
+            kwargs,
+            (),
+        )
+        return buildertype.field_type("content")()
+
+    @numba.core.typing.templates.bound_function("end_list")
+    def resolve_end_list(self, buildertype, args, kwargs):
+        _check(
+            "end_list",
+            buildertype,
+            (ListOffsetBuilderType, RegularBuilderType),
+            args,
+            kwargs,
+            (),
+        )
+        return numba.types.none()
+
+    @numba.core.typing.templates.bound_function("append_valid")
+    def resolve_append_valid(self, buildertype, args, kwargs):
+        _check("append_valid", buildertype, IndexedOptionBuilderType, args, kwargs, ())
+        return buildertype.field_type("content")()
+
+    @numba.core.typing.templates.bound_function("append_null")
+    def resolve_append_null(self, buildertype, args, kwargs):
+        _check("append_null", buildertype, IndexedOptionBuilderType, args, kwargs, ())
+        return numba.types.none()
+
+    def resolve_content(self, buildertype):
+        # records have a content(name_or_index) method, the others an attribute
+        if isinstance(buildertype.structtype, RecordBuilderType):
+            return self.resolve_record_content(buildertype)
+        else:
+            return buildertype.field_type("content")
+
+    @numba.core.typing.templates.bound_function("content")
+    def resolve_record_content(self, buildertype, args, kwargs):
+        _check(
+            "content",
+            buildertype,
+            RecordBuilderType,
+            args,
+            kwargs,
+            ((numba.types.StringLiteral, numba.types.IntegerLiteral),),
+        )
+        index = buildertype.structtype.field_index(args[0])
+        if index is None:
+            raise TypeError(f"no field {args[0].literal_value!r} in {buildertype}")
+        contenttype = buildertype.structtype.contenttypes[index]
+        return LayoutBuilderType(contenttype)(args[0])
+
+    @numba.core.typing.templates.bound_function("end_record")
+    def resolve_end_record(self, buildertype, args, kwargs):
+        _check("end_record", buildertype, RecordBuilderType, args, kwargs, ())
+        return numba.types.none()
+
+
+########## lowering
+
+# The builder and its methods are lowered directly, rather than with StructRef
+# attributes and @overload_method, so that an append is a few loads and a store
+# with no reference counting (which would be two atomic operations per call).
+
+
+def _payload(context, builder, buildertype, builderval):
+    proxyin = context.make_helper(builder, buildertype, builderval)
+    datatype = buildertype.structtype.get_data_type()
+    dataptr = builder.bitcast(
+        context.nrt.meminfo_data(builder, proxyin.meminfo),
+        context.data_model_manager[datatype].get_value_type().as_pointer(),
+    )
+    return numba.core.cgutils.create_struct_proxy(datatype)(
+        context, builder, ref=dataptr
+    )
+
+
+def _borrowed(context, builder, structtype, structval):
+    proxyin = numba.core.cgutils.create_struct_proxy(structtype)(
+        context, builder, value=structval
+    )
+    proxyout = context.make_helper(builder, LayoutBuilderType(structtype))
+    proxyout.meminfo = proxyin.meminfo
+    return proxyout._getvalue()
+
+
+def _content(context, builder, buildertype, payload, index=None):
+    if index is None:
+        structtype = buildertype.structtype.contenttype
+        structval = payload.content
+    else:
+        structtype = buildertype.structtype.contenttypes[index]
+        structval = builder.extract_value(payload.contents, index)
+    return LayoutBuilderType(structtype), _borrowed(
+        context, builder, structtype, structval
+    )
+
+
+def _grow(array, at):
+    out = ak.nplike.numpy.empty(max(2 * len(array), at + 1), array.dtype)
+    out[: len(array)] = array
+    return out
+
+
+def _store(context, builder, buildertype, payload, field, at, value, valuetype):
+    arraytype = buildertype.structtype.field_dict[field]
+    array = context.make_array(arraytype)(context, builder, getattr(payload, field))
+    (size,) = numba.core.cgutils.unpack_tuple(builder, array.shape)
+
+    with builder.if_then(builder.icmp_signed(">=", at, size), likely=False):
+        old = getattr(payload, field)
+        new = context.compile_internal(
+            builder, _grow, arraytype(arraytype, numba.int64), (old, at)
+        )
+        context.nrt.decref(builder, arraytype, old)
+        setattr(payload, field, new)
+
+    array = context.make_array(arraytype)(context, builder, getattr(payload, field))
+    ptr = numba.core.cgutils.get_item_pointer(
+        context, builder, arraytype, array, (at,), wraparound=False
+    )
+    numba.np.arrayobj.store_item(
+        context,
+        builder,
+        arraytype,
+        context.cast(builder, value, valuetype, arraytype.dtype),
+        ptr,
+    )
+
+
+def _increment_length(context, builder, payload):
+    payload.length = builder.add(payload.length, context.get_constant(numba.int64, 1))
+
+
+@numba.extending.lower_getattr_generic(LayoutBuilderType)
+def lower_getattr_generic(context, builder, buildertype, builderval, attr):
+    payload = _payload(context, builder, buildertype, builderval)
+    if attr == "content":
+        _, out = _content(context, builder, buildertype, payload)
+        return out
+    else:
+        return numba.core.imputils.impl_ret_borrowed(
+            context, builder, buildertype.field_type(attr), getattr(payload, attr)
+        )
+
+
+@numba.extending.lower_builtin("append", LayoutBuilderType, numba.types.Boolean)
+@numba.extending.lower_builtin("append", LayoutBuilderType, numba.types.Number)
+def lower_append(context, builder, sig, args):
+    buildertype, xtype = sig.args
+    builderval, xval = args
+    payload = _payload(context, builder, buildertype, builderval)
+    _store(context, builder, buildertype, payload, "data", payload.length, xval, xtype)
+    _increment_length(context, builder, payload)
+    return context.get_dummy_value()
+
+
+@numba.extending.lower_builtin("begin_list", LayoutBuilderType)
+def lower_begin_list(context, builder, sig, args):
+    (buildertype,) = sig.args
+    (builderval,) = args
+    payload = _payload(context, builder, buildertype, builderval)
+    _, out = _content(context, builder, buildertype, payload)
+    return out
+
+
+@numba.extending.lower_builtin("end_list", LayoutBuilderType)
+def lower_end_list(context, builder, sig, args):
+    (buildertype,) = sig.args
+    (builderval,) = args
+    payload = _payload(context, builder, buildertype, builderval)
+    if isinstance(buildertype.structtype, ListOffsetBuilderType):
+        contenttype, contentval = _content(context, builder, buildertype, payload)
+        contentlength = _payload(context, builder, contenttype, contentval).length
+        at = builder.add(payload.length, context.get_constant(numba.int64, 1))
+        _store(
+            context,
+            builder,
+            buildertype,
+            payload,
+            "offsets",
+            at,
+            contentlength,
+            numba.int64,
+        )
+    _increment_length(context, builder, payload)
+    return context.get_dummy_value()
+
+
+@numba.extending.lower_builtin("append_valid", LayoutBuilderType)
+def lower_append_valid(context, builder, sig, args):
+    (buildertype,) = sig.args
+    (builderval,) = args
+    payload = _payload(context, builder, buildertype, builderval)
+    contenttype, contentval = _content(context, builder, buildertype, payload)
+    contentlength = _payload(context, builder, contenttype, contentval).length
+    _store(
+        context,
+        builder,
+        buildertype,
+        payload,
+        "index",
+        payload.length,
+        contentlength,
+        numba.int64,
+    )
+    _increment_length(context, builder, payload)
+    return contentval
+
+
+@numba.extending.lower_builtin("append_null", LayoutBuilderType)
+def lower_append_null(context, builder, sig, args):
+    (buildertype,) = sig.args
+    (builderval,) = args
+    payload = _payload(context, builder, buildertype, builderval)
+    _store(
+        context,
+        builder,
+        buildertype,
+        payload,
+        "index",
+        payload.length,
+        context.get_constant(numba.int64, -1),
+        numba.int64,
+    )
+    _increment_length(context, builder, payload)
+    return context.get_dummy_value()
+
+
+@numba.extending.lower_builtin("content", LayoutBuilderType, numba.types.Literal)
+def lower_content(context, builder, sig, args):
+    buildertype, keytype = sig.args
+    builderval, _ = args
+    payload = _payload(context, builder, buildertype, builderval)
+    index = buildertype.structtype.field_index(keytype)
+    _, out = _content(context, builder, buildertype, payload, index)
+    return out
+
+
+@numba.extending.lower_builtin("end_record", LayoutBuilderType)
+def lower_end_record(context, builder, sig, args):
+    (buildertype,) = sig.args
+    (builderval,) = args
+    payload = _payload(context, builder, buildertype, builderval)
+    _increment_length(context, builder, payload)
+    return context.get_dummy_value()
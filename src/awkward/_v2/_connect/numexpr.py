@@ -3,159 +3,179 @@
 # Ideally, you want to collaborate with NumExpr to get this without a nested module.
 # Barring that, though, just reimplement in v2.
 
-# from __future__ import absolute_import
-
-# import warnings
-# import sys
-# import types
-
-# import awkward as ak
-
-# checked_version = False
-
-
-# def import_numexpr():
-#     global checked_version
-#     try:
-#         import numexpr
-#     except ImportError:
-#         raise ImportError(
-#             """install the 'numexpr' package with:
-
-#     pip install numexpr --upgrade
-
-# or
-
-#     conda install numexpr"""
-#         )
-#     else:
-#         if not checked_version and ak._v2._util.parse_version(
-#             numexpr.__version__
-#         ) < ak._v2._util.parse_version("2.7.1"):
-#             warnings.warn(
-#                 "Awkward Array is only known to work with numexpr 2.7.1 or later"
-#                 "(you have version {0})".format(numexpr.__version__),
-#                 RuntimeWarning,
-#             )
-#         checked_version = True
-#         return numexpr
-
-
-# def getArguments(names, local_dict=None, global_dict=None):
-#     call_frame = sys._getframe(2)
-
-#     clear_local_dict = False
-#     if local_dict is None:
-#         local_dict = call_frame.f_locals
-#         clear_local_dict = True
-#     try:
-#         frame_globals = call_frame.f_globals
-#         if global_dict is None:
-#             global_dict = frame_globals
-
-#         clear_local_dict = clear_local_dict and frame_globals is not local_dict
-
-#         arguments = []
-#         for name in names:
-#             try:
-#                 a = local_dict[name]
-#             except KeyError:
-#                 a = global_dict[name]
-#             arguments.append(a)  # <--- different from NumExpr
-#     finally:
-#         if clear_local_dict:
-#             local_dict.clear()
-
-#     return arguments
-
-
-# def evaluate(
-#     expression, local_dict=None, global_dict=None, order="K", casting="safe", **kwargs
-# ):
-#     numexpr = import_numexpr()
-
-#     context = numexpr.necompiler.getContext(kwargs, frame_depth=1)
-#     expr_key = (expression, tuple(sorted(context.items())))
-#     if expr_key not in numexpr.necompiler._names_cache:
-#         numexpr.necompiler._names_cache[expr_key] = numexpr.necompiler.getExprNames(
-#             expression, context
-#         )
-#     names, ex_uses_vml = numexpr.necompiler._names_cache[expr_key]
-#     arguments = getArguments(names, local_dict, global_dict)
-
-#     arrays = [
-#         ak._v2.operations.convert.to_layout(x, allow_record=True, allow_other=True)
-#         for x in arguments
-#     ]
-
-#     def getfunction(inputs):
-#         if all(
-#             isinstance(x, ak._v2.contents.NumpyArray) or not isinstance(x, ak._v2.contents.Content)
-#             for x in inputs
-#         ):
-#             return lambda: (
-#                 ak._v2.contents.NumpyArray(
-#                     numexpr.evaluate(
-#                         expression,
-#                         dict(zip(names, inputs)),
-#                         {},
-#                         order=order,
-#                         casting=casting,
-#                         **kwargs
-#                     )
-#                 ),
-#             )
-#         else:
-#             return None
-
-#     behavior = ak._v2._util.behaviorof(*arrays)
-#     out = ak._v2._util.broadcast_and_apply(
-#         arrays, getfunction, behavior, allow_records=False, pass_depth=False
-#     )
-#     assert isinstance(out, tuple) and len(out) == 1
-#     return ak._v2._util.wrap(out[0], behavior)
-
-
-# evaluate.evaluate = evaluate
-
-
-# def re_evaluate(local_dict=None):
-#     numexpr = import_numexpr()
-
-#     try:
-#         compiled_ex = numexpr.necompiler._numexpr_last["ex"]  # noqa: F841
-#     except KeyError:
-#         raise RuntimeError(
-#             "not a previous evaluate() execution found"
-#
-#         )
-#     names = numexpr.necompiler._numexpr_last["argnames"]
-#     arguments = getArguments(names, local_dict)
-
-#     arrays = [
-#         ak._v2.operations.convert.to_layout(x, allow_record=True, allow_other=True)
-#         for x in arguments
-#     ]
-
-#     def getfunction(inputs):
-#         if all(
-#             isinstance(x, ak._v2.contents.NumpyArray) or not isinstance(x, ak._v2.contents.Content)
-#             for x in inputs
-#         ):
-#             return lambda: (
-#                 ak._v2.contents.NumpyArray(numexpr.re_evaluate(dict(zip(names, inputs)))),
-#             )
-#         else:
-#             return None
-
-#     behavior = ak._v2._util.behaviorof(*arrays)
-#     out = ak._v2._util.broadcast_and_apply(
-#         arrays, getfunction, behavior, allow_records=False, pass_depth=False
-#     )
-#     assert isinstance(out, tuple) and len(out) == 1
-#     return ak._v2._util.wrap(out[0], behavior)
-
-
-# ak.numexpr = types.ModuleType("numexpr")
-# ak.numexpr.evaluate = evaluate
-# ak.numexpr.re_evaluate = re_evaluate
+import sys
+import types
+import warnings
+
+import awkward as ak
+
+numpy = ak.nplike.Numpy.instance()
+
+checked_version = False
+
+
+def import_numexpr():
+    global checked_version
+    try:
+        import numexpr
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(
+            """install the 'numexpr' package with:
+
+    pip install numexpr --upgrade
+
+or
+
+    conda install numexpr"""
+        ) from None
+    else:
+        if not checked_version and ak._v2._util.parse_version(
+            numexpr.__version__
+        ) < ak._v2._util.parse_version("2.7.1"):
+            warnings.warn(
+                "Awkward Array is only known to work with numexpr 2.7.1 or later"
+                "(you have version {})".format(numexpr.__version__),
+                RuntimeWarning,
+            )
+        checked_version = True
+        return numexpr
+
+
+def getArguments(names, local_dict=None, global_dict=None):
+    call_frame = sys._getframe(2)
+
+    clear_local_dict = False
+    if local_dict is None:
+        local_dict = call_frame.f_locals
+        clear_local_dict = True
+    try:
+        frame_globals = call_frame.f_globals
+        if global_dict is None:
+            global_dict = frame_globals
+
+        clear_local_dict = clear_local_dict and frame_globals is not local_dict
+
+        arguments = []
+        for name in names:
+            try:
+                a = local_dict[name]
+            except KeyError:
+                a = global_dict[name]
+            arguments.append(a)  # <--- different from NumExpr
+    finally:
+        if clear_local_dict:
+            local_dict.clear()
+
+    return arguments
+
+
+def _apply(names, arguments, evaluate_flat, function_name):
+    # The structure of all arguments is broadcasted once, and the expression is
+    # evaluated on the flat buffers at the leaves in a single NumExpr call, with
+    # no intermediate arrays for its subexpressions.
+    behavior = ak._v2._util.behavior_of(*arguments)
+    arrays = [
+        ak._v2.operations.convert.to_layout(x, allow_record=True, allow_other=True)
+        for x in arguments
+    ]
+
+    def action(inputs, **ignore):
+        if all(
+            isinstance(x, ak._v2.contents.NumpyArray)
+            or not isinstance(x, ak._v2.contents.Content)
+            for x in inputs
+        ):
+            args = [
+                x.to(numpy) if isinstance(x, ak._v2.contents.NumpyArray) else x
+                for x in inputs
+            ]
+            return (ak._v2.contents.NumpyArray(evaluate_flat(dict(zip(names, args)))),)
+        else:
+            return None
+
+    out = ak._v2._broadcasting.broadcast_and_apply(
+        arrays, action, behavior, allow_records=False, function_name=function_name
+    )
+    assert isinstance(out, tuple) and len(out) == 1
+    return ak._v2._util.wrap(out[0], behavior)
+
+
+def evaluate(
+    expression, local_dict=None, global_dict=None, order="K", casting="safe", **kwargs
+):
+    """
+    Args:
+        expression (str): NumExpr expression, with the names of variables
+            (arrays or scalars) in the caller's scope or `local_dict` and
+            `global_dict`.
+        local_dict (None or dict): Variables to use instead of the caller's
+            local variables.
+        global_dict (None or dict): Variables to use instead of the caller's
+            global variables.
+        order, casting, kwargs: Passed to `numexpr.evaluate`.
+
+    Evaluates an elementwise expression on Awkward Arrays (mixed with NumPy
+    arrays and scalars, which are broadcasted the same way as in NumPy ufuncs).
+
+    Unlike a chain of ufuncs such as `np.sqrt(px**2 + py**2) * weight`, which
+    broadcasts the arrays' structure and allocates an intermediate array for
+    each operation, the structure is broadcasted once and the whole expression
+    is computed on the flat buffers in one pass by NumExpr's virtual machine:
+
+        >>> px = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+        >>> py = ak.Array([[0.1, 0.2, 0.3], [], [0.4, 0.5]])
+        >>> weight = ak.Array([1, 2, 3])
+        >>> ak.numexpr.evaluate("sqrt(px**2 + py**2) * weight")
+        <Array [[1.1, 2.21, 3.31], [], [13.3, 16.6]] type='3 * var * float64'>
+
+    The result has the structure of the broadcasted arguments; records are not
+    allowed.
+    """
+    numexpr = import_numexpr()
+
+    context = numexpr.necompiler.getContext(kwargs, frame_depth=1)
+    expr_key = (expression, tuple(sorted(context.items())))
+    if expr_key not in numexpr.necompiler._names_cache:
+        numexpr.necompiler._names_cache[expr_key] = numexpr.necompiler.getExprNames(
+            expression, context
+        )
+    names, ex_uses_vml = numexpr.necompiler._names_cache[expr_key]
+    arguments = getArguments(names, local_dict, global_dict)
+
+    def evaluate_flat(variables):
+        return numexpr.evaluate(
+            expression, variables, {}, order=order, casting=casting, **kwargs
+        )
+
+    return _apply(names, arguments, evaluate_flat, "ak._v2.numexpr.evaluate")
+
+
+evaluate.evaluate = evaluate
+
+
+def re_evaluate(local_dict=None):
+    """
+    Args:
+        local_dict (None or dict): Variables to use instead of the caller's
+            local variables.
+
+    Evaluates the last expression passed to #ak.numexpr.evaluate with new
+    values of its variables, without recompiling it.
+    """
+    numexpr = import_numexpr()
+
+    try:
+        compiled_ex = numexpr.necompiler._numexpr_last["ex"]  # noqa: F841
+    except KeyError:
+        raise RuntimeError("not a previous evaluate() execution found") from None
+    names = numexpr.necompiler._numexpr_last["argnames"]
+    arguments = getArguments(names, local_dict)
+
+    return _apply(names, arguments, numexpr.re_evaluate, "ak._v2.numexpr.re_evaluate")
+
+
+# ak._v2 is still being imported, so it is not yet an attribute of ak
+_v2 = sys.modules["awkward._v2"]
+_v2.numexpr = types.ModuleType("numexpr")
+_v2.numexpr.evaluate = evaluate
+_v2.numexpr.re_evaluate = re_evaluate
@@ -160,6 +160,9 @@ def array_ufunc(ufunc, method, inputs, kwargs):
     if method != "__call__" or len(inputs) == 0 or "out" in kwargs:
         return NotImplemented
 
+    if any(isinstance(x, ak._v2.partition.PartitionedArray) for x in inputs):
+        return ak._v2.partition.array_ufunc(ufunc, method, inputs, kwargs)
+
     behavior = ak._v2._util.behavior_of(*inputs)
 
     inputs = _array_ufunc_custom_cast(inputs, behavior)
@@ -198,6 +201,7 @@ def array_ufunc(ufunc, method, inputs, kwargs):
                 args = []
                 for x in inputs:
                     if isinstance(x, NumpyArray):
+                        ak._v2._typetracer.touch_data(x.to(nplike))
                         shape = x.shape
                         args.append(numpy.empty((0,) + x.shape[1:], x.dtype))
                     else:
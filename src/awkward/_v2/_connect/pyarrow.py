@@ -45,9 +45,9 @@ def import_pyarrow_parquet(name):
     if pyarrow is None:
         raise ImportError(error_message.format(name))
 
-    import pyarrow.parquet
+    import pyarrow.parquet as out
 
-    return pyarrow.parquet
+    return out
 
 
 if pyarrow is not None:
@@ -204,6 +204,30 @@ else:
         return numpy.unpackbits(bitarray, bitorder=("little" if lsb_order else "big"))
 
 
+class PackedValidBits:
+    """
+    A validity bitmap that is already in Arrow's format (LSB order, 1 means
+    valid), passed down from a BitMaskedArray without unpacking it. Only
+    `to_arrow(zero_copy=True)` makes these; everywhere else, `validbytes`
+    are boolean arrays.
+    """
+
+    def __init__(self, bits, length):
+        self.bits = bits
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+
+def check_zero_copy(zero_copy, node, reason):
+    if zero_copy:
+        raise ValueError(
+            f"{node} can't be converted without copying: {reason} "
+            "(use zero_copy=False to allow copies)"
+        )
+
+
 def and_validbytes(validbytes1, validbytes2):
     if validbytes1 is None:
         return validbytes2
@@ -216,6 +240,8 @@ def and_validbytes(validbytes1, validbytes2):
 def to_validbits(validbytes):
     if validbytes is None:
         return None
+    elif isinstance(validbytes, PackedValidBits):
+        return pyarrow.py_buffer(validbytes.bits)
     else:
         return pyarrow.py_buffer(packbits(validbytes))
 
@@ -232,6 +258,9 @@ def to_length(nparray, length):
 def to_null_count(validbytes, count_nulls):
     if validbytes is None or not count_nulls:
         return -1
+    elif isinstance(validbytes, PackedValidBits):
+        valid = unpackbits(validbytes.bits)[: validbytes.length]
+        return validbytes.length - numpy.count_nonzero(valid)
     else:
         return len(validbytes) - numpy.count_nonzero(validbytes)
 
@@ -257,7 +286,9 @@ def mask_parameters(awkwardarrow_type):
         return None
 
 
-def popbuffers_finalize(out, array, validbits, awkwardarrow_type, fix_offsets=True):
+def popbuffers_finalize(
+    out, array, validbits, awkwardarrow_type, fix_offsets=True, zero_copy=False
+):
     # Every buffer from Arrow must be offsets-corrected.
     if fix_offsets and (array.offset != 0 or len(array) != len(out)):
         out = out[array.offset : array.offset + len(array)]
@@ -272,8 +303,20 @@ def popbuffers_finalize(out, array, validbits, awkwardarrow_type, fix_offsets=Tr
     if validbits is None:
         return ak._v2.contents.UnmaskedArray(out, parameters=mask_parameters)
     else:
+        # The validity bits are never offsets-corrected, even for struct fields.
+        bits = numpy.frombuffer(validbits, dtype=np.uint8)
+        if array.offset % 8 == 0:
+            bits = bits[array.offset // 8 :]
+        else:
+            check_zero_copy(
+                zero_copy,
+                f"Arrow {array.type} validity bitmap",
+                f"its offset ({array.offset}) is not a multiple of 8",
+            )
+            bits = packbits(unpackbits(bits)[array.offset : array.offset + len(out)])
+
         return ak._v2.contents.BitMaskedArray(
-            ak._v2.index.IndexU8(numpy.frombuffer(validbits, dtype=np.uint8)),
+            ak._v2.index.IndexU8(bits),
             out,
             valid_when=True,
             length=len(out),
@@ -282,7 +325,7 @@ def popbuffers_finalize(out, array, validbits, awkwardarrow_type, fix_offsets=Tr
         )
 
 
-def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
+def popbuffers(paarray, awkwardarrow_type, storage_type, buffers, zero_copy=False):
     # Start by removing the ExtensionArray wrapper.
     if awkwardarrow_type is not None:
         paarray = paarray.storage
@@ -299,22 +342,27 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
         assert not isinstance(storage_type, AwkwardArrowType)
         # In that case, just ignore its logical type and use its storage type.
         return popbuffers(
-            paarray, awkwardarrow_type, storage_type.storage_type, buffers
+            paarray, awkwardarrow_type, storage_type.storage_type, buffers, zero_copy
         )
 
     elif isinstance(storage_type, pyarrow.lib.DictionaryType):
         masked_index = popbuffers(
-            paarray.indices, None, storage_type.index_type, buffers
+            paarray.indices, None, storage_type.index_type, buffers, zero_copy
         )
         index = masked_index.content.data
 
         if not isinstance(masked_index, ak._v2.contents.UnmaskedArray):
             mask = masked_index.mask_as_bool(valid_when=False)
             if mask.any():
+                check_zero_copy(
+                    zero_copy,
+                    f"Arrow {storage_type}",
+                    "missing values must be written into the index",
+                )
                 index = numpy.array(index, copy=True)
                 index[mask] = -1
 
-        content = handle_arrow(paarray.dictionary)
+        content = handle_arrow(paarray.dictionary, zero_copy=zero_copy)
 
         parameters = ak._v2._util.merge_parameters(
             mask_parameters(awkwardarrow_type), node_parameters(awkwardarrow_type)
@@ -333,7 +381,7 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
         validbits = buffers.pop(0)
 
         a, b = to_awkwardarrow_storage_types(storage_type.value_type)
-        akcontent = popbuffers(paarray.values, a, b, buffers)
+        akcontent = popbuffers(paarray.values, a, b, buffers, zero_copy)
 
         if not storage_type.value_field.nullable:
             # strip the dummy option-type node
@@ -344,7 +392,9 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
             storage_type.list_size,
             parameters=node_parameters(awkwardarrow_type),
         )
-        return popbuffers_finalize(out, paarray, validbits, awkwardarrow_type)
+        return popbuffers_finalize(
+            out, paarray, validbits, awkwardarrow_type, zero_copy=zero_copy
+        )
 
     elif isinstance(storage_type, (pyarrow.lib.LargeListType, pyarrow.lib.ListType)):
         assert storage_type.num_buffers == 2
@@ -361,7 +411,7 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
             )
 
         a, b = to_awkwardarrow_storage_types(storage_type.value_type)
-        akcontent = popbuffers(paarray.values, a, b, buffers)
+        akcontent = popbuffers(paarray.values, a, b, buffers, zero_copy)
 
         if not storage_type.value_field.nullable:
             # strip the dummy option-type node
@@ -370,7 +420,9 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
         out = ak._v2.contents.ListOffsetArray(
             akoffsets, akcontent, parameters=node_parameters(awkwardarrow_type)
         )
-        return popbuffers_finalize(out, paarray, validbits, awkwardarrow_type)
+        return popbuffers_finalize(
+            out, paarray, validbits, awkwardarrow_type, zero_copy=zero_copy
+        )
 
     elif isinstance(storage_type, pyarrow.lib.MapType):
         # FIXME: make a ListOffsetArray of 2-tuples with __array__ == "sorted_map".
@@ -405,7 +457,9 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
             storage_type.byte_width,
             parameters=parameters,
         )
-        return popbuffers_finalize(out, paarray, validbits, awkwardarrow_type)
+        return popbuffers_finalize(
+            out, paarray, validbits, awkwardarrow_type, zero_copy=zero_copy
+        )
 
     elif storage_type in _string_like:
         assert storage_type.num_buffers == 3
@@ -442,7 +496,9 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
             ),
             parameters=parameters,
         )
-        return popbuffers_finalize(out, paarray, validbits, awkwardarrow_type)
+        return popbuffers_finalize(
+            out, paarray, validbits, awkwardarrow_type, zero_copy=zero_copy
+        )
 
     elif isinstance(storage_type, pyarrow.lib.StructType):
         assert storage_type.num_buffers == 1
@@ -456,7 +512,7 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
             keys.append(field_name)
 
             a, b = to_awkwardarrow_storage_types(field.type)
-            akcontent = popbuffers(paarray.field(field_name), a, b, buffers)
+            akcontent = popbuffers(paarray.field(field_name), a, b, buffers, zero_copy)
             if not field.nullable:
                 # strip the dummy option-type node
                 akcontent = remove_optiontype(akcontent)
@@ -472,7 +528,12 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
             parameters=node_parameters(awkwardarrow_type),
         )
         return popbuffers_finalize(
-            out, paarray, validbits, awkwardarrow_type, fix_offsets=False
+            out,
+            paarray,
+            validbits,
+            awkwardarrow_type,
+            fix_offsets=False,
+            zero_copy=zero_copy,
         )
 
     elif isinstance(storage_type, pyarrow.lib.UnionType):
@@ -480,6 +541,9 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
             assert storage_type.num_buffers == 2
             validbits = buffers.pop(0)
             nptags = numpy.frombuffer(buffers.pop(0), dtype=np.int8)
+            check_zero_copy(
+                zero_copy, f"Arrow {storage_type}", "sparse unions need a new index"
+            )
             npindex = numpy.arange(len(nptags), dtype=np.int32)
         else:
             assert storage_type.num_buffers == 3
@@ -491,7 +555,7 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
         for i in range(storage_type.num_fields):
             field = storage_type[i]
             a, b = to_awkwardarrow_storage_types(field.type)
-            akcontent = popbuffers(paarray.field(i), a, b, buffers)
+            akcontent = popbuffers(paarray.field(i), a, b, buffers, zero_copy)
 
             if not field.nullable:
                 # strip the dummy option-type node
@@ -504,11 +568,16 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
             akcontents,
             parameters=node_parameters(awkwardarrow_type),
         )
-        return popbuffers_finalize(out, paarray, None, awkwardarrow_type)
+        return popbuffers_finalize(
+            out, paarray, None, awkwardarrow_type, zero_copy=zero_copy
+        )
 
     elif storage_type == pyarrow.null():
         validbits = buffers.pop(0)
         assert storage_type.num_fields == 0
+        check_zero_copy(
+            zero_copy, "Arrow null", "it has no buffers to view as an Awkward Array"
+        )
 
         # This is already an option-type and offsets-corrected, so no popbuffers_finalize.
         return ak._v2.contents.IndexedOptionArray(
@@ -521,6 +590,9 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
         assert storage_type.num_buffers == 2
         validbits = buffers.pop(0)
         bitdata = buffers.pop(0)
+        check_zero_copy(
+            zero_copy, "Arrow bool", "its bit-packed data must be unpacked into bytes"
+        )
 
         bytedata = unpackbits(numpy.frombuffer(bitdata, dtype=np.uint8))
 
@@ -529,7 +601,9 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
             parameters=node_parameters(awkwardarrow_type),
             nplike=ak.nplike.Numpy.instance(),
         )
-        return popbuffers_finalize(out, paarray, validbits, awkwardarrow_type)
+        return popbuffers_finalize(
+            out, paarray, validbits, awkwardarrow_type, zero_copy=zero_copy
+        )
 
     elif isinstance(storage_type, pyarrow.lib.DataType):
         assert storage_type.num_buffers == 2
@@ -538,6 +612,9 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
 
         to64, dt = _pyarrow_to_numpy_dtype.get(str(storage_type), (False, None))
         if to64:
+            check_zero_copy(
+                zero_copy, f"Arrow {storage_type}", "32-bit values must be widened"
+            )
             data = numpy.frombuffer(data, dtype=np.int32).astype(np.int64)
         if dt is None:
             dt = storage_type.to_pandas_dtype()
@@ -547,7 +624,9 @@ def popbuffers(paarray, awkwardarrow_type, storage_type, buffers):
             parameters=node_parameters(awkwardarrow_type),
             nplike=ak.nplike.Numpy.instance(),
         )
-        return popbuffers_finalize(out, paarray, validbits, awkwardarrow_type)
+        return popbuffers_finalize(
+            out, paarray, validbits, awkwardarrow_type, zero_copy=zero_copy
+        )
 
     else:
         raise TypeError(f"unrecognized Arrow array type: {storage_type!r}")
@@ -586,12 +665,211 @@ def remove_optiontype(akarray):
         return akarray.content
 
 
-def handle_arrow(obj, pass_empty_field=False):
+def empty_arrow_array(arrowtype):
+    # pyarrow.array([], type=...) can't make extension arrays (or anything
+    # that contains them), so build them up from their storage.
+    awkwardarrow_type, storage_type = to_awkwardarrow_storage_types(arrowtype)
+
+    if isinstance(storage_type, pyarrow.lib.StructType):
+        storage = pyarrow.Array.from_buffers(
+            storage_type,
+            0,
+            [None],
+            children=[empty_arrow_array(field.type) for field in storage_type],
+        )
+    elif isinstance(storage_type, pyarrow.lib.FixedSizeListType):
+        storage = pyarrow.Array.from_buffers(
+            storage_type,
+            0,
+            [None],
+            children=[empty_arrow_array(storage_type.value_type)],
+        )
+    elif isinstance(storage_type, (pyarrow.lib.LargeListType, pyarrow.lib.ListType)):
+        if isinstance(storage_type, pyarrow.lib.LargeListType):
+            offsets = numpy.zeros(1, dtype=np.int64)
+        else:
+            offsets = numpy.zeros(1, dtype=np.int32)
+        storage = pyarrow.Array.from_buffers(
+            storage_type,
+            0,
+            [None, pyarrow.py_buffer(offsets)],
+            children=[empty_arrow_array(storage_type.value_type)],
+        )
+    else:
+        storage = pyarrow.array([], type=storage_type)
+
+    if awkwardarrow_type is None:
+        return storage
+    else:
+        return pyarrow.ExtensionArray.from_storage(awkwardarrow_type, storage)
+
+
+def project_arrow_type(full_type, projected_type):
+    """
+    Returns `full_type` (which may contain AwkwardArrowTypes) with only the
+    struct fields that are in `projected_type`, which is what Arrow makes of
+    the same column when only some of its nested fields are read.
+    """
+    awkwardarrow_type, storage_type = to_awkwardarrow_storage_types(full_type)
+    projected_storage_type = to_awkwardarrow_storage_types(projected_type)[1]
+
+    if isinstance(storage_type, pyarrow.lib.StructType):
+        fields = []
+        for projected_field in projected_storage_type:
+            field = storage_type[storage_type.get_field_index(projected_field.name)]
+            fields.append(
+                pyarrow.field(
+                    field.name,
+                    project_arrow_type(field.type, projected_field.type),
+                    field.nullable,
+                    field.metadata,
+                )
+            )
+        out = pyarrow.struct(fields)
+
+    elif isinstance(
+        storage_type,
+        (
+            pyarrow.lib.LargeListType,
+            pyarrow.lib.ListType,
+            pyarrow.lib.FixedSizeListType,
+        ),
+    ):
+        field = storage_type.value_field
+        value_field = pyarrow.field(
+            field.name,
+            project_arrow_type(field.type, projected_storage_type.value_type),
+            field.nullable,
+            field.metadata,
+        )
+        if isinstance(storage_type, pyarrow.lib.LargeListType):
+            out = pyarrow.large_list(value_field)
+        elif isinstance(storage_type, pyarrow.lib.ListType):
+            out = pyarrow.list_(value_field)
+        else:
+            out = pyarrow.list_(value_field, storage_type.list_size)
+
+    else:
+        out = storage_type
+
+    if awkwardarrow_type is None:
+        return out
+    else:
+        return AwkwardArrowType(
+            out,
+            awkwardarrow_type.mask_type,
+            awkwardarrow_type.node_type,
+            awkwardarrow_type.mask_parameters,
+            awkwardarrow_type.node_parameters,
+            awkwardarrow_type.record_is_tuple,
+        )
+
+
+def storage_arrow_type(arrowtype):
+    """
+    Returns `arrowtype` with all of its AwkwardArrowTypes (at any depth)
+    replaced by their storage types, keeping the names, nullability, and
+    metadata of nested fields.
+    """
+    storage_type = to_awkwardarrow_storage_types(arrowtype)[1]
+
+    if isinstance(storage_type, pyarrow.lib.StructType):
+        return pyarrow.struct(
+            [
+                pyarrow.field(
+                    field.name,
+                    storage_arrow_type(field.type),
+                    field.nullable,
+                    field.metadata,
+                )
+                for field in storage_type
+            ]
+        )
+
+    elif isinstance(
+        storage_type,
+        (
+            pyarrow.lib.LargeListType,
+            pyarrow.lib.ListType,
+            pyarrow.lib.FixedSizeListType,
+        ),
+    ):
+        field = storage_type.value_field
+        value_field = pyarrow.field(
+            field.name,
+            storage_arrow_type(field.type),
+            field.nullable,
+            field.metadata,
+        )
+        if isinstance(storage_type, pyarrow.lib.LargeListType):
+            return pyarrow.large_list(value_field)
+        elif isinstance(storage_type, pyarrow.lib.ListType):
+            return pyarrow.list_(value_field)
+        else:
+            return pyarrow.list_(value_field, storage_type.list_size)
+
+    else:
+        return storage_type
+
+
+def with_arrow_type(paarray, arrowtype):
+    """
+    Rewraps the buffers of `paarray` (without copying them) as `arrowtype`,
+    which must have the same physical layout, such as a type from
+    #project_arrow_type. Struct fields are matched by name, so `arrowtype`
+    may also have fewer struct fields than `paarray`.
+    """
+    awkwardarrow_type, storage_type = to_awkwardarrow_storage_types(arrowtype)
+    if isinstance(paarray, pyarrow.lib.ExtensionArray):
+        paarray = paarray.storage
+
+    if isinstance(storage_type, pyarrow.lib.StructType):
+        children = [
+            with_arrow_type(paarray.field(field.name), field.type)
+            for field in storage_type
+        ]
+    elif isinstance(
+        storage_type,
+        (
+            pyarrow.lib.LargeListType,
+            pyarrow.lib.ListType,
+            pyarrow.lib.FixedSizeListType,
+        ),
+    ):
+        children = [with_arrow_type(paarray.values, storage_type.value_type)]
+    else:
+        children = None
+
+    if children is None:
+        storage = paarray
+    elif isinstance(storage_type, pyarrow.lib.StructType) and paarray.offset != 0:
+        # StructArray.field has already applied the offset to the children
+        storage = pyarrow.StructArray.from_arrays(
+            children,
+            fields=list(storage_type),
+            mask=paarray.is_null() if paarray.null_count != 0 else None,
+        )
+    else:
+        storage = pyarrow.Array.from_buffers(
+            storage_type,
+            len(paarray),
+            paarray.buffers()[: storage_type.num_buffers],
+            offset=paarray.offset,
+            children=children,
+        )
+
+    if awkwardarrow_type is None:
+        return storage
+    else:
+        return pyarrow.ExtensionArray.from_storage(awkwardarrow_type, storage)
+
+
+def handle_arrow(obj, pass_empty_field=False, zero_copy=False):
     if isinstance(obj, pyarrow.lib.Array):
         buffers = obj.buffers()
 
         awkwardarrow_type, storage_type = to_awkwardarrow_storage_types(obj.type)
-        out = popbuffers(obj, awkwardarrow_type, storage_type, buffers)
+        out = popbuffers(obj, awkwardarrow_type, storage_type, buffers, zero_copy)
         assert len(buffers) == 0
 
         if not_null(awkwardarrow_type, out):
@@ -600,20 +878,24 @@ def handle_arrow(obj, pass_empty_field=False):
             return out
 
     elif isinstance(obj, pyarrow.lib.ChunkedArray):
-        layouts = [handle_arrow(x) for x in obj.chunks if len(x) > 0]
+        layouts = [
+            handle_arrow(x, zero_copy=zero_copy) for x in obj.chunks if len(x) > 0
+        ]
 
         if len(layouts) == 1:
             return layouts[0]
+        elif len(layouts) == 0:
+            return handle_arrow(empty_arrow_array(obj.type), zero_copy=zero_copy)
         else:
-            raise NotImplementedError(
-                "FIXME: need ak._v2.operations.structure.concatenate"
+            check_zero_copy(
+                zero_copy, "Arrow ChunkedArray", "its chunks must be concatenated"
             )
             return ak._v2.operations.structure.concatenate(layouts, highlevel=False)
 
     elif isinstance(obj, pyarrow.lib.RecordBatch):
         child_array = []
         for i in range(obj.num_columns):
-            layout = handle_arrow(obj.column(i))
+            layout = handle_arrow(obj.column(i), zero_copy=zero_copy)
             if obj.schema.field(i).nullable and not layout.is_OptionType:
                 layout = ak._v2.contents.UnmaskedArray(layout)
             child_array.append(layout)
@@ -624,21 +906,24 @@ def handle_arrow(obj, pass_empty_field=False):
             return ak._v2.contents.RecordArray(child_array, obj.schema.names)
 
     elif isinstance(obj, pyarrow.lib.Table):
+        if any(column.num_chunks > 1 for column in obj.columns):
+            check_zero_copy(zero_copy, "Arrow Table", "its chunks must be combined")
         batches = obj.combine_chunks().to_batches()
         if len(batches) == 0:
             # zero-length array with the right type
-            raise NotImplementedError
+            batch = pyarrow.RecordBatch.from_arrays(
+                [empty_arrow_array(field.type) for field in obj.schema],
+                schema=obj.schema,
+            )
+            out = handle_arrow(batch, pass_empty_field, zero_copy)
         elif len(batches) == 1:
-            out = handle_arrow(batches[0], pass_empty_field)
+            out = handle_arrow(batches[0], pass_empty_field, zero_copy)
         else:
             arrays = [
                 handle_arrow(batch, pass_empty_field)
                 for batch in batches
                 if len(batch) > 0
             ]
-            raise NotImplementedError(
-                "FIXME: need ak._v2.operations.structure.concatenate"
-            )
             out = ak._v2.operations.structure.concatenate(arrays, highlevel=False)
 
         if obj.schema.metadata is not None and b"ak:parameters" in obj.schema.metadata:
@@ -675,14 +960,14 @@ def handle_arrow(obj, pass_empty_field=False):
     ):
         chunks = []
         for batch in obj:
-            chunk = handle_arrow(batch, pass_empty_field)
+            chunk = handle_arrow(batch, pass_empty_field, zero_copy)
             if len(chunk) > 0:
                 chunks.append(chunk)
         if len(chunks) == 1:
             return chunks[0]
         else:
-            raise NotImplementedError(
-                "FIXME: need ak._v2.operations.structure.concatenate"
+            check_zero_copy(
+                zero_copy, "RecordBatches", "their arrays must be concatenated"
             )
             return ak._v2.operations.structure.concatenate(chunks, highlevel=False)
 
@@ -0,0 +1,360 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import collections
+import itertools
+import threading
+import weakref
+
+from collections.abc import Mapping, MutableMapping
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+
+class DeferredLength:
+    """
+    A length that is computed on first use and then remembered, so that the
+    length of a node's content can be described before the buffer that
+    determines it (e.g. the last entry of an offsets buffer) is read.
+    """
+
+    def __init__(self, function):
+        self._function = function
+        self._value = None
+
+    def __call__(self):
+        if self._value is None:
+            self._value = int(self._function())
+            self._function = None
+        return self._value
+
+    def __repr__(self):
+        if self._value is None:
+            return "DeferredLength(?)"
+        else:
+            return f"DeferredLength({self._value})"
+
+
+def resolve_length(length):
+    if isinstance(length, DeferredLength):
+        return length()
+    else:
+        return length
+
+
+class DeferredBuffer:
+    """
+    A buffer whose dtype and shape are known in advance (from a Form and a
+    length), but whose data are only pulled from `generator` when something
+    needs them. #ak._v2.index.Index and #ak._v2.contents.NumpyArray accept a
+    DeferredBuffer in place of an array and materialize it on first access to
+    their data.
+
+    Unless the buffer is #transient, the `generator` is called at most once:
+    the materialized data are kept for as long as the DeferredBuffer (or a
+    node that uses it) exists.
+    """
+
+    def __init__(
+        self, generator, dtype, length, inner_shape=(), nplike=None, transient=False
+    ):
+        if not callable(generator):
+            raise TypeError(
+                f"DeferredBuffer 'generator' must be callable, not {repr(generator)}"
+            )
+        if nplike is None:
+            nplike = ak.nplike.Numpy.instance()
+        self._generator = generator
+        self._dtype = np.dtype(dtype)
+        self._length = length
+        self._inner_shape = tuple(inner_shape)
+        self._nplike = nplike
+        self._transient = transient
+        self._data = None
+        self._raw = None
+        self._lock = threading.Lock()
+
+    @property
+    def transient(self):
+        """
+        If True, the data belong to something else (such as an #ArrayCache
+        that may evict them): only a weak reference to what `generator`
+        returns is kept, and the `generator` is called again once the owner
+        has let go of it. Nodes don't hold onto the data of a transient
+        buffer, either.
+        """
+        return self._transient
+
+    @property
+    def nplike(self):
+        return self._nplike
+
+    @property
+    def dtype(self):
+        return self._dtype
+
+    @property
+    def length(self):
+        self._length = resolve_length(self._length)
+        return self._length
+
+    @property
+    def inner_shape(self):
+        return self._inner_shape
+
+    @property
+    def shape(self):
+        return (self.length,) + self._inner_shape
+
+    def materialize(self):
+        if self._transient:
+            raw_array = None if self._raw is None else self._raw()
+            if raw_array is None:
+                raw_array = self._generator()
+                try:
+                    self._raw = weakref.ref(raw_array)
+                except TypeError:
+                    pass
+            return self._view(raw_array)
+
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    self._data = self._view(self._generator())
+                    self._generator = None
+        return self._data
+
+    def _view(self, raw_array):
+        length = self.length
+        count = length
+        for x in self._inner_shape:
+            count *= x
+        data = self._nplike.frombuffer(raw_array, dtype=self._dtype, count=count)
+        if self._inner_shape != ():
+            data = data.reshape((length,) + self._inner_shape)
+        return data
+
+    def getitem_range(self, start, stop):
+        """
+        Returns a DeferredBuffer for `[start:stop]` of this one, so that a
+        slice of a node that hasn't been materialized isn't materialized.
+        """
+        return DeferredBuffer(
+            lambda: self.materialize()[start:stop],
+            self._dtype,
+            stop - start,
+            self._inner_shape,
+            self._nplike,
+            self._transient,
+        )
+
+    def __repr__(self):
+        return "<DeferredBuffer dtype={} shape={}>".format(
+            repr(str(self._dtype)),
+            repr((self._length,) + self._inner_shape),
+        )
+
+
+def _nbytes(value):
+    if isinstance(value, Mapping):
+        return sum(_nbytes(x) for x in value.values())
+    else:
+        return getattr(value, "nbytes", 0)
+
+
+class ArrayCache(MutableMapping):
+    """
+    Args:
+        limit (None or int): Maximum number of bytes (by `nbytes`) to hold;
+            None never evicts anything.
+
+    A MutableMapping for the arrays made by #ak._v2.operations.structure.virtual
+    (or anything else with an `nbytes`, or a Mapping of them) that evicts the
+    least recently used items when the total `nbytes` exceeds its `limit`.
+    An item larger than the `limit` is evicted as soon as it is added.
+
+    The #hits, #misses, and #evictions counters are updated by lookups,
+    failed lookups, and evictions (`key in cache` counts as neither a hit
+    nor a miss). It is safe to use from multiple threads.
+    """
+
+    def __init__(self, limit=None):
+        if limit is not None and not (ak._v2._util.isint(limit) and limit >= 0):
+            raise TypeError("ArrayCache 'limit' must be None or a non-negative int")
+        self._limit = limit
+        self._items = collections.OrderedDict()
+        self._sizes = {}
+        self._nbytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def limit(self):
+        return self._limit
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    @property
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "items": len(self._items),
+            "nbytes": self._nbytes,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                value = self._items[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            self._items[key] = value
+            self._sizes[key] = _nbytes(value)
+            self._nbytes += self._sizes[key]
+            while self._limit is not None and self._nbytes > self._limit:
+                self._remove(next(iter(self._items)))
+                self.evictions += 1
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        del self._items[key]
+        self._nbytes -= self._sizes.pop(key)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return "<ArrayCache limit={} nbytes={} items={}>".format(
+            self._limit, self._nbytes, len(self._items)
+        )
+
+
+_virtual_ids = itertools.count()
+
+
+class VirtualBuffers:
+    """
+    The buffers of a layout that is made by calling `generate` on demand,
+    keyed by the nodes of the expected `form`. If a `cache` is given, each
+    buffer is stored in it under `(cache_key, node, attribute)`, and a buffer
+    that has been evicted is regenerated when it is looked up again;
+    otherwise, they are generated once and kept.
+    """
+
+    def __init__(self, generate, form, length, cache, cache_key):
+        self._generate = generate
+        self._form = form
+        self._length = length
+        self._cache = cache
+        if cache_key is None:
+            cache_key = f"ak-virtual-{next(_virtual_ids)}"
+        self._cache_key = cache_key
+        self._kept = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return self._cache
+
+    @property
+    def cache_key(self):
+        return self._cache_key
+
+    def getkey(self, form, attribute):
+        # the same Form objects are used to read and to write the buffers
+        return (id(form), attribute)
+
+    def cachekey(self, key):
+        return (self._cache_key,) + key
+
+    def _store(self, out, key):
+        # The buffers after `key` (in the order of the form) are stored as
+        # the most recently used, nearest last, so that reading the nodes
+        # in order finds as many of them as the cache can hold. The buffer
+        # that was asked for is the most recent of all.
+        keys = list(out)
+        i = keys.index(key)
+        for k in keys[:i] + keys[:i:-1] + [key]:
+            self._cache[self.cachekey(k)] = out[k]
+
+    def _materialize(self):
+        layout = ak._v2.operations.convert.to_layout(
+            self._generate(), allow_record=False, allow_other=False
+        )
+        if layout.length != self._length:
+            raise ValueError(
+                "generated array has length {}, but the expected length is {}".format(
+                    layout.length, self._length
+                )
+            )
+        if not self._form.generated_compatibility(layout.form):
+            raise ValueError(
+                "generated array does not conform to the expected Form:\n\n{}\n\n"
+                "vs generated:\n\n{}".format(self._form, layout.form)
+            )
+
+        container = {}
+        layout._to_buffers(
+            self._form,
+            lambda layout, form, attribute: self.getkey(form, attribute),
+            container,
+            numpy,
+        )
+        return {k: numpy.ascontiguousarray(v) for k, v in container.items()}
+
+    def __getitem__(self, key):
+        if self._cache is None:
+            if self._kept is None:
+                with self._lock:
+                    if self._kept is None:
+                        self._kept = self._materialize()
+            return self._kept[key]
+
+        try:
+            return self._cache[self.cachekey(key)]
+        except KeyError:
+            pass
+
+        with self._lock:
+            # another thread may have generated it while this one waited
+            # (`in` doesn't count as a miss)
+            if self.cachekey(key) in self._cache:
+                try:
+                    return self._cache[self.cachekey(key)]
+                except KeyError:
+                    pass
+            out = self._materialize()
+            self._store(out, key)
+            return out[key]
@@ -0,0 +1,244 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import json
+import os
+import threading
+import time
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+
+class KernelEvent:
+    """
+    One call of a cpu-kernel, as recorded by #ak._v2._profiling.KernelProfiler.
+
+    Attributes:
+        name (str): Name of the kernel, such as `"awkward_ListArray_num"`.
+        types (tuple of str): Dtypes that specialize the kernel.
+        lengths (tuple of int): Length of each array argument, in order.
+        nbytes (int): Number of bytes in the array arguments that the kernel
+            writes to (the arrays allocated for its output).
+        start (float): `time.perf_counter()` when the kernel was called.
+        duration (float): Wall time spent in the kernel, in seconds.
+        thread (int): `threading.get_ident()` of the calling thread.
+        node (None or str): Class name of the #ak._v2.contents.Content that
+            checked the kernel's result, if any.
+        error (None or str): Error message returned by the kernel, if any.
+    """
+
+    __slots__ = [
+        "name",
+        "types",
+        "lengths",
+        "nbytes",
+        "start",
+        "duration",
+        "thread",
+        "node",
+        "error",
+    ]
+
+    def __init__(self, name, types, lengths, nbytes, start, duration, thread):
+        self.name = name
+        self.types = types
+        self.lengths = lengths
+        self.nbytes = nbytes
+        self.start = start
+        self.duration = duration
+        self.thread = thread
+        self.node = None
+        self.error = None
+
+    def __repr__(self):
+        return "<KernelEvent {}{} lengths={} {:.1f} us>".format(
+            self.name,
+            "".join(", " + x for x in self.types),
+            self.lengths,
+            self.duration * 1e6,
+        )
+
+
+class KernelProfiler:
+    """
+    Records every cpu-kernel called while it is active, as a list of
+    #ak._v2._profiling.KernelEvent.
+
+        >>> with ak._v2._profiling.KernelProfiler() as profiler:
+        ...     ak._v2.cartesian([one, two])
+        ...
+        >>> print(profiler.summary())
+
+    Profiling is opt-in: without an active KernelProfiler, kernel dispatch
+    only updates the counters in #ak.nplike.Numpy.kernel_stats. Profilers
+    can be nested and are shared by all threads.
+    """
+
+    def __init__(self):
+        self._events = []
+        self._last = {}
+        self._start = None
+
+    @property
+    def events(self):
+        return self._events
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        ak.nplike._profilers.append(self)
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        ak.nplike._profilers.remove(self)
+        self._last = {}
+
+    def clear(self):
+        self._events = []
+        self._last = {}
+
+    def _record(self, kernel, args, start, stop):
+        name_and_types = kernel._name_and_types
+        lengths = []
+        nbytes = 0
+        for x, direction in zip(args, kernel._directions):
+            if isinstance(x, numpy.ndarray):
+                lengths.append(len(x))
+                if direction == "out":
+                    nbytes += x.nbytes
+
+        thread = threading.get_ident()
+        event = KernelEvent(
+            name_and_types[0],
+            tuple(str(np.dtype(x)) for x in name_and_types[1:]),
+            tuple(lengths),
+            nbytes,
+            start,
+            stop - start,
+            thread,
+        )
+        self._events.append(event)
+        self._last[thread] = event
+
+    def _annotate(self, node, error):
+        event = self._last.pop(threading.get_ident(), None)
+        if event is not None:
+            event.node = type(node).__name__
+            if error.str is not None:
+                event.error = error.str.decode(errors="surrogateescape")
+
+    def totals(self):
+        """
+        Returns a list of dicts, one for each kernel and dtype signature, with
+        the number of `calls`, total `time` (seconds), total `nbytes` written,
+        and total `length` of array arguments, sorted by decreasing time.
+        """
+        totals = {}
+        for event in self._events:
+            key = (event.name, event.types)
+            total = totals.get(key)
+            if total is None:
+                total = totals[key] = {
+                    "name": event.name,
+                    "types": event.types,
+                    "calls": 0,
+                    "time": 0.0,
+                    "nbytes": 0,
+                    "length": 0,
+                }
+            total["calls"] += 1
+            total["time"] += event.duration
+            total["nbytes"] += event.nbytes
+            total["length"] += sum(event.lengths)
+
+        return sorted(totals.values(), key=lambda x: -x["time"])
+
+    def summary(self, limit=None):
+        """
+        Args:
+            limit (None or int): If not None, only show this many kernels.
+
+        Returns a table of the time spent in each kernel, as a string.
+        """
+        totals = self.totals()
+        if limit is not None:
+            totals = totals[:limit]
+
+        header = ("kernel", "calls", "time (ms)", "mean (us)", "nbytes out")
+        rows = [
+            (
+                total["name"] + "".join(", " + x for x in total["types"]),
+                str(total["calls"]),
+                "{:.3f}".format(total["time"] * 1e3),
+                "{:.1f}".format(total["time"] * 1e6 / total["calls"]),
+                str(total["nbytes"]),
+            )
+            for total in totals
+        ]
+        widths = [
+            max([len(header[i])] + [len(row[i]) for row in rows])
+            for i in range(len(header))
+        ]
+
+        def line(row):
+            return "  ".join(
+                x.ljust(w) if i == 0 else x.rjust(w)
+                for i, (x, w) in enumerate(zip(row, widths))
+            ).rstrip()
+
+        out = [line(header), line(["-" * w for w in widths])]
+        out.extend(line(row) for row in rows)
+        return "\n".join(out)
+
+    def to_chrome_trace(self, file=None):
+        """
+        Args:
+            file (None, str, Path, or file-like object): If not None, write
+                the trace to this file as JSON.
+
+        Returns the events in Chrome's Trace Event Format (a dict), which can
+        be viewed in `chrome://tracing` or https://ui.perfetto.dev.
+        """
+        if self._start is None:
+            origin = min((event.start for event in self._events), default=0.0)
+        else:
+            origin = self._start
+
+        pid = os.getpid()
+        trace = []
+        for event in self._events:
+            arguments = {
+                "types": list(event.types),
+                "lengths": list(event.lengths),
+                "nbytes": event.nbytes,
+            }
+            if event.node is not None:
+                arguments["node"] = event.node
+            if event.error is not None:
+                arguments["error"] = event.error
+            trace.append(
+                {
+                    "name": event.name,
+                    "cat": "kernel",
+                    "ph": "X",
+                    "ts": (event.start - origin) * 1e6,
+                    "dur": event.duration * 1e6,
+                    "pid": pid,
+                    "tid": event.thread,
+                    "args": arguments,
+                }
+            )
+
+        out = {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+        if file is not None:
+            is_path, file = ak._util.regularize_path(file)
+            if is_path or ak._v2._util.isstr(file):
+                with open(file, "w") as f:
+                    json.dump(out, f)
+            else:
+                json.dump(out, file)
+
+        return out
@@ -1,14 +1,167 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
 
+import concurrent.futures
+import os
+import threading
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+
+# Reductions of at least "min_length" values are split among "threads" threads
+# (None for os.cpu_count()); the kernels release the GIL while they run.
+parallel = {"threads": 1, "min_length": 1 << 20}
+
+# If True, reductions of a ListOffsetArray of NumpyArray at axis=-1 are computed
+# from the offsets with ufunc.reduceat (see Reducer.apply_segmented) instead of
+# making a parents array for the kernels. ufunc.reduceat has a per-list cost,
+# so it is only used if the lists have at least "segmented_min_mean_length"
+# values on average.
+segmented = True
+segmented_min_mean_length = 16
+
+_executor = None
+_executor_threads = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(threads):
+    global _executor, _executor_threads
+    with _executor_lock:
+        if _executor_threads != threads:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = concurrent.futures.ThreadPoolExecutor(threads)
+            _executor_threads = threads
+        return _executor
+
+
+def _threads():
+    threads = parallel["threads"]
+    if threads is None:
+        threads = os.cpu_count() or 1
+    return threads
+
+
+def _parallel_chunks(nplike, parents, outlength, threads):
+    # Splits parents into (start, stop, outstart, outstop) ranges that don't
+    # divide any output element, or returns None if it shouldn't be split.
+    if (
+        threads <= 1
+        or outlength == 0
+        or not isinstance(nplike, ak.nplike.Numpy)
+        or nplike.kernel_provider != "cpu"
+    ):
+        return None
+
+    length = len(parents)
+    if length < max(parallel["min_length"], threads):
+        return None
+
+    # only sorted parents can be split into independent ranges
+    if not numpy.all(parents[1:] >= parents[:-1]):
+        return None
+
+    guesses = (numpy.arange(1, threads, dtype=np.int64) * length) // threads
+    starts = numpy.unique(numpy.searchsorted(parents, parents[guesses], side="left"))
+    starts = starts[starts != 0].tolist()
+    if len(starts) == 0:
+        return None
+
+    bounds = [0] + starts + [length]
+    outbounds = [0] + parents[starts].tolist() + [outlength]
+    return list(zip(bounds[:-1], bounds[1:], outbounds[:-1], outbounds[1:]))
 
 
 class Reducer:
     needs_position = False
 
+    @classmethod
+    def apply_segmented(cls, array, offsets):
+        # Reduces each range of array (a 1-d, contiguous NumpyArray) between
+        # offsets (a NumPy array that starts at 0 and ends at its length), or
+        # returns None if this reducer or dtype has no segmented version.
+        return None
+
+    @classmethod
+    def _segmented(cls, array, offsets, ufunc, data, identity, dtype):
+        # same as the kernels: empty ranges get the identity
+        nplike = array.nplike
+        starts = offsets[:-1]
+        nonempty = offsets[1:] != starts
+        result = nplike.full(len(starts), identity, dtype=dtype)
+        if len(data) != 0:
+            result[nonempty] = nplike.reduceat(
+                ufunc, data, starts[nonempty], dtype=dtype
+            )
+        return result
+
+    @classmethod
+    def _can_segment(cls, array):
+        return (
+            array.dtype.kind in ("b", "i", "u", "f")
+            and isinstance(array.nplike, ak.nplike.Numpy)
+            and array.nplike.kernel_provider == "cpu"
+        )
+
+    @classmethod
+    def _long_enough(cls, array, offsets):
+        return array.length >= segmented_min_mean_length * (len(offsets) - 1)
+
+    @classmethod
+    def _apply_kernel(cls, array, kernel, result, data, parents, outlength, *args):
+        # Runs a reducer kernel, in parallel over sorted ranges of parents if
+        # the array is big enough (see ak._v2._reducers.parallel).
+        nplike = array.nplike
+        npparents = parents.to(nplike)
+        threads = _threads()
+        chunks = _parallel_chunks(nplike, npparents, outlength, threads)
+
+        if chunks is None:
+            if data is None:
+                error = kernel(result, npparents, parents.length, outlength, *args)
+            else:
+                error = kernel(
+                    result, data, npparents, parents.length, outlength, *args
+                )
+            array._handle_error(error)
+            return
+
+        # complex results have two numbers per output
+        width = len(result) // outlength
+
+        def task(chunk):
+            start, stop, outstart, outstop = chunk
+            localparents = npparents[start:stop] - outstart
+            out = result[outstart * width : outstop * width]
+            if data is None:
+                return kernel(
+                    out, localparents, stop - start, outstop - outstart, *args
+                )
+            else:
+                return kernel(
+                    out,
+                    data[start:stop],
+                    localparents,
+                    stop - start,
+                    outstop - outstart,
+                    *args,
+                )
+
+        errors = list(_get_executor(threads).map(task, chunks))
+        for error in errors:
+            array._handle_error(error)
+
+        if cls.needs_position:
+            # positions are relative to each range's start
+            for start, _stop, outstart, outstop in chunks:
+                if start != 0:
+                    out = result[outstart:outstop]
+                    out[out >= 0] += start
+
     @classmethod
     def return_dtype(cls, given_dtype):
         if (
@@ -64,34 +217,32 @@ class ArgMin(Reducer):
         dtype = cls.maybe_other_type(array.dtype)
         result = array.nplike.empty(outlength, dtype=np.int64)
         if array.dtype.type in (np.complex128, np.complex64):
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_argmin_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         else:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_argmin",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array.data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array.data,
+                parents,
+                outlength,
             )
         return ak._v2.contents.NumpyArray(result)
 
@@ -107,34 +258,32 @@ class ArgMax(Reducer):
         dtype = cls.maybe_other_type(array.dtype)
         result = array.nplike.empty(outlength, dtype=np.int64)
         if array.dtype.type in (np.complex128, np.complex64):
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_argmax_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         else:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_argmax",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         return ak._v2.contents.NumpyArray(result)
 
@@ -147,18 +296,26 @@ class Count(Reducer):
     def apply(cls, array, parents, outlength):
         assert isinstance(array, ak._v2.contents.NumpyArray)
         result = array.nplike.empty(outlength, dtype=np.int64)
-        array._handle_error(
+        cls._apply_kernel(
+            array,
             array.nplike[
                 "awkward_reduce_count_64", result.dtype.type, parents.dtype.type
-            ](
-                result,
-                parents.to(array.nplike),
-                parents.length,
-                outlength,
-            )
+            ],
+            result,
+            None,
+            parents,
+            outlength,
         )
         return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def apply_segmented(cls, array, offsets):
+        if not cls._can_segment(array):
+            return None
+        return ak._v2.contents.NumpyArray(
+            array.nplike.asarray(offsets[1:] - offsets[:-1], dtype=np.int64)
+        )
+
 
 class CountNonzero(Reducer):
     name = "count_nonzero"
@@ -170,34 +327,32 @@ class CountNonzero(Reducer):
         dtype = np.dtype(np.int64) if array.dtype.kind.upper() == "M" else array.dtype
         result = array.nplike.empty(outlength, dtype=np.int64)
         if array.dtype.type in (np.complex128, np.complex64):
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_countnonzero_complex",
                     result.dtype.type,
                     cls.return_dtype(array.dtype),
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         else:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_countnonzero",
                     result.dtype.type,
                     dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         return ak._v2.contents.NumpyArray(result)
 
@@ -220,66 +375,62 @@ class Sum(Reducer):
 
         if array.dtype == np.bool_:
             if result.dtype in (np.int64, np.uint64):
-                array._handle_error(
+                cls._apply_kernel(
+                    array,
                     array.nplike[
                         "awkward_reduce_sum_int64_bool_64",
                         np.int64,
                         array.dtype.type,
                         parents.dtype.type,
-                    ](
-                        result,
-                        array._data,
-                        parents.to(array.nplike),
-                        parents.length,
-                        outlength,
-                    )
+                    ],
+                    result,
+                    array._data,
+                    parents,
+                    outlength,
                 )
             elif result.dtype in (np.int32, np.uint32):
-                array._handle_error(
+                cls._apply_kernel(
+                    array,
                     array.nplike[
                         "awkward_reduce_sum_int32_bool_64",
                         np.int32,
                         array.dtype.type,
                         parents.dtype.type,
-                    ](
-                        result,
-                        array._data,
-                        parents.to(array.nplike),
-                        parents.length,
-                        outlength,
-                    )
+                    ],
+                    result,
+                    array._data,
+                    parents,
+                    outlength,
                 )
             else:
                 raise NotImplementedError
         elif array.dtype.type in (np.complex128, np.complex64):
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_sum_complex",
                     result.dtype.type,
                     np.float64 if array.dtype.type == np.complex128 else np.float32,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         else:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_sum",
                     result.dtype.type,
                     np.int64 if array.dtype.kind == "m" else array.dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
 
         if array.dtype.kind == "m":
@@ -289,6 +440,15 @@ class Sum(Reducer):
         else:
             return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def apply_segmented(cls, array, offsets):
+        if not cls._can_segment(array) or not cls._long_enough(array, offsets):
+            return None
+        dtype = cls.return_dtype(array.dtype)
+        return ak._v2.contents.NumpyArray(
+            cls._segmented(array, offsets, "add", array.data, 0, dtype)
+        )
+
 
 class Prod(Reducer):
     name = "prod"
@@ -304,55 +464,64 @@ class Prod(Reducer):
             dtype=cls.return_dtype(array.dtype),
         )
         if array.dtype == np.bool_:
-            array._handle_error(
+            # the kernel's output is bool, not the integer result type
+            boolresult = array.nplike.empty(outlength, dtype=np.bool_)
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_prod_bool",
                     array.dtype.type,
                     array.dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                boolresult,
+                array._data,
+                parents,
+                outlength,
             )
+            result = array.nplike.asarray(boolresult, dtype=result.dtype)
         elif array.dtype.type in (np.complex128, np.complex64):
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_prod_complex",
                     result.dtype.type,
                     np.float64 if array.dtype.type == np.complex128 else np.float32,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         else:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_prod",
                     result.dtype.type,
                     array.dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         if array.dtype.type in (np.complex128, np.complex64):
             return ak._v2.contents.NumpyArray(result.view(array.dtype))
         else:
             return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def apply_segmented(cls, array, offsets):
+        if not cls._can_segment(array) or not cls._long_enough(array, offsets):
+            return None
+        dtype = cls.return_dtype(array.dtype)
+        return ak._v2.contents.NumpyArray(
+            cls._segmented(array, offsets, "multiply", array.data, 1, dtype)
+        )
+
 
 class Any(Reducer):
     name = "any"
@@ -364,37 +533,45 @@ class Any(Reducer):
         dtype = cls.maybe_other_type(array.dtype)
         result = array.nplike.empty(outlength, dtype=np.bool_)
         if array.dtype.type in (np.complex128, np.complex64):
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_sum_bool_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         else:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_sum_bool",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def apply_segmented(cls, array, offsets):
+        if not cls._can_segment(array) or not cls._long_enough(array, offsets):
+            return None
+        return ak._v2.contents.NumpyArray(
+            cls._segmented(
+                array, offsets, "logical_or", array.data != 0, False, np.bool_
+            )
+        )
+
 
 class All(Reducer):
     name = "all"
@@ -406,37 +583,45 @@ class All(Reducer):
         dtype = cls.maybe_other_type(array.dtype)
         result = array.nplike.empty(outlength, dtype=np.bool_)
         if array.dtype.type in (np.complex128, np.complex64):
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_prod_bool_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         else:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_prod_bool",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         return ak._v2.contents.NumpyArray(result)
 
+    @classmethod
+    def apply_segmented(cls, array, offsets):
+        if not cls._can_segment(array) or not cls._long_enough(array, offsets):
+            return None
+        return ak._v2.contents.NumpyArray(
+            cls._segmented(
+                array, offsets, "logical_and", array.data != 0, True, np.bool_
+            )
+        )
+
 
 class Min(Reducer):
     name = "min"
@@ -476,51 +661,48 @@ class Min(Reducer):
             cls.maybe_double_length(array.dtype.type, outlength), dtype=dtype
         )
         if array.dtype == np.bool_:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_prod_bool",
                     result.dtype.type,
                     array.dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         elif array.dtype.type in (np.complex128, np.complex64):
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_min_complex",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                    cls._min_initial(cls.initial, dtype),
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
+                cls._min_initial(cls.initial, dtype),
             )
         else:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_min",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                    cls._min_initial(cls.initial, dtype),
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
+                cls._min_initial(cls.initial, dtype),
             )
         if array.dtype.type in (np.complex128, np.complex64):
             return ak._v2.contents.NumpyArray(
@@ -529,6 +711,22 @@ class Min(Reducer):
         else:
             return ak._v2.contents.NumpyArray(array.nplike.array(result, array.dtype))
 
+    @classmethod
+    def apply_segmented(cls, array, offsets):
+        if (
+            not cls._can_segment(array)
+            or not cls._long_enough(array, offsets)
+            or array.dtype == np.bool_
+        ):
+            return None
+        identity = cls._min_initial(cls.initial, array.dtype.type)
+        # like the kernels, NaN never replaces the identity
+        result = cls._segmented(
+            array, offsets, "fmin", array.data, identity, array.dtype
+        )
+        result = array.nplike.where(result < identity, result, identity)
+        return ak._v2.contents.NumpyArray(array.nplike.asarray(result, array.dtype))
+
 
 class Max(Reducer):
     name = "max"
@@ -568,51 +766,48 @@ class Max(Reducer):
             cls.maybe_double_length(array.dtype.type, outlength), dtype=dtype
         )
         if array.dtype == np.bool_:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_sum_bool",
                     result.dtype.type,
                     array.dtype.type,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
             )
         elif array.dtype.type in (np.complex128, np.complex64):
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_max_complex",
                     dtype,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                    cls._max_initial(cls.initial, dtype),
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
+                cls._max_initial(cls.initial, dtype),
             )
         else:
-            array._handle_error(
+            cls._apply_kernel(
+                array,
                 array.nplike[
                     "awkward_reduce_max",
                     result.dtype.type,
                     dtype,
                     parents.dtype.type,
-                ](
-                    result,
-                    array._data,
-                    parents.to(array.nplike),
-                    parents.length,
-                    outlength,
-                    cls._max_initial(cls.initial, dtype),
-                )
+                ],
+                result,
+                array._data,
+                parents,
+                outlength,
+                cls._max_initial(cls.initial, dtype),
             )
         if array.dtype.type in (np.complex128, np.complex64):
             return ak._v2.contents.NumpyArray(
@@ -620,3 +815,19 @@ class Max(Reducer):
             )
         else:
             return ak._v2.contents.NumpyArray(array.nplike.array(result, array.dtype))
+
+    @classmethod
+    def apply_segmented(cls, array, offsets):
+        if (
+            not cls._can_segment(array)
+            or not cls._long_enough(array, offsets)
+            or array.dtype == np.bool_
+        ):
+            return None
+        identity = cls._max_initial(cls.initial, array.dtype.type)
+        # like the kernels, NaN never replaces the identity
+        result = cls._segmented(
+            array, offsets, "fmax", array.data, identity, array.dtype
+        )
+        result = array.nplike.where(result > identity, result, identity)
+        return ak._v2.contents.NumpyArray(array.nplike.asarray(result, array.dtype))
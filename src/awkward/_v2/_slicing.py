@@ -60,8 +60,9 @@ def getitem_broadcast(items):
                     out[-1].metadata["shape"] = x.shape
                 elif issubclass(x.dtype.type, (np.bool_, bool)):
                     if len(x.shape) == 1:
-                        out.append(ak._v2.index.Index64(nplike.nonzero(x)[0]))
-                        out[-1].metadata["shape"] = x.shape
+                        nonzero = nplike.nonzero(x)[0]
+                        out.append(ak._v2.index.Index64(nonzero))
+                        out[-1].metadata["shape"] = nonzero.shape
                     else:
                         for w in nplike.nonzero(x):
                             out.append(ak._v2.index.Index64(w))
@@ -287,6 +288,21 @@ def prepare_tuple_nested(item):
 
 
 def prepare_tuple_bool_to_int(item):
+    if (
+        isinstance(item, ak._v2.contents.ListOffsetArray)
+        and item.nplike.known_data
+        and (item.offsets[0] != 0 or item.offsets[-1] != item.content.length)
+    ):
+        # the booleans have to line up with item.localindex(axis=1)
+        item = item.toListOffsetArray64(True)
+        item = ak._v2.contents.ListOffsetArray(
+            item.offsets,
+            item.content[: item.offsets[-1]],
+            item.identifier,
+            item.parameters,
+            item.nplike,
+        )
+
     if (
         isinstance(item, ak._v2.contents.ListOffsetArray)
         and isinstance(item.content, ak._v2.contents.NumpyArray)
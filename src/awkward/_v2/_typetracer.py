@@ -2,6 +2,9 @@
 
 
 import numbers
+import operator
+from collections.abc import Iterable
+from functools import reduce
 
 import numpy
 
@@ -22,6 +25,7 @@ class NoError:
 
 class NoKernel:
     def __call__(self, *args):
+        touch_data(args)
         return NoError()
 
 
@@ -78,6 +82,8 @@ UnknownLength = UnknownLengthType()
 def _emptyarray(x):
     if isinstance(x, UnknownScalar):
         return numpy.empty(0, x._dtype)
+    elif isinstance(x, UnknownLengthType):
+        return numpy.empty(0, np.int64)
     elif hasattr(x, "dtype"):
         return numpy.empty(0, x.dtype)
     else:
@@ -174,6 +180,64 @@ class OneOf:
         return f"OneOf({self._contents!r})"
 
 
+class TypeTracerReport:
+    """
+    Records which of the buffers of a layout made by #typetracer_with_report
+    have been needed by an operation, identified by the `form_key` of the
+    node they belong to.
+
+    Buffers are only "touched" when an operation needs their values (such as
+    offsets to find the elements of a list or data to compute a ufunc), not
+    when it only needs their type or passes them through unchanged (such as
+    projecting a record field or slicing a range).
+    """
+
+    def __init__(self):
+        self._data_touched = []
+        self._data_touched_set = set()
+
+    def __repr__(self):
+        return f"<TypeTracerReport with {len(self._data_touched)} data touched>"
+
+    def touch_data(self, form_key):
+        if form_key is not None and form_key not in self._data_touched_set:
+            self._data_touched.append(form_key)
+            self._data_touched_set.add(form_key)
+
+    @property
+    def data_touched(self):
+        """
+        List of `form_keys` whose buffers have been touched, in the order in
+        which they were first touched.
+        """
+        return list(self._data_touched)
+
+
+def touch_data(array):
+    """
+    Touches a #TypeTracerArray, or all of the buffers in a layout, including
+    the ones that an operation passed through to its output without reading.
+    """
+    if isinstance(array, TypeTracerArray):
+        array.touch_data()
+    elif isinstance(array, (list, tuple)):
+        for x in array:
+            touch_data(x)
+    elif isinstance(array, (ak._v2.highlevel.Array, ak._v2.highlevel.Record)):
+        touch_data(array.layout)
+    elif isinstance(array, ak._v2.record.Record):
+        touch_data(array.array)
+    elif isinstance(array, ak._v2.contents.Content):
+        container = {}
+        array._to_buffers(
+            array.form_with_key(),
+            lambda layout, form, attribute: (form.form_key, attribute),
+            container,
+            array.nplike,
+        )
+        touch_data(list(container.values()))
+
+
 def _length_after_slice(slice, original_length):
     start, stop, step = slice.indices(original_length)
     assert step != 0
@@ -188,20 +252,52 @@ def _length_after_slice(slice, original_length):
 class TypeTracerArray:
     @classmethod
     def from_array(cls, array, dtype=None):
-        if isinstance(array, ak._v2.index.Index):
-            array = array.data
+        if isinstance(array, (ak._v2.index.Index, ak._v2.contents.NumpyArray)):
+            array = array.to(TypeTracer.instance())
+        elif not isinstance(array, ak._v2._lazy.DeferredBuffer) and not hasattr(
+            array, "shape"
+        ):
+            array = numpy.asarray(array)
 
         if dtype is None:
             dtype = array.dtype
 
-        shape = list(array.shape)
-        shape[0] = UnknownLength
+        if isinstance(array, ak._v2._lazy.DeferredBuffer):
+            shape = [UnknownLength] + list(array.inner_shape)
+        else:
+            shape = list(array.shape)
+            if len(shape) != 0:
+                shape[0] = UnknownLength
+
+        if isinstance(array, TypeTracerArray):
+            if np.dtype(dtype) == array.dtype:
+                return cls(dtype, shape, array._form_key, array._report)
+            else:
+                array.touch_data()
 
         return cls(dtype, shape=shape)
 
-    def __init__(self, dtype, shape=None):
+    def __init__(self, dtype, shape=None, form_key=None, report=None):
         self._dtype = np.dtype(dtype)
         self.shape = shape
+        self._form_key = form_key
+        self._report = report
+
+    @property
+    def form_key(self):
+        return self._form_key
+
+    @property
+    def report(self):
+        return self._report
+
+    def touch_data(self):
+        if self._report is not None:
+            self._report.touch_data(self._form_key)
+
+    def _view(self, dtype, shape):
+        # same buffer, so touching the result touches this one
+        return TypeTracerArray(dtype, shape, self._form_key, self._report)
 
     def __repr__(self):
         dtype = repr(self._dtype)
@@ -273,9 +369,12 @@ class TypeTracerArray:
         )
 
     def __setitem__(self, where, what):
-        raise AssertionError(
-            "bug in Awkward Array: attempt to set values of a TypeTracerArray"
-        )
+        # the values are still unknown afterward, but they must fit
+        existing = self.__getitem__(where)
+        if isinstance(what, TypeTracerArray) and isinstance(existing, TypeTracerArray):
+            if what.ndim > existing.ndim:
+                raise ValueError("cannot assign an array to a lower-dimensional slice")
+        touch_data(what)
 
     def __getitem__(self, where):
         if isinstance(where, tuple):
@@ -288,17 +387,17 @@ class TypeTracerArray:
                 missing = max(0, len(self._shape) - (len(before) + len(after)))
                 where = before + (slice(None, None, None),) * missing + after
 
-        if ak._v2._util.isint(where):
+        if ak._v2._util.isint(where) or isinstance(
+            where, (UnknownLengthType, UnknownScalar)
+        ):
             if len(self._shape) == 1:
-                if where == 0:
-                    return UnknownScalar(self._dtype)
-                else:
-                    return UnknownScalar(self._dtype)
+                self.touch_data()
+                return UnknownScalar(self._dtype)
             else:
-                return TypeTracerArray(self._dtype, self._shape[1:])
+                return self._view(self._dtype, self._shape[1:])
 
         elif isinstance(where, slice):
-            return TypeTracerArray(self._dtype, (UnknownLength,) + self._shape[1:])
+            return self._view(self._dtype, (UnknownLength,) + self._shape[1:])
 
         elif (
             hasattr(where, "dtype")
@@ -306,6 +405,7 @@ class TypeTracerArray:
             and issubclass(where.dtype.type, np.integer)
         ):
             assert len(self._shape) != 0
+            touch_data((self, where))
             return TypeTracerArray(self._dtype, where.shape + self._shape[1:])
 
         elif (
@@ -314,11 +414,13 @@ class TypeTracerArray:
             and issubclass(where.dtype.type, (np.bool_, bool))
         ):
             assert len(self._shape) != 0
+            touch_data((self, where))
             return TypeTracerArray(self._dtype, (UnknownLength,) + self._shape[1:])
 
         elif isinstance(where, tuple) and any(
             hasattr(x, "dtype") and hasattr(x, "shape") for x in where
         ):
+            touch_data((self,) + where)
             for num_basic, wh in enumerate(where):  # noqa: B007
                 if not isinstance(wh, slice):
                     break
@@ -373,31 +475,82 @@ class TypeTracerArray:
                     raise NotImplementedError(repr(wh))
 
             shape = (next._shape[0],) + tuple(after_shape)
-            return TypeTracerArray(self._dtype, shape)
+            return self._view(self._dtype, shape)
 
         else:
             raise NotImplementedError(repr(where))
 
+    def __add__(self, other):
+        return _apply_ufunc(numpy.add, (self, other), {})
+
+    def __radd__(self, other):
+        return _apply_ufunc(numpy.add, (other, self), {})
+
+    def __sub__(self, other):
+        return _apply_ufunc(numpy.subtract, (self, other), {})
+
+    def __rsub__(self, other):
+        return _apply_ufunc(numpy.subtract, (other, self), {})
+
+    def __mul__(self, other):
+        return _apply_ufunc(numpy.multiply, (self, other), {})
+
+    def __rmul__(self, other):
+        return _apply_ufunc(numpy.multiply, (other, self), {})
+
+    def __truediv__(self, other):
+        return _apply_ufunc(numpy.true_divide, (self, other), {})
+
+    def __floordiv__(self, other):
+        return _apply_ufunc(numpy.floor_divide, (self, other), {})
+
+    def __and__(self, other):
+        return _apply_ufunc(numpy.bitwise_and, (self, other), {})
+
+    def __or__(self, other):
+        return _apply_ufunc(numpy.bitwise_or, (self, other), {})
+
+    def __invert__(self):
+        return _apply_ufunc(numpy.invert, (self,), {})
+
+    def __eq__(self, other):
+        if isinstance(other, numbers.Real):
+            self.touch_data()
+            return TypeTracerArray(np.bool_, self._shape)
+        else:
+            return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, numbers.Real):
+            self.touch_data()
+            return TypeTracerArray(np.bool_, self._shape)
+        else:
+            return NotImplemented
+
     def __lt__(self, other):
         if isinstance(other, numbers.Real):
+            self.touch_data()
             return TypeTracerArray(np.bool_, self._shape)
         else:
             return NotImplemented
 
     def __le__(self, other):
         if isinstance(other, numbers.Real):
+            self.touch_data()
             return TypeTracerArray(np.bool_, self._shape)
         else:
             return NotImplemented
 
     def __gt__(self, other):
         if isinstance(other, numbers.Real):
+            self.touch_data()
             return TypeTracerArray(np.bool_, self._shape)
         else:
             return NotImplemented
 
     def __ge__(self, other):
         if isinstance(other, numbers.Real):
+            self.touch_data()
             return TypeTracerArray(np.bool_, self._shape)
         else:
             return NotImplemented
@@ -411,7 +564,20 @@ class TypeTracerArray:
         assert all(ak._v2._util.isint(x) for x in args[1:])
         assert all(x >= 0 for x in args[1:])
 
-        return TypeTracerArray(self._dtype, (UnknownLength,) + args[1:])
+        return self._view(self._dtype, (UnknownLength,) + args[1:])
+
+    def view(self, dtype):
+        dtype = np.dtype(dtype)
+        if len(self._shape) > 1 and dtype.itemsize != self._dtype.itemsize:
+            last = self._shape[-1] * self._dtype.itemsize // dtype.itemsize
+            return self._view(dtype, self._shape[:-1] + (last,))
+        return self._view(dtype, self._shape)
+
+    def astype(self, dtype, **kwargs):
+        if np.dtype(dtype) == self._dtype:
+            return self._view(self._dtype, self._shape)
+        self.touch_data()
+        return TypeTracerArray(dtype, self._shape)
 
     def copy(self):
         return self
@@ -420,12 +586,70 @@ class TypeTracerArray:
 unset = object()
 
 
+def _dtype_arg(x):
+    # stand-in for an argument of a NumPy function, to find the result's dtype
+    if isinstance(x, (TypeTracerArray, UnknownScalar, UnknownLengthType)):
+        return _emptyarray(x)
+    else:
+        return x
+
+
+def _apply_ufunc(ufunc, args, kwargs):
+    touch_data(args)
+    out = kwargs.pop("out", None)
+    dtype = ufunc(*[_dtype_arg(x) for x in args], **kwargs).dtype
+    if out is not None:
+        return out
+    arrays = [x for x in args if isinstance(x, TypeTracerArray)]
+    if len(arrays) == 0:
+        return UnknownScalar(dtype)
+    shape = TypeTracer.instance().broadcast_arrays(*arrays)[0].shape
+    return TypeTracerArray(dtype, shape)
+
+
+def _apply_reducer(dtype, array, axis=None, keepdims=False):
+    touch_data(array)
+    if axis is None:
+        if keepdims:
+            return TypeTracerArray(dtype, (1,) * array.ndim)
+        else:
+            return UnknownScalar(dtype)
+    else:
+        shape = list(array.shape)
+        if keepdims:
+            shape[axis] = 1
+        else:
+            del shape[axis]
+        if len(shape) == 0:
+            return UnknownScalar(dtype)
+        else:
+            return TypeTracerArray(dtype, shape)
+
+
 class TypeTracer(ak.nplike.NumpyLike):
     known_data = False
     known_shape = False
 
     def to_rectilinear(self, array, *args, **kwargs):
-        raise NotImplementedError
+        if isinstance(array, TypeTracerArray):
+            return array
+
+        elif isinstance(
+            array,
+            (
+                ak._v2.highlevel.Array,
+                ak._v2.highlevel.Record,
+                ak._v2.contents.Content,
+                ak._v2.record.Record,
+            ),
+        ):
+            return ak._v2.operations.convert.to_numpy(array, *args, **kwargs)
+
+        elif isinstance(array, Iterable):
+            return [self.to_rectilinear(x, *args, **kwargs) for x in array]
+
+        else:
+            raise TypeError("to_rectilinear argument must be iterable")
 
     def __getitem__(self, name_and_types):
         return NoKernel()
@@ -447,27 +671,30 @@ class TypeTracer(ak.nplike.NumpyLike):
     def array(self, data, dtype=unset, **kwargs):
         # data[, dtype=[, copy=]]
         if dtype is unset:
-            dtype = data.dtype
+            dtype = None
         return TypeTracerArray.from_array(data, dtype=dtype)
 
     def asarray(self, array, dtype=unset, **kwargs):
         # array[, dtype=][, order=]
         if dtype is unset:
-            dtype = array.dtype
+            dtype = None
         return TypeTracerArray.from_array(array, dtype=dtype)
 
     def ascontiguousarray(self, array, dtype=unset, **kwargs):
         # array[, dtype=]
         if dtype is unset:
-            dtype = array.dtype
+            dtype = None
         return TypeTracerArray.from_array(array, dtype=dtype)
 
-    def isscalar(self, *args, **kwargs):
-        raise NotImplementedError
+    def isscalar(self, x):
+        return isinstance(x, UnknownScalar) or numpy.isscalar(x)
 
-    def frombuffer(self, *args, **kwargs):
+    def frombuffer(self, buffer, dtype=np.float64, count=-1, offset=0):
         # array[, dtype=]
-        raise NotImplementedError
+        if isinstance(buffer, TypeTracerArray):
+            return buffer._view(dtype, (UnknownLength,))
+        else:
+            return TypeTracerArray(dtype, (UnknownLength,))
 
     def zeros(self, shape, dtype=np.float64, **kwargs):
         # shape/len[, dtype=]
@@ -487,49 +714,63 @@ class TypeTracer(ak.nplike.NumpyLike):
             dtype = numpy.array(value).dtype
         return TypeTracerArray(dtype, shape)
 
-    def zeros_like(self, *args, **kwargs):
+    def zeros_like(self, array, dtype=None, **kwargs):
         # array
-        raise NotImplementedError
+        return TypeTracerArray(array.dtype if dtype is None else dtype, array.shape)
 
-    def ones_like(self, *args, **kwargs):
+    def ones_like(self, array, dtype=None, **kwargs):
         # array
-        raise NotImplementedError
+        return TypeTracerArray(array.dtype if dtype is None else dtype, array.shape)
 
-    def full_like(self, *args, **kwargs):
+    def full_like(self, array, fill_value, dtype=None, **kwargs):
         # array, fill_value
-        raise NotImplementedError
+        return TypeTracerArray(array.dtype if dtype is None else dtype, array.shape)
 
     def arange(self, *args, **kwargs):
         # stop[, dtype=]
         # start, stop[, dtype=]
         # start, stop, step[, dtype=]
-        raise NotImplementedError
+        dtype = kwargs.get("dtype", None)
+        if dtype is None:
+            dtype = numpy.result_type(*[_emptyarray(x) for x in args])
+        return TypeTracerArray(dtype, (UnknownLength,))
 
-    def meshgrid(self, *args, **kwargs):
+    def meshgrid(self, *arrays, **kwargs):
         # *arrays, indexing="ij"
-        raise NotImplementedError
+        touch_data(arrays)
+        shape = (UnknownLength,) * len(arrays)
+        return [TypeTracerArray(x.dtype, shape) for x in arrays]
 
     ############################ testing
 
-    def shape(self, *args, **kwargs):
+    def shape(self, array):
         # array
-        raise NotImplementedError
+        return array.shape
 
-    def array_equal(self, *args, **kwargs):
+    def array_equal(self, array1, array2):
         # array1, array2
+        touch_data((array1, array2))
         return False
 
-    def size(self, *args, **kwargs):
+    def size(self, array, axis=None):
         # array
-        raise NotImplementedError
+        if axis is None:
+            return reduce(operator.mul, array.shape, 1)
+        else:
+            return array.shape[axis]
 
-    def searchsorted(self, *args, **kwargs):
+    def searchsorted(self, haystack, needle, side="left", **kwargs):
         # haystack, needle, side="right"
-        raise NotImplementedError
+        touch_data((haystack, needle))
+        if isinstance(needle, TypeTracerArray):
+            return TypeTracerArray(np.int64, needle.shape)
+        else:
+            return UnknownScalar(np.dtype(np.int64))
 
-    def argsort(self, *args, **kwargs):
+    def argsort(self, array, *args, **kwargs):
         # array
-        raise NotImplementedError
+        touch_data(array)
+        return TypeTracerArray(np.int64, array.shape)
 
     ############################ manipulation
 
@@ -568,30 +809,57 @@ class TypeTracer(ak.nplike.NumpyLike):
                     )
 
         return [
-            TypeTracerArray(x.dtype, [UnknownLength] + shape) for x in [first] + rest
+            x._view(x.dtype, [UnknownLength] + shape)
+            if isinstance(x, TypeTracerArray)
+            else TypeTracerArray(x.dtype, [UnknownLength] + shape)
+            for x in [first] + rest
         ]
 
-    def add(self, *args, **kwargs):
-        # array1, array2[, out=]
-        raise NotImplementedError
-
-    def cumsum(self, *args, **kwargs):
+    def cumsum(self, array, axis=None, dtype=None, out=None):
         # arrays[, out=]
-        raise NotImplementedError
+        touch_data(array)
+        if out is not None:
+            return out
+        if dtype is None:
+            dtype = numpy.cumsum(_emptyarray(array)).dtype
+        if axis is None:
+            return TypeTracerArray(dtype, (UnknownLength,))
+        else:
+            return TypeTracerArray(dtype, array.shape)
 
-    def cumprod(self, *args, **kwargs):
+    def cumprod(self, array, axis=None, dtype=None, out=None):
         # arrays[, out=]
-        raise NotImplementedError
+        touch_data(array)
+        if out is not None:
+            return out
+        if dtype is None:
+            dtype = numpy.cumprod(_emptyarray(array)).dtype
+        if axis is None:
+            return TypeTracerArray(dtype, (UnknownLength,))
+        else:
+            return TypeTracerArray(dtype, array.shape)
 
     def nonzero(self, array):
         # array
+        touch_data(array)
         return (TypeTracerArray(np.int64, (UnknownLength,)),) * len(array.shape)
 
-    def unique(self, *args, **kwargs):
+    def unique(
+        self, array, return_index=False, return_inverse=False, return_counts=False
+    ):
         # array
-        raise NotImplementedError
+        touch_data(array)
+        out = [TypeTracerArray(array.dtype, (UnknownLength,))]
+        for flag in (return_index, return_inverse, return_counts):
+            if flag:
+                out.append(TypeTracerArray(np.int64, (UnknownLength,)))
+        if len(out) == 1:
+            return out[0]
+        else:
+            return tuple(out)
 
     def concatenate(self, arrays):
+        touch_data(arrays)
         inner_shape = None
         emptyarrays = []
         for x in arrays:
@@ -612,120 +880,208 @@ class TypeTracer(ak.nplike.NumpyLike):
             numpy.concatenate(emptyarrays).dtype, (UnknownLength,) + inner_shape
         )
 
-    def repeat(self, *args, **kwargs):
+    def repeat(self, array, repeats, axis=None):
         # array, int
         # array1, array2
-        raise NotImplementedError
+        touch_data((array, repeats))
+        dtype = _emptyarray(array).dtype
+        if axis is None:
+            return TypeTracerArray(dtype, (UnknownLength,))
+        else:
+            return TypeTracerArray(dtype, array.shape)
 
-    def stack(self, *args, **kwargs):
+    def stack(self, arrays, axis=0):
         # arrays
-        raise NotImplementedError
+        touch_data(arrays)
+        if len(arrays) == 0:
+            raise ValueError("need at least one array to stack")
+        dtype = numpy.result_type(*[_emptyarray(x) for x in arrays])
+        shape = list(numpy.shape(arrays[0]))
+        shape.insert(axis if axis >= 0 else len(shape) + axis + 1, len(arrays))
+        return TypeTracerArray(dtype, shape)
 
-    def vstack(self, *args, **kwargs):
+    def vstack(self, arrays):
         # arrays
-        raise NotImplementedError
+        if all(len(numpy.shape(x)) <= 1 for x in arrays):
+            return self.stack(arrays)
+        else:
+            return self.concatenate(arrays)
 
-    def packbits(self, *args, **kwargs):
+    def packbits(self, array, *args, **kwargs):
         # array
-        raise NotImplementedError
+        touch_data(array)
+        return TypeTracerArray(np.uint8, (UnknownLength,))
 
-    def unpackbits(self, *args, **kwargs):
+    def unpackbits(self, array, *args, **kwargs):
         # array
-        raise NotImplementedError
+        touch_data(array)
+        return TypeTracerArray(np.uint8, (UnknownLength,))
 
-    def atleast_1d(self, *args, **kwargs):
+    def atleast_1d(self, *arrays):
         # *arrays
-        raise NotImplementedError
+        out = []
+        for x in arrays:
+            if isinstance(x, TypeTracerArray):
+                out.append(x._view(x.dtype, x.shape if x.ndim != 0 else None))
+            else:
+                out.append(TypeTracerArray(_emptyarray(x).dtype, (UnknownLength,)))
+        if len(out) == 1:
+            return out[0]
+        else:
+            return out
 
-    def broadcast_to(self, *args, **kwargs):
+    def broadcast_to(self, array, shape):
         # array, shape
-        raise NotImplementedError
+        if isinstance(array, TypeTracerArray):
+            return array._view(array.dtype, shape)
+        else:
+            return TypeTracerArray(_emptyarray(array).dtype, shape)
 
-    def append(self, *args, **kwargs):
+    def append(self, array, values, axis=None):
         # array, element
-        raise NotImplementedError
+        touch_data((array, values))
+        dtype = numpy.append(_emptyarray(array), _emptyarray(values)).dtype
+        if axis is None:
+            return TypeTracerArray(dtype, (UnknownLength,))
+        else:
+            return TypeTracerArray(dtype, array.shape)
 
-    def where(self, *args, **kwargs):
+    def where(self, condition, *args):
         # array, element
-        raise NotImplementedError
+        if len(args) == 0:
+            return self.nonzero(condition)
+        return _apply_ufunc(
+            lambda c, x, y: numpy.where(numpy.asarray(c, np.bool_), x, y),
+            (condition,) + args,
+            {},
+        )
 
     ############################ ufuncs
 
+    def add(self, *args, **kwargs):
+        # array1, array2[, out=]
+        return _apply_ufunc(numpy.add, args, kwargs)
+
+    def multiply(self, *args, **kwargs):
+        # array1, array2
+        return _apply_ufunc(numpy.multiply, args, kwargs)
+
+    def logical_or(self, *args, **kwargs):
+        # array1, array2
+        return _apply_ufunc(numpy.logical_or, args, kwargs)
+
+    def logical_and(self, *args, **kwargs):
+        # array1, array2
+        return _apply_ufunc(numpy.logical_and, args, kwargs)
+
+    def reduceat(self, ufunc, array, indices, dtype=None, **kwargs):
+        # ufunc name, array, indices[, dtype=]
+        touch_data((array, indices))
+        if dtype is None:
+            dtype = array.dtype
+        return TypeTracerArray(dtype, (UnknownLength,) + array.shape[1:])
+
     def sqrt(self, *args, **kwargs):
         # array
-        raise NotImplementedError
+        return _apply_ufunc(numpy.sqrt, args, kwargs)
 
     def exp(self, *args, **kwargs):
         # array
-        raise NotImplementedError
+        return _apply_ufunc(numpy.exp, args, kwargs)
 
     def true_divide(self, *args, **kwargs):
         # array1, array2
-        raise NotImplementedError
+        return _apply_ufunc(numpy.true_divide, args, kwargs)
 
     def bitwise_or(self, *args, **kwargs):
         # array1, array2[, out=output]
-        raise NotImplementedError
-
-    def logical_and(self, *args, **kwargs):
-        # array1, array2
-        raise NotImplementedError
+        return _apply_ufunc(numpy.bitwise_or, args, kwargs)
 
     def equal(self, *args, **kwargs):
         # array1, array2
-        raise NotImplementedError
+        return _apply_ufunc(numpy.equal, args, kwargs)
 
     def ceil(self, *args, **kwargs):
         # array
-        raise NotImplementedError
+        return _apply_ufunc(numpy.ceil, args, kwargs)
+
+    def minimum(self, *args, **kwargs):
+        # array1, array2
+        return _apply_ufunc(numpy.minimum, args, kwargs)
+
+    def maximum(self, *args, **kwargs):
+        # array1, array2
+        return _apply_ufunc(numpy.maximum, args, kwargs)
 
     ############################ almost-ufuncs
 
     def nan_to_num(self, *args, **kwargs):
         # array, copy=True, nan=0.0, posinf=None, neginf=None
-        raise NotImplementedError
+        return _apply_ufunc(numpy.nan_to_num, args, kwargs)
 
     def isclose(self, *args, **kwargs):
         # a, b, rtol=1e-05, atol=1e-08, equal_nan=False
-        raise NotImplementedError
+        return _apply_ufunc(numpy.isclose, args, kwargs)
+
+    def isnan(self, *args, **kwargs):
+        # array
+        return _apply_ufunc(numpy.isnan, args, kwargs)
+
+    def isneginf(self, *args, **kwargs):
+        # array
+        return _apply_ufunc(numpy.isneginf, args, kwargs)
+
+    def isposinf(self, *args, **kwargs):
+        # array
+        return _apply_ufunc(numpy.isposinf, args, kwargs)
+
+    def isfinite(self, *args, **kwargs):
+        # array
+        return _apply_ufunc(numpy.isfinite, args, kwargs)
 
     ############################ reducers
 
     def all(self, array, prefer):
         # array
+        touch_data(array)
         return prefer
 
     def any(self, array, prefer):
         # array
+        touch_data(array)
         return prefer
 
-    def count_nonzero(self, *args, **kwargs):
+    def count_nonzero(self, array, axis=None, keepdims=False):
         # array
-        raise NotImplementedError
+        return _apply_reducer(np.dtype(np.int64), array, axis, keepdims)
 
-    def sum(self, *args, **kwargs):
+    def sum(self, array, axis=None, dtype=None, keepdims=False, **kwargs):
         # array
-        raise NotImplementedError
+        if dtype is None:
+            dtype = numpy.sum(_emptyarray(array)).dtype
+        return _apply_reducer(np.dtype(dtype), array, axis, keepdims)
 
-    def prod(self, *args, **kwargs):
+    def prod(self, array, axis=None, dtype=None, keepdims=False, **kwargs):
         # array
-        raise NotImplementedError
+        if dtype is None:
+            dtype = numpy.prod(_emptyarray(array)).dtype
+        return _apply_reducer(np.dtype(dtype), array, axis, keepdims)
 
-    def min(self, *args, **kwargs):
+    def min(self, array, axis=None, keepdims=False, **kwargs):
         # array
-        raise NotImplementedError
+        return _apply_reducer(array.dtype, array, axis, keepdims)
 
-    def max(self, *args, **kwargs):
+    def max(self, array, axis=None, keepdims=False, **kwargs):
         # array
-        raise NotImplementedError
+        return _apply_reducer(array.dtype, array, axis, keepdims)
 
-    def argmin(self, *args, **kwargs):
+    def argmin(self, array, axis=None, keepdims=False, **kwargs):
         # array[, axis=]
-        raise NotImplementedError
+        return _apply_reducer(np.dtype(np.int64), array, axis, keepdims)
 
-    def argmax(self, *args, **kwargs):
+    def argmax(self, array, axis=None, keepdims=False, **kwargs):
         # array[, axis=]
-        raise NotImplementedError
+        return _apply_reducer(np.dtype(np.int64), array, axis, keepdims)
 
     def array_str(
         self, array, max_line_width=unset, precision=unset, suppress_small=unset
@@ -733,5 +1089,176 @@ class TypeTracer(ak.nplike.NumpyLike):
         # array, max_line_width, precision=None, suppress_small=None
         return "[?? ... ??]"
 
-    def datetime_as_string(self, *args, **kwargs):
-        raise NotImplementedError
+    def datetime_as_string(self, array, *args, **kwargs):
+        touch_data(array)
+        dtype = numpy.datetime_as_string(_emptyarray(array), *args, **kwargs).dtype
+        return TypeTracerArray(dtype, array.shape)
+
+
+def _index_from_form(index_format, form, report):
+    dtype = ak._v2.operations.convert.ak_from_buffers._index_to_dtype[index_format]
+    return ak._v2.index.Index(
+        TypeTracerArray(dtype, (UnknownLength,), form.form_key, report),
+        nplike=TypeTracer.instance(),
+    )
+
+
+def _from_form(form, report):
+    tt = TypeTracer.instance()
+
+    if form.has_identifier:
+        raise NotImplementedError(
+            "typetracer_with_report for an array with an Identifier"
+        )
+
+    if isinstance(form, ak._v2.forms.EmptyForm):
+        return ak._v2.contents.EmptyArray(None, form.parameters, tt)
+
+    elif isinstance(form, ak._v2.forms.NumpyForm):
+        dtype = ak._v2.types.numpytype.primitive_to_dtype(form.primitive)
+        data = TypeTracerArray(
+            dtype, (UnknownLength,) + tuple(form.inner_shape), form.form_key, report
+        )
+        return ak._v2.contents.NumpyArray(data, None, form.parameters, tt)
+
+    elif isinstance(form, ak._v2.forms.RegularForm):
+        return ak._v2.contents.RegularArray(
+            _from_form(form.content, report),
+            form.size,
+            UnknownLength,
+            None,
+            form.parameters,
+            tt,
+        )
+
+    elif isinstance(form, ak._v2.forms.ListForm):
+        return ak._v2.contents.ListArray(
+            _index_from_form(form.starts, form, report),
+            _index_from_form(form.stops, form, report),
+            _from_form(form.content, report),
+            None,
+            form.parameters,
+            tt,
+        )
+
+    elif isinstance(form, ak._v2.forms.ListOffsetForm):
+        return ak._v2.contents.ListOffsetArray(
+            _index_from_form(form.offsets, form, report),
+            _from_form(form.content, report),
+            None,
+            form.parameters,
+            tt,
+        )
+
+    elif isinstance(form, ak._v2.forms.IndexedForm):
+        return ak._v2.contents.IndexedArray(
+            _index_from_form(form.index, form, report),
+            _from_form(form.content, report),
+            None,
+            form.parameters,
+            tt,
+        )
+
+    elif isinstance(form, ak._v2.forms.IndexedOptionForm):
+        return ak._v2.contents.IndexedOptionArray(
+            _index_from_form(form.index, form, report),
+            _from_form(form.content, report),
+            None,
+            form.parameters,
+            tt,
+        )
+
+    elif isinstance(form, ak._v2.forms.ByteMaskedForm):
+        return ak._v2.contents.ByteMaskedArray(
+            _index_from_form(form.mask, form, report),
+            _from_form(form.content, report),
+            form.valid_when,
+            None,
+            form.parameters,
+            tt,
+        )
+
+    elif isinstance(form, ak._v2.forms.BitMaskedForm):
+        return ak._v2.contents.BitMaskedArray(
+            _index_from_form(form.mask, form, report),
+            _from_form(form.content, report),
+            form.valid_when,
+            UnknownLength,
+            form.lsb_order,
+            None,
+            form.parameters,
+            tt,
+        )
+
+    elif isinstance(form, ak._v2.forms.UnmaskedForm):
+        return ak._v2.contents.UnmaskedArray(
+            _from_form(form.content, report), None, form.parameters, tt
+        )
+
+    elif isinstance(form, ak._v2.forms.RecordForm):
+        return ak._v2.contents.RecordArray(
+            [_from_form(x, report) for x in form.contents],
+            None if form.is_tuple else form.fields,
+            UnknownLength,
+            None,
+            form.parameters,
+            tt,
+        )
+
+    elif isinstance(form, ak._v2.forms.UnionForm):
+        return ak._v2.contents.UnionArray(
+            _index_from_form(form.tags, form, report),
+            _index_from_form(form.index, form, report),
+            [_from_form(x, report) for x in form.contents],
+            None,
+            form.parameters,
+            tt,
+        )
+
+    else:
+        raise AssertionError("unexpected form node type: " + str(type(form)))
+
+
+def typetracer_with_report(form):
+    """
+    Args:
+        form (#ak.forms.Form or str/dict equivalent): The form of the array
+            whose buffers would be read.
+
+    Returns a layout with the given `form` and unknown length, whose buffers
+    have no data (see #ak.nplike.TypeTracer), and a #TypeTracerReport that
+    records which buffers an operation on that layout needed.
+
+    Running a whole analysis function on the layout (or an #ak.Array of it)
+    is cheap, since no data are computed, and it returns the form of the
+    output. Afterward, `report.data_touched` is the list of `form_keys` of
+    the nodes whose buffers the function read, so that an I/O library can
+    read only those:
+
+        >>> form = array.layout.form_with_key()
+        >>> layout, report = ak._v2._typetracer.typetracer_with_report(form)
+        >>> out = analysis(ak._v2.Array(layout))
+        >>> report.data_touched
+        ['node0', 'node2']
+
+    The buffers that the function passed through to its output without
+    reading them (such as the record fields it returned unchanged) are not
+    in this list; to include them, call #touch_data on the output before
+    looking at the report.
+
+    Nodes whose `form_key` is None are never reported.
+    """
+    if ak._v2._util.isstr(form):
+        if ak._v2.types.numpytype.is_primitive(form):
+            form = ak._v2.forms.NumpyForm(form)
+        else:
+            form = ak._v2.forms.from_json(form)
+    elif isinstance(form, dict):
+        form = ak._v2.forms.from_iter(form)
+    if not isinstance(form, ak._v2.forms.Form):
+        raise TypeError(
+            "'form' argument must be a Form or its Python dict/JSON string representation"
+        )
+
+    report = TypeTracerReport()
+    return _from_form(form, report), report
@@ -75,6 +75,25 @@ def tobytes(array):
         return array.tostring()
 
 
+def bytes_to_list(array, starts, stops, decode):
+    """
+    Splits the uint8 `array` into a list of bytes (or str, if `decode`) from
+    Python lists of `starts` and `stops`, converting the buffer only once.
+    """
+    content = tobytes(array)
+    if not decode:
+        return [content[start:stop] for start, stop in zip(starts, stops)]
+    elif not (array > 127).any():
+        # pure ASCII, so byte positions are character positions
+        content = content.decode("ascii")
+        return [content[start:stop] for start, stop in zip(starts, stops)]
+    else:
+        return [
+            content[start:stop].decode(errors="surrogateescape")
+            for start, stop in zip(starts, stops)
+        ]
+
+
 def little_endian(array):
     return array.astype(array.dtype.newbyteorder("<"), copy=False)
 
@@ -491,6 +510,20 @@ def wrap(content, behavior=None, highlevel=True, like=None):
     return content
 
 
+def row_chunks(sizes, max_size):
+    # Yields (start, stop) ranges of rows whose total size is at most max_size,
+    # except for single rows that are larger than max_size on their own.
+    cumulative = ak.nplike.numpy.cumsum(sizes)
+    start, before = 0, 0
+    while start < len(cumulative):
+        stop = int(
+            ak.nplike.numpy.searchsorted(cumulative, before + max_size, side="right")
+        )
+        stop = max(stop, start + 1)
+        yield start, stop
+        start, before = stop, cumulative[stop - 1]
+
+
 def extra(args, kwargs, defaults):
     out = []
     for i in range(len(defaults)):
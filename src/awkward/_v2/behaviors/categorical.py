@@ -1,350 +1,510 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
-# from __future__ import absolute_import
 
-# import awkward as ak
-
-# np = ak.nplike.NumpyMetadata.instance()
-
-
-# class CategoricalBehavior(ak._v2.highlevel.Array):
-#     __name__ = "Array"
-
-
-# ak._v2.behavior["categorical"] = CategoricalBehavior
-
-
-# class _HashableDict(object):
-#     def __init__(self, obj):
-#         self.keys = tuple(sorted(obj))
-#         self.values = tuple(_hashable(obj[k]) for k in self.keys)
-#         self.hash = hash((_HashableDict,) + self.keys, self.values)
-
-#     def __hash__(self):
-#         return self.hash
-
-#     def __eq__(self, other):
-#         return (
-#             isinstance(other, _HashableDict)
-#             and self.keys == other.keys
-#             and self.values == other.values
-#         )
-
-
-# class _HashableList(object):
-#     def __init__(self, obj):
-#         self.values = tuple(obj)
-#         self.hash = hash((_HashableList,) + self.values)
-
-#     def __hash__(self):
-#         return self.hash
-
-#     def __eq__(self, other):
-#         return isinstance(other, _HashableList) and self.values == other.values
-
-
-# def _hashable(obj):
-#     if isinstance(obj, dict):
-#         return _HashableDict(obj)
-#     elif isinstance(obj, tuple):
-#         return tuple(_hashable(x) for x in obj)
-#     elif isinstance(obj, list):
-#         return _HashableList(obj)
-#     else:
-#         return obj
-
-
-# def _categorical_equal(one, two):
-#     behavior = ak._v2._util.behaviorof(one, two)
-
-#     one, two = one.layout, two.layout
-
-#     assert isinstance(one, ak._v2._util.indexedtypes + ak._v2._util.indexedoptiontypes)
-#     assert isinstance(two, ak._v2._util.indexedtypes + ak._v2._util.indexedoptiontypes)
-#     assert one.parameter("__array__") == "categorical"
-#     assert two.parameter("__array__") == "categorical"
-
-#     one_index = ak.nplike.numpy.asarray(one.index)
-#     two_index = ak.nplike.numpy.asarray(two.index)
-#     one_content = ak._v2._util.wrap(one.content, behavior)
-#     two_content = ak._v2._util.wrap(two.content, behavior)
-
-#     if len(one_content) == len(two_content) and ak._v2.operations.reducers.all(
-#         one_content == two_content, axis=None
-#     ):
-#         one_mapped = one_index
-
-#     else:
-#         one_list = ak._v2.operations.convert.to_list(one_content)
-#         two_list = ak._v2.operations.convert.to_list(two_content)
-#         one_hashable = [_hashable(x) for x in one_list]
-#         two_hashable = [_hashable(x) for x in two_list]
-#         two_lookup = {x: i for i, x in enumerate(two_hashable)}
-
-#         one_to_two = ak.nplike.numpy.empty(len(one_hashable) + 1, dtype=np.int64)
-#         for i, x in enumerate(one_hashable):
-#             one_to_two[i] = two_lookup.get(x, len(two_hashable))
-#         one_to_two[-1] = -1
-
-#         one_mapped = one_to_two[one_index]
-
-#     out = one_mapped == two_index
-#     return ak._v2._util.wrap(ak._v2.contents.NumpyArray(out), ak._v2._util.behaviorof(one, two))
-
-
-# ak._v2.behavior[ak.nplike.numpy.equal, "categorical", "categorical"] = _categorical_equal
-
-
-# def _apply_ufunc(ufunc, method, inputs, kwargs):
-#     nextinputs = []
-#     for x in inputs:
-#         if isinstance(x, ak._v2.highlevel.Array) and isinstance(
-#             x.layout, ak._v2._util.indexedtypes
-#         ):
-#             nextinputs.append(
-#                 ak._v2.highlevel.Array(x.layout.project(), behavior=ak._v2._util.behaviorof(x))
-#             )
-#         else:
-#             nextinputs.append(x)
-
-#     return getattr(ufunc, method)(*nextinputs, **kwargs)
-
-
-# ak._v2.behavior[ak.nplike.numpy.ufunc, "categorical"] = _apply_ufunc
-
-
-# def is_categorical(array):
-#     """
-#     Args:
-#         array: A possibly-categorical Awkward Array.
-
-#     If the `array` is categorical (contains #ak.layout.IndexedArray or
-#     #ak.layout.IndexedOptionArray labeled with parameter
-#     `"__array__" = "categorical"`), then this function returns True;
-#     otherwise, it returns False.
-
-#     See also #ak.categories, #ak.to_categorical, #ak.from_categorical.
-#     """
-
-#     layout = ak._v2.operations.convert.to_layout(
-#         array, allow_record=False, allow_other=False
-#     )
-#     return layout.purelist_parameter("__array__") == "categorical"
-
-
-# def categories(array, highlevel=True):
-#     """
-#     Args:
-#         array: A possibly-categorical Awkward Array.
-#         highlevel (bool): If True, return an #ak.Array; otherwise, return
-#             a low-level #ak.layout.Content subclass.
-
-#     If the `array` is categorical (contains #ak.layout.IndexedArray or
-#     #ak.layout.IndexedOptionArray labeled with parameter
-#     `"__array__" = "categorical"`), then this function returns its categories.
-
-#     See also #ak.is_categorical, #ak.to_categorical, #ak.from_categorical.
-#     """
-
-#     output = [None]
-
-#     def getfunction(layout):
-#         if layout.parameter("__array__") == "categorical":
-#             output[0] = layout.content
-#             return lambda: layout
-
-#         else:
-#             return None
-
-#     layout = ak._v2.operations.convert.to_layout(
-#         array, allow_record=False, allow_other=False
-#     )
-#     ak._v2._util.recursively_apply(layout, getfunction, pass_depth=False)
-
-#     if output[0] is None:
-#         return None
-#     elif highlevel:
-#         return ak._v2._util.wrap(output[0], ak._v2._util.behaviorof(array))
-#     else:
-#         return output[0]
-
-
-# def to_categorical(array, highlevel=True):
-#     """
-#     Args:
-#         array: Data convertible to an Awkward Array
-#         highlevel (bool): If True, return an #ak.Array; otherwise, return
-#             a low-level #ak.layout.Content subclass.
-
-#     Creates a categorical dataset, which has the following properties:
-
-#        * only distinct values (categories) are stored in their entirety,
-#        * pointers to those distinct values are represented by integers
-#          (an #ak.layout.IndexedArray or #ak.layout.IndexedOptionArray
-#          labeled with parameter `"__array__" = "categorical"`.
-
-#     This is equivalent to R's "factor", Pandas's "categorical", and
-#     Arrow/Parquet's "dictionary encoding." It differs from generic uses of
-#     #ak.layout.IndexedArray and #ak.layout.IndexedOptionArray in Awkward
-#     Arrays by the guarantee of no duplicate categories and the `"categorical"`
-#     parameter.
-
-#         >>> array = ak.Array([["one", "two", "three"], [], ["three", "two"]])
-#         >>> categorical = ak.to_categorical(array)
-#         >>> categorical
-#         <Array [['one', 'two', ... 'three', 'two']] type='3 * var * categorical[type=str...'>
-#         >>> ak.type(categorical)
-#         3 * var * categorical[type=string]
-#         >>> ak.to_list(categorical) == ak.to_list(array)
-#         True
-#         >>> ak.categories(categorical)
-#         <Array ['one', 'two', 'three'] type='3 * string'>
-#         >>> ak.is_categorical(categorical)
-#         True
-#         >>> ak.from_categorical(categorical)
-#         <Array [['one', 'two', ... 'three', 'two']] type='3 * var * string'>
-
-#     This function descends through nested lists, but not into the fields of
-#     records, so records can be categories. To make categorical record
-#     fields, split up the record, apply this function to each desired field,
-#     and #ak.zip the results together.
-
-#         >>> records = ak.Array([
-#         ...     {"x": 1.1, "y": "one"},
-#         ...     {"x": 2.2, "y": "two"},
-#         ...     {"x": 3.3, "y": "three"},
-#         ...     {"x": 2.2, "y": "two"},
-#         ...     {"x": 1.1, "y": "one"}
-#         ... ])
-#         >>> records
-#         <Array [{x: 1.1, y: 'one'}, ... y: 'one'}] type='5 * {"x": float64, "y": string}'>
-#         >>> categorical_records = ak.zip({
-#         ...     "x": ak.to_categorical(records["x"]),
-#         ...     "y": ak.to_categorical(records["y"]),
-#         ... })
-#         >>> categorical_records
-#         <Array [{x: 1.1, y: 'one'}, ... y: 'one'}] type='5 * {"x": categorical[type=floa...'>
-#         >>> ak.type(categorical_records)
-#         5 * {"x": categorical[type=float64], "y": categorical[type=string]}
-#         >>> ak.to_list(categorical_records) == ak.to_list(records)
-#         True
-
-#     The check for uniqueness is currently implemented in a Python loop, so
-#     conversion to categorical should be regarded as expensive. (This can
-#     change, but it would always be an _n log(n)_ operation.)
-
-#     See also #ak.is_categorical, #ak.categories, #ak.from_categorical.
-#     """
-
-#     def getfunction(layout):
-#         if layout.purelist_depth == 1:
-#             if isinstance(layout, ak._v2._util.optiontypes):
-#                 layout = layout.simplify()
-
-#             if isinstance(layout, ak._v2._util.indexedoptiontypes):
-#                 content = layout.content
-#                 cls = ak._v2.contents.IndexedOptionArray64
-#             elif isinstance(layout, ak._v2._util.indexedtypes):
-#                 content = layout.content
-#                 cls = ak._v2.contents.IndexedArray64
-#             elif isinstance(layout, ak._v2._util.optiontypes):
-#                 content = layout.content
-#                 cls = ak._v2.contents.IndexedOptionArray64
-#             else:
-#                 content = layout
-#                 cls = ak._v2.contents.IndexedArray64
-
-#             content_list = ak._v2.operations.convert.to_list(content)
-#             hashable = [_hashable(x) for x in content_list]
-
-#             lookup = {}
-#             is_first = ak.nplike.numpy.empty(len(hashable), dtype=np.bool_)
-#             mapping = ak.nplike.numpy.empty(len(hashable), dtype=np.int64)
-#             for i, x in enumerate(hashable):
-#                 if x in lookup:
-#                     is_first[i] = False
-#                     mapping[i] = lookup[x]
-#                 else:
-#                     is_first[i] = True
-#                     lookup[x] = j = len(lookup)
-#                     mapping[i] = j
-
-#             if isinstance(layout, ak._v2._util.indexedoptiontypes):
-#                 original_index = ak.nplike.numpy.asarray(layout.index)
-#                 index = mapping[original_index]
-#                 index[original_index < 0] = -1
-#                 index = ak._v2.index.Index64(index)
-
-#             elif isinstance(layout, ak._v2._util.indexedtypes):
-#                 original_index = ak.nplike.numpy.asarray(layout.index)
-#                 index = ak._v2.index.Index64(mapping[original_index])
-
-#             elif isinstance(layout, ak._v2._util.optiontypes):
-#                 mask = ak.nplike.numpy.asarray(layout.bytemask())
-#                 mapping[mask.view(np.bool_)] = -1
-#                 index = ak._v2.index.Index64(mapping)
-
-#             else:
-#                 index = ak._v2.index.Index64(mapping)
-
-#             out = cls(index, content[is_first], parameters={"__array__": "categorical"})
-#             return lambda: out
-
-#         else:
-#             return None
-
-#     layout = ak._v2.operations.convert.to_layout(
-#         array, allow_record=False, allow_other=False
-#     )
-#     out = ak._v2._util.recursively_apply(layout, getfunction, pass_depth=False)
-#     if highlevel:
-#         return ak._v2._util.wrap(out, ak._v2._util.behaviorof(array))
-#     else:
-#         return out
-
-
-# def from_categorical(array, highlevel=True):
-#     """
-#     Args:
-#         array: Awkward Array from which to remove the 'categorical' parameter.
-#         highlevel (bool): If True, return an #ak.Array; otherwise, return
-#             a low-level #ak.layout.Content subclass.
-
-#     This function replaces categorical data with non-categorical data (by
-#     removing the label that declares it as such).
-
-#     This is a metadata-only operation; the running time does not scale with the
-#     size of the dataset. (Conversion to categorical is expensive; conversion
-#     from categorical is cheap.)
-
-#     See also #ak.is_categorical, #ak.categories, #ak.to_categorical,
-#     #ak.from_categorical.
-#     """
-
-#     def getfunction(layout):
-#         if layout.parameter("__array__") == "categorical":
-#             out = ak._v2.operations.structure.with_parameter(
-#                 layout, "__array__", None, highlevel=False
-#             )
-#             return lambda: out
-
-#         else:
-#             return None
-
-#     layout = ak._v2.operations.convert.to_layout(
-#         array, allow_record=False, allow_other=False
-#     )
-#     out = ak._v2._util.recursively_apply(layout, getfunction, pass_depth=False)
-#     if highlevel:
-#         return ak._v2._util.wrap(out, ak._v2._util.behaviorof(array))
-#     else:
-#         return out
-
-
-# __all__ = [
-#     x for x in list(globals()) if not x.startswith("_") and x not in ("ak", "np")
-# ]
-
-
-# def __dir__():
-#     return __all__
+import awkward as ak
+from awkward._v2.highlevel import Array
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+class CategoricalBehavior(Array):
+    __name__ = "Array"
+
+
+class _HashableDict:
+    def __init__(self, obj):
+        self.keys = tuple(sorted(obj))
+        self.values = tuple(_hashable(obj[k]) for k in self.keys)
+        self.hash = hash((_HashableDict,) + self.keys + self.values)
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, _HashableDict)
+            and self.keys == other.keys
+            and self.values == other.values
+        )
+
+
+class _HashableList:
+    def __init__(self, obj):
+        self.values = tuple(_hashable(x) for x in obj)
+        self.hash = hash((_HashableList,) + self.values)
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        return isinstance(other, _HashableList) and self.values == other.values
+
+
+def _hashable(obj):
+    if isinstance(obj, dict):
+        return _HashableDict(obj)
+    elif isinstance(obj, tuple):
+        return tuple(_hashable(x) for x in obj)
+    elif isinstance(obj, list):
+        return _HashableList(obj)
+    else:
+        return obj
+
+
+def _hash_table_codes(nplike, keys):
+    # Dictionary-encodes np.uint64 keys with an open-addressing hash table that
+    # is filled by all pending keys at once: each round, keys claim their empty
+    # slots, and the ones that find a different key in their slot probe the
+    # next slot. This is O(n), with as many rounds as the longest probe.
+    length = len(keys)
+    bits = max(int(2 * length).bit_length(), 1)
+    size = 1 << bits
+    table = nplike.full(size, -1, np.int64)
+    slots = ((keys * np.uint64(0x9E3779B97F4A7C15)) >> np.uint64(64 - bits)).astype(
+        np.int64
+    )
+
+    pending = nplike.arange(length, dtype=np.int64)
+    while len(pending) > 0:
+        pending_slots = slots[pending]
+        empty = table[pending_slots] < 0
+        table[pending_slots[empty]] = pending[empty]
+        collided = keys[table[pending_slots]] != keys[pending]
+        pending = pending[collided]
+        slots[pending] = (slots[pending] + 1) & (size - 1)
+
+    # number the categories in order of first appearance: NumPy doesn't say
+    # which value an assignment with repeated indexes keeps, so positions that
+    # are earlier than their slot's value are assigned again until none are
+    # (in practice, the last value is kept and this loop does not repeat)
+    first = nplike.full(size, length, np.int64)
+    pending = nplike.arange(length - 1, -1, -1, dtype=np.int64)
+    while len(pending) > 0:
+        first[slots[pending]] = pending
+        pending = pending[pending < first[slots[pending]]]
+    (used,) = nplike.nonzero(first < length)
+    order = nplike.argsort(first[used])
+    rank = nplike.empty(size, np.int64)
+    rank[used[order]] = nplike.arange(len(used), dtype=np.int64)
+
+    return rank[slots], first[used][order]
+
+
+def _number_keys(nplike, data):
+    if issubclass(data.dtype.type, np.floating):
+        # -0.0 and 0.0 are the same category, and so are all NaNs
+        data = nplike.where(nplike.isnan(data), np.nan, data + 0)
+    unsigned = np.dtype("u{}".format(data.dtype.itemsize))
+    return nplike.ascontiguousarray(data).view(unsigned).astype(np.uint64)
+
+
+def _categorize(layout):
+    """
+    Returns `mapping`, an `np.int64` array with the category of each element of
+    `layout`, and `firsts`, the position of each category's first occurrence.
+
+    Numbers and strings are dictionary-encoded by hashing their buffers; all
+    other data are encoded with a Python dict of their #ak.to_list values.
+    """
+    nplike = layout.nplike
+
+    if (
+        isinstance(layout, ak._v2.contents.NumpyArray)
+        and len(layout.shape) == 1
+        and layout.dtype.kind in "biufmM"
+        and layout.dtype.itemsize <= 8
+    ):
+        # (wider numbers, such as float128, don't fit in the 64-bit keys)
+        return _hash_table_codes(nplike, _number_keys(nplike, layout.data))
+
+    elif layout.parameter("__array__") in ("string", "bytestring") and isinstance(
+        layout.content, ak._v2.contents.NumpyArray
+    ):
+        seed = 0
+        while True:
+            keys = ak._v2.behaviors.string._string_hash(layout, seed)
+            mapping, firsts = _hash_table_codes(nplike, keys)
+
+            # two different strings with the same 64-bit hash would be merged
+            categories = layout._carry(
+                ak._v2.index.Index64(firsts), False, ak._v2._slicing.NestedIndexError
+            )
+            representatives = categories._carry(
+                ak._v2.index.Index64(mapping), False, ak._v2._slicing.NestedIndexError
+            )
+            if not nplike.any(
+                ak._v2.behaviors.string._string_compare(layout, representatives, True)
+            ):
+                return mapping, firsts
+            seed += 1
+
+    else:
+        hashable = [_hashable(x) for x in layout.to_list()]
+        lookup = {}
+        mapping = nplike.empty(len(hashable), np.int64)
+        firsts = []
+        for i, x in enumerate(hashable):
+            j = lookup.get(x)
+            if j is None:
+                lookup[x] = j = len(lookup)
+                firsts.append(i)
+            mapping[i] = j
+        return mapping, nplike.asarray(firsts, dtype=np.int64)
+
+
+def _without_categorical(layout):
+    parameters = dict(layout.parameters)
+    del parameters["__array__"]
+    return type(layout)(layout.index, layout.content, parameters=parameters)
+
+
+def _categorical_index(layout):
+    index = layout.nplike.asarray(layout.index.data, dtype=np.int64)
+    if not layout.is_OptionType:
+        return index, None
+    else:
+        return index, index < 0
+
+
+def _categorical_equal(one, two):
+    behavior = ak._v2._util.behavior_of(one, two)
+
+    one, two = one.layout, two.layout
+
+    assert one.is_IndexedType and one.parameter("__array__") == "categorical"
+    assert two.is_IndexedType and two.parameter("__array__") == "categorical"
+
+    nplike = ak.nplike.of(one, two)
+    one_index, one_none = _categorical_index(one)
+    two_index, two_none = _categorical_index(two)
+
+    if one.content is two.content:
+        out = one_index == two_index
+
+    else:
+        # encode the categories of both sides with the same integer codes
+        mapping, _ = _categorize(one.content.merge(two.content))
+        one_codes = mapping[: one.content.length]
+        two_codes = mapping[one.content.length :]
+        out = one_codes[one_index] == two_codes[two_index]
+
+    if one_none is not None or two_none is not None:
+        if one_none is None:
+            none = two_none
+        elif two_none is None:
+            none = one_none
+        else:
+            none = one_none | two_none
+        index = nplike.where(none, -1, nplike.arange(len(out), dtype=np.int64))
+        return ak._v2._util.wrap(
+            ak._v2.contents.IndexedOptionArray(
+                ak._v2.index.Index64(index), ak._v2.contents.NumpyArray(out)
+            ).simplify_optiontype(),
+            behavior,
+        )
+
+    return ak._v2._util.wrap(ak._v2.contents.NumpyArray(out), behavior)
+
+
+def _categorical_notequal(one, two):
+    return ~_categorical_equal(one, two)
+
+
+def _broadcasted_constant(layout):
+    # A constant, like the "two" in categorical == "two", is broadcasted to the
+    # categorical's length by repeating its only item. If the layout is such a
+    # repetition, this returns the item as a length-1 array; otherwise None.
+    nplike = layout.nplike
+    if layout.length == 1:
+        return layout
+    elif layout.length == 0 or not nplike.known_data:
+        return None
+    elif isinstance(layout, ak._v2.contents.ListArray):
+        starts = nplike.asarray(layout.starts.data)
+        stops = nplike.asarray(layout.stops.data)[: len(starts)]
+        if nplike.all(starts == starts[0]) and nplike.all(stops == stops[0]):
+            return layout[:1]
+    elif isinstance(layout, ak._v2.contents.IndexedArray):
+        index = nplike.asarray(layout.index.data)
+        if nplike.all(index == index[0]):
+            return layout[:1]
+    return None
+
+
+def _apply_ufunc(ufunc, method, inputs, kwargs):
+    categorical = [
+        x
+        for x in inputs
+        if isinstance(x, ak._v2.highlevel.Array)
+        and x.layout.is_IndexedType
+        and x.layout.parameter("__array__") == "categorical"
+    ]
+
+    if len(categorical) == 1:
+        # with constants, compute the ufunc once per category, then pick the
+        # results by index
+        behavior = ak._v2._util.behavior_of(*inputs)
+        layout = categorical[0].layout
+        nextinputs = []
+        for x in inputs:
+            if x is categorical[0]:
+                nextinputs.append(ak._v2._util.wrap(layout.content, behavior))
+            elif isinstance(x, ak._v2.highlevel.Array):
+                constant = _broadcasted_constant(x.layout)
+                if constant is None:
+                    break
+                nextinputs.append(ak._v2._util.wrap(constant, behavior))
+            else:
+                nextinputs.append(x)
+
+        else:
+            out = getattr(ufunc, method)(*nextinputs, **kwargs)
+            if isinstance(out, ak._v2.highlevel.Array):
+                if layout.is_OptionType:
+                    out = ak._v2.contents.IndexedOptionArray(layout.index, out.layout)
+                else:
+                    out = ak._v2.contents.IndexedArray(
+                        layout.index, out.layout
+                    ).project()
+                return ak._v2._util.wrap(out, behavior)
+
+    nextinputs = []
+    for x in inputs:
+        if any(x is y for y in categorical):
+            nextinputs.append(
+                ak._v2.highlevel.Array(
+                    _without_categorical(x.layout),
+                    behavior=ak._v2._util.behavior_of(x),
+                )
+            )
+        else:
+            nextinputs.append(x)
+
+    return getattr(ufunc, method)(*nextinputs, **kwargs)
+
+
+def is_categorical(array):
+    """
+    Args:
+        array: A possibly-categorical Awkward Array.
+
+    If the `array` is categorical (contains #ak.layout.IndexedArray or
+    #ak.layout.IndexedOptionArray labeled with parameter
+    `"__array__" = "categorical"`), then this function returns True;
+    otherwise, it returns False.
+
+    See also #ak.categories, #ak.to_categorical, #ak.from_categorical.
+    """
+
+    layout = ak._v2.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    return layout.purelist_parameter("__array__") == "categorical"
+
+
+def categories(array, highlevel=True):
+    """
+    Args:
+        array: A possibly-categorical Awkward Array.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    If the `array` is categorical (contains #ak.layout.IndexedArray or
+    #ak.layout.IndexedOptionArray labeled with parameter
+    `"__array__" = "categorical"`), then this function returns its categories.
+
+    See also #ak.is_categorical, #ak.to_categorical, #ak.from_categorical.
+    """
+
+    output = [None]
+
+    def action(layout, **kwargs):
+        if layout.parameter("__array__") == "categorical":
+            output[0] = layout.content
+            return layout
+
+        else:
+            return None
+
+    layout = ak._v2.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    layout.recursively_apply(action)
+
+    if output[0] is None:
+        return None
+    else:
+        return ak._v2._util.wrap(output[0], ak._v2._util.behavior_of(array), highlevel)
+
+
+def to_categorical(array, highlevel=True):
+    """
+    Args:
+        array: Data convertible to an Awkward Array
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    Creates a categorical dataset, which has the following properties:
+
+       * only distinct values (categories) are stored in their entirety,
+       * pointers to those distinct values are represented by integers
+         (an #ak.layout.IndexedArray or #ak.layout.IndexedOptionArray
+         labeled with parameter `"__array__" = "categorical"`.
+
+    This is equivalent to R's "factor", Pandas's "categorical", and
+    Arrow/Parquet's "dictionary encoding." It differs from generic uses of
+    #ak.layout.IndexedArray and #ak.layout.IndexedOptionArray in Awkward
+    Arrays by the guarantee of no duplicate categories and the `"categorical"`
+    parameter.
+
+        >>> array = ak.Array([["one", "two", "three"], [], ["three", "two"]])
+        >>> categorical = ak.to_categorical(array)
+        >>> categorical
+        <Array [['one', 'two', ... 'three', 'two']] type='3 * var * categorical[type=str...'>
+        >>> ak.type(categorical)
+        3 * var * categorical[type=string]
+        >>> ak.to_list(categorical) == ak.to_list(array)
+        True
+        >>> ak.categories(categorical)
+        <Array ['one', 'two', 'three'] type='3 * string'>
+        >>> ak.is_categorical(categorical)
+        True
+        >>> ak.from_categorical(categorical)
+        <Array [['one', 'two', ... 'three', 'two']] type='3 * var * string'>
+
+    This function descends through nested lists, but not into the fields of
+    records, so records can be categories. To make categorical record
+    fields, split up the record, apply this function to each desired field,
+    and #ak.zip the results together.
+
+        >>> records = ak.Array([
+        ...     {"x": 1.1, "y": "one"},
+        ...     {"x": 2.2, "y": "two"},
+        ...     {"x": 3.3, "y": "three"},
+        ...     {"x": 2.2, "y": "two"},
+        ...     {"x": 1.1, "y": "one"}
+        ... ])
+        >>> records
+        <Array [{x: 1.1, y: 'one'}, ... y: 'one'}] type='5 * {"x": float64, "y": string}'>
+        >>> categorical_records = ak.zip({
+        ...     "x": ak.to_categorical(records["x"]),
+        ...     "y": ak.to_categorical(records["y"]),
+        ... })
+        >>> categorical_records
+        <Array [{x: 1.1, y: 'one'}, ... y: 'one'}] type='5 * {"x": categorical[type=floa...'>
+        >>> ak.type(categorical_records)
+        5 * {"x": categorical[type=float64], "y": categorical[type=string]}
+        >>> ak.to_list(categorical_records) == ak.to_list(records)
+        True
+
+    Numbers and strings are dictionary-encoded in _O(n)_ time with a hash
+    table over their buffers; other categories (such as records) are found
+    with a Python loop, so their conversion should be regarded as expensive.
+
+    Once an array is categorical, ufuncs with constants (such as
+    `categorical == "two"`) are computed once per category and picked by the
+    integer index, and two categorical arrays are compared by their indexes.
+
+    See also #ak.is_categorical, #ak.categories, #ak.from_categorical.
+    """
+
+    def action(layout, **kwargs):
+        if layout.purelist_depth == 1:
+            if layout.is_OptionType:
+                layout = layout.simplify_optiontype()
+
+            if layout.is_IndexedType and layout.is_OptionType:
+                content = layout.content
+                cls = ak._v2.contents.IndexedOptionArray
+            elif layout.is_IndexedType:
+                content = layout.content
+                cls = ak._v2.contents.IndexedArray
+            elif layout.is_OptionType:
+                content = layout.content
+                cls = ak._v2.contents.IndexedOptionArray
+            else:
+                content = layout
+                cls = ak._v2.contents.IndexedArray
+
+            nplike = layout.nplike
+            if not nplike.known_data:
+                ak._v2._typetracer.touch_data(layout)
+                index = ak._v2.index.Index64(nplike.empty(layout.length, np.int64))
+                return cls(index, content, parameters={"__array__": "categorical"})
+
+            mapping, firsts = _categorize(content)
+
+            if layout.is_IndexedType and layout.is_OptionType:
+                original_index = nplike.asarray(layout.index.data, dtype=np.int64)
+                index = mapping[original_index]
+                index[original_index < 0] = -1
+
+            elif layout.is_IndexedType:
+                original_index = nplike.asarray(layout.index.data, dtype=np.int64)
+                index = mapping[original_index]
+
+            elif layout.is_OptionType:
+                index = mapping.copy()
+                index[layout.mask_as_bool(valid_when=False)] = -1
+
+            else:
+                index = mapping
+
+            categories = content._carry(
+                ak._v2.index.Index64(firsts), False, ak._v2._slicing.NestedIndexError
+            ).packed()
+            return cls(
+                ak._v2.index.Index64(index),
+                categories,
+                parameters={"__array__": "categorical"},
+            )
+
+        else:
+            return None
+
+    layout = ak._v2.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, ak._v2._util.behavior_of(array), highlevel)
+
+
+def from_categorical(array, highlevel=True):
+    """
+    Args:
+        array: Awkward Array from which to remove the 'categorical' parameter.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+
+    This function replaces categorical data with non-categorical data (by
+    removing the label that declares it as such).
+
+    This is a metadata-only operation; the running time does not scale with the
+    size of the dataset. (Conversion to categorical is expensive; conversion
+    from categorical is cheap.)
+
+    See also #ak.is_categorical, #ak.categories, #ak.to_categorical,
+    #ak.from_categorical.
+    """
+
+    def action(layout, **kwargs):
+        if layout.parameter("__array__") == "categorical":
+            return _without_categorical(layout)
+
+        else:
+            return None
+
+    layout = ak._v2.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    out = layout.recursively_apply(action)
+    return ak._v2._util.wrap(out, ak._v2._util.behavior_of(array), highlevel)
+
+
+def register(behavior):
+    behavior["categorical"] = CategoricalBehavior
+    behavior[ak.nplike.numpy.equal, "categorical", "categorical"] = _categorical_equal
+    behavior[
+        ak.nplike.numpy.not_equal, "categorical", "categorical"
+    ] = _categorical_notequal
+    behavior[ak.nplike.numpy.ufunc, "categorical"] = _apply_ufunc
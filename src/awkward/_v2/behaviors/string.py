@@ -109,46 +109,190 @@ class CharBehavior(Array):
 #             yield x.__str__()
 
 
-# def _string_equal(one, two):
-#     nplike = ak.nplike.of(one, two)
-#     behavior = ak._v2._util.behaviorof(one, two)
-
-#     one, two = ak.without_parameters(one).layout, ak.without_parameters(two).layout
-
-#     # first condition: string lengths must be the same
-#     counts1 = nplike.asarray(one.count(axis=-1))
-#     counts2 = nplike.asarray(two.count(axis=-1))
-
-#     out = counts1 == counts2
-
-#     # only compare characters in strings that are possibly equal (same length)
-#     possible = nplike.logical_and(out, counts1)
-#     possible_counts = counts1[possible]
-
-#     if len(possible_counts) > 0:
-#         onepossible = one[possible]
-#         twopossible = two[possible]
-
-#         reduced = ak.all(ak.Array(onepossible) == ak.Array(twopossible), axis=-1).layout
-
-#         # update same-length strings with a verdict about their characters
-#         out[possible] = reduced
+def _string_starts_stops_chars(layout):
+    if isinstance(layout, ak._v2.contents.RegularArray):
+        layout = layout.toListOffsetArray64(False)
+    nplike = layout.nplike
+    if isinstance(layout, ak._v2.contents.ListOffsetArray):
+        offsets = nplike.asarray(layout.offsets.data, dtype=np.int64)
+        starts, stops = offsets[:-1], offsets[1:]
+    else:
+        starts = nplike.asarray(layout.starts.data, dtype=np.int64)
+        stops = nplike.asarray(layout.stops.data, dtype=np.int64)[: len(starts)]
+    chars = nplike.asarray(layout.content.data).view(np.uint8)
+    return starts, stops, chars
+
+
+# strings are compared and hashed in chunks of rows with about this many
+# characters in total, so that the temporary arrays (about 20 bytes per
+# character) stay small
+_string_chunk_size = 1 << 20
+
+
+def _string_row_chunks(nplike, counts):
+    # (start, stop) of consecutive rows with about _string_chunk_size
+    # characters (up to one row more than that)
+    cumulative = nplike.cumsum(counts)
+    total = int(cumulative[-1]) if len(counts) > 0 else 0
+    bounds = nplike.searchsorted(
+        cumulative,
+        nplike.arange(_string_chunk_size, total, _string_chunk_size),
+        side="right",
+    )
+    bounds = sorted({0, len(counts)}.union(int(x) for x in bounds))
+    return zip(bounds[:-1], bounds[1:])
 
-#     return ak._v2._util.wrap(ak._v2.contents.NumpyArray(out), behavior)
 
+def _string_flat_index(nplike, starts, counts):
+    # positions in the chars buffer of all characters of all strings, in order,
+    # and where each string begins in that flat sequence
+    before = nplike.cumsum(counts) - counts
+    total = int(before[-1] + counts[-1]) if len(counts) > 0 else 0
+    index = nplike.arange(total, dtype=np.int64) + nplike.repeat(
+        starts - before, counts
+    )
+    return index, before
+
+
+def _string_compare(one, two, equal_only):
+    # Returns -1, 0, 1 for each pair of strings, comparing them lexicographically
+    # (or only 0 for equal and nonzero for different if equal_only), by finding
+    # the first differing character of all pairs in a chunk of rows at once.
+    nplike = ak.nplike.of(one, two)
+    starts1, stops1, chars1 = _string_starts_stops_chars(one)
+    starts2, stops2, chars2 = _string_starts_stops_chars(two)
+    if len(starts1) == 1 and len(starts2) != 1:
+        starts1 = nplike.repeat(starts1, len(starts2))
+        stops1 = nplike.repeat(stops1, len(starts2))
+    elif len(starts2) == 1 and len(starts1) != 1:
+        starts2 = nplike.repeat(starts2, len(starts1))
+        stops2 = nplike.repeat(stops2, len(starts1))
+    counts1 = stops1 - starts1
+    counts2 = stops2 - starts2
+
+    if equal_only:
+        out = (counts1 != counts2).astype(np.int8)
+        counts = nplike.where(out == 0, counts1, 0)
+    else:
+        out = (counts1 > counts2).astype(np.int8) - (counts1 < counts2).astype(np.int8)
+        counts = nplike.minimum(counts1, counts2)
+
+    for start, stop in _string_row_chunks(nplike, counts):
+        _string_compare_chars(
+            nplike,
+            chars1,
+            starts1[start:stop],
+            chars2,
+            starts2[start:stop],
+            counts[start:stop],
+            out[start:stop],
+        )
 
-# def _string_notequal(one, two):
-#     return ~_string_equal(one, two)
+    return out
 
 
-# def _string_broadcast(layout, offsets):
-#     nplike = ak.nplike.of(offsets)
-#     offsets = nplike.asarray(offsets)
-#     counts = offsets[1:] - offsets[:-1]
-#     if ak._v2._util.win or ak._v2._util.bits32:
-#         counts = counts.astype(np.int32)
-#     parents = nplike.repeat(nplike.arange(len(counts), dtype=counts.dtype), counts)
-#     return ak._v2.contents.IndexedArray64(ak._v2.index.Index64(parents), layout).project()
+def _string_compare_chars(nplike, chars1, starts1, chars2, starts2, counts, out):
+    # fills `out` (a view) where the first `counts` characters differ
+    index1, before = _string_flat_index(nplike, starts1, counts)
+    left = chars1[index1]
+    del index1
+    index2, _ = _string_flat_index(nplike, starts2, counts)
+    right = chars2[index2]
+    del index2
+
+    (differ,) = nplike.nonzero(left != right)
+    if len(differ) > 0:
+        which = nplike.searchsorted(before, differ, side="right") - 1
+        first = nplike.empty(len(which), np.bool_)
+        first[0] = True
+        first[1:] = which[1:] != which[:-1]
+        differ, which = differ[first], which[first]
+        out[which] = (left[differ] > right[differ]).astype(np.int8) - (
+            left[differ] < right[differ]
+        ).astype(np.int8)
+
+
+def _string_comparison(compare, equal_only):
+    def comparison(one, two):
+        behavior = ak._v2._util.behavior_of(one, two)
+        one, two = one.layout, two.layout
+        nplike = ak.nplike.of(one, two)
+        if nplike.known_data:
+            out = compare(_string_compare(one, two, equal_only), 0)
+        else:
+            ak._v2._typetracer.touch_data(one)
+            ak._v2._typetracer.touch_data(two)
+            out = nplike.empty(max(one.length, two.length), np.bool_)
+        return ak._v2._util.wrap(
+            ak._v2.contents.NumpyArray(out, nplike=nplike), behavior
+        )
+
+    return comparison
+
+
+_string_equal = _string_comparison(ak.nplike.numpy.equal, True)
+_string_notequal = _string_comparison(ak.nplike.numpy.not_equal, True)
+_string_less = _string_comparison(ak.nplike.numpy.less, False)
+_string_less_equal = _string_comparison(ak.nplike.numpy.less_equal, False)
+_string_greater = _string_comparison(ak.nplike.numpy.greater, False)
+_string_greater_equal = _string_comparison(ak.nplike.numpy.greater_equal, False)
+
+
+def _string_broadcast(layout, offsets):
+    nplike = ak.nplike.of(offsets)
+    offsets = nplike.asarray(offsets)
+    counts = offsets[1:] - offsets[:-1]
+    if ak._v2._util.win or ak._v2._util.bits32:
+        counts = counts.astype(np.int32)
+    parents = nplike.repeat(nplike.arange(counts.shape[0], dtype=counts.dtype), counts)
+    return ak._v2.contents.IndexedArray(ak._v2.index.Index64(parents), layout).project()
+
+
+_string_hash_multiplier = 0x100000001B3
+
+
+def _string_hash(layout, seed=0):
+    """
+    Returns a 64-bit hash (`np.uint64`) of each string or bytestring in `layout`,
+    computed from its offsets and characters in a single pass: a polynomial
+    hash of the characters, mixed with the string length and finalized with
+    splitmix64.
+
+    Different `seed` values select different polynomials, so strings that
+    collide for one seed are unlikely to collide for another.
+    """
+    nplike = layout.nplike
+    starts, stops, chars = _string_starts_stops_chars(layout)
+    counts = stops - starts
+
+    maxcount = int(counts.max()) if len(counts) > 0 else 0
+    multiplier = _string_hash_multiplier + 2 * seed
+    powers = nplike.full(maxcount + 1, multiplier, np.uint64)
+    powers[0] = 1
+    powers = nplike.cumprod(powers, dtype=np.uint64)
+
+    out = nplike.zeros(len(counts), np.uint64)
+    for start, stop in _string_row_chunks(nplike, counts):
+        chunk_counts = counts[start:stop]
+        index, before = _string_flat_index(nplike, starts[start:stop], chunk_counts)
+        local = nplike.arange(len(index), dtype=np.int64) - nplike.repeat(
+            before, chunk_counts
+        )
+        terms = (chars[index].astype(np.uint64) + np.uint64(1)) * powers[local]
+        del index, local
+        summed = nplike.empty(len(terms) + 1, np.uint64)
+        summed[0] = 0
+        nplike.cumsum(terms, out=summed[1:])
+        out[start:stop] = summed[before + chunk_counts] - summed[before]
+
+    out ^= (counts.astype(np.uint64) + np.uint64(1)) * np.uint64(0x9E3779B97F4A7C15)
+
+    out ^= out >> np.uint64(30)
+    out *= np.uint64(0xBF58476D1CE4E5B9)
+    out ^= out >> np.uint64(27)
+    out *= np.uint64(0x94D049BB133111EB)
+    out ^= out >> np.uint64(31)
+    return out
 
 
 def _string_numba_typer(viewtype):
@@ -248,13 +392,19 @@ def register(behavior):
     # behavior["string"] = StringBehavior
     # behavior["__typestr__", "string"] = "string"
 
-    # behavior[ak.nplike.numpy.equal, "bytestring", "bytestring"] = _string_equal
-    # behavior[ak.nplike.numpy.equal, "string", "string"] = _string_equal
-    # behavior[ak.nplike.numpy.not_equal, "bytestring", "bytestring"] = _string_notequal
-    # behavior[ak.nplike.numpy.not_equal, "string", "string"] = _string_notequal
-
-    # behavior["__broadcast__", "bytestring"] = _string_broadcast
-    # behavior["__broadcast__", "string"] = _string_broadcast
+    for ufunc, function in [
+        (ak.nplike.numpy.equal, _string_equal),
+        (ak.nplike.numpy.not_equal, _string_notequal),
+        (ak.nplike.numpy.less, _string_less),
+        (ak.nplike.numpy.less_equal, _string_less_equal),
+        (ak.nplike.numpy.greater, _string_greater),
+        (ak.nplike.numpy.greater_equal, _string_greater_equal),
+    ]:
+        behavior[ufunc, "bytestring", "bytestring"] = function
+        behavior[ufunc, "string", "string"] = function
+
+    behavior["__broadcast__", "bytestring"] = _string_broadcast
+    behavior["__broadcast__", "string"] = _string_broadcast
 
     behavior["__numba_typer__", "bytestring"] = _string_numba_typer
     behavior["__numba_lower__", "bytestring"] = _string_numba_lower
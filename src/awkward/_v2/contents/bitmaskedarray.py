@@ -49,7 +49,9 @@ class BitMaskedArray(Content):
                     type(self).__name__, repr(valid_when)
                 )
             )
-        if not ak._util.isint(length):
+        if not isinstance(
+            length, ak._v2._typetracer.UnknownLengthType
+        ) and not ak._util.isint(length):
             raise TypeError(
                 "{} 'length' must be an integer, not {}".format(
                     type(self).__name__, repr(length)
@@ -341,10 +343,10 @@ class BitMaskedArray(Content):
             return self
 
     def num(self, axis, depth=0):
-        return self.toByteMaskedArray.num(axis, depth)
+        return self.toByteMaskedArray().num(axis, depth)
 
     def _offsets_and_flattened(self, axis, depth):
-        return self.toByteMaskedArray._offsets_and_flattened(axis, depth)
+        return self.toByteMaskedArray()._offsets_and_flattened(axis, depth)
 
     def mergeable(self, other, mergebool):
         if not _parameters_equal(self._parameters, other._parameters):
@@ -506,6 +508,27 @@ class BitMaskedArray(Content):
         return self.toByteMaskedArray()._rpad(target, axis, depth, clip)
 
     def _to_arrow(self, pyarrow, mask_node, validbytes, length, options):
+        if options["zero_copy"]:
+            # Arrow's validity bitmaps have the same layout as this mask if
+            # lsb_order=True and valid_when=True, so it can be passed as-is.
+            if validbytes is not None:
+                reason = "nested option-types must be combined into one mask"
+            elif not self._lsb_order:
+                reason = "Arrow validity bitmaps are in LSB order"
+            elif not self._valid_when:
+                reason = "Arrow validity bitmaps are valid when 1"
+            else:
+                return self._content._to_arrow(
+                    pyarrow,
+                    self,
+                    ak._v2._connect.pyarrow.PackedValidBits(
+                        self._mask.to(numpy), length
+                    ),
+                    length,
+                    options,
+                )
+            ak._v2._connect.pyarrow.check_zero_copy(True, type(self).__name__, reason)
+
         return self.toByteMaskedArray()._to_arrow(
             pyarrow, mask_node, validbytes, length, options
         )
@@ -566,7 +589,18 @@ class BitMaskedArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return (
+            not self._content.is_RecordType
+            and self._mask.length == int(math.ceil(self._length / 8.0))
+            and self._content.length <= self._length
+            and self._content.is_packed
+        )
+
     def packed(self):
+        if self.is_packed:
+            return self
+
         if self._content.is_RecordType:
             next = self.toIndexedOptionArray64()
 
@@ -611,11 +645,7 @@ class BitMaskedArray(Content):
 
         mask = self.mask_as_bool(valid_when=True, nplike=numpy)[: self._length]
         content = self._content._to_list(behavior)
-        out = [None] * self._length
-        for i, isvalid in enumerate(mask):
-            if isvalid:
-                out[i] = content[i]
-        return out
+        return [x if isvalid else None for x, isvalid in zip(content, mask.tolist())]
 
     def _to_json(
         self,
@@ -637,8 +667,4 @@ class BitMaskedArray(Content):
             complex_real_string,
             complex_imag_string,
         )
-        out = [None] * self._length
-        for i, isvalid in enumerate(mask):
-            if isvalid:
-                out[i] = content[i]
-        return out
+        return [x if isvalid else None for x, isvalid in zip(content, mask.tolist())]
@@ -39,7 +39,7 @@ class ByteMaskedArray(Content):
                     type(self).__name__, repr(valid_when)
                 )
             )
-        if mask.length > content.length:
+        if not mask.is_deferred and mask.length > content.length:
             raise ValueError(
                 "{} len(mask) ({}) must be <= len(content) ({})".format(
                     type(self).__name__, mask.length, content.length
@@ -866,6 +866,11 @@ class ByteMaskedArray(Content):
             )
 
     def _to_arrow(self, pyarrow, mask_node, validbytes, length, options):
+        ak._v2._connect.pyarrow.check_zero_copy(
+            options["zero_copy"],
+            type(self).__name__,
+            "the mask must be packed into bits",
+        )
         this_validbytes = self.mask_as_bool(valid_when=True)
 
         return self._content._to_arrow(
@@ -930,7 +935,17 @@ class ByteMaskedArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return (
+            not self._content.is_RecordType
+            and self._content.length <= self._mask.length
+            and self._content.is_packed
+        )
+
     def packed(self):
+        if self.is_packed:
+            return self
+
         if self._content.is_RecordType:
             next = self.toIndexedOptionArray64()
             content = next._content.packed()
@@ -966,11 +981,7 @@ class ByteMaskedArray(Content):
 
         mask = self.mask_as_bool(valid_when=True, nplike=numpy)
         content = self._content._to_list(behavior)
-        out = [None] * self._mask.length
-        for i, isvalid in enumerate(mask):
-            if isvalid:
-                out[i] = content[i]
-        return out
+        return [x if isvalid else None for x, isvalid in zip(content, mask.tolist())]
 
     def _to_json(
         self,
@@ -994,8 +1005,4 @@ class ByteMaskedArray(Content):
             complex_real_string,
             complex_imag_string,
         )
-        out = [None] * self._mask.length
-        for i, isvalid in enumerate(mask):
-            if isvalid:
-                out[i] = content[i]
-        return out
+        return [x if isvalid else None for x, isvalid in zip(content, mask.tolist())]
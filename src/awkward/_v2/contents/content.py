@@ -22,6 +22,8 @@ class Content:
     is_RecordType = False
     is_UnionType = False
 
+    _is_packed_result = None
+
     def _init(self, identifier, parameters, nplike):
         if identifier is not None and not isinstance(
             identifier, ak._v2.identifier.Identifier
@@ -174,6 +176,10 @@ class Content:
         return None
 
     def _handle_error(self, error, slicer=None):
+        if ak.nplike._profilers:
+            for profiler in ak.nplike._profilers:
+                profiler._annotate(self, error)
+
         if error.str is not None:
             if error.filename is None:
                 filename = ""
@@ -1097,10 +1103,13 @@ at inner {} of length {}, using sub-slice {}.{}""".format(
             ):
                 content = self.content
             else:
-                return 'at {} ("{}"): __array__ = "string" only allowed for IndexedArray and IndexedOptionArray'.format(
+                return 'at {} ("{}"): __array__ = "categorical" only allowed for IndexedArray and IndexedOptionArray'.format(
+                    path, type(self)
+                )
+            if not content.is_unique():
+                return 'at {} ("{}"): __array__ = "categorical" requires contents to be unique'.format(
                     path, type(self)
                 )
-            return NotImplementedError("TODO: Implement is_unique")
 
         return ""
 
@@ -1114,6 +1123,17 @@ at inner {} of length {}, using sub-slice {}.{}""".format(
     def nbytes(self):
         return self._nbytes_part()
 
+    @property
+    def is_packed(self):
+        """
+        True if #packed would return this node as-is: it has no unreachable
+        data and no #ak.layout.IndexedArray or #ak.layout.ListArray
+        indirection, all the way down. This is computed once per node.
+        """
+        if self._is_packed_result is None:
+            self._is_packed_result = self._is_packed()
+        return self._is_packed_result
+
     def purelist_parameter(self, key):
         return self.Form.purelist_parameter(self, key)
 
@@ -1222,6 +1242,7 @@ at inner {} of length {}, using sub-slice {}.{}""".format(
         categorical_as_dictionary=False,
         extensionarray=True,
         count_nulls=True,
+        zero_copy=False,
     ):
         import awkward._v2._connect.pyarrow
 
@@ -1239,6 +1260,7 @@ at inner {} of length {}, using sub-slice {}.{}""".format(
                 "categorical_as_dictionary": categorical_as_dictionary,
                 "extensionarray": extensionarray,
                 "count_nulls": count_nulls,
+                "zero_copy": zero_copy,
             },
         )
 
@@ -332,6 +332,9 @@ class EmptyArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return True
+
     def packed(self):
         return self
 
@@ -601,7 +601,7 @@ class IndexedArray(Content):
         )
 
     def fillna(self, value):
-        if value.length != 1:
+        if value.nplike.known_shape and value.length != 1:
             raise ValueError(f"fillna value length ({value.length}) is not equal to 1")
 
         return IndexedArray(
@@ -684,10 +684,8 @@ class IndexedArray(Content):
         if self._index.length == 0:
             return True
 
-        nextindex = self._unique_index(self._index)
-
-        next = self._content._carry(nextindex, False, NestedIndexError)
-        return next._is_unique(negaxis, starts, parents, outlength)
+        projected = self.project()
+        return projected._is_unique(negaxis, starts, parents, outlength)
 
     def _unique(self, negaxis, starts, parents, outlength):
         if self._index.length == 0:
@@ -1047,6 +1045,12 @@ class IndexedArray(Content):
         index = self._index.to(numpy)
 
         if self.parameter("__array__") == "categorical":
+            if validbytes is not None:
+                ak._v2._connect.pyarrow.check_zero_copy(
+                    options["zero_copy"],
+                    type(self).__name__,
+                    "missing values must be turned into a validity bitmap",
+                )
             dictionary = self._content._to_arrow(
                 pyarrow, None, None, self._content.length, options
             )
@@ -1066,6 +1070,11 @@ class IndexedArray(Content):
                 return out
 
         else:
+            ak._v2._connect.pyarrow.check_zero_copy(
+                options["zero_copy"],
+                type(self).__name__,
+                "the index must be projected (unless categorical_as_dictionary=True)",
+            )
             if self._content.length == 0:
                 # IndexedOptionArray._to_arrow replaces -1 in the index with 0. So behind
                 # every masked value is self._content[0], unless self._content.length == 0.
@@ -1133,6 +1142,9 @@ class IndexedArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return False
+
     def packed(self):
         return self.project().packed()
 
@@ -1143,10 +1155,7 @@ class IndexedArray(Content):
 
         index = self._index.to(numpy)
         content = self._content._to_list(behavior)
-        out = [None] * index.length
-        for i, ind in enumerate(index):
-            out[i] = content[ind]
-        return out
+        return [content[i] for i in index.tolist()]
 
     def _to_json(
         self,
@@ -1168,7 +1177,4 @@ class IndexedArray(Content):
             complex_real_string,
             complex_imag_string,
         )
-        out = [None] * index.length
-        for i, ind in enumerate(index):
-            out[i] = content[ind]
-        return out
+        return [content[i] for i in index.tolist()]
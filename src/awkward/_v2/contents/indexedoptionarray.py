@@ -686,7 +686,7 @@ class IndexedOptionArray(Content):
         )
 
     def fillna(self, value):
-        if value.length != 1:
+        if value.nplike.known_shape and value.length != 1:
             raise ValueError(f"fillna value length ({value.length}) is not equal to 1")
 
         contents = [self._content, value]
@@ -1563,6 +1563,11 @@ class IndexedOptionArray(Content):
             )
 
     def _to_arrow(self, pyarrow, mask_node, validbytes, length, options):
+        ak._v2._connect.pyarrow.check_zero_copy(
+            options["zero_copy"],
+            type(self).__name__,
+            "the index must be turned into a validity bitmap",
+        )
         index = numpy.array(self._index, copy=True)
         this_validbytes = self.mask_as_bool(valid_when=True)
         index[~this_validbytes] = 0
@@ -1672,18 +1677,37 @@ class IndexedOptionArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return (
+            self._nplike.known_data
+            and self._content.is_packed
+            and self._index_is_packed()
+        )
+
+    def _index_is_packed(self):
+        # the valid entries of the index are 0, 1, 2, ... up to the content's
+        # length, so that every item of the content is used exactly once
+        index = self._index.to(self._nplike)
+        valid = index[index >= 0]
+        return valid.shape[0] == self._content.length and self._nplike.array_equal(
+            valid, self._nplike.arange(valid.shape[0], dtype=valid.dtype)
+        )
+
     def packed(self):
+        if self.is_packed:
+            return self
+
         original_index = self._index.to(self._nplike)
 
         is_none = original_index < 0
         num_none = self._nplike.count_nonzero(is_none)
-        if self._content.length > len(original_index) - num_none:
+        if not self._nplike.known_data or not self._index_is_packed():
             new_index = self._nplike.empty(
-                len(original_index), dtype=original_index.dtype
+                self._index.length, dtype=original_index.dtype
             )
             new_index[is_none] = -1
             new_index[~is_none] = self._nplike.arange(
-                len(original_index) - num_none, dtype=original_index.dtype
+                self._index.length - num_none, dtype=original_index.dtype
             )
             return ak._v2.contents.IndexedOptionArray(
                 ak._v2.index.Index(new_index),
@@ -1709,11 +1733,7 @@ class IndexedOptionArray(Content):
 
         index = self._index.to(numpy)
         content = self._content._to_list(behavior)
-        out = [None] * len(index)
-        for i, ind in enumerate(index):
-            if ind >= 0:
-                out[i] = content[ind]
-        return out
+        return [content[i] if i >= 0 else None for i in index.tolist()]
 
     def _to_json(
         self,
@@ -1735,8 +1755,4 @@ class IndexedOptionArray(Content):
             complex_real_string,
             complex_imag_string,
         )
-        out = [None] * len(index)
-        for i, ind in enumerate(index):
-            if ind >= 0:
-                out[i] = content[ind]
-        return out
+        return [content[i] if i >= 0 else None for i in index.tolist()]
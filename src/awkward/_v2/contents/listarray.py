@@ -40,7 +40,7 @@ class ListArray(Content):
                     type(self).__name__, repr(content)
                 )
             )
-        if starts.length > stops.length:
+        if not starts.is_deferred and starts.length > stops.length:
             raise ValueError(
                 "{} len(starts) ({}) must be <= len(stops) ({})".format(
                     type(self).__name__, starts.length, stops.length
@@ -1205,6 +1205,11 @@ class ListArray(Content):
             return self.toListOffsetArray64(True)._rpad(target, axis, depth, clip=True)
 
     def _to_arrow(self, pyarrow, mask_node, validbytes, length, options):
+        ak._v2._connect.pyarrow.check_zero_copy(
+            options["zero_copy"],
+            type(self).__name__,
+            "starts and stops must become offsets",
+        )
         return self.toListOffsetArray64(False)._to_arrow(
             pyarrow, mask_node, validbytes, length, options
         )
@@ -1271,6 +1276,9 @@ class ListArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return False
+
     def packed(self):
         return self.toListOffsetArray64(True).packed()
 
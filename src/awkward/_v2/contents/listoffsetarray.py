@@ -33,7 +33,7 @@ class ListOffsetArray(Content):
                     type(self).__name__, repr(content)
                 )
             )
-        if ak.nplike.of(offsets).known_shape:
+        if ak.nplike.of(offsets).known_shape and not offsets.is_deferred:
             if not offsets.length >= 1:
                 raise ValueError(
                     "{} len(offsets) ({}) must be >= 1".format(
@@ -995,7 +995,7 @@ class ListOffsetArray(Content):
                         self_stops.to(self._nplike),
                         stable,
                         ascending,
-                        False,
+                        True,
                     )
                 )
                 return ak._v2.contents.NumpyArray(nextcarry, None, None, self._nplike)
@@ -1628,33 +1628,47 @@ class ListOffsetArray(Content):
             return out
 
         else:
-            nextparents = ak._v2.index.Index64.empty(nextlen, self._nplike)
+            outcontent = None
+            if (
+                ak._v2._reducers.segmented
+                and not reducer.needs_position
+                and isinstance(self._content, ak._v2.contents.NumpyArray)
+                and self._nplike.known_data
+            ):
+                # offsets[0] == 0 (see above), so the offsets are enough to
+                # reduce each list without making nextparents
+                outcontent = self._content[: self._offsets[-1]]._reduce_segmented(
+                    reducer, self._offsets.to(self._nplike), mask, keepdims
+                )
 
-            self._handle_error(
-                self._nplike[
-                    "awkward_ListOffsetArray_reduce_local_nextparents_64",
-                    nextparents.dtype.type,
-                    self._offsets.dtype.type,
-                ](
-                    nextparents.to(self._nplike),
-                    self._offsets.to(self._nplike),
-                    globalstarts_length,
+            if outcontent is None:
+                nextparents = ak._v2.index.Index64.empty(nextlen, self._nplike)
+
+                self._handle_error(
+                    self._nplike[
+                        "awkward_ListOffsetArray_reduce_local_nextparents_64",
+                        nextparents.dtype.type,
+                        self._offsets.dtype.type,
+                    ](
+                        nextparents.to(self._nplike),
+                        self._offsets.to(self._nplike),
+                        globalstarts_length,
+                    )
                 )
-            )
 
-            trimmed = self._content[self.offsets[0] : self.offsets[-1]]
-            nextstarts = self.offsets[:-1]
+                trimmed = self._content[self.offsets[0] : self.offsets[-1]]
+                nextstarts = self.offsets[:-1]
 
-            outcontent = trimmed._reduce_next(
-                reducer,
-                negaxis,
-                nextstarts,
-                shifts,
-                nextparents,
-                globalstarts_length,
-                mask,
-                keepdims,
-            )
+                outcontent = trimmed._reduce_next(
+                    reducer,
+                    negaxis,
+                    nextstarts,
+                    shifts,
+                    nextparents,
+                    globalstarts_length,
+                    mask,
+                    keepdims,
+                )
 
             outoffsets = ak._v2.index.Index64.empty(outlength + 1, self._nplike)
             self._handle_error(
@@ -1845,13 +1859,16 @@ class ListOffsetArray(Content):
             downsize = options["list_to32"]
 
         npoffsets = self._offsets.to(numpy)
-        akcontent = self._content[npoffsets[0] : npoffsets[length]]
+        # Arrow allows offsets that don't start at zero, so don't rebase them;
+        # the content before npoffsets[0] is just unused.
+        akcontent = self._content[: npoffsets[length]]
         if len(npoffsets) > length + 1:
             npoffsets = npoffsets[: length + 1]
 
         # ArrowNotImplementedError: Lists with non-zero length null components
-        # are not supported. So make the null'ed lists empty.
-        if validbytes is not None:
+        # are not supported. So make the null'ed lists empty. (Arrow arrays
+        # allow them, though, so don't spend a copy on it with zero_copy=True.)
+        if validbytes is not None and not options["zero_copy"]:
             nonzeros = npoffsets[1:] != npoffsets[:-1]
             maskedbytes = validbytes == 0
             if numpy.any(maskedbytes & nonzeros):  # null and count > 0
@@ -1873,9 +1890,19 @@ class ListOffsetArray(Content):
 
         if issubclass(npoffsets.dtype.type, np.int64):
             if downsize and npoffsets[-1] < np.iinfo(np.int32).max:
+                ak._v2._connect.pyarrow.check_zero_copy(
+                    options["zero_copy"],
+                    type(self).__name__,
+                    "downsizing offsets to 32 bits (list_to32, string_to32, or bytestring_to32)",
+                )
                 npoffsets = npoffsets.astype(np.int32)
 
         if issubclass(npoffsets.dtype.type, np.uint32):
+            ak._v2._connect.pyarrow.check_zero_copy(
+                options["zero_copy"],
+                type(self).__name__,
+                "Arrow offsets are signed",
+            )
             if npoffsets[-1] < np.iinfo(np.int32).max:
                 npoffsets = npoffsets.astype(np.int32)
             else:
@@ -2000,8 +2027,33 @@ class ListOffsetArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return (
+            self._nplike.known_data
+            and self._offsets.dtype == np.dtype(np.int64)
+            and self._offsets[0] == 0
+            and self._content.length == self._offsets[-1]
+            and self._content.is_packed
+        )
+
     def packed(self):
-        next = self.toListOffsetArray64(True)
+        if self.is_packed:
+            return self
+
+        if self._nplike.known_data and self._offsets[0] == 0:
+            # keep the content (and its packed subtrees); at most the offsets
+            # need to be widened and the content trimmed
+            next = ListOffsetArray(
+                ak._v2.index.Index64(
+                    self._offsets.to(self._nplike), nplike=self._nplike
+                ),
+                self._content,
+                self._identifier,
+                self._parameters,
+                self._nplike,
+            )
+        else:
+            next = self.toListOffsetArray64(True)
         content = next._content.packed()
         if content.length != next._offsets[-1]:
             content = content[: next._offsets[-1]]
@@ -2011,20 +2063,20 @@ class ListOffsetArray(Content):
 
     def _to_list(self, behavior):
         if self.parameter("__array__") == "bytestring":
-            content = ak._v2._util.tobytes(self._content.data)
-            starts, stops = self.starts, self.stops
-            out = [None] * starts.length
-            for i in range(starts.length):
-                out[i] = content[starts[i] : stops[i]]
-            return out
+            return ak._v2._util.bytes_to_list(
+                self._content.data,
+                self.starts.to(numpy).tolist(),
+                self.stops.to(numpy).tolist(),
+                decode=False,
+            )
 
         elif self.parameter("__array__") == "string":
-            content = ak._v2._util.tobytes(self._content.data)
-            starts, stops = self.starts, self.stops
-            out = [None] * starts.length
-            for i in range(starts.length):
-                out[i] = content[starts[i] : stops[i]].decode(errors="surrogateescape")
-            return out
+            return ak._v2._util.bytes_to_list(
+                self._content.data,
+                self.starts.to(numpy).tolist(),
+                self.stops.to(numpy).tolist(),
+                decode=True,
+            )
 
         else:
             out = self._to_list_custom(behavior)
@@ -2032,12 +2084,9 @@ class ListOffsetArray(Content):
                 return out
 
             content = self._content._to_list(behavior)
-            starts, stops = self.starts, self.stops
-            out = [None] * starts.length
-
-            for i in range(starts.length):
-                out[i] = content[starts[i] : stops[i]]
-            return out
+            starts = self.starts.to(numpy).tolist()
+            stops = self.stops.to(numpy).tolist()
+            return [content[start:stop] for start, stop in zip(starts, stops)]
 
     def _to_json(
         self,
@@ -2051,12 +2100,12 @@ class ListOffsetArray(Content):
             self.parameter("__array__") == "bytestring"
             or self.parameter("__array__") == "string"
         ):
-            content = ak._v2._util.tobytes(self._content.data)
-            starts, stops = self.starts, self.stops
-            out = [None] * starts.length
-            for i in range(starts.length):
-                out[i] = content[starts[i] : stops[i]].decode(errors="surrogateescape")
-            return out
+            return ak._v2._util.bytes_to_list(
+                self._content.data,
+                self.starts.to(numpy).tolist(),
+                self.stops.to(numpy).tolist(),
+                decode=True,
+            )
 
         else:
             out = self._to_json_custom()
@@ -2070,12 +2119,9 @@ class ListOffsetArray(Content):
                 complex_real_string,
                 complex_imag_string,
             )
-            starts, stops = self.starts, self.stops
-            out = [None] * starts.length
-
-            for i in range(starts.length):
-                out[i] = content[starts[i] : stops[i]]
-            return out
+            starts = self.starts.to(numpy).tolist()
+            stops = self.stops.to(numpy).tolist()
+            return [content[start:stop] for start, stop in zip(starts, stops)]
 
     def _awkward_strings_to_nonfinite(self, nonfinit_dict):
         if self.parameter("__array__") == "string":
@@ -13,14 +13,18 @@ numpy = ak.nplike.Numpy.instance()
 
 class NumpyArray(Content):
     is_NumpyType = True
+    _deferred = None
 
     def __init__(self, data, identifier=None, parameters=None, nplike=None):
         if nplike is None:
             nplike = ak.nplike.of(data)
-        self._data = nplike.asarray(data)
+        if isinstance(data, ak._v2._lazy.DeferredBuffer):
+            self._deferred = data
+        else:
+            self._data = nplike.asarray(data)
 
-        ak._v2.types.numpytype.dtype_to_primitive(self._data.dtype)
-        if len(self._data.shape) == 0:
+        ak._v2.types.numpytype.dtype_to_primitive(self.dtype)
+        if not isinstance(data, ak._v2._lazy.DeferredBuffer) and len(self.shape) == 0:
             raise TypeError(
                 "{} 'data' must be an array, not {}".format(
                     type(self).__name__, repr(data)
@@ -29,16 +33,35 @@ class NumpyArray(Content):
 
         self._init(identifier, parameters, nplike)
 
+    def __getattr__(self, name):
+        if name == "_data" and self._deferred is not None:
+            if self._deferred.transient:
+                return self._deferred.materialize()
+            self._data = self._deferred.materialize()
+            self._deferred = None
+            return self._data
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def is_deferred(self):
+        return self._deferred is not None
+
     @property
     def data(self):
         return self._data
 
     @property
     def shape(self):
+        if self._deferred is not None:
+            return self._deferred.shape
         return self._data.shape
 
     @property
     def inner_shape(self):
+        if self._deferred is not None:
+            return self._deferred.inner_shape
         return self._data.shape[1:]
 
     @property
@@ -47,6 +70,8 @@ class NumpyArray(Content):
 
     @property
     def dtype(self):
+        if self._deferred is not None:
+            return self._deferred.dtype
         return self._data.dtype
 
     @property
@@ -57,8 +82,8 @@ class NumpyArray(Content):
 
     def _form_with_key(self, getkey):
         return self.Form(
-            ak._v2.types.numpytype.dtype_to_primitive(self._data.dtype),
-            self._data.shape[1:],
+            ak._v2.types.numpytype.dtype_to_primitive(self.dtype),
+            self.inner_shape,
             has_identifier=self._identifier is not None,
             parameters=self._parameters,
             form_key=getkey(self),
@@ -80,9 +105,15 @@ class NumpyArray(Content):
 
     @property
     def length(self):
+        if self._deferred is not None:
+            return self._deferred.length
         return self._data.shape[0]
 
     def to(self, nplike):
+        if self._deferred is not None and isinstance(
+            nplike, ak._v2._typetracer.TypeTracer
+        ):
+            return nplike.asarray(self._deferred)
         return nplike.asarray(self._data)
 
     def __repr__(self):
@@ -228,10 +259,13 @@ class NumpyArray(Content):
         start, stop, step = where.indices(self.length)
         assert step == 1
 
-        try:
-            out = self._data[where]
-        except IndexError as err:
-            raise NestedIndexError(self, where, str(err))
+        if self._deferred is not None:
+            out = self._deferred.getitem_range(start, max(start, stop))
+        else:
+            try:
+                out = self._data[where]
+            except IndexError as err:
+                raise NestedIndexError(self, where, str(err))
 
         return NumpyArray(
             out,
@@ -506,6 +540,9 @@ class NumpyArray(Content):
     def is_contiguous(self):
         if isinstance(self._nplike, ak._v2._typetracer.TypeTracer):
             return True
+        if self._deferred is not None:
+            # DeferredBuffer.materialize always makes a C-contiguous view
+            return True
 
         # Alternatively, self._data.flags["C_CONTIGUOUS"], but the following assumes
         # less of the nplike.
@@ -1105,6 +1142,41 @@ class NumpyArray(Content):
 
         return out
 
+    def _reduce_segmented(self, reducer, offsets, mask, keepdims):
+        # Same as _reduce_next with parents made from offsets, or None if the
+        # reducer can't work from offsets directly.
+        if len(self._data.shape) != 1 or not self.is_contiguous:
+            return None
+
+        out = reducer.apply_segmented(self, offsets)
+        if out is None:
+            return None
+
+        if mask:
+            outmask = ak._v2.index.Index8(
+                self._nplike.asarray(offsets[1:] == offsets[:-1], dtype=np.int8)
+            )
+            out = ak._v2.contents.ByteMaskedArray(
+                outmask,
+                out,
+                False,
+                None,
+                None,
+                self._nplike,
+            )
+
+        if keepdims:
+            out = ak._v2.contents.RegularArray(
+                out,
+                1,
+                self.length,
+                None,
+                None,
+                self._nplike,
+            )
+
+        return out
+
     def _validityerror(self, path):
         if len(self.shape) == 0:
             return f'at {path} ("{type(self)}"): shape is zero-dimensional'
@@ -1150,8 +1222,19 @@ class NumpyArray(Content):
         storage_type = pyarrow.from_numpy_dtype(nparray.dtype)
 
         if issubclass(nparray.dtype.type, (bool, np.bool_)):
+            ak._v2._connect.pyarrow.check_zero_copy(
+                options["zero_copy"],
+                type(self).__name__,
+                "Arrow booleans are packed into bits",
+            )
             nparray = ak._v2._connect.pyarrow.packbits(nparray)
 
+        elif not nparray.flags["C_CONTIGUOUS"]:
+            ak._v2._connect.pyarrow.check_zero_copy(
+                options["zero_copy"], type(self).__name__, "the data are not contiguous"
+            )
+            nparray = numpy.ascontiguousarray(nparray)
+
         return pyarrow.Array.from_buffers(
             ak._v2._connect.pyarrow.to_awkwardarrow_type(
                 storage_type, options["extensionarray"], mask_node, self
@@ -1213,7 +1296,13 @@ class NumpyArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return len(self.shape) == 1 and self.is_contiguous
+
     def packed(self):
+        if self.is_packed:
+            return self
+
         return self.contiguous().toRegularArray()
 
     def _to_list(self, behavior):
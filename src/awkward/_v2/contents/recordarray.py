@@ -953,7 +953,13 @@ class RecordArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return all(x.length == self._length and x.is_packed for x in self._contents)
+
     def packed(self):
+        if self.is_packed:
+            return self
+
         return RecordArray(
             [
                 x.packed() if x.length == self._length else x[: self._length].packed()
@@ -981,20 +987,18 @@ class RecordArray(Content):
 
         if self.is_tuple:
             contents = [x._to_list(behavior) for x in self._contents]
-            length = self._length
-            out = [None] * length
-            for i in range(length):
-                out[i] = tuple(x[i] for x in contents)
-            return out
+            return list(self._zip_rows(contents))
 
         else:
             fields = self._fields
             contents = [x._to_list(behavior) for x in self._contents]
-            length = self._length
-            out = [None] * length
-            for i in range(length):
-                out[i] = dict(zip(fields, [x[i] for x in contents]))
-            return out
+            return [dict(zip(fields, row)) for row in self._zip_rows(contents)]
+
+    def _zip_rows(self, contents):
+        # one tuple per record; contents may be longer than the RecordArray
+        if len(contents) == 0:
+            return [()] * self._length
+        return zip(*[x[: self._length] for x in contents])
 
     def _to_json(
         self,
@@ -1027,14 +1031,8 @@ class RecordArray(Content):
                 )
                 for x in self._contents
             ]
-            length = self._length
-            out = [None] * length
-            fields = []
-            for i in range(length):
-                fields.append(str(i))
-            for i in range(length):
-                out[i] = dict(zip(fields, [x[i] for x in contents]))
-            return out
+            fields = [str(i) for i in range(len(contents))]
+            return [dict(zip(fields, row)) for row in self._zip_rows(contents)]
 
         else:
             fields = self._fields
@@ -1048,8 +1046,4 @@ class RecordArray(Content):
                 )
                 for x in self._contents
             ]
-            length = self._length
-            out = [None] * length
-            for i in range(length):
-                out[i] = dict(zip(fields, [x[i] for x in contents]))
-            return out
+            return [dict(zip(fields, row)) for row in self._zip_rows(contents)]
@@ -1033,6 +1033,11 @@ class RegularArray(Content):
 
     def _to_arrow(self, pyarrow, mask_node, validbytes, length, options):
         if self.parameter("__array__") == "string":
+            ak._v2._connect.pyarrow.check_zero_copy(
+                options["zero_copy"],
+                type(self).__name__,
+                "fixed-size strings must become variable-length strings with offsets",
+            )
             return self.toListOffsetArray64(False)._to_arrow(
                 pyarrow, mask_node, validbytes, length, options
             )
@@ -1142,7 +1147,16 @@ class RegularArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return (
+            self._content.length == self._length * self._size
+            and self._content.is_packed
+        )
+
     def packed(self):
+        if self.is_packed:
+            return self
+
         length = self._length * self._size
         if self._content.length == length:
             content = self._content.packed()
@@ -1158,24 +1172,25 @@ class RegularArray(Content):
             self._nplike,
         )
 
+    def _starts_and_stops_list(self):
+        length, size = self._length, self._size
+        if size == 0:
+            return [0] * length, [0] * length
+        else:
+            return range(0, length * size, size), range(size, (length + 1) * size, size)
+
     def _to_list(self, behavior):
         if self.parameter("__array__") == "bytestring":
-            content = ak._v2._util.tobytes(self._content.data)
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = content[(i) * size : (i + 1) * size]
-            return out
+            starts, stops = self._starts_and_stops_list()
+            return ak._v2._util.bytes_to_list(
+                self._content.data, starts, stops, decode=False
+            )
 
         elif self.parameter("__array__") == "string":
-            content = ak._v2._util.tobytes(self._content.data)
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = content[(i) * size : (i + 1) * size].decode(
-                    errors="surrogateescape"
-                )
-            return out
+            starts, stops = self._starts_and_stops_list()
+            return ak._v2._util.bytes_to_list(
+                self._content.data, starts, stops, decode=True
+            )
 
         else:
             out = self._to_list_custom(behavior)
@@ -1183,11 +1198,8 @@ class RegularArray(Content):
                 return out
 
             content = self._content._to_list(behavior)
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = content[(i) * size : (i + 1) * size]
-            return out
+            starts, stops = self._starts_and_stops_list()
+            return [content[start:stop] for start, stop in zip(starts, stops)]
 
     def _to_json(
         self,
@@ -1201,14 +1213,10 @@ class RegularArray(Content):
             self.parameter("__array__") == "bytestring"
             or self.parameter("__array__") == "string"
         ):
-            content = ak._v2._util.tobytes(self._content.data)
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = content[(i) * size : (i + 1) * size].decode(
-                    errors="surrogateescape"
-                )
-            return out
+            starts, stops = self._starts_and_stops_list()
+            return ak._v2._util.bytes_to_list(
+                self._content.data, starts, stops, decode=True
+            )
 
         else:
             out = self._to_json_custom()
@@ -1222,8 +1230,5 @@ class RegularArray(Content):
                 complex_real_string,
                 complex_imag_string,
             )
-            length, size = self._length, self._size
-            out = [None] * length
-            for i in range(length):
-                out[i] = content[(i) * size : (i + 1) * size]
-            return out
+            starts, stops = self._starts_and_stops_list()
+            return [content[start:stop] for start, stop in zip(starts, stops)]
@@ -58,7 +58,7 @@ class UnionArray(Content):
                     )
                 )
 
-        if tags.length > index.length:
+        if not tags.is_deferred and tags.length > index.length:
             raise ValueError(
                 "{} len(tags) ({}) must be <= len(index) ({})".format(
                     type(self).__name__, tags.length, index.length
@@ -1088,6 +1088,19 @@ class UnionArray(Content):
     def _to_arrow(self, pyarrow, mask_node, validbytes, length, options):
         nptags = self._tags.to(numpy)
         npindex = self._index.to(numpy)
+
+        if validbytes is not None:
+            ak._v2._connect.pyarrow.check_zero_copy(
+                options["zero_copy"],
+                type(self).__name__,
+                "Arrow unions can't have masks, so the mask must be pushed down",
+            )
+        if not issubclass(npindex.dtype.type, np.int32):
+            ak._v2._connect.pyarrow.check_zero_copy(
+                options["zero_copy"],
+                type(self).__name__,
+                "Arrow union offsets are 32-bit",
+            )
         copied_index = False
 
         values = []
@@ -1243,7 +1256,29 @@ class UnionArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        if not self._nplike.known_data or self._index.length != self._tags.length:
+            return False
+        tags = self._tags.to(self._nplike)
+        index = self._index.to(self._nplike)
+        for tag, content in enumerate(self._contents):
+            if not content.is_packed or not self._index_is_packed(
+                index[tags == tag], content
+            ):
+                return False
+        return True
+
+    def _index_is_packed(self, index, content):
+        # the index of one tag is 0, 1, 2, ... up to the content's length, so
+        # that every item of the content is used exactly once
+        return index.shape[0] == content.length and self._nplike.array_equal(
+            index, self._nplike.arange(index.shape[0], dtype=index.dtype)
+        )
+
     def packed(self):
+        if self.is_packed:
+            return self
+
         tags = self._tags.to(self._nplike)
         original_index = index = self._index.to(self._nplike)[: tags.shape[0]]
 
@@ -1253,7 +1288,7 @@ class UnionArray(Content):
             is_tag = tags == tag
             num_tag = self._nplike.count_nonzero(is_tag)
 
-            if len(contents[tag]) > num_tag:
+            if not self._index_is_packed(index[is_tag], contents[tag]):
                 if original_index is index:
                     index = index.copy()
                 index[is_tag] = self._nplike.arange(num_tag, dtype=index.dtype)
@@ -1279,10 +1314,10 @@ class UnionArray(Content):
         index = self._index.to(numpy)
         contents = [x._to_list(behavior) for x in self._contents]
 
-        out = [None] * tags.shape[0]
-        for i, tag in enumerate(tags):
-            out[i] = contents[tag][index[i]]
-        return out
+        return [
+            contents[tag][i]
+            for tag, i in zip(tags.tolist(), index[: tags.shape[0]].tolist())
+        ]
 
     def _to_json(
         self,
@@ -1309,7 +1344,7 @@ class UnionArray(Content):
             for x in self._contents
         ]
 
-        out = [None] * tags.shape[0]
-        for i, tag in enumerate(tags):
-            out[i] = contents[tag][index[i]]
-        return out
+        return [
+            contents[tag][i]
+            for tag, i in zip(tags.tolist(), index[: tags.shape[0]].tolist())
+        ]
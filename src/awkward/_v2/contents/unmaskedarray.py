@@ -533,7 +533,13 @@ class UnmaskedArray(Content):
         else:
             raise AssertionError(result)
 
+    def _is_packed(self):
+        return self._content.is_packed
+
     def packed(self):
+        if self.is_packed:
+            return self
+
         return UnmaskedArray(
             self._content.packed(), self._identifier, self._parameters, self._nplike
         )
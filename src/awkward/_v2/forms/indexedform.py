@@ -57,16 +57,16 @@ class IndexedForm(Form):
         out = self._content._type(typestrs)
 
         if self._parameters is not None:
+            parameters = self._parameters
+            if parameters.get("__array__") == "categorical":
+                parameters = dict(parameters)
+                del parameters["__array__"]
+
             if out._parameters is None:
-                out._parameters = self._parameters
+                out._parameters = parameters
             else:
                 out._parameters = dict(out._parameters)
-                _parameters_update(out._parameters, self._parameters)
-
-            if self._parameters.get("__array__") == "categorical":
-                if out._parameters is self._parameters:
-                    out._parameters = dict(out._parameters)
-                del out._parameters["__array__"]
+                _parameters_update(out._parameters, parameters)
 
         return out
 
@@ -27,6 +27,8 @@
 import sys
 import re
 import keyword
+import copyreg
+import pickle
 
 from collections.abc import Iterable
 from collections.abc import Sized
@@ -41,6 +43,17 @@ numpy = ak.nplike.Numpy.instance()
 _dir_pattern = re.compile(r"^[a-zA-Z_]\w*$")
 
 
+def _pickle_buffers(container):
+    # Protocol 5 can send these out-of-band (and zero-copy) if the consumer
+    # asks for it, or in-band as raw bytes, without NumPy's array metadata.
+    return {
+        key: pickle.PickleBuffer(
+            numpy.ascontiguousarray(buffer).reshape(-1).view(np.uint8)
+        )
+        for key, buffer in container.items()
+    }
+
+
 # def _suffix(array):
 #     out = ak._v2.operations.convert.kernels(array)
 #     if out is None or out == "cpu":
@@ -1411,7 +1424,10 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
         return numba.typeof(self._numbaview)
 
     def __getstate__(self):
-        packed = ak._v2.operations.structure.packed(self._layout, highlevel=False)
+        if self._layout.is_packed:
+            packed = self._layout
+        else:
+            packed = ak._v2.operations.structure.packed(self._layout, highlevel=False)
         form, length, container = ak._v2.operations.convert.to_buffers(
             packed, buffer_key="part0-{form_key}-{attribute}", form_key="node{id}"
         )
@@ -1421,6 +1437,16 @@ class Array(NDArrayOperatorsMixin, Iterable, Sized):
             behavior = self._behavior
         return form, length, container, behavior
 
+    def __reduce_ex__(self, protocol):
+        if protocol < 5:
+            return super().__reduce_ex__(protocol)
+        form, length, container, behavior = self.__getstate__()
+        return (
+            copyreg.__newobj__,
+            (type(self),),
+            (form, length, _pickle_buffers(container), behavior),
+        )
+
     def __setstate__(self, state):
         if isinstance(state[1], dict):
             raise ValueError(
@@ -2019,7 +2045,10 @@ class Record(NDArrayOperatorsMixin):
         return numba.typeof(self._numbaview)
 
     def __getstate__(self):
-        packed = ak._v2.operations.structure.packed(self._layout, highlevel=False)
+        if self._layout.is_packed:
+            packed = self._layout
+        else:
+            packed = ak._v2.operations.structure.packed(self._layout, highlevel=False)
         form, length, container = ak._v2.operations.convert.to_buffers(
             packed.array, buffer_key="part0-{form_key}-{attribute}", form_key="node{id}"
         )
@@ -2029,6 +2058,16 @@ class Record(NDArrayOperatorsMixin):
             behavior = self._behavior
         return form, length, container, behavior, packed.at
 
+    def __reduce_ex__(self, protocol):
+        if protocol < 5:
+            return super().__reduce_ex__(protocol)
+        form, length, container, behavior, at = self.__getstate__()
+        return (
+            copyreg.__newobj__,
+            (type(self),),
+            (form, length, _pickle_buffers(container), behavior, at),
+        )
+
     def __setstate__(self, state):
         if isinstance(state[1], dict):
             raise ValueError(
@@ -16,6 +16,7 @@ _dtype_to_form = {
 
 class Index:
     _expected_dtype = None
+    _deferred = None
 
     def __init__(self, data, metadata=None, nplike=None):
         if nplike is None:
@@ -23,33 +24,55 @@ class Index:
         self._nplike = nplike
         self._metadata = metadata
 
-        self._data = self._nplike.asarray(data, dtype=self._expected_dtype, order="C")
-        if len(self._data.shape) != 1:
-            raise TypeError("Index data must be one-dimensional")
+        if isinstance(data, ak._v2._lazy.DeferredBuffer):
+            if data.inner_shape != ():
+                raise TypeError("Index data must be one-dimensional")
+            self._deferred = data
+        else:
+            self._data = self._nplike.asarray(
+                data, dtype=self._expected_dtype, order="C"
+            )
+            if len(self._data.shape) != 1:
+                raise TypeError("Index data must be one-dimensional")
 
         if self._expected_dtype is None:
-            if self._data.dtype == np.dtype(np.int8):
+            if self.dtype == np.dtype(np.int8):
                 self.__class__ = Index8
-            elif self._data.dtype == np.dtype(np.uint8):
+            elif self.dtype == np.dtype(np.uint8):
                 self.__class__ = IndexU8
-            elif self._data.dtype == np.dtype(np.int32):
+            elif self.dtype == np.dtype(np.int32):
                 self.__class__ = Index32
-            elif self._data.dtype == np.dtype(np.uint32):
+            elif self.dtype == np.dtype(np.uint32):
                 self.__class__ = IndexU32
-            elif self._data.dtype == np.dtype(np.int64):
+            elif self.dtype == np.dtype(np.int64):
                 self.__class__ = Index64
             else:
                 raise TypeError(
                     "Index data must be int8, uint8, int32, uint32, int64, not "
-                    + repr(self._data.dtype)
+                    + repr(self.dtype)
                 )
         else:
-            if self._data.dtype != self._expected_dtype:
+            if self.dtype != self._expected_dtype:
                 # self._data = self._data.astype(self._expected_dtype)   # copy/convert
                 raise NotImplementedError(
                     "while developing, we want to catch these errors"
                 )
 
+    def __getattr__(self, name):
+        if name == "_data" and self._deferred is not None:
+            if self._deferred.transient:
+                return self._deferred.materialize()
+            self._data = self._deferred.materialize()
+            self._deferred = None
+            return self._data
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    @property
+    def is_deferred(self):
+        return self._deferred is not None
+
     @classmethod
     def zeros(cls, length, nplike, dtype=None):
         if dtype is None:
@@ -72,6 +95,8 @@ class Index:
 
     @property
     def dtype(self):
+        if self._deferred is not None:
+            return self._deferred.dtype
         return self._data.dtype
 
     @property
@@ -86,6 +111,8 @@ class Index:
 
     @property
     def length(self):
+        if self._deferred is not None:
+            return self._deferred.length
         return self._data.shape[0]
 
     def __len__(self):
@@ -94,6 +121,10 @@ class Index:
     def to(self, nplike):
         if nplike is self._nplike:
             return self._data
+        elif self._deferred is not None and isinstance(
+            nplike, ak._v2._typetracer.TypeTracer
+        ):
+            return nplike.asarray(self._deferred)
         else:
             return nplike.asarray(self._data)
 
@@ -144,9 +175,20 @@ class Index:
 
     @property
     def form(self):
-        return _dtype_to_form[self._data.dtype]
+        return _dtype_to_form[self.dtype]
 
     def __getitem__(self, where):
+        if (
+            self._deferred is not None
+            and isinstance(where, slice)
+            and where.step in (None, 1)
+        ):
+            start, stop, _ = where.indices(self._deferred.length)
+            return type(self)(
+                self._deferred.getitem_range(start, max(start, stop)),
+                nplike=self._nplike,
+            )
+
         out = self._data[where]
         if hasattr(out, "shape") and len(out.shape) != 0:
             return type(self)(out)
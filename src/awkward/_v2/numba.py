@@ -42,6 +42,7 @@ def register():
     import awkward._v2._connect.numba.arrayview
     import awkward._v2._connect.numba.layout
     import awkward._v2._connect.numba.builder
+    import awkward._v2._connect.numba.layoutbuilder
 
     n = ak._v2.numba
     n.ArrayViewType = awkward._v2._connect.numba.arrayview.ArrayViewType
@@ -61,6 +62,9 @@ def register():
     n.UnionArrayType = awkward._v2._connect.numba.layout.UnionArrayType
     n.ArrayBuilderType = awkward._v2._connect.numba.builder.ArrayBuilderType
     n.ArrayBuilderModel = awkward._v2._connect.numba.builder.ArrayBuilderModel
+    n.LayoutBuilder = awkward._v2._connect.numba.layoutbuilder.LayoutBuilder
+    n.LayoutBuilderType = awkward._v2._connect.numba.layoutbuilder.LayoutBuilderType
+    n.LayoutBuilderModel = awkward._v2._connect.numba.layoutbuilder.LayoutBuilderModel
 
     @numba.extending.typeof_impl.register(ak._v2.highlevel.Array)
     def typeof_Array(obj, c):
@@ -73,3 +77,63 @@ def register():
     @numba.extending.typeof_impl.register(ak._v2.highlevel.ArrayBuilder)
     def typeof_ArrayBuilder(obj, c):
         return obj.numba_type
+
+
+def layout_builder(form, initial=1024):
+    """
+    Args:
+        form (#ak.forms.Form or str/dict equivalent): The Form of the array
+            to build.
+        initial (int): Initial number of items each buffer can hold before
+            it is reallocated (each reallocation doubles it).
+
+    Returns a builder for arrays of a given `form` that is filled in
+    Numba-compiled functions. Unlike #ak.ArrayBuilder, which discovers the
+    type of the data as it goes, the type of a LayoutBuilder is fixed by
+    its `form`, so appending to it compiles to a store into a NumPy buffer
+    (and a length check), and #snapshot passes those buffers to
+    #ak.from_buffers without copying them.
+
+    The builder is a tree of nodes that mirrors the `form`:
+
+       * NumpyForm: `append(x)`;
+       * ListOffsetForm and RegularForm: `begin_list()` returns the node
+         for the list contents, `end_list()` closes the list;
+       * IndexedOptionForm: `append_valid()` returns the node for the
+         content (append one item to it), `append_null()` adds a None;
+       * RecordForm: `content(name_or_index)` (with a constant argument)
+         returns the node for a field, `end_record()` closes the record.
+
+    Every node has a `length`. For example,
+
+        >>> builder = ak._v2.numba.layout_builder(
+        ...     {
+        ...         "class": "ListOffsetArray",
+        ...         "offsets": "i64",
+        ...         "content": {
+        ...             "class": "RecordArray",
+        ...             "contents": {"x": "float64", "y": "int64"},
+        ...         },
+        ...     }
+        ... )
+        >>> @nb.njit
+        ... def fill(builder, n):
+        ...     for i in range(n):
+        ...         records = builder.begin_list()
+        ...         for j in range(i):
+        ...             records.content("x").append(j * 1.1)
+        ...             records.content("y").append(j)
+        ...             records.end_record()
+        ...         builder.end_list()
+        ...
+        >>> fill(builder, 3)
+        >>> builder.snapshot()
+        <Array [[], [{x: 0, ...}], [{...}, {...}]] type='3 * var * {x: float64, ...'>
+
+    Only these Form nodes (with NumpyForms of booleans and numbers, and
+    IndexedOptionForms with a signed index) are supported. Consistency of
+    the nodes (e.g. that each record has a value for every field) is up to
+    the caller, as in the C++ LayoutBuilder.
+    """
+    register_and_check()
+    return ak._v2.numba.LayoutBuilder(form, initial)
@@ -6,7 +6,7 @@ import awkward as ak
 np = ak.nplike.NumpyMetadata.instance()
 
 
-def from_arrow(array, highlevel=True, behavior=None):
+def from_arrow(array, highlevel=True, behavior=None, zero_copy=False):
     """
     Args:
         array (`pyarrow.Array`, `pyarrow.ChunkedArray`, `pyarrow.RecordBatch`,
@@ -16,8 +16,26 @@ def from_arrow(array, highlevel=True, behavior=None):
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        zero_copy (bool): If True, raise ValueError instead of copying any
+            buffer; otherwise, copy whatever can't be viewed directly.
+
+    Converts an Apache Arrow array into an Awkward Array.
+
+    Most Arrow buffers are viewed, not copied: offsets are used as they are
+    (Arrow slices become offsets that don't start at zero) and validity
+    bitmaps become #ak.layout.BitMaskedArray masks. The exceptions are
+    booleans (Arrow packs them into bits), 32-bit dates and times, dictionary
+    indexes with missing values, the null type, sparse unions, slices whose
+    offset isn't a multiple of 8 in arrays with validity bitmaps, and tables
+    or chunked arrays with more than one chunk. With `zero_copy=True`, these
+    raise an error that names the Arrow node, so that a successful conversion
+    is guaranteed to share all of its memory with Arrow.
+
+    See also #ak.to_arrow.
     """
     import awkward._v2._connect.pyarrow
 
-    out = awkward._v2._connect.pyarrow.handle_arrow(array, pass_empty_field=True)
+    out = awkward._v2._connect.pyarrow.handle_arrow(
+        array, pass_empty_field=True, zero_copy=zero_copy
+    )
     return ak._v2._util.wrap(out, behavior, highlevel)
@@ -17,6 +17,7 @@ def from_buffers(
     nplike=numpy,
     highlevel=True,
     behavior=None,
+    lazy=False,
 ):
     """
     Args:
@@ -39,6 +40,9 @@ def from_buffers(
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        lazy (bool): If True, no buffers are read from the `container` until
+            the array's data are needed; the values in `container` may also be
+            callables that return buffers, which are only called at that time.
 
     Reconstitutes an Awkward Array from a Form, length, and a collection of memory
     buffers, so that data can be losslessly read from file formats and storage
@@ -57,6 +61,14 @@ def from_buffers(
 
     The `buffer_key` should be the same as the one used in #ak.to_buffers.
 
+    With `lazy=True`, each #ak.layout.NumpyArray and #ak.layout.Index is
+    backed by a deferred buffer, which gets its dtype and shape from the
+    `form` and `length` and only pulls data from the `container` when it is
+    first accessed. The lengths of nested nodes are computed from their
+    parents' index buffers (e.g. the last offset of a list) only when they
+    are needed, so selecting a few fields of a wide record reads only those
+    fields' buffers (and the indexes that lead to them).
+
     See #ak.to_buffers for examples.
     """
     if ak._v2._util.isstr(form):
@@ -90,7 +102,7 @@ def from_buffers(
             f"buffer_key must be a string or a callable, not {type(buffer_key)}"
         )
 
-    out = reconstitute(form, length, container, getkey, nplike)
+    out = reconstitute(form, length, container, getkey, nplike, lazy)
     return ak._v2._util.wrap(out, behavior, highlevel)
 
 
@@ -103,44 +115,87 @@ _index_to_dtype = {
 }
 
 
-def reconstitute(form, length, container, getkey, nplike):
+def _length_plus_one(length):
+    if isinstance(length, ak._v2._lazy.DeferredLength):
+        return ak._v2._lazy.DeferredLength(lambda: length() + 1)
+    else:
+        return length + 1
+
+
+class _Reconstitutor:
+    def __init__(self, container, getkey, nplike, lazy, transient):
+        self.container = container
+        self.getkey = getkey
+        self.nplike = nplike
+        self.lazy = lazy
+        self.transient = transient
+
+    def buffer(self, form, attribute, dtype, length, inner_shape=()):
+        key = self.getkey(form, attribute)
+        if self.lazy:
+            container = self.container
+
+            def generator():
+                raw_array = container[key]
+                if callable(raw_array):
+                    raw_array = raw_array()
+                return raw_array
+
+            return ak._v2._lazy.DeferredBuffer(
+                generator, dtype, length, inner_shape, self.nplike, self.transient
+            )
+
+        else:
+            raw_array = self.container[key]
+            count = length
+            for x in inner_shape:
+                count *= x
+            data = self.nplike.frombuffer(raw_array, dtype=dtype, count=count)
+            if inner_shape != ():
+                data = data.reshape((length,) + inner_shape)
+            return data
+
+    def length(self, function):
+        if self.lazy:
+            return ak._v2._lazy.DeferredLength(function)
+        else:
+            return function()
+
+
+def reconstitute(form, length, container, getkey, nplike, lazy=False, transient=False):
+    return _reconstitute(
+        form, length, _Reconstitutor(container, getkey, nplike, lazy, transient)
+    )
+
+
+def _reconstitute(form, length, r):
     if form.has_identifier:
         raise NotImplementedError("ak.from_buffers for an array with an Identifier")
     else:
         identifier = None
 
     if isinstance(form, ak._v2.forms.EmptyForm):
+        length = ak._v2._lazy.resolve_length(length)
         if length != 0:
             raise ValueError(f"EmptyForm node, but the expected length is {length}")
         return ak._v2.contents.EmptyArray(identifier, form.parameters)
 
     elif isinstance(form, ak._v2.forms.NumpyForm):
         dtype = ak._v2.types.numpytype.primitive_to_dtype(form.primitive)
-        raw_array = container[getkey(form, "data")]
-        real_length = length
-        for x in form.inner_shape:
-            real_length *= x
-        data = nplike.frombuffer(raw_array, dtype=dtype, count=real_length)
-        if form.inner_shape != ():
-            if len(data) == 0:
-                data = data.reshape((length,) + form.inner_shape)
-            else:
-                data = data.reshape((-1,) + form.inner_shape)
-        return ak._v2.contents.NumpyArray(data, identifier, form.parameters, nplike)
+        data = r.buffer(form, "data", dtype, length, form.inner_shape)
+        return ak._v2.contents.NumpyArray(data, identifier, form.parameters, r.nplike)
 
     elif isinstance(form, ak._v2.forms.UnmaskedForm):
-        content = reconstitute(form.content, length, container, getkey, nplike)
+        content = _reconstitute(form.content, length, r)
         return ak._v2.contents.UnmaskedArray(content, identifier, form.parameters)
 
     elif isinstance(form, ak._v2.forms.BitMaskedForm):
-        raw_array = container[getkey(form, "mask")]
+        length = ak._v2._lazy.resolve_length(length)
         excess_length = int(math.ceil(length / 8.0))
-        mask = nplike.frombuffer(
-            raw_array, dtype=_index_to_dtype[form.mask], count=excess_length
-        )
+        mask = r.buffer(form, "mask", _index_to_dtype[form.mask], excess_length)
         return ak._v2.contents.BitMaskedArray(
-            ak._v2.index.Index(mask),
-            reconstitute(form.content, length, container, getkey, nplike),
+            ak._v2.index.Index(mask, nplike=r.nplike),
+            _reconstitute(form.content, length, r),
             form.valid_when,
             length,
             form.lsb_order,
@@ -149,80 +204,104 @@ def reconstitute(form, length, container, getkey, nplike):
         )
 
     elif isinstance(form, ak._v2.forms.ByteMaskedForm):
-        raw_array = container[getkey(form, "mask")]
-        mask = nplike.frombuffer(
-            raw_array, dtype=_index_to_dtype[form.mask], count=length
-        )
+        mask = r.buffer(form, "mask", _index_to_dtype[form.mask], length)
         return ak._v2.contents.ByteMaskedArray(
-            ak._v2.index.Index(mask),
-            reconstitute(form.content, length, container, getkey, nplike),
+            ak._v2.index.Index(mask, nplike=r.nplike),
+            _reconstitute(form.content, length, r),
             form.valid_when,
             identifier,
             form.parameters,
         )
 
     elif isinstance(form, ak._v2.forms.IndexedOptionForm):
-        raw_array = container[getkey(form, "index")]
-        index = nplike.frombuffer(
-            raw_array, dtype=_index_to_dtype[form.index], count=length
+        index = ak._v2.index.Index(
+            r.buffer(form, "index", _index_to_dtype[form.index], length),
+            nplike=r.nplike,
         )
-        next_length = 0 if len(index) == 0 else max(0, nplike.max(index) + 1)
+
+        def next_length():
+            if len(index) == 0:
+                return 0
+            else:
+                return max(0, r.nplike.max(index.data) + 1)
+
         return ak._v2.contents.IndexedOptionArray(
-            ak._v2.index.Index(index),
-            reconstitute(form.content, next_length, container, getkey, nplike),
+            index,
+            _reconstitute(form.content, r.length(next_length), r),
             identifier,
             form.parameters,
         )
 
     elif isinstance(form, ak._v2.forms.IndexedForm):
-        raw_array = container[getkey(form, "index")]
-        index = nplike.frombuffer(
-            raw_array, dtype=_index_to_dtype[form.index], count=length
+        index = ak._v2.index.Index(
+            r.buffer(form, "index", _index_to_dtype[form.index], length),
+            nplike=r.nplike,
         )
-        next_length = 0 if len(index) == 0 else nplike.max(index) + 1
+
+        def next_length():
+            if len(index) == 0:
+                return 0
+            else:
+                return r.nplike.max(index.data) + 1
+
         return ak._v2.contents.IndexedArray(
-            ak._v2.index.Index(index),
-            reconstitute(form.content, next_length, container, getkey, nplike),
+            index,
+            _reconstitute(form.content, r.length(next_length), r),
             identifier,
             form.parameters,
         )
 
     elif isinstance(form, ak._v2.forms.ListForm):
-        raw_array1 = container[getkey(form, "starts")]
-        raw_array2 = container[getkey(form, "stops")]
-        starts = nplike.frombuffer(
-            raw_array1, dtype=_index_to_dtype[form.starts], count=length
+        starts = ak._v2.index.Index(
+            r.buffer(form, "starts", _index_to_dtype[form.starts], length),
+            nplike=r.nplike,
         )
-        stops = nplike.frombuffer(
-            raw_array2, dtype=_index_to_dtype[form.stops], count=length
+        stops = ak._v2.index.Index(
+            r.buffer(form, "stops", _index_to_dtype[form.stops], length),
+            nplike=r.nplike,
         )
-        reduced_stops = stops[starts != stops]
-        next_length = 0 if len(starts) == 0 else nplike.max(reduced_stops)
+
+        def next_length():
+            reduced_stops = stops.data[starts.data != stops.data]
+            if len(reduced_stops) == 0:
+                return 0
+            else:
+                return r.nplike.max(reduced_stops)
+
         return ak._v2.contents.ListArray(
-            ak._v2.index.Index(starts),
-            ak._v2.index.Index(stops),
-            reconstitute(form.content, next_length, container, getkey, nplike),
+            starts,
+            stops,
+            _reconstitute(form.content, r.length(next_length), r),
             identifier,
             form.parameters,
         )
 
     elif isinstance(form, ak._v2.forms.ListOffsetForm):
-        raw_array = container[getkey(form, "offsets")]
-        offsets = nplike.frombuffer(
-            raw_array, dtype=_index_to_dtype[form.offsets], count=length + 1
+        offsets = ak._v2.index.Index(
+            r.buffer(
+                form, "offsets", _index_to_dtype[form.offsets], _length_plus_one(length)
+            ),
+            nplike=r.nplike,
         )
-        next_length = 0 if len(offsets) == 1 else offsets[-1]
+
+        def next_length():
+            if len(offsets) == 1:
+                return 0
+            else:
+                return offsets.data[-1]
+
         return ak._v2.contents.ListOffsetArray(
-            ak._v2.index.Index(offsets),
-            reconstitute(form.content, next_length, container, getkey, nplike),
+            offsets,
+            _reconstitute(form.content, r.length(next_length), r),
             identifier,
             form.parameters,
         )
 
     elif isinstance(form, ak._v2.forms.RegularForm):
+        length = ak._v2._lazy.resolve_length(length)
         next_length = length * form.size
         return ak._v2.contents.RegularArray(
-            reconstitute(form.content, next_length, container, getkey, nplike),
+            _reconstitute(form.content, next_length, r),
             form.size,
             length,
             identifier,
@@ -230,11 +309,9 @@ def reconstitute(form, length, container, getkey, nplike):
         )
 
     elif isinstance(form, ak._v2.forms.RecordForm):
+        length = ak._v2._lazy.resolve_length(length)
         return ak._v2.contents.RecordArray(
-            [
-                reconstitute(content, length, container, getkey, nplike)
-                for content in form.contents
-            ],
+            [_reconstitute(content, length, r) for content in form.contents],
             None if form.is_tuple else form.fields,
             length,
             identifier,
@@ -242,27 +319,28 @@ def reconstitute(form, length, container, getkey, nplike):
         )
 
     elif isinstance(form, ak._v2.forms.UnionForm):
-        raw_array1 = container[getkey(form, "tags")]
-        raw_array2 = container[getkey(form, "index")]
-        tags = nplike.frombuffer(
-            raw_array1, dtype=_index_to_dtype[form.tags], count=length
+        tags = ak._v2.index.Index(
+            r.buffer(form, "tags", _index_to_dtype[form.tags], length),
+            nplike=r.nplike,
         )
-        index = nplike.frombuffer(
-            raw_array2, dtype=_index_to_dtype[form.index], count=length
+        index = ak._v2.index.Index(
+            r.buffer(form, "index", _index_to_dtype[form.index], length),
+            nplike=r.nplike,
         )
-        lengths = []
-        for tag in range(len(form.contents)):
-            selected_index = index[tags == tag]
+
+        def next_length(tag):
+            selected_index = index.data[tags.data == tag]
             if len(selected_index) == 0:
-                lengths.append(0)
+                return 0
             else:
-                lengths.append(nplike.max(selected_index) + 1)
+                return r.nplike.max(selected_index) + 1
+
         return ak._v2.contents.UnionArray(
-            ak._v2.index.Index(tags),
-            ak._v2.index.Index(index),
+            tags,
+            index,
             [
-                reconstitute(content, lengths[i], container, getkey, nplike)
-                for i, content in enumerate(form.contents)
+                _reconstitute(content, r.length(lambda tag=tag: next_length(tag)), r)
+                for tag, content in enumerate(form.contents)
             ],
             identifier,
             form.parameters,
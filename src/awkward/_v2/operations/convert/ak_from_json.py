@@ -2,7 +2,6 @@
 
 
 import awkward as ak
-import json
 
 np = ak.nplike.NumpyMetadata.instance()
 
@@ -13,14 +12,20 @@ def from_json(
     infinity_string=None,
     minus_infinity_string=None,
     complex_record_fields=None,
+    schema=None,
     highlevel=True,
     behavior=None,
+    initial=1024,
+    resize=1.5,
+    buffersize=65536,
 ):
     """
     Args:
-        source (str): JSON-formatted string to convert into an array. The string
-            must comply with 'ndjson' specification: please, see
-            https://github.com/ndjson/ndjson-spec for more details.
+        source (str, bytes, or file-like object): JSON-formatted text to convert
+            into an array. Several JSON values must be separated by newlines,
+            as in the 'ndjson' specification: please, see
+            https://github.com/ndjson/ndjson-spec for more details. If `source`
+            has a `read` method, it is read in chunks of `buffersize`.
         nan_string (None or str): If not None, strings with this value will be
             interpreted as floating-point NaN values.
         infinity_string (None or str): If not None, strings with this value will
@@ -29,13 +34,39 @@ def from_json(
             will be interpreted as floating-point negative infinity values.
         complex_record_fields (None or (str, str)): If not None, defines a pair of
             field names to interpret records as complex numbers.
+        schema (None, str, bytes, or nested dicts): If not None, a JSONSchema
+            describing the data, which is passed to #ak.from_json_schema to parse
+            the data directly into buffers of the known type. Several JSON
+            values separated by newlines are only allowed if the root of the
+            schema is an object.
         highlevel (bool): If True, return an #ak.Array; otherwise, return
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        initial (int): Initial size (in bytes) of buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions).
+        resize (float): Resize multiplier for buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
+            should be strictly greater than 1.
+        buffersize (int): Size of the chunks read from a file-like `source`
+            (in bytes, or in characters for a text file).
 
     Converts a JSON string into an Awkward Array.
 
+    The text is parsed in C++ and fed directly into an #ak.layout.ArrayBuilder,
+    without creating Python objects for the JSON values. A file-like `source`
+    is streamed into the parser one chunk at a time (a JSON value may span
+    several chunks), so only one chunk of text is in memory at once.
+
+    If a `schema` is given, the parsing is delegated to #ak.from_json_schema,
+    which does not need to discover the type of the data as it goes and fills
+    the output buffers directly. This is usually considerably faster than
+    parsing without a schema (see `studies/json-schema-throughput.py`).
+
+    If `source` contains exactly one JSON value, that value is returned
+    (an array for a JSON list, a record for a JSON object, or a scalar);
+    otherwise, the values are returned as an array.
+
     See also #ak.from_json_schema and #ak.to_json.
     """
 
@@ -50,20 +81,59 @@ def from_json(
     ):
         complex_real_string, complex_imag_string = complex_record_fields
 
-    lines = source.splitlines()
-    if len(lines) == 1:
-        out = json.loads(source)
+    if schema is not None:
+        if (
+            nan_string is not None
+            or infinity_string is not None
+            or minus_infinity_string is not None
+        ):
+            raise NotImplementedError(
+                "nan_string, infinity_string, and minus_infinity_string are "
+                "not supported with a schema"
+            )
+        layout = ak._v2.operations.convert.from_json_schema(
+            source,
+            schema,
+            highlevel=False,
+            output_initial_size=initial,
+            output_resize_factor=resize,
+            buffersize=buffersize,
+        )
+        if isinstance(layout, ak._v2.record.Record):
+            layout, num = layout.array, 1
+        else:
+            num = None
+
+    elif hasattr(source, "read"):
+        builder = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+        num = ak._ext.fromjsonobj(
+            source,
+            builder,
+            nan_string=nan_string,
+            infinity_string=infinity_string,
+            minus_infinity_string=minus_infinity_string,
+            buffersize=buffersize,
+            one_per_line=True,
+        )
+
+    elif isinstance(source, (str, bytes)):
+        builder = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+        num = ak._ext.fromjson(
+            source,
+            builder,
+            nan_string=nan_string,
+            infinity_string=infinity_string,
+            minus_infinity_string=minus_infinity_string,
+            one_per_line=True,
+        )
+
     else:
-        non_empty_lines = [line for line in lines if line.strip() != ""]
-        lines = ",".join(non_empty_lines)
-        text = f"[{lines}]"
-        out = json.loads(text)
-
-    try:
-        iter(out)
-        layout = ak._v2.operations.convert.from_iter(out).layout
-    except TypeError:
-        return out
+        raise TypeError(
+            f"source must be a str, bytes, or file-like object, not {repr(source)}"
+        )
+
+    if schema is None:
+        layout = _builder_to_layout(builder)
 
     def record_to_complex(node, **kwargs):
         if isinstance(node, ak._v2.contents.RecordArray):
@@ -90,7 +160,16 @@ def from_json(
         else layout.recursively_apply(record_to_complex)
     )
 
-    if highlevel:
-        return ak._v2._util.wrap(layout, behavior, highlevel)
+    out = ak._v2._util.wrap(layout, behavior, highlevel)
+    if num == 1:
+        return out[0]
     else:
-        return layout
+        return out
+
+
+def _builder_to_layout(builder):
+    formstr, length, buffers = builder.to_buffers()
+    form = ak._v2.forms.from_json(formstr)
+    return ak._v2.operations.convert.from_buffers(
+        form, length, buffers, highlevel=False
+    )
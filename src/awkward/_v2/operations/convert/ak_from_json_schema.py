@@ -17,10 +17,13 @@ def from_json_schema(
     behavior=None,
     output_initial_size=1024,
     output_resize_factor=1.5,
+    buffersize=65536,
 ):
     """
     Args:
-        source (str or bytes): JSON-formatted string to convert into an array.
+        source (str, bytes, or file-like object): JSON-formatted string to
+            convert into an array. If `source` has a `read` method, it is read
+            in chunks of `buffersize`.
         schema (str, bytes, or nested dicts): JSONSchema to assume in the parsing.
             The JSON data are *not* validated against the schema; the schema is
             only used to accelerate parsing.
@@ -32,11 +35,24 @@ def from_json_schema(
             grow as needed to accommodate the size of the dataset.
         output_resize_factor (float): Resize multiplier for output buffers, which
             determines how quickly they grow; should be strictly greater than 1.
+        buffersize (int): Size of the chunks read from a file-like `source`
+            (in bytes, or in characters for a text file).
 
     Converts a JSON string into an Awkward Array, using a JSONSchema to accelerate
     the parsing of the source and building of the output. The JSON data are not
     *validated* against the schema; the schema is *assumed* to be correct.
 
+    The schema is compiled into instructions for a specialized parser that
+    fills each output buffer directly, so there is no type discovery (as
+    in #ak.layout.ArrayBuilder) and the buffers are passed to
+    #ak.from_buffers without copying.
+
+    If the root of the schema is `"type": "array"`, `source` must contain
+    exactly one JSON array. If it is `"type": "object"`, `source` may contain
+    several JSON objects separated by newlines (as in the 'ndjson'
+    specification; one object may span several lines): exactly one object
+    is returned as a record, and any other number as an array of records.
+
     Supported JSONSchema elements:
 
       * The root of the schema must be `"type": "array"` or `"type": "object"`.
@@ -61,8 +77,14 @@ def from_json_schema(
 
     See also #ak.from_json and #ak.to_json.
     """
-    if not isinstance(source, bytes) and not ak._v2._util.isstr(source):
-        raise NotImplementedError("for now, 'source' must be bytes or str")
+    if (
+        not hasattr(source, "read")
+        and not isinstance(source, bytes)
+        and not ak._v2._util.isstr(source)
+    ):
+        raise NotImplementedError(
+            "for now, 'source' must be bytes, str, or a file-like object"
+        )
 
     if isinstance(schema, bytes) or ak._v2._util.isstr(schema):
         schema = json.loads(schema)
@@ -94,7 +116,18 @@ def from_json_schema(
         output_resize_factor=output_resize_factor,
     )
 
-    if not specializedjson.parse_string(source):
+    one_per_line = schema.get("type") == "object"
+    if hasattr(source, "read"):
+        if not specializedjson.parse_stream(
+            source, buffersize=buffersize, one_per_line=one_per_line
+        ):
+            raise ValueError(
+                "JSON is invalid or does not fit schema at position {}".format(
+                    specializedjson.json_position
+                )
+            )
+
+    elif not specializedjson.parse_string(source, one_per_line=one_per_line):
         position = specializedjson.json_position
         before = source[max(0, position - 30) : position]
         if isinstance(before, bytes):
@@ -117,14 +150,13 @@ def from_json_schema(
         if value is None:
             container[key] = specializedjson[key]
 
-    if schema.get("type") == "array":
-        length = len(specializedjson)
-    else:
-        length = 1
+    length = len(specializedjson)
 
-    out = ak._v2.operations.convert.from_buffers(form, length, container)
+    out = ak._v2.operations.convert.from_buffers(
+        form, length, container, highlevel=highlevel, behavior=behavior
+    )
 
-    if schema.get("type") == "array":
+    if schema.get("type") == "array" or length != 1:
         return out
     else:
         return out[0]
@@ -227,7 +259,7 @@ def build_assembly(schema, container, instructions):
 
         else:
             if is_optional:
-                mask = f"node{container}"
+                mask = f"node{len(container)}"
                 container[mask + "-mask"] = None
                 instructions.append(["FillByteMaskedArray", mask + "-mask", "int8"])
 
@@ -15,6 +15,7 @@ def to_arrow(
     categorical_as_dictionary=False,
     extensionarray=True,
     count_nulls=True,
+    zero_copy=False,
 ):
     """
     Args:
@@ -45,6 +46,9 @@ def to_arrow(
         count_nulls (bool): If True, count the number of missing values at each level
             and include these in the resulting Arrow array, which makes some downstream
             applications faster. If False, skip the up-front cost of counting them.
+        zero_copy (bool): If True, raise ValueError instead of copying any
+            buffer, so that the Arrow array shares all of its memory with the
+            Awkward Array; otherwise, copy whatever can't be passed directly.
 
     Converts an Awkward Array into an Apache Arrow array.
 
@@ -74,4 +78,5 @@ def to_arrow(
         categorical_as_dictionary=categorical_as_dictionary,
         extensionarray=extensionarray,
         count_nulls=count_nulls,
+        zero_copy=zero_copy,
     )
@@ -17,6 +17,7 @@ def to_arrow_table(
     categorical_as_dictionary=False,
     extensionarray=True,
     count_nulls=True,
+    zero_copy=False,
 ):
     """
     Args:
@@ -47,6 +48,9 @@ def to_arrow_table(
         count_nulls (bool): If True, count the number of missing values at each level
             and include these in the resulting Arrow array, which makes some downstream
             applications faster. If False, skip the up-front cost of counting them.
+        zero_copy (bool): If True, raise ValueError instead of copying any
+            buffer, so that the Arrow array shares all of its memory with the
+            Awkward Array; otherwise, copy whatever can't be passed directly.
 
     Converts an Awkward Array into an Apache Arrow table.
 
@@ -86,11 +90,12 @@ def to_arrow_table(
                     categorical_as_dictionary=categorical_as_dictionary,
                     extensionarray=extensionarray,
                     count_nulls=count_nulls,
+                    zero_copy=zero_copy,
                 )
             )
             pafields.append(
                 pyarrow.field(name, paarrays[-1].type).with_nullable(
-                    layout.is_OptionType
+                    layout.is_OptionType or layout[name].is_OptionType
                 )
             )
         parameters = []
@@ -109,6 +114,7 @@ def to_arrow_table(
                 categorical_as_dictionary=categorical_as_dictionary,
                 extensionarray=extensionarray,
                 count_nulls=count_nulls,
+                zero_copy=zero_copy,
             )
         )
         pafields.append(
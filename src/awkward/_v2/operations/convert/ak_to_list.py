@@ -43,7 +43,14 @@ def to_list(array):
     ):
         return array.to_list()
 
-    elif isinstance(array, (ak._v2.contents.Content, ak._v2.record.Record)):
+    elif isinstance(
+        array,
+        (
+            ak._v2.contents.Content,
+            ak._v2.record.Record,
+            ak._v2.partition.PartitionedArray,
+        ),
+    ):
         return array.to_list(None)
 
     elif isinstance(
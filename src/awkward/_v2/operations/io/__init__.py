@@ -4,3 +4,5 @@ from awkward._v2.operations.io.ak_from_json_file import from_json_file  # noqa:
 from awkward._v2.operations.io.ak_to_json_file import to_json_file  # noqa: F401
 from awkward._v2.operations.io.ak_from_parquet import from_parquet  # noqa: F401
 from awkward._v2.operations.io.ak_to_parquet import to_parquet  # noqa: F401
+from awkward._v2.operations.io.ak_from_memmap import from_memmap  # noqa: F401
+from awkward._v2.operations.io.ak_to_memmap import to_memmap  # noqa: F401
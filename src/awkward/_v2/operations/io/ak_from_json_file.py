@@ -2,29 +2,10 @@
 
 
 import awkward as ak
-import json
 
 np = ak.nplike.NumpyMetadata.instance()
 
 
-class NDJSONDecoder(json.JSONDecoder):
-    """
-    JSON decoder class to implement 'ndjson' specs:
-    see https://github.com/ndjson/ndjson-spec
-
-    - accept newline as line delimiter '\n' (0x0A) as well as carriage return and newline '\r\n' (0x0D0A)
-    - ignore empty lines '\n\n'
-    - raise an error if JSON is nor parsable
-    """
-
-    def decode(self, s, *args, **kwargs):
-        lines = s.splitlines()
-        non_empty_lines = [line for line in lines if line.strip() != ""]
-        lines = ",".join(non_empty_lines)
-        text = f"[{lines}]"
-        return super().decode(text, *args, **kwargs)
-
-
 def from_json_file(
     source,
     nan_string=None,
@@ -33,6 +14,8 @@ def from_json_file(
     complex_record_fields=None,
     highlevel=False,
     behavior=None,
+    initial=1024,
+    resize=1.5,
     buffersize=65536,
 ):
     """
@@ -50,11 +33,21 @@ def from_json_file(
             a low-level #ak.layout.Content subclass.
         behavior (None or dict): Custom #ak.behavior for the output array, if
             high-level.
+        initial (int): Initial size (in bytes) of buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions).
+        resize (float): Resize multiplier for buffers used by
+            #ak.layout.ArrayBuilder (see #ak.layout.ArrayBuilderOptions);
+            should be strictly greater than 1.
         buffersize (int): Size (in bytes) of the buffer used by the JSON
             parser.
 
     Converts content of a JSON file into an Awkward Array.
 
+    The file is streamed through the C++ JSON parser `buffersize` bytes at a
+    time and fed directly into an #ak.layout.ArrayBuilder, so the file is
+    never loaded into memory as a whole and no Python objects are created
+    for the JSON values.
+
     See also #ak.from_json_schema and #ak.to_json.
     """
     if complex_record_fields is None:
@@ -68,10 +61,22 @@ def from_json_file(
     ):
         complex_real_string, complex_imag_string = complex_record_fields
 
-    with open(source, encoding="utf-8") as f:
-        data = json.load(f, cls=NDJSONDecoder)
+    is_path, source = ak._util.regularize_path(source)
+    if not ak._util.is_file_path(source):
+        raise FileNotFoundError(f"file not found or not a regular file: {source}")
+
+    builder = ak.layout.ArrayBuilder(initial=initial, resize=resize)
+    num = ak._ext.fromjsonfile(
+        source,
+        builder,
+        nan_string=nan_string,
+        infinity_string=infinity_string,
+        minus_infinity_string=minus_infinity_string,
+        buffersize=buffersize,
+        one_per_line=True,
+    )
 
-    layout = ak._v2.operations.convert.from_iter(data).layout
+    layout = ak._v2.operations.convert.ak_from_json._builder_to_layout(builder)
 
     def record_to_complex(node, **kwargs):
         if isinstance(node, ak._v2.contents.RecordArray):
@@ -98,25 +103,8 @@ def from_json_file(
         else layout.recursively_apply(record_to_complex)
     )
 
-    nonfinite_dict = {}
-    if nan_string is not None:
-        nonfinite_dict[nan_string] = np.nan
-    if infinity_string is not None:
-        nonfinite_dict[infinity_string] = np.inf
-    if minus_infinity_string is not None:
-        nonfinite_dict[minus_infinity_string] = -np.inf
-
-    def string_to_nonfinite(node, **kwargs):
-        if isinstance(node, ak._v2.contents.ListOffsetArray):
-            if node.parameter("__array__") == "string":
-                return node._awkward_strings_to_nonfinite(nonfinite_dict)
-
-    layout = layout.recursively_apply(string_to_nonfinite) if nonfinite_dict else layout
-
-    layout = (
-        layout.content
-        if isinstance(layout, ak._v2.contents.ListOffsetArray)
-        else layout
-    )
-
-    return ak._v2._util.wrap(layout, behavior, highlevel)
+    out = ak._v2._util.wrap(layout, behavior, highlevel)
+    if num == 1:
+        return out[0]
+    else:
+        return out
@@ -0,0 +1,66 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import json
+
+import numpy
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def from_memmap(source, highlevel=True, behavior=None):
+    """
+    Args:
+        source (str or Path): Name of a file written by #ak.to_memmap.
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Opens a file written by #ak.to_memmap as a read-only Awkward Array whose
+    buffers are views of a `numpy.memmap` of the file.
+
+    Only the header is read when the file is opened, so opening is
+    instantaneous regardless of the file's size; the operating system loads
+    the pages of each buffer when they are first accessed, and only those
+    pages. Since the mapping is read-only, all processes on a machine that
+    open the same file share the same pages in the page cache, rather than
+    each having its own deserialized copy.
+
+    See also #ak.to_memmap and #ak.from_buffers.
+    """
+    magic = ak._v2.operations.io.ak_to_memmap._magic
+
+    with open(source, "rb") as file:
+        if file.read(len(magic)) != magic:
+            raise ValueError(f"{source!r} is not a file written by ak.to_memmap")
+        header_size = int.from_bytes(file.read(8), "little")
+        header = json.loads(file.read(header_size).decode("utf-8"))
+
+    if header["format_version"] != ak._v2.operations.io.ak_to_memmap._format_version:
+        raise ValueError(
+            "{!r} has format version {}, but this version of Awkward Array reads {}".format(
+                source,
+                header["format_version"],
+                ak._v2.operations.io.ak_to_memmap._format_version,
+            )
+        )
+
+    start = ak._v2.operations.io.ak_to_memmap._aligned(
+        len(magic) + 8 + header_size, header["alignment"]
+    )
+    mapped = numpy.memmap(source, dtype=np.uint8, mode="r")
+
+    container = {}
+    for key, (position, nbytes) in header["buffers"].items():
+        container[key] = mapped[start + position : start + position + nbytes]
+
+    return ak._v2.operations.convert.from_buffers(
+        header["form"],
+        header["length"],
+        container,
+        highlevel=highlevel,
+        behavior=behavior,
+    )
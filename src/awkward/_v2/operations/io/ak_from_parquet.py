@@ -1,61 +1,338 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
 
+import concurrent.futures
+
 import awkward as ak
 
 np = ak.nplike.NumpyMetadata.instance()
 
 
-def from_parquet(  # this will be going through Awkward-Dask
+def from_parquet(
     source,
     columns=None,
     row_groups=None,
     use_threads=True,
-    include_partition_columns=True,
-    lazy=False,
-    lazy_cache="new",
-    lazy_cache_key=None,
+    max_workers=None,
     highlevel=True,
     behavior=None,
-    **options
+    **options,
 ):
-    raise NotImplementedError
-
-
-#     """
-#     Args:
-#         source (str, Path, file-like object, pyarrow.NativeFile): Where to
-#             get the Parquet file. If `source` is the name of a local directory
-#             (str or Path), then it is interpreted as a partitioned Parquet dataset.
-#         columns (None or list of str): If None, read all columns; otherwise,
-#             read a specified set of columns.
-#         row_groups (None, int, or list of int): If None, read all row groups;
-#             otherwise, read a single or list of row groups.
-#         use_threads (bool): Passed to the pyarrow.parquet.ParquetFile.read
-#             functions; if True, do multithreaded reading.
-#         include_partition_columns (bool): If True and `source` is a partitioned
-#             Parquet dataset with subdirectory names defining partition names
-#             and values, include those special columns in the output.
-#         lazy (bool): If True, read columns in row groups on demand (as
-#             #ak.layout.VirtualArray, possibly in #ak.partition.PartitionedArray
-#             if the file has more than one row group); if False, read all
-#             requested data immediately.
-#         lazy_cache (None, "new", or MutableMapping): If lazy, pass this
-#             cache to the VirtualArrays. If "new", a new dict (keep-forever cache)
-#             is created. If None, no cache is used.
-#         lazy_cache_key (None or str): If lazy, pass this cache_key to the
-#             VirtualArrays. If None, a process-unique string is constructed.
-#         highlevel (bool): If True, return an #ak.Array; otherwise, return
-#             a low-level #ak.layout.Content subclass.
-#         behavior (None or dict): Custom #ak.behavior for the output array, if
-#             high-level.
-#         options: All other options are passed to pyarrow.parquet.ParquetFile.
-
-#     Reads a Parquet file into an Awkward Array (through pyarrow).
-
-#         >>> ak.from_parquet("array1.parquet")
-#         <Array [[1, 2, 3], [], ... [], [6, 7, 8, 9]] type='6 * var * ?int64'>
-
-#     See also #ak.from_arrow, which is used as an intermediate step.
-#     See also #ak.to_parquet.
-#     """
+    """
+    Args:
+        source (str, Path, file-like object, pyarrow.NativeFile): Where to
+            get the Parquet file.
+        columns (None, str, or list of str): If None, read all columns;
+            otherwise, read a specified set of columns. Nested fields are
+            selected with dots, such as `"muons.pt"` (list levels are skipped),
+            and only the Parquet columns for those fields are decoded.
+        row_groups (None, int, or list of int): If None, read all row groups;
+            otherwise, read a single or list of row groups.
+        use_threads (bool): If True, read the row groups in a thread pool and
+            let pyarrow use multiple threads to decode each one; if False,
+            read everything in the current thread.
+        max_workers (None or int): Maximum number of threads in the pool that
+            reads row groups (passed to `concurrent.futures.ThreadPoolExecutor`).
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+        options: All other options are passed to pyarrow.parquet.ParquetFile.
+
+    Reads a Parquet file into an Awkward Array (through pyarrow).
+
+        >>> ak.from_parquet("array1.parquet")
+        <Array [[1, 2, 3], [], ... [], [6, 7, 8, 9]] type='6 * var * ?int64'>
+
+    If `source` is a path, each row group is read by a separate task with its
+    own handle on the file; a file-like `source` is read one row group at a
+    time. The Arrow data are converted into an Awkward Array in one step at
+    the end, without going through Python objects.
+
+    See also #ak.from_arrow, which is used as an intermediate step.
+    See also #ak.to_parquet.
+    """
+    import awkward._v2._connect.pyarrow
+
+    pyarrow_parquet = awkward._v2._connect.pyarrow.import_pyarrow_parquet(
+        "ak._v2.from_parquet"
+    )
+    pyarrow = awkward._v2._connect.pyarrow.pyarrow
+
+    is_path, source = ak._util.regularize_path(source)
+    is_path = is_path or ak._v2._util.isstr(source)
+
+    parquetfile = pyarrow_parquet.ParquetFile(source, **options)
+    schema = parquetfile.schema_arrow
+
+    if row_groups is None:
+        row_groups = range(parquetfile.num_row_groups)
+    elif ak._v2._util.isint(row_groups):
+        row_groups = [row_groups]
+    for row_group in row_groups:
+        if not 0 <= row_group < parquetfile.num_row_groups:
+            raise ValueError(
+                f"row group {row_group} is out of range for a file with "
+                f"{parquetfile.num_row_groups} row groups"
+            )
+
+    if columns is None:
+        selected, is_partial = None, False
+    else:
+        if ak._v2._util.isstr(columns):
+            columns = [columns]
+        parquet_paths = _parquet_paths(parquetfile.schema)
+        selected, is_partial, chosen = _select_columns(schema, parquet_paths, columns)
+
+    projected_types = None
+    if is_partial:
+        # pyarrow (through at least 12.0) crashes when reading some of the
+        # nested fields of a Parquet column whose stored Arrow type is an
+        # extension type, so the file is read through a copy of its footer
+        # that stores plain storage types; the extension types are put back
+        # (without copying the data) by _restore_extension_types
+        metadata = _storage_metadata(pyarrow_parquet, parquetfile, schema)
+        if metadata is None:
+            # the footer can't be reproduced: read the whole top-level
+            # columns and drop the unwanted fields afterward
+            projected_types = _projected_types(schema, chosen)
+            selected = list(projected_types)
+        else:
+            options = dict(options, metadata=metadata)
+
+    def read(row_group, file=None):
+        if file is None:
+            file = pyarrow_parquet.ParquetFile(source, **options)
+        return file.read_row_group(row_group, columns=selected, use_threads=use_threads)
+
+    if len(row_groups) == 0:
+        file = pyarrow_parquet.ParquetFile(source, **options)
+        tables = [file.read_row_groups([], columns=selected)]
+
+    elif is_path and use_threads and len(row_groups) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            tables = list(executor.map(read, row_groups))
+
+    else:
+        if is_partial or not is_path:
+            # the first handle has the original footer, and a file-like
+            # object can't be shared
+            file = pyarrow_parquet.ParquetFile(source, **options)
+        else:
+            file = parquetfile
+        tables = [read(row_group, file) for row_group in row_groups]
+
+    if len(tables) == 1:
+        table = tables[0]
+    else:
+        table = pyarrow.concat_tables(tables)
+
+    if is_partial:
+        table = _restore_extension_types(table, schema, projected_types)
+
+    out = awkward._v2._connect.pyarrow.handle_arrow(table, pass_empty_field=True)
+    return ak._v2._util.wrap(out, behavior, highlevel)
+
+
+def _storage_metadata(pyarrow_parquet, parquetfile, schema):
+    # A copy of the file's footer whose stored Arrow schema has no extension
+    # types, or None if the Parquet schema that pyarrow writes for it (with
+    # either convention for naming list items) differs from the file's.
+    import io
+
+    from awkward._v2._connect.pyarrow import pyarrow, storage_arrow_type
+
+    storage_schema = pyarrow.schema(
+        [
+            pyarrow.field(
+                field.name,
+                storage_arrow_type(field.type),
+                field.nullable,
+                field.metadata,
+            )
+            for field in schema
+        ],
+        metadata=schema.metadata,
+    )
+
+    for use_compliant_nested_type in (False, True):
+        sink = io.BytesIO()
+        pyarrow_parquet.write_metadata(
+            storage_schema,
+            sink,
+            version=parquetfile.metadata.format_version,
+            use_compliant_nested_type=use_compliant_nested_type,
+        )
+        sink.seek(0)
+        metadata = pyarrow_parquet.read_metadata(sink)
+        # ParquetSchema.equals does not compare the names of list items
+        if metadata.schema.equals(parquetfile.schema) and _parquet_paths(
+            metadata.schema
+        ) == _parquet_paths(parquetfile.schema):
+            metadata.append_row_groups(parquetfile.metadata)
+            return metadata
+
+    return None
+
+
+def _parquet_paths(parquet_schema):
+    # The path of each Parquet leaf column, such as "muons.list.item.pt".
+    return [parquet_schema.column(i).path for i in range(len(parquet_schema))]
+
+
+def _leaf_paths(arrowtype, path):
+    # One path of field names (skipping list levels) per Parquet leaf column.
+    from awkward._v2._connect.pyarrow import pyarrow
+
+    if isinstance(arrowtype, pyarrow.lib.ExtensionType):
+        yield from _leaf_paths(arrowtype.storage_type, path)
+
+    elif isinstance(arrowtype, pyarrow.lib.StructType):
+        for field in arrowtype:
+            yield from _leaf_paths(field.type, path + (field.name,))
+
+    elif isinstance(
+        arrowtype,
+        (
+            pyarrow.lib.LargeListType,
+            pyarrow.lib.ListType,
+            pyarrow.lib.FixedSizeListType,
+        ),
+    ):
+        yield from _leaf_paths(arrowtype.value_type, path)
+
+    elif isinstance(arrowtype, pyarrow.lib.MapType):
+        yield from _leaf_paths(arrowtype.key_type, path + ("key",))
+        yield from _leaf_paths(arrowtype.item_type, path + ("value",))
+
+    else:
+        yield path
+
+
+def _select_columns(schema, parquet_paths, columns):
+    leaves = []
+    for field in schema:
+        leaves.extend(_leaf_paths(field.type, (field.name,)))
+    if len(leaves) != len(parquet_paths):
+        raise AssertionError(
+            f"Arrow schema has {len(leaves)} leaves, but Parquet schema has "
+            f"{len(parquet_paths)} columns"
+        )
+
+    chosen = [False] * len(leaves)
+    for column in columns:
+        if column in schema.names:
+            request = (column,)
+        else:
+            request = tuple(column.split("."))
+        found = False
+        for i, leaf in enumerate(leaves):
+            if leaf[: len(request)] == request:
+                chosen[i] = True
+                found = True
+        if not found:
+            raise ValueError(f"column {column!r} not found in schema")
+
+    selected = []
+    is_partial = False
+    for name in schema.names:
+        which = [i for i, leaf in enumerate(leaves) if leaf[0] == name]
+        if all(chosen[i] for i in which):
+            selected.append(name)
+        elif any(chosen[i] for i in which):
+            selected.extend(parquet_paths[i] for i in which if chosen[i])
+            is_partial = True
+
+    return selected, is_partial, {leaf for i, leaf in enumerate(leaves) if chosen[i]}
+
+
+def _projected_type(arrowtype, path, chosen):
+    # The storage type of the fields of arrowtype that have chosen leaves
+    # (following the same paths as _leaf_paths), or None if there are none.
+    from awkward._v2._connect.pyarrow import pyarrow
+
+    if isinstance(arrowtype, pyarrow.lib.ExtensionType):
+        return _projected_type(arrowtype.storage_type, path, chosen)
+
+    elif isinstance(arrowtype, pyarrow.lib.StructType):
+        fields = []
+        for field in arrowtype:
+            projected = _projected_type(field.type, path + (field.name,), chosen)
+            if projected is not None:
+                fields.append(
+                    pyarrow.field(field.name, projected, field.nullable, field.metadata)
+                )
+        if len(fields) == 0:
+            return None
+        return pyarrow.struct(fields)
+
+    elif isinstance(
+        arrowtype,
+        (
+            pyarrow.lib.LargeListType,
+            pyarrow.lib.ListType,
+            pyarrow.lib.FixedSizeListType,
+        ),
+    ):
+        field = arrowtype.value_field
+        projected = _projected_type(field.type, path, chosen)
+        if projected is None:
+            return None
+        value_field = pyarrow.field(
+            field.name, projected, field.nullable, field.metadata
+        )
+        if isinstance(arrowtype, pyarrow.lib.LargeListType):
+            return pyarrow.large_list(value_field)
+        elif isinstance(arrowtype, pyarrow.lib.ListType):
+            return pyarrow.list_(value_field)
+        else:
+            return pyarrow.list_(value_field, arrowtype.list_size)
+
+    elif any(leaf[: len(path)] == path for leaf in chosen):
+        # a leaf, or a map (whose keys and values are not separable)
+        return arrowtype
+
+    else:
+        return None
+
+
+def _projected_types(schema, chosen):
+    # The projected type of each top-level column that has chosen leaves.
+    out = {}
+    for field in schema:
+        projected = _projected_type(field.type, (field.name,), chosen)
+        if projected is not None:
+            out[field.name] = projected
+    return out
+
+
+def _restore_extension_types(table, schema, projected_types=None):
+    # If projected_types is not None, the table has whole top-level columns
+    # and only the fields in projected_types (see _projected_types) are kept.
+    from awkward._v2._connect.pyarrow import (
+        pyarrow,
+        project_arrow_type,
+        with_arrow_type,
+    )
+
+    fields, columns = [], []
+    for projected_field, column in zip(table.schema, table.columns):
+        field = schema.field(projected_field.name)
+        if projected_types is None:
+            projected_type = projected_field.type
+        else:
+            projected_type = projected_types[field.name]
+        arrowtype = project_arrow_type(field.type, projected_type)
+        fields.append(
+            pyarrow.field(field.name, arrowtype, field.nullable, field.metadata)
+        )
+        columns.append(
+            pyarrow.chunked_array(
+                [with_arrow_type(chunk, arrowtype) for chunk in column.chunks],
+                type=arrowtype,
+            )
+        )
+
+    return pyarrow.Table.from_arrays(
+        columns, schema=pyarrow.schema(fields, metadata=schema.metadata)
+    )
@@ -0,0 +1,81 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import json
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+_magic = b"awkward\x00"
+_format_version = 1
+
+
+def _aligned(position, alignment):
+    return -(-position // alignment) * alignment
+
+
+def to_memmap(array, destination, alignment=4096):
+    """
+    Args:
+        array: Array-like data (anything #ak.to_layout recognizes).
+        destination (str or Path): Name of the file to write (overwrite).
+        alignment (int): Byte alignment of each buffer in the file. The
+            default, 4096, is the page size on most systems, so that no two
+            buffers share a page.
+
+    Writes an Awkward Array to a single file that #ak.from_memmap can open
+    without reading it: the file is a JSON header with the #ak.forms.Form,
+    length, and buffer positions (the same information as #ak.to_buffers
+    returns), followed by the buffers themselves, uncompressed and aligned.
+
+        >>> array = ak.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+        >>> ak.to_memmap(array, "array.awkward")
+        >>> ak.from_memmap("array.awkward")
+        <Array [[1.1, 2.2, 3.3], [], [4.4, 5.5]] type='3 * var * float64'>
+
+    The array is packed (see #ak.packed) before writing, so the file contains
+    no unreachable data. Multi-byte values are written in little-endian
+    order.
+
+    See also #ak.from_memmap.
+    """
+    if not (ak._v2._util.isint(alignment) and alignment > 0):
+        raise TypeError("'alignment' must be a positive integer")
+
+    layout = ak._v2.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    layout = ak._v2.operations.structure.packed(layout, highlevel=False)
+    form, length, container = ak._v2.operations.convert.to_buffers(layout)
+
+    buffers = {}
+    positions = {}
+    position = 0
+    for key, buffer in container.items():
+        buffer = numpy.ascontiguousarray(numpy.asarray(buffer))
+        position = _aligned(position, alignment)
+        buffers[key] = buffer
+        positions[key] = [position, buffer.nbytes]
+        position += buffer.nbytes
+
+    header = json.dumps(
+        {
+            "format_version": _format_version,
+            "form": form.tolist(verbose=False),
+            "length": length,
+            "alignment": alignment,
+            "buffers": positions,
+        }
+    ).encode("utf-8")
+    start = _aligned(len(_magic) + 8 + len(header), alignment)
+
+    with open(destination, "wb") as file:
+        file.write(_magic)
+        file.write(len(header).to_bytes(8, "little"))
+        file.write(header)
+        for key, buffer in buffers.items():
+            file.seek(start + positions[key][0])
+            file.write(buffer.reshape(-1).view(np.uint8))
+        file.truncate(start + position)
@@ -6,63 +6,90 @@ import awkward as ak
 np = ak.nplike.NumpyMetadata.instance()
 
 
-def to_parquet(  # this will be going through Awkward-Dask
+def to_parquet(
     array,
     where,
-    explode_records=False,
     list_to32=False,
     string_to32=True,
     bytestring_to32=True,
+    emptyarray_to=None,
+    categorical_as_dictionary=False,
+    extensionarray=True,
+    count_nulls=True,
+    row_group_size=None,
     **options
 ):
-    raise NotImplementedError
-
-
-#     """
-#     Args:
-#         array: Data to write to a Parquet file.
-#         where (str, Path, file-like object): Where to write the Parquet file.
-#         explode_records (bool): If True, lists of records are written as
-#             records of lists, so that nested fields become top-level fields
-#             (which can be zipped when read back).
-#         list_to32 (bool): If True, convert Awkward lists into 32-bit Arrow lists
-#             if they're small enough, even if it means an extra conversion. Otherwise,
-#             signed 32-bit #ak.layout.ListOffsetArray maps to Arrow `ListType` and
-#             all others map to Arrow `LargeListType`.
-#         string_to32 (bool): Same as the above for Arrow `string` and `large_string`.
-#         bytestring_to32 (bool): Same as the above for Arrow `binary` and `large_binary`.
-#         options: All other options are passed to pyarrow.parquet.ParquetWriter.
-#             In particular, if no `schema` is given, a schema is derived from
-#             the array type.
-
-#     Writes an Awkward Array to a Parquet file (through pyarrow).
-
-#         >>> array1 = ak.Array([[1, 2, 3], [], [4, 5], [], [], [6, 7, 8, 9]])
-#         >>> ak.to_parquet(array1, "array1.parquet")
-
-#     If the `array` does not contain records at top-level, the Arrow table will consist
-#     of one field whose name is `""`.
-
-#     Parquet files can maintain the distinction between "option-type but no elements are
-#     missing" and "not option-type" at all levels, including the top level. However,
-#     there is no distinction between `?union[X, Y, Z]]` type and `union[?X, ?Y, ?Z]` type.
-#     Be aware of these type distinctions when passing data through Arrow or Parquet.
-
-#     To make a partitioned Parquet dataset, use this function to write each Parquet
-#     file to a directory (as separate invocations, probably in parallel with multiple
-#     processes), then give them common metadata by calling `ak.to_parquet.dataset`.
-
-#         >>> ak.to_parquet(array1, "directory-name/file1.parquet")
-#         >>> ak.to_parquet(array2, "directory-name/file2.parquet")
-#         >>> ak.to_parquet(array3, "directory-name/file3.parquet")
-#         >>> ak.to_parquet.dataset("directory-name")
-
-#     Then all of the flies in the collection can be addressed as one array. For example,
-
-#         >>> dataset = ak.from_parquet("directory_name", lazy=True)
-
-#     (If it is large, you will likely want to load it lazily.)
-
-#     See also #ak.to_arrow, which is used as an intermediate step.
-#     See also #ak.from_parquet.
-#     """
+    """
+    Args:
+        array: Data to write to a Parquet file.
+        where (str, Path, file-like object): Where to write the Parquet file.
+        list_to32 (bool): If True, convert Awkward lists into 32-bit Arrow lists
+            if they're small enough, even if it means an extra conversion. Otherwise,
+            signed 32-bit #ak.types.ListType maps to Arrow `ListType`,
+            signed 64-bit #ak.types.ListType maps to Arrow `LargeListType`,
+            and unsigned 32-bit #ak.types.ListType picks whichever Arrow type its
+            values fit into.
+        string_to32 (bool): Same as the above for Arrow `string` and `large_string`.
+        bytestring_to32 (bool): Same as the above for Arrow `binary` and `large_binary`.
+        emptyarray_to (None or dtype): If None, #ak.types.UnknownType maps to Arrow's
+            null type; otherwise, it is converted a given numeric dtype.
+        categorical_as_dictionary (bool): If True, #ak.layout.IndexedArray and
+            #ak.layout.IndexedOptionArray labeled with `__array__ = "categorical"`
+            are mapped to Arrow `DictionaryArray`; otherwise, the projection is
+            evaluated before conversion (always the case without
+            `__array__ = "categorical"`).
+        extensionarray (bool): If True, the Arrow data are written with extension
+            types, which preserve the array's #ak.types.Type through Parquet;
+            otherwise, plain Arrow types are written.
+        count_nulls (bool): If True, count the number of missing values at each level
+            and include these in the resulting Arrow array, which makes some downstream
+            applications faster. If False, skip the up-front cost of counting them.
+        row_group_size (None or int): Maximum number of entries in each row group;
+            if None, pyarrow's default is used. Smaller row groups can be read
+            in parallel by #ak.from_parquet.
+        options: All other options are passed to pyarrow.parquet.ParquetWriter.
+            In particular, if no `schema` is given, a schema is derived from
+            the array type.
+
+    Writes an Awkward Array to a Parquet file (through pyarrow).
+
+        >>> array1 = ak.Array([[1, 2, 3], [], [4, 5], [], [], [6, 7, 8, 9]])
+        >>> ak.to_parquet(array1, "array1.parquet")
+
+    If the `array` does not contain records at top-level, the Arrow table will consist
+    of one field whose name is `""`.
+
+    Parquet files can maintain the distinction between "option-type but no elements are
+    missing" and "not option-type" at all levels, including the top level. However,
+    there is no distinction between `?union[X, Y, Z]]` type and `union[?X, ?Y, ?Z]` type.
+    Be aware of these type distinctions when passing data through Arrow or Parquet.
+
+    See also #ak.to_arrow_table, which is used as an intermediate step.
+    See also #ak.from_parquet.
+    """
+    import awkward._v2._connect.pyarrow
+
+    pyarrow_parquet = awkward._v2._connect.pyarrow.import_pyarrow_parquet(
+        "ak._v2.to_parquet"
+    )
+
+    table = ak._v2.operations.convert.to_arrow_table(
+        array,
+        list_to32=list_to32,
+        string_to32=string_to32,
+        bytestring_to32=bytestring_to32,
+        emptyarray_to=emptyarray_to,
+        categorical_as_dictionary=categorical_as_dictionary,
+        extensionarray=extensionarray,
+        count_nulls=count_nulls,
+    )
+
+    where = ak._util.regularize_path(where)[1]
+    if "schema" not in options:
+        options["schema"] = table.schema
+
+    writer = pyarrow_parquet.ParquetWriter(where, **options)
+    try:
+        writer.write_table(table, row_group_size=row_group_size)
+    finally:
+        writer.close()
@@ -4,6 +4,7 @@ from awkward._v2.operations.structure.ak_copy import copy  # noqa: F401
 from awkward._v2.operations.structure.ak_mask import mask  # noqa: F401
 from awkward._v2.operations.structure.ak_num import num  # noqa: F401
 from awkward._v2.operations.structure.ak_run_lengths import run_lengths  # noqa: F401
+from awkward._v2.operations.structure.ak_group_by import group_by  # noqa: F401
 from awkward._v2.operations.structure.ak_zip import zip  # noqa: F401
 from awkward._v2.operations.structure.ak_unzip import unzip  # noqa: F401
 from awkward._v2.operations.structure.ak_to_regular import to_regular  # noqa: F401
@@ -42,6 +43,12 @@ from awkward._v2.operations.structure.ak_combinations import combinations  # noq
 from awkward._v2.operations.structure.ak_argcombinations import (  # noqa: F401
     argcombinations,
 )
+from awkward._v2.operations.structure.ak_iter_cartesian import (  # noqa: F401
+    iter_cartesian,
+)
+from awkward._v2.operations.structure.ak_iter_combinations import (  # noqa: F401
+    iter_combinations,
+)
 from awkward._v2.operations.structure.ak_nan_to_num import nan_to_num  # noqa: F401
 from awkward._v2.operations.structure.ak_isclose import isclose  # noqa: F401
 from awkward._v2.operations.structure.ak_values_astype import (  # noqa: F401
@@ -50,3 +57,4 @@ from awkward._v2.operations.structure.ak_values_astype import (  # noqa: F401
 from awkward._v2.operations.structure.ak_strings_astype import (  # noqa: F401
     strings_astype,
 )
+from awkward._v2.operations.structure.ak_virtual import virtual  # noqa: F401
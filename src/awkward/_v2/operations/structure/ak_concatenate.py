@@ -118,7 +118,7 @@ def concatenate(
                 nplike = ak.nplike.of(*inputs)
 
                 length = max(
-                    len(x) for x in inputs if isinstance(x, ak._v2.contents.Content)
+                    x.length for x in inputs if isinstance(x, ak._v2.contents.Content)
                 )
                 nextinputs = []
                 for x in inputs:
@@ -136,7 +136,7 @@ def concatenate(
                             )
                         )
 
-                counts = nplike.zeros(len(nextinputs[0]), dtype=np.int64)
+                counts = nplike.zeros(nextinputs[0].length, dtype=np.int64)
                 all_counts = []
                 all_flatten = []
 
@@ -148,15 +148,15 @@ def concatenate(
                     all_counts.append(c)
                     all_flatten.append(f)
 
-                offsets = nplike.empty(len(nextinputs[0]) + 1, dtype=np.int64)
+                offsets = nplike.empty(nextinputs[0].length + 1, dtype=np.int64)
                 offsets[0] = 0
                 nplike.cumsum(counts, out=offsets[1:])
 
                 offsets = ak._v2.index.Index64(offsets)
 
                 inner = ak._v2.contents.UnionArray(
-                    ak._v2.index.Index8.empty(len(offsets) - 1, nplike),
-                    ak._v2.index.Index64.empty(len(offsets) - 1, nplike),
+                    ak._v2.index.Index8.empty(offsets.length - 1, nplike),
+                    ak._v2.index.Index64.empty(offsets.length - 1, nplike),
                     all_flatten,
                 )
 
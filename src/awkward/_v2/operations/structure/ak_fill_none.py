@@ -57,6 +57,9 @@ def fill_none(array, value, axis=-1, highlevel=True, behavior=None):
     )
     nplike = ak.nplike.of(arraylayout)
 
+    # The value is a constant with known data, even if the array is a typetracer
+    valuenplike = nplike if nplike.known_data else ak.nplike.Numpy.instance()
+
     # Convert value type to appropriate layout
     if (
         isinstance(value, np.ndarray)
@@ -64,14 +67,16 @@ def fill_none(array, value, axis=-1, highlevel=True, behavior=None):
         and len(value.shape) != 0
     ):
         valuelayout = ak._v2.operations.convert.to_layout(
-            nplike.asarray(value)[np.newaxis], allow_record=False, allow_other=False
+            valuenplike.asarray(value)[np.newaxis],
+            allow_record=False,
+            allow_other=False,
         )
     elif isinstance(value, (bool, numbers.Number, np.bool_, np.number)) or (
         isinstance(value, np.ndarray)
         and issubclass(value.dtype.type, (np.bool_, np.number))
     ):
         valuelayout = ak._v2.operations.convert.to_layout(
-            nplike.asarray(value), allow_record=False, allow_other=False
+            valuenplike.asarray(value), allow_record=False, allow_other=False
         )
     elif (
         isinstance(value, Iterable)
@@ -84,7 +89,7 @@ def fill_none(array, value, axis=-1, highlevel=True, behavior=None):
         if isinstance(valuelayout, ak._v2.record.Record):
             valuelayout = valuelayout.array[valuelayout.at : valuelayout.at + 1]
         elif len(valuelayout) == 0:
-            offsets = ak._v2.index.Index64(nplike.array([0, 0], dtype=np.int64))
+            offsets = ak._v2.index.Index64(valuenplike.array([0, 0], dtype=np.int64))
             valuelayout = ak._v2.contents.ListOffsetArray(offsets, valuelayout)
         else:
             valuelayout = ak._v2.contents.RegularArray(valuelayout, len(valuelayout), 1)
@@ -93,6 +98,9 @@ def fill_none(array, value, axis=-1, highlevel=True, behavior=None):
             [value], allow_record=False, allow_other=False
         )
 
+    if not nplike.known_data:
+        valuelayout = valuelayout.typetracer
+
     def maybe_fillna(layout):
         if layout.is_OptionType:
             return layout.fillna(valuelayout)
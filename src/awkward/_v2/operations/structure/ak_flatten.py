@@ -99,7 +99,9 @@ def flatten(array, axis=1, highlevel=True, behavior=None):
 
     if axis is None:
         out = layout.completely_flatten(function_name="ak.flatten")
-        assert isinstance(out, tuple) and all(isinstance(x, np.ndarray) for x in out)
+        assert isinstance(out, tuple) and all(
+            isinstance(x, nplike.ndarray) for x in out
+        )
 
         out = ak._v2.contents.NumpyArray(nplike.concatenate(out))
 
@@ -0,0 +1,264 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def group_by(array, axis=-1, highlevel=True, behavior=None):
+    """
+    Args:
+        array: Data whose values are the keys to group by.
+        axis (int): The dimension at which this operation is applied. The
+            outermost dimension is `0`, followed by `1`, etc., and negative
+            values count backward from the innermost: `-1` is the innermost
+            dimension, `-2` is the next level up, etc.
+        highlevel (bool): If True, return #ak.Array objects; otherwise, return
+            low-level #ak.layout.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Groups the distinct values within each list at a given `axis`, returning
+    a 3-tuple of
+
+       * `keys`: the distinct values of each list, in order of first
+         appearance,
+       * `counts`: the number of times each of these values appears, and
+       * `index`: for each key, the positions in its list where it appears,
+         in their original order.
+
+    `keys` and `counts` have the same structure as `array`; `index` has one
+    more dimension, whose offsets are the per-group offsets.
+
+        >>> array = ak.Array([[3, 1, 3, 2, 1, 3], [], [5, 5]])
+        >>> keys, counts, index = ak.group_by(array)
+        >>> keys
+        <Array [[3, 1, 2], [], [5]] type='3 * var * int64'>
+        >>> counts
+        <Array [[3, 2, 1], [], [2]] type='3 * var * int64'>
+        >>> index
+        <Array [[[0, 2, 5], [1, 4], [3]], [], [[0, 1]]] type='3 * var * var * int64'>
+
+    Flattening the last dimension of `index` gives a permutation of each
+    list that makes its groups contiguous, in the order of `keys`:
+
+        >>> array[ak.flatten(index, axis=-1)]
+        <Array [[3, 3, 3, 1, 1, 2], [], [5, 5]] type='3 * var * int64'>
+
+    Unlike #ak.run_lengths, the values do not need to be sorted. Numbers,
+    strings and categorical data (see #ak.to_categorical, whose integer index
+    is grouped directly) are grouped in _O(n)_ time with a hash table; if the
+    numbers in each list are already sorted, they are grouped by their runs
+    without hashing. Other values (such as records, which are grouped as a
+    whole) are compared as Python objects, which should be regarded as
+    expensive. None is a key like any other.
+
+    To group one array by the values of another, apply this permutation to it:
+
+        >>> records = ak.Array([[{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}, {"x": 1, "y": 3.3}]])
+        >>> keys, counts, index = ak.group_by(records.x)
+        >>> records.y[ak.flatten(index, axis=-1)]
+        <Array [[1.1, 3.3, 2.2]] type='1 * var * float64'>
+
+    See also #ak.run_lengths, #ak.to_categorical.
+    """
+
+    def action(layout, depth, depth_context, **kwargs):
+        posaxis = layout.axis_wrap_if_negative(depth_context["posaxis"])
+        depth_context["posaxis"] = posaxis
+
+        if (
+            depth == posaxis
+            and layout.is_ListType
+            and layout.parameter("__array__") not in ("string", "bytestring")
+        ):
+            listoffsetarray = layout.toListOffsetArray64(True)
+            offsets = listoffsetarray.offsets.data
+            content = listoffsetarray.content[: offsets[-1]]
+            groups, groupoffsets = _group(content, offsets)
+            return ak._v2.contents.ListOffsetArray(
+                ak._v2.index.Index64(groupoffsets), groups
+            )
+
+        elif depth <= posaxis and (
+            layout.is_NumpyType
+            or layout.is_UnknownType
+            or layout.parameter("__array__") in ("string", "bytestring")
+        ):
+            raise np.AxisError(
+                "axis={} exceeds the depth of this array".format(
+                    depth_context["posaxis"]
+                )
+            )
+
+        elif depth <= posaxis and (layout.is_RecordType or layout.is_UnionType):
+            raise NotImplementedError(
+                "group_by does not descend into the fields of records or unions; "
+                "select a field first"
+            )
+
+    layout = ak._v2.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+
+    if layout.axis_wrap_if_negative(axis) == 0:
+        nplike = layout.nplike
+        offsets = nplike.asarray([0, layout.length], dtype=np.int64)
+        out, _ = _group(layout, offsets)
+    else:
+        out = layout.recursively_apply(
+            action,
+            depth_context={"posaxis": axis},
+        )
+
+    return (
+        ak._v2._util.wrap(out["keys"], behavior, highlevel),
+        ak._v2._util.wrap(out["counts"], behavior, highlevel),
+        ak._v2._util.wrap(out["index"], behavior, highlevel),
+    )
+
+
+def _codes(content):
+    # Returns an np.int64 code for each element of content, equal where the
+    # elements are equal, and the number of distinct codes.
+    nplike = content.nplike
+
+    if content.parameter("__array__") == "categorical":
+        index = nplike.asarray(content.index.data, dtype=np.int64)
+        # None (-1) becomes code 0
+        return index + 1, content.content.length + 1
+
+    elif content.is_OptionType:
+        isnone = content.mask_as_bool(valid_when=False)
+        mapping, firsts = ak._v2.behaviors.categorical._categorize(content.project())
+        codes = nplike.zeros(content.length, np.int64)
+        codes[~isnone] = mapping + 1
+        return codes, len(firsts) + 1
+
+    else:
+        mapping, firsts = ak._v2.behaviors.categorical._categorize(content)
+        return mapping, len(firsts)
+
+
+def _group(content, offsets):
+    # Groups the elements of content within each list of offsets (which starts
+    # at zero and ends at content.length), returning a RecordArray of "keys",
+    # "counts", and "index" with one record per group and the offsets of the
+    # groups in each list.
+    nplike = content.nplike
+    if not nplike.known_data:
+        return _group_typetracer(content, offsets)
+
+    length = content.length
+    numlists = len(offsets) - 1
+    parents = nplike.repeat(
+        nplike.arange(numlists, dtype=np.int64), offsets[1:] - offsets[:-1]
+    )
+    starts = nplike.zeros(length, np.bool_)
+    starts[offsets[:-1][offsets[:-1] < length]] = True
+
+    if content.is_IndexedType and not content.is_OptionType:
+        if content.parameter("__array__") != "categorical":
+            content = content.project()
+
+    if length == 0:
+        order = nplike.empty(0, np.int64)
+        runstarts = nplike.empty(0, np.bool_)
+
+    elif (
+        isinstance(content, ak._v2.contents.NumpyArray)
+        and len(content.shape) == 1
+        and content.dtype.kind in "biufmM"
+        and nplike.all((content.data[1:] >= content.data[:-1]) | starts[1:])
+    ):
+        # already sorted within each list: the groups are runs of equal values
+        data = content.data
+        order = nplike.arange(length, dtype=np.int64)
+        runstarts = starts.copy()
+        runstarts[1:] |= data[1:] != data[:-1]
+
+    else:
+        # the codes come from a hash table; sorting them within each list is
+        # one stable sort of keys that are already sorted by list, which is
+        # nearly linear (it merges sorted runs)
+        codes, numcodes = _codes(content)
+        ranks = nplike.cumsum(starts) - 1
+        if ranks[-1] < np.iinfo(np.int64).max // numcodes:
+            order = nplike.argsort(ranks * numcodes + codes, kind="stable")
+        else:
+            order = nplike.lexsort((codes, ranks))
+        runstarts = starts.copy()
+        runstarts[1:] |= codes[order][1:] != codes[order][:-1]
+
+    (groupstarts,) = nplike.nonzero(runstarts)
+    groupstops = nplike.empty(len(groupstarts), np.int64)
+    groupstops[:-1] = groupstarts[1:]
+    groupstops[-1:] = length
+    # the first element of each group (sorting is stable), whose order is the
+    # order of first appearance within each list
+    firsts = order[groupstarts]
+    reorder = nplike.argsort(firsts, kind="stable")
+    firsts = firsts[reorder]
+    counts = (groupstops - groupstarts)[reorder]
+
+    indexoffsets = nplike.empty(len(counts) + 1, np.int64)
+    indexoffsets[0] = 0
+    nplike.cumsum(counts, out=indexoffsets[1:])
+    order = order[
+        nplike.repeat(groupstarts[reorder] - indexoffsets[:-1], counts)
+        + nplike.arange(length, dtype=np.int64)
+    ]
+    localindex = order - offsets[:-1][parents[order]]
+
+    groupoffsets = nplike.searchsorted(
+        parents[firsts], nplike.arange(numlists + 1, dtype=np.int64), side="left"
+    )
+
+    groups = ak._v2.contents.RecordArray(
+        [
+            content._carry(
+                ak._v2.index.Index64(firsts), False, ak._v2._slicing.NestedIndexError
+            ),
+            ak._v2.contents.NumpyArray(counts),
+            ak._v2.contents.ListOffsetArray(
+                ak._v2.index.Index64(indexoffsets),
+                ak._v2.contents.NumpyArray(localindex),
+            ),
+        ],
+        ["keys", "counts", "index"],
+        length=len(firsts),
+    )
+    return groups, groupoffsets
+
+
+def _group_typetracer(content, offsets):
+    # The same output as _group, with unknown lengths; grouping reads all
+    # of the content's data and the offsets.
+    nplike = content.nplike
+    ak._v2._typetracer.touch_data(content)
+    ak._v2._typetracer.touch_data(offsets)
+
+    if content.is_IndexedType and not content.is_OptionType:
+        if content.parameter("__array__") != "categorical":
+            content = content.project()
+
+    def unknown():
+        return nplike.empty((ak._v2._typetracer.UnknownLength,), np.int64)
+
+    groups = ak._v2.contents.RecordArray(
+        [
+            content._carry(
+                ak._v2.index.Index64(unknown()), False, ak._v2._slicing.NestedIndexError
+            ),
+            ak._v2.contents.NumpyArray(unknown(), nplike=nplike),
+            ak._v2.contents.ListOffsetArray(
+                ak._v2.index.Index64(unknown()),
+                ak._v2.contents.NumpyArray(unknown(), nplike=nplike),
+            ),
+        ],
+        ["keys", "counts", "index"],
+        length=ak._v2._typetracer.UnknownLength,
+    )
+    return groups, unknown()
@@ -53,7 +53,9 @@ def is_none(array, axis=0, highlevel=True, behavior=None):
             or layout.is_RecordType
             or layout.is_NumpyType
         ):
-            return ak._v2.contents.NumpyArray(nplike.zeros(len(layout), dtype=np.bool_))
+            return ak._v2.contents.NumpyArray(
+                nplike.zeros(layout.length, dtype=np.bool_)
+            )
 
     # Locate the axis
     def getfunction_outer(layout, depth, depth_context, **kwargs):
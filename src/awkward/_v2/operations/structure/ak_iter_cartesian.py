@@ -0,0 +1,114 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def iter_cartesian(
+    arrays,
+    axis=1,
+    nested=None,
+    parameters=None,
+    with_name=None,
+    chunk_size=1048576,
+    where=None,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        arrays (dict or iterable of arrays): Arrays on which to compute the
+            Cartesian product.
+        axis (int): The dimension at which this operation is applied; it must
+            be at least `1`, since the output is split between rows. Negative
+            values count backward from the innermost: `-1` is the innermost
+            dimension, `-2` is the next level up, etc.
+        nested (None, True, False, or iterable of str or int): As in
+            #ak.cartesian.
+        parameters (None or dict): Parameters for the new
+            #ak.layout.RecordArray node that is created by this operation.
+        with_name (None or str): Assigns a `"__record__"` name to the new
+            #ak.layout.RecordArray node that is created by this operation
+            (overriding `parameters`, if necessary).
+        chunk_size (int): The maximum number of tuples/records in each chunk,
+            unless a single row has more than that on its own.
+        where (None or callable): If not None, a function that takes a chunk
+            of the Cartesian product (as an #ak.Array) and returns a boolean
+            array of the same structure, selecting the items to keep.
+        highlevel (bool): If True, yield #ak.Array chunks; otherwise, yield
+            low-level #ak.layout.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Computes the same Cartesian product as #ak.cartesian, but yields it in
+    chunks of consecutive rows of the `arrays`, so that no more than
+    `chunk_size` tuples/records exist at a time. Concatenating the chunks
+    gives the output of #ak.cartesian.
+
+        >>> one = ak.Array([[1, 2, 3], [], [4, 5], [6]])
+        >>> two = ak.Array([["a", "b"], ["c"], ["d"], ["e", "f"]])
+        >>> for chunk in ak.iter_cartesian({"x": one, "y": two}, chunk_size=6):
+        ...     print(chunk.tolist())
+        ...
+        [[{'x': 1, 'y': 'a'}, {'x': 1, 'y': 'b'}, {'x': 2, 'y': 'a'}, {'x': 2, 'y': 'b'}, {'x': 3, 'y': 'a'}, {'x': 3, 'y': 'b'}], []]
+        [[{'x': 4, 'y': 'd'}, {'x': 5, 'y': 'd'}], [{'x': 6, 'y': 'e'}, {'x': 6, 'y': 'f'}]]
+
+    With `where`, each chunk is filtered before it is yielded, so that the
+    rejected items only exist while their chunk is being computed.
+
+    See also #ak.cartesian, #ak.iter_combinations.
+    """
+    if isinstance(arrays, dict):
+        behavior = ak._v2._util.behavior_of(*arrays.values(), behavior=behavior)
+        layouts = {
+            n: ak._v2.operations.convert.to_layout(
+                x, allow_record=False, allow_other=False
+            )
+            for n, x in arrays.items()
+        }
+        values = list(layouts.values())
+    else:
+        behavior = ak._v2._util.behavior_of(*arrays, behavior=behavior)
+        layouts = [
+            ak._v2.operations.convert.to_layout(
+                x, allow_record=False, allow_other=False
+            )
+            for x in arrays
+        ]
+        values = layouts
+
+    posaxis = values[0].axis_wrap_if_negative(axis)
+    if posaxis < 1:
+        raise ValueError(
+            "iter_cartesian yields ranges of rows, so its 'axis' must be at least 1"
+        )
+
+    # the size of the product in each list at posaxis, summed within each row
+    sizes = 1
+    for x in values:
+        sizes = sizes * ak._v2.operations.structure.num(x, axis=posaxis)
+    for _ in range(posaxis - 1):
+        sizes = ak._v2.operations.reducers.sum(sizes, axis=-1)
+    sizes = ak._v2.operations.structure.fill_none(sizes, 0, highlevel=False)
+
+    for start, stop in ak._v2._util.row_chunks(
+        ak._v2.operations.convert.to_numpy(sizes), chunk_size
+    ):
+        if isinstance(layouts, dict):
+            part = {n: x[start:stop] for n, x in layouts.items()}
+        else:
+            part = [x[start:stop] for x in layouts]
+        out = ak._v2.operations.structure.cartesian(
+            part,
+            axis=posaxis,
+            nested=nested,
+            parameters=parameters,
+            with_name=with_name,
+            highlevel=False,
+        )
+        if where is not None:
+            mask = where(ak._v2._util.wrap(out, behavior))
+            out = out[ak._v2.operations.convert.to_layout(mask)]
+        yield ak._v2._util.wrap(out, behavior, highlevel)
@@ -0,0 +1,120 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+
+
+def iter_combinations(
+    array,
+    n,
+    replacement=False,
+    axis=1,
+    fields=None,
+    parameters=None,
+    with_name=None,
+    chunk_size=1048576,
+    where=None,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        array: Array from which to choose `n` items without replacement.
+        n (int): The number of items to choose in each list: `2` chooses
+            unique pairs, `3` chooses unique triples, etc.
+        replacement (bool): If True, combinations that include the same
+            item more than once are allowed; otherwise each item in a
+            combinations is strictly unique.
+        axis (int): The dimension at which this operation is applied; it must
+            be at least `1`, since the output is split between rows. Negative
+            values count backward from the innermost: `-1` is the innermost
+            dimension, `-2` is the next level up, etc.
+        fields (None or list of str): If None, the pairs/triples/etc. are
+            tuples with unnamed fields; otherwise, these `fields` name the
+            fields. The number of `fields` must be equal to `n`.
+        parameters (None or dict): Parameters for the new
+            #ak.layout.RecordArray node that is created by this operation.
+        with_name (None or str): Assigns a `"__record__"` name to the new
+            #ak.layout.RecordArray node that is created by this operation
+            (overriding `parameters`, if necessary).
+        chunk_size (int): The maximum number of combinations in each chunk,
+            unless a single row has more than that on its own.
+        where (None or callable): If not None, a function that takes a chunk
+            of combinations (as an #ak.Array) and returns a boolean array of
+            the same structure, selecting the combinations to keep.
+        highlevel (bool): If True, yield #ak.Array chunks; otherwise, yield
+            low-level #ak.layout.Content subclasses.
+        behavior (None or dict): Custom #ak.behavior for the output arrays, if
+            high-level.
+
+    Computes the same combinations as #ak.combinations, but yields them in
+    chunks of consecutive rows of `array`, so that no more than `chunk_size`
+    combinations exist at a time. Concatenating the chunks gives the output
+    of #ak.combinations.
+
+        >>> array = ak.Array([[1, 2, 3, 4], [], [5, 6], [7, 8, 9]])
+        >>> for chunk in ak.iter_combinations(array, 2, chunk_size=4):
+        ...     print(chunk)
+        ...
+        [[(1, 2), (1, 3), (1, 4), (2, 3), (2, 4), (3, 4)]]
+        [[], [(5, 6)], [(7, 8), (7, 9), (8, 9)]]
+
+    With `where`, each chunk is filtered before it is yielded, so that the
+    rejected combinations only exist while their chunk is being computed:
+
+        >>> for chunk in ak.iter_combinations(
+        ...     array, 2, where=lambda pairs: pairs["0"] + pairs["1"] > 8
+        ... ):
+        ...     print(chunk)
+        ...
+        [[], [], [(5, 6)], [(7, 8), (7, 9), (8, 9)]]
+
+    This is intended for combinations of large `n` in long lists, whose output
+    would not fit in memory all at once.
+
+    See also #ak.combinations, #ak.iter_cartesian.
+    """
+    layout = ak._v2.operations.convert.to_layout(
+        array, allow_record=False, allow_other=False
+    )
+    behavior = ak._v2._util.behavior_of(array, behavior=behavior)
+
+    posaxis = layout.axis_wrap_if_negative(axis)
+    if posaxis < 1:
+        raise ValueError(
+            "iter_combinations yields ranges of rows, so its 'axis' must be at "
+            "least 1"
+        )
+
+    # the number of combinations in each list at posaxis...
+    lengths = ak._v2.operations.structure.num(layout, axis=posaxis)
+    if replacement:
+        lengths = lengths + (n - 1)
+    sizes = 1
+    for j in range(1, n + 1):
+        sizes = sizes * (lengths - (j - 1)) // j
+
+    # ...summed within each row
+    for _ in range(posaxis - 1):
+        sizes = ak._v2.operations.reducers.sum(sizes, axis=-1)
+    sizes = ak._v2.operations.structure.fill_none(sizes, 0, highlevel=False)
+
+    for start, stop in ak._v2._util.row_chunks(
+        ak._v2.operations.convert.to_numpy(sizes), chunk_size
+    ):
+        out = ak._v2.operations.structure.combinations(
+            layout[start:stop],
+            n,
+            replacement=replacement,
+            axis=posaxis,
+            fields=fields,
+            parameters=parameters,
+            with_name=with_name,
+            highlevel=False,
+        )
+        if where is not None:
+            mask = where(ak._v2._util.wrap(out, behavior))
+            out = out[ak._v2.operations.convert.to_layout(mask)]
+        yield ak._v2._util.wrap(out, behavior, highlevel)
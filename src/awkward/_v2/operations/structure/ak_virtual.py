@@ -0,0 +1,119 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+from collections.abc import MutableMapping
+
+import awkward as ak
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+
+def virtual(
+    generate,
+    args=(),
+    kwargs=None,
+    form=None,
+    length=None,
+    cache="new",
+    cache_key=None,
+    highlevel=True,
+    behavior=None,
+):
+    """
+    Args:
+        generate (callable): Function that makes an array from `args` and
+            `kwargs`.
+        args (tuple): Positional arguments to pass to `generate`.
+        kwargs (dict): Keyword arguments to pass to `generate`.
+        form (#ak.forms.Form or str/dict equivalent): The Form of the array
+            that `generate` will make; the generated array is checked against
+            it.
+        length (int): The length of the array that `generate` will make; the
+            generated array is checked against it.
+        cache (None, "new", or MutableMapping): Where to keep the generated
+            buffers. If "new", a new #ak._v2._lazy.ArrayCache without a size
+            limit is created; if an ArrayCache with a `limit` (or another
+            MutableMapping), the buffers may be evicted and are regenerated
+            when they are needed again. If None, the buffers are generated
+            once and held by the array.
+        cache_key (None or str): Key for the generated buffers in the `cache`.
+            If None, a unique key is generated for this virtual array (unique
+            per Python process).
+        highlevel (bool): If True, return an #ak.Array; otherwise, return
+            a low-level #ak.layout.Content subclass.
+        behavior (None or dict): Custom #ak.behavior for the output array, if
+            high-level.
+
+    Creates a virtual array, an array whose data are created on demand.
+
+    Unlike Awkward 1.x, the `form` and `length` are required: the result is
+    a layout of the given `form`, so its type, length, and structure (e.g.
+    selecting fields or slicing) are all known without calling `generate`.
+    Every #ak.layout.Index and #ak.layout.NumpyArray in it is backed by a
+    deferred buffer, and the first time any of them is needed, `generate`
+    is called and each of its buffers is stored in the `cache` as a separate
+    item. The array's nodes don't hold onto the buffers, so the `cache`
+    alone determines how much of the data stays in memory.
+
+        >>> def generate():
+        ...     print("generating")
+        ...     return ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+        ...
+        >>> form = {
+        ...     "class": "ListOffsetArray",
+        ...     "offsets": "i64",
+        ...     "content": "float64",
+        ... }
+        >>> cache = ak._v2._lazy.ArrayCache(limit=1024**3)
+        >>> array = ak._v2.virtual(generate, form=form, length=3, cache=cache)
+        >>> sliced = array[1:]
+        >>> sliced.type
+        2 * var * float64
+        >>> sliced[1]
+        generating
+        <Array [4.4, 5.5] type='2 * float64'>
+        >>> cache.stats
+        {'hits': 1, 'misses': 1, 'evictions': 0, 'items': 2, 'nbytes': 72}
+
+    See also #ak.from_buffers with `lazy=True`, which defers buffers one by
+    one.
+    """
+    if not callable(generate):
+        raise TypeError(f"'generate' must be callable, not {generate!r}")
+
+    if ak._v2._util.isstr(form):
+        if ak._v2.types.numpytype.is_primitive(form):
+            form = ak._v2.forms.NumpyForm(form)
+        else:
+            form = ak._v2.forms.from_json(form)
+    elif isinstance(form, dict):
+        form = ak._v2.forms.from_iter(form)
+    if not isinstance(form, ak._v2.forms.Form):
+        raise TypeError(
+            "'form' argument must be a Form or its Python dict/JSON string representation"
+        )
+
+    if not (ak._v2._util.isint(length) and length >= 0):
+        raise TypeError("'length' argument must be a non-negative integer")
+
+    if ak._v2._util.isstr(cache) and cache == "new":
+        cache = ak._v2._lazy.ArrayCache()
+    elif cache is not None and not isinstance(cache, MutableMapping):
+        raise TypeError("'cache' must be None, \"new\", or a MutableMapping")
+
+    if kwargs is None:
+        kwargs = {}
+
+    buffers = ak._v2._lazy.VirtualBuffers(
+        lambda: generate(*args, **kwargs), form, length, cache, cache_key
+    )
+    out = ak._v2.operations.convert.ak_from_buffers.reconstitute(
+        form,
+        length,
+        buffers,
+        buffers.getkey,
+        numpy,
+        lazy=True,
+        transient=cache is not None,
+    )
+    return ak._v2._util.wrap(out, behavior, highlevel)
@@ -83,11 +83,13 @@ def where(condition, *args, **kwargs):
             if isinstance(akcondition, ak._v2.contents.NumpyArray):
                 npcondition = nplike.asarray(akcondition)
                 tags = ak._v2.index.Index8((npcondition == 0).view(np.int8))
-                index = ak._v2.index.Index64(nplike.arange(len(tags), dtype=np.int64))
+                index = ak._v2.index.Index64(nplike.arange(tags.length, dtype=np.int64))
                 if not isinstance(left, ak._v2.contents.Content):
-                    left = ak._v2.contents.NumpyArray(nplike.repeat(left, len(tags)))
+                    left = ak._v2.contents.NumpyArray(nplike.repeat(left, tags.length))
                 if not isinstance(right, ak._v2.contents.Content):
-                    right = ak._v2.contents.NumpyArray(nplike.repeat(right, len(tags)))
+                    right = ak._v2.contents.NumpyArray(
+                        nplike.repeat(right, tags.length)
+                    )
                 tmp = ak._v2.contents.UnionArray(tags, index, [left, right])
                 return (tmp.simplify_uniontype(mergebool=mergebool),)
             else:
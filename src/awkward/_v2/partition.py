@@ -0,0 +1,529 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import bisect
+import concurrent.futures
+
+from collections.abc import Iterable
+
+import awkward as ak
+from awkward._v2._connect.numpy import NDArrayOperatorsMixin
+
+np = ak.nplike.NumpyMetadata.instance()
+numpy = ak.nplike.Numpy.instance()
+
+
+def partition_as(sample, inputs):
+    """
+    Splits each of the `inputs` at the same `stops` as the `sample`
+    #ak._v2.partition.PartitionedArray, returning a list (one item per
+    partition) of lists (one item per input). Arrays with the same length as
+    the sample are split; anything else (scalars, arrays to be broadcasted)
+    is passed to every partition as-is.
+    """
+    stops = sample.stops
+    columns = []
+    for x in inputs:
+        if isinstance(x, PartitionedArray):
+            columns.append(x.repartition(stops).partitions)
+        elif (
+            isinstance(x, (ak._v2.contents.Content, ak._v2.highlevel.Array))
+            and len(x) == sample.length
+        ):
+            columns.append(_split(x, stops))
+        else:
+            columns.append([x] * len(stops))
+    return [list(row) for row in zip(*columns)]
+
+
+def _split(array, stops):
+    out = []
+    start = 0
+    for stop in stops:
+        out.append(_packed(array[start:stop]))
+        start = stop
+    return out
+
+
+def _packed(array):
+    # A range slice still holds (and operations on it would process) the
+    # data outside the range; packing trims list contents to the range.
+    if isinstance(array, ak._v2.highlevel.Array):
+        return ak._v2._util.wrap(array.layout.packed(), array.behavior)
+    else:
+        return array.packed()
+
+
+def _layout(obj):
+    if isinstance(obj, (ak._v2.highlevel.Array, ak._v2.highlevel.Record)):
+        return obj.layout
+    else:
+        return obj
+
+
+def broadcast_and_apply(inputs, action, behavior, **kwargs):
+    # ak._v2._broadcasting.broadcast_and_apply for inputs that include at
+    # least one PartitionedArray: every partition is broadcasted separately.
+    sample = [x for x in inputs if isinstance(x, PartitionedArray)][0]
+    rows = partition_as(sample, inputs)
+
+    if kwargs.get("depth_context") is None and kwargs.get("lateral_context") is None:
+        threads = sample.threads
+    else:
+        # contexts are shared among partitions, so they are filled in order
+        threads = 1
+
+    outs = _map(
+        lambda row: ak._v2._broadcasting.broadcast_and_apply(
+            row, action, behavior, **kwargs
+        ),
+        rows,
+        threads,
+    )
+    return tuple(
+        PartitionedArray(list(parts), threads=sample.threads) for parts in zip(*outs)
+    )
+
+
+def array_ufunc(ufunc, method, inputs, kwargs):
+    # ak._v2._connect.numpy.array_ufunc for inputs that include at least one
+    # PartitionedArray: the ufunc is applied to each partition separately.
+    if method != "__call__" or len(inputs) == 0 or "out" in kwargs:
+        return NotImplemented
+
+    sample = [x for x in inputs if isinstance(x, PartitionedArray)][0]
+    outs = _map(
+        lambda row: _layout(
+            ak._v2._connect.numpy.array_ufunc(ufunc, method, row, kwargs)
+        ),
+        partition_as(sample, inputs),
+        sample.threads,
+    )
+    return PartitionedArray(outs, threads=sample.threads)
+
+
+def _map(function, items, threads):
+    if threads is None:
+        threads = len(items)
+    if threads <= 1 or len(items) <= 1:
+        return [function(x) for x in items]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+            min(threads, len(items))
+        ) as executor:
+            return list(executor.map(function, items))
+
+
+class PartitionedArray(NDArrayOperatorsMixin):
+    """
+    Args:
+        partitions (list of #ak._v2.contents.Content): The chunks of data,
+            which must all have the same type.
+        stops (None or list of int): The cumulative lengths of `partitions`;
+            if None, they are computed from the partitions.
+        threads (None or int): Number of threads to use when applying an
+            operation to all partitions; None means one per partition.
+
+    A logical array whose data are split among a list of contiguous
+    `partitions` along the first axis, so that each can be processed
+    separately. Slices, ufuncs,
+    #ak._v2._broadcasting.broadcast_and_apply, and reductions along inner
+    axes act on each partition and return a new PartitionedArray with the
+    same partitioning; reductions along `axis=0` reduce each partition and
+    then combine these partial results.
+
+    Empty partitions are dropped (unless they are all empty).
+    """
+
+    def __init__(self, partitions, stops=None, threads=1):
+        partitions = [_layout(x) for x in partitions]
+        if len(partitions) == 0:
+            raise ValueError("PartitionedArray must have at least one partition")
+        for x in partitions:
+            if not isinstance(x, ak._v2.contents.Content):
+                raise TypeError(
+                    "PartitionedArray partitions must be ak._v2.contents.Content, "
+                    "not {}".format(type(x))
+                )
+
+        if stops is None:
+            stops = []
+            total = 0
+            for x in partitions:
+                total += x.length
+                stops.append(total)
+        elif len(stops) != len(partitions):
+            raise ValueError(
+                "PartitionedArray stops must have the same length as partitions"
+            )
+
+        nonempty = [i for i, x in enumerate(partitions) if x.length != 0]
+        if len(nonempty) == 0:
+            nonempty = [0]
+        self._partitions = [partitions[i] for i in nonempty]
+        self._stops = [int(stops[i]) for i in nonempty]
+        self._threads = threads
+
+        mytype = self._partitions[0].form.type
+        for x in self._partitions[1:]:
+            if x.form.type != mytype:
+                raise ValueError(
+                    "PartitionedArray partitions have different types: {} and {}".format(
+                        str(mytype), str(x.form.type)
+                    )
+                )
+
+    @classmethod
+    def from_content(cls, content, stops, threads=1):
+        """
+        Splits `content` at the cumulative lengths `stops`, the last of which
+        must be the length of `content`.
+        """
+        content = _layout(content)
+        if len(stops) == 0 or stops[-1] != content.length:
+            raise ValueError(
+                "last stop ({}) must be the length of the array ({})".format(
+                    stops[-1] if len(stops) != 0 else None, content.length
+                )
+            )
+        return cls(_split(content, stops), stops, threads)
+
+    @property
+    def partitions(self):
+        return self._partitions
+
+    @property
+    def npartitions(self):
+        return len(self._partitions)
+
+    def partition(self, partitionid):
+        return self._partitions[partitionid]
+
+    @property
+    def stops(self):
+        return self._stops
+
+    @property
+    def starts(self):
+        return [0] + self._stops[:-1]
+
+    @property
+    def lengths(self):
+        return [x.length for x in self._partitions]
+
+    @property
+    def threads(self):
+        return self._threads
+
+    @property
+    def length(self):
+        return self._stops[-1]
+
+    def __len__(self):
+        return self.length
+
+    @property
+    def form(self):
+        return self._partitions[0].form
+
+    @property
+    def nbytes(self):
+        return sum(x.nbytes for x in self._partitions)
+
+    def __repr__(self):
+        return "<PartitionedArray npartitions={} len={} type={}>".format(
+            self.npartitions, repr(str(self.length)), repr(str(self.form.type))
+        )
+
+    def __iter__(self):
+        for partition in self._partitions:
+            yield from partition
+
+    def to_list(self, behavior=None):
+        out = []
+        for x in self._partitions:
+            out.extend(x.to_list(behavior))
+        return out
+
+    def to_content(self):
+        """
+        Concatenates the partitions into a single #ak._v2.contents.Content.
+        """
+        if len(self._partitions) == 1:
+            return self._partitions[0]
+        else:
+            return self._partitions[0].mergemany(self._partitions[1:])
+
+    def partitionid_index_at(self, at):
+        partitionid = bisect.bisect_right(self._stops, at)
+        return partitionid, at - self.starts[partitionid]
+
+    def repartition(self, stops):
+        """
+        Returns the same logical array split at a new set of `stops`.
+        """
+        if list(stops) == self._stops:
+            return self
+        if len(stops) == 0 or stops[-1] != self.length:
+            raise ValueError(
+                "last stop ({}) must be the length of the array ({})".format(
+                    stops[-1] if len(stops) != 0 else None, self.length
+                )
+            )
+
+        partitions = []
+        start = 0
+        for stop in stops:
+            pieces = []
+            firstid = bisect.bisect_right(self._stops, start)
+            for partitionid in range(firstid, len(self._partitions)):
+                pstart = self.starts[partitionid]
+                if pstart >= stop:
+                    break
+                piece = self._partitions[partitionid][
+                    max(start, pstart)
+                    - pstart : min(stop, self._stops[partitionid])
+                    - pstart
+                ]
+                if piece.length != 0:
+                    pieces.append(piece.packed())
+
+            if len(pieces) == 0:
+                partitions.append(self._partitions[0][0:0].packed())
+            elif len(pieces) == 1:
+                partitions.append(pieces[0])
+            else:
+                partitions.append(pieces[0].mergemany(pieces[1:]))
+            start = stop
+
+        return PartitionedArray(partitions, stops, self._threads)
+
+    def map_partitions(self, function):
+        """
+        Returns a PartitionedArray of `function` applied to each partition,
+        on #threads threads.
+        """
+        return PartitionedArray(
+            _map(function, self._partitions, self._threads), threads=self._threads
+        )
+
+    def __getitem__(self, where):
+        if ak._util.isint(where):
+            if where < 0:
+                where += self.length
+            if not 0 <= where < self.length:
+                raise IndexError(f"{type(self).__name__} index out of range")
+            partitionid, index = self.partitionid_index_at(where)
+            return self._partitions[partitionid][index]
+
+        elif isinstance(where, slice):
+            return self._getitem_range(where)
+
+        elif isinstance(where, str) or (
+            isinstance(where, Iterable)
+            and not isinstance(where, tuple)
+            and len(where) > 0
+            and all(isinstance(x, str) for x in where)
+        ):
+            return self.map_partitions(lambda x: x[where])
+
+        elif isinstance(where, tuple) and len(where) == 0:
+            return self
+
+        elif isinstance(where, tuple):
+            head, tail = where[0], where[1:]
+            if ak._util.isint(head):
+                if head < 0:
+                    head += self.length
+                if not 0 <= head < self.length:
+                    raise IndexError(f"{type(self).__name__} index out of range")
+                partitionid, index = self.partitionid_index_at(head)
+                return self._partitions[partitionid][(index,) + tail]
+
+            elif isinstance(head, slice):
+                return self._getitem_range(head).map_partitions(
+                    lambda x: x[(slice(None),) + tail]
+                )
+
+            elif head is Ellipsis or isinstance(head, str):
+                return self.map_partitions(lambda x: x[where])
+
+            elif head is np.newaxis:
+                return PartitionedArray(
+                    [self.to_content()[where]], threads=self._threads
+                )
+
+            else:
+                return self._getitem_array(head, tail)
+
+        elif where is Ellipsis:
+            return self
+
+        elif where is np.newaxis:
+            return PartitionedArray([self.to_content()[where]], threads=self._threads)
+
+        else:
+            return self._getitem_array(where, ())
+
+    def _getitem_range(self, where):
+        start, stop, step = where.indices(self.length)
+        if step < 0:
+            return PartitionedArray([self.to_content()[where]], threads=self._threads)
+
+        partitions = []
+        for x, pstart, pstop in zip(self._partitions, self.starts, self._stops):
+            if pstop <= start or pstart >= stop:
+                continue
+            # first selected index in this partition
+            first = start + max(0, -(-(pstart - start) // step)) * step
+            if first < min(stop, pstop):
+                partitions.append(x[first - pstart : min(stop, pstop) - pstart : step])
+
+        if len(partitions) == 0:
+            partitions = [self._partitions[0][0:0]]
+        return PartitionedArray(partitions, threads=self._threads)
+
+    def _getitem_array(self, head, tail):
+        if isinstance(head, PartitionedArray):
+            layout = head
+        else:
+            layout = ak._v2.operations.convert.to_layout(
+                head,
+                allow_record=False,
+                allow_other=False,
+            )
+
+        if isinstance(layout, PartitionedArray):
+            aligned = not _is_integer_array(layout.partition(0))
+        else:
+            aligned = len(layout) == self.length and not _is_integer_array(layout)
+
+        if aligned:
+            # a boolean mask or a nested slice lines up with the partitions
+            rows = partition_as(self, [self, layout])
+            return PartitionedArray(
+                _map(lambda row: row[0][(row[1],) + tail], rows, self._threads),
+                threads=self._threads,
+            )
+
+        # integer arrays can pick from anywhere
+        if isinstance(layout, PartitionedArray):
+            layout = layout.to_content()
+        return PartitionedArray(
+            [self.to_content()[(layout,) + tail]], threads=self._threads
+        )
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        return array_ufunc(ufunc, method, inputs, kwargs)
+
+    def _reduce(self, name, axis, mask, keepdims, **kwargs):
+        if axis is None:
+            return self._reduce_all(name, **kwargs)
+
+        branch, depth = self._partitions[0].branch_depth
+        negaxis = -axis
+        if not branch and negaxis <= 0:
+            negaxis += depth
+
+        if branch or negaxis != depth:
+            return self.map_partitions(
+                lambda x: getattr(x, name)(axis, mask, keepdims, **kwargs)
+            )
+
+        elif name in ("argmin", "argmax"):
+            # positions would have to be shifted by each partition's start
+            return getattr(self.to_content(), name)(axis, mask, keepdims)
+
+        else:
+            partials = _map(
+                lambda x: getattr(x, name)(axis, mask, True, **kwargs),
+                self._partitions,
+                self._threads,
+            )
+            combined = partials[0]
+            if len(partials) > 1:
+                combined = combined.mergemany(partials[1:])
+            if name in ("count", "count_nonzero"):
+                return combined.sum(axis, mask, keepdims)
+            else:
+                return getattr(combined, name)(axis, mask, keepdims, **kwargs)
+
+    def _reduce_all(self, name, initial=None):
+        # like ak._v2.operations.reducers with axis=None: every value of the
+        # array is reduced to one scalar, here one partition at a time
+        function = getattr(ak._v2.operations.reducers, name)
+        if name in ("argmin", "argmax"):
+            # positions would have to be shifted by each partition's size
+            return function(self.to_content(), axis=None)
+
+        partials = _map(
+            lambda x: function(x, axis=None), self._partitions, self._threads
+        )
+        if name in ("min", "max"):
+            partials = [x for x in partials if x is not None]
+            if initial is not None:
+                partials.append(initial)
+            if len(partials) == 0:
+                return None
+
+        combine = {
+            "count": numpy.add,
+            "count_nonzero": numpy.add,
+            "sum": numpy.add,
+            "prod": numpy.multiply,
+            "any": numpy.logical_or,
+            "all": numpy.logical_and,
+            "min": numpy.minimum,
+            "max": numpy.maximum,
+        }[name]
+        out = partials[0]
+        for x in partials[1:]:
+            out = combine(out, x)
+        return out
+
+    def argmin(self, axis=-1, mask=True, keepdims=False):
+        return self._reduce("argmin", axis, mask, keepdims)
+
+    def argmax(self, axis=-1, mask=True, keepdims=False):
+        return self._reduce("argmax", axis, mask, keepdims)
+
+    def count(self, axis=-1, mask=False, keepdims=False):
+        return self._reduce("count", axis, mask, keepdims)
+
+    def count_nonzero(self, axis=-1, mask=False, keepdims=False):
+        return self._reduce("count_nonzero", axis, mask, keepdims)
+
+    def sum(self, axis=-1, mask=False, keepdims=False):
+        return self._reduce("sum", axis, mask, keepdims)
+
+    def prod(self, axis=-1, mask=False, keepdims=False):
+        return self._reduce("prod", axis, mask, keepdims)
+
+    def any(self, axis=-1, mask=False, keepdims=False):
+        return self._reduce("any", axis, mask, keepdims)
+
+    def all(self, axis=-1, mask=False, keepdims=False):
+        return self._reduce("all", axis, mask, keepdims)
+
+    def min(self, axis=-1, mask=True, keepdims=False, initial=None):
+        return self._reduce("min", axis, mask, keepdims, initial=initial)
+
+    def max(self, axis=-1, mask=True, keepdims=False, initial=None):
+        return self._reduce("max", axis, mask, keepdims, initial=initial)
+
+
+def _is_integer_array(layout):
+    # an array of integers (maybe missing), as opposed to booleans or lists
+    while isinstance(
+        layout,
+        (
+            ak._v2.contents.IndexedOptionArray,
+            ak._v2.contents.ByteMaskedArray,
+            ak._v2.contents.BitMaskedArray,
+            ak._v2.contents.UnmaskedArray,
+            ak._v2.contents.IndexedArray,
+        ),
+    ):
+        layout = layout.content
+    return isinstance(layout, ak._v2.contents.NumpyArray) and issubclass(
+        layout.dtype.type, (np.integer,)
+    )
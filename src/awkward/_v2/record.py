@@ -150,8 +150,14 @@ class Record:
     def _getitem_fields(self, where):
         return self._array._getitem_fields(where)._getitem_at(self._at)
 
+    @property
+    def is_packed(self):
+        return self._at == 0 and self._array.length == 1 and self._array.is_packed
+
     def packed(self):
-        if self._array.length == 1:
+        if self.is_packed:
+            return self
+        elif self._array.length == 1:
             return Record(self._array.packed(), self._at)
         else:
             return Record(self._array[self._at : self._at + 1].packed(), 0)
@@ -4,6 +4,8 @@
 
 
 import ctypes
+import threading
+import time
 
 from collections.abc import Iterable
 
@@ -280,6 +282,10 @@ class NumpyLike(Singleton):
         # array1, array2
         return self._module.logical_and(*args, **kwargs)
 
+    def reduceat(self, ufunc, *args, **kwargs):
+        # ufunc name, array, indices[, dtype=]
+        return getattr(self._module, ufunc).reduceat(*args, **kwargs)
+
     def sqrt(self, *args, **kwargs):
         # array
         return self._module.sqrt(*args, **kwargs)
@@ -385,11 +391,69 @@ class NumpyLike(Singleton):
         return self._module.datetime_as_string(*args, **kwargs)
 
 
+# active ak._v2._profiling.KernelProfiler objects
+_profilers = []
+
+
+class _KernelCounters:
+    """
+    The number of calls to a kernel and the time spent in them, counted
+    separately by each thread that calls it (kernels are called from the
+    reducers' thread pool), so that calls don't contend for a lock.
+    """
+
+    def __init__(self):
+        self._by_thread = {}
+
+    def add(self, seconds):
+        ident = threading.get_ident()
+        counter = self._by_thread.get(ident)
+        if counter is None:
+            # only this thread inserts or updates its own counter
+            counter = self._by_thread[ident] = [0, 0.0]
+        counter[0] += 1
+        counter[1] += seconds
+
+    @property
+    def calls(self):
+        return sum(calls for calls, _ in list(self._by_thread.values()))
+
+    @property
+    def time(self):
+        return sum(seconds for _, seconds in list(self._by_thread.values()))
+
+    def reset(self):
+        self._by_thread = {}
+
+
 class NumpyKernel:
     def __init__(self, kernel, name_and_types):
         self._kernel = kernel
         self._name_and_types = name_and_types
 
+        # A second function pointer to the same symbol that takes pointer
+        # arguments as plain addresses, so that calls don't need ctypes.cast.
+        self._function = ak._cpu_kernels.lib[kernel.__name__]
+        self._function.restype = kernel.restype
+        self._function.argtypes = [
+            ctypes.c_void_p if issubclass(t, ctypes._Pointer) else t
+            for t in kernel.argtypes
+        ]
+        self._is_pointer = tuple(
+            issubclass(t, ctypes._Pointer) for t in kernel.argtypes
+        )
+        self._directions = kernel.dir
+
+        self._counters = _KernelCounters()
+
+    @property
+    def calls(self):
+        return self._counters.calls
+
+    @property
+    def time(self):
+        return self._counters.time
+
     def __repr__(self):
         return "<{} {}{}>".format(
             type(self).__name__,
@@ -397,22 +461,116 @@ class NumpyKernel:
             "".join(", " + str(numpy.dtype(x)) for x in self._name_and_types[1:]),
         )
 
-    @staticmethod
-    def _cast(x, t):
-        if issubclass(t, ctypes._Pointer):
-            if isinstance(x, numpy.ndarray):
-                return ctypes.cast(x.ctypes.data, t)
-            else:
-                return ctypes.cast(x, t)
+    def __call__(self, *args):
+        assert len(args) == len(self._is_pointer)
+        pointers = [
+            x.ctypes.data if is_pointer and isinstance(x, numpy.ndarray) else x
+            for x, is_pointer in zip(args, self._is_pointer)
+        ]
+        start = time.perf_counter()
+        try:
+            return self._function(*pointers)
+        finally:
+            stop = time.perf_counter()
+            self._counters.add(stop - start)
+            if _profilers:
+                for profiler in _profilers:
+                    profiler._record(self, args, start, stop)
+
+
+class PythonKernelError:
+    def __init__(self, message):
+        if message is None:
+            self.str = None
+        else:
+            self.str = message.encode(errors="surrogateescape")
+        self.filename = None
+        self.id = ak._util.kSliceNone
+        self.attempt = ak._util.kSliceNone
+        self.pass_through = False
+
+
+class PythonKernel:
+    """
+    A kernel from the Python definitions in kernel-specification.yml, called
+    directly on NumPy arrays or, if `jit`, compiled by Numba on first use.
+    It has the same interface as NumpyKernel, including its error struct.
+    """
+
+    def __init__(
+        self, function, directions, dtypes, pointers, name_and_types, jit=False
+    ):
+        self._function = function
+        self._directions = directions
+        self._dtypes = [numpy.dtype(x) for x in dtypes]
+        self._pointers = pointers
+        self._name_and_types = name_and_types
+        self._jit = jit
+        if jit:
+            import numba
+
+            self._compiled = numba.njit(function)
         else:
-            return x
+            self._compiled = None
 
-    def __call__(self, *args):
-        assert len(args) == len(self._kernel.argtypes)
-        return self._kernel(
-            *(self._cast(x, t) for x, t in zip(args, self._kernel.argtypes))
+        self._counters = _KernelCounters()
+
+    @property
+    def calls(self):
+        return self._counters.calls
+
+    @property
+    def time(self):
+        return self._counters.time
+
+    def __repr__(self):
+        return "<{} {}{}{}>".format(
+            type(self).__name__,
+            self._name_and_types[0],
+            "".join(", " + str(numpy.dtype(x)) for x in self._name_and_types[1:]),
+            " (jit)" if self._jit else "",
         )
 
+    def _run(self, args):
+        if self._compiled is not None:
+            import numba
+
+            try:
+                return self._compiled(*args)
+            except numba.core.errors.TypingError:
+                # a few definitions use Python features that Numba lacks
+                self._compiled = None
+
+        return self._function(*args)
+
+    def __call__(self, *args):
+        assert len(args) == len(self._directions)
+        # The compiled kernels reinterpret their arguments' bytes (e.g. datetimes
+        # as int64, int64 as bool), so arrays get the same view. Numba would
+        # type Python int arguments as int64, so scalars get the C type.
+        converted = []
+        for x, dtype, pointer in zip(args, self._dtypes, self._pointers):
+            if pointer:
+                if isinstance(x, numpy.ndarray) and x.dtype != dtype:
+                    x = x.view(dtype)
+            elif self._compiled is not None:
+                x = numpy.asarray(x).astype(dtype)[()]
+            converted.append(x)
+
+        start = time.perf_counter()
+        try:
+            self._run(converted)
+        except ValueError as err:
+            return PythonKernelError(str(err))
+        else:
+            return PythonKernelError(None)
+        finally:
+            stop = time.perf_counter()
+            self._counters.add(stop - start)
+            if _profilers:
+                for profiler in _profilers:
+                    profiler._record(self, args, start, stop)
+
 
 class Numpy(NumpyLike):
     def to_rectilinear(self, array, *args, **kwargs):
@@ -440,9 +598,87 @@ class Numpy(NumpyLike):
         else:
             raise TypeError("to_rectilinear argument must be iterable")
 
+    _kernels = {"cpu": {}, "python": {}, "numba": {}}
+    _kernel_provider = "cpu"
+    _kernel_definitions = None
+
+    @property
+    def kernel_provider(self):
+        """
+        Where kernels come from, shared by all Numpy instances:
+
+        - `"cpu"`: the compiled libawkward-cpu-kernels (default);
+        - `"python"`: the Python definitions in kernel-specification.yml,
+          evaluated on NumPy arrays (slow, but needs no compiled code);
+        - `"numba"`: the same definitions, compiled by Numba on first use.
+
+        Kernels without a Python definition (sorting, combinations, complex
+        reducers, and a few others) always come from `"cpu"`.
+        """
+        return self._kernel_provider
+
+    @kernel_provider.setter
+    def kernel_provider(self, value):
+        if value not in self._kernels:
+            raise ValueError(
+                "kernel_provider must be one of {}, not {}".format(
+                    ", ".join(repr(x) for x in self._kernels), repr(value)
+                )
+            )
+        if value == "numba":
+            ak._v2.numba.register_and_check()
+        type(self)._kernel_provider = value
+
     def __getitem__(self, name_and_types):
+        kernels = self._kernels[self._kernel_provider]
+        out = kernels.get(name_and_types)
+        if out is None:
+            out = self._new_kernel(name_and_types)
+            kernels[name_and_types] = out
+        return out
+
+    def _new_kernel(self, name_and_types):
+        if self._kernel_provider != "cpu":
+            if Numpy._kernel_definitions is None:
+                import awkward._kernel_definitions
+
+                Numpy._kernel_definitions = awkward._kernel_definitions.by_signature()
+
+            definition = self._kernel_definitions.get(name_and_types)
+            if definition is not None:
+                function, directions, dtypes, pointers = definition
+                return PythonKernel(
+                    function,
+                    directions,
+                    dtypes,
+                    pointers,
+                    name_and_types,
+                    jit=self._kernel_provider == "numba",
+                )
+
         return NumpyKernel(ak._cpu_kernels.kernel[name_and_types], name_and_types)
 
+    def kernel_stats(self):
+        """
+        Returns a dict from `(kernel_name, dtype, ...)` to `(calls, seconds)`
+        for every kernel from the current #kernel_provider that has been
+        called since the last #reset_kernel_stats, where `seconds` is the
+        cumulative time spent in the kernel itself.
+        """
+        out = {}
+        for name_and_types, kernel in list(
+            self._kernels[self._kernel_provider].items()
+        ):
+            calls = kernel.calls
+            if calls != 0:
+                out[name_and_types] = (calls, kernel.time)
+        return out
+
+    def reset_kernel_stats(self):
+        for kernels in self._kernels.values():
+            for kernel in list(kernels.values()):
+                kernel._counters.reset()
+
     def __init__(self):
         self._module = numpy
 
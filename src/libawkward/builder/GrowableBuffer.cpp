@@ -69,6 +69,7 @@ namespace awkward {
                                     size_t reserved)
       : options_(options)
       , ptr_(std::move(ptr))
+      , ptr_start_(0)
       , length_(length)
       , reserved_(reserved) { }
 
@@ -82,12 +83,14 @@ namespace awkward {
   template <typename T>
   const typename GrowableBuffer<T>::UniquePtr&
   GrowableBuffer<T>::ptr() const {
+    concatenate();
     return ptr_;
   }
 
   template <typename T>
   typename GrowableBuffer<T>::UniquePtr
   GrowableBuffer<T>::get_ptr() {
+    concatenate();
     return std::move(ptr_);
   }
 
@@ -100,6 +103,7 @@ namespace awkward {
   template <typename T>
   void
   GrowableBuffer<T>::set_length(size_t newlength) {
+    concatenate();
     if (newlength > reserved_) {
       set_reserved(newlength);
     }
@@ -116,6 +120,7 @@ namespace awkward {
   void
   GrowableBuffer<T>::set_reserved(size_t minreserved) {
     if (minreserved > reserved_) {
+      concatenate();
       UniquePtr ptr(reinterpret_cast<T*>(awkward_malloc((int64_t)(minreserved*sizeof(T)))));
       memcpy(ptr.get(), ptr_.get(), length_ * sizeof(T));
       ptr_ = std::move(ptr);
@@ -126,6 +131,9 @@ namespace awkward {
   template <typename T>
   void
   GrowableBuffer<T>::clear() {
+    panels_.clear();
+    panel_lengths_.clear();
+    ptr_start_ = 0;
     length_ = 0;
     reserved_ = (size_t) options_.initial();
     ptr_ = UniquePtr(reinterpret_cast<T*>(awkward_malloc(options_.initial()*(int64_t)sizeof(T))));
@@ -135,16 +143,57 @@ namespace awkward {
   void
   GrowableBuffer<T>::append(T datum) {
     if (length_ == reserved_) {
-      set_reserved((size_t)ceil(reserved_ * options_.resize()));
+      size_t newreserved = (size_t)ceil(reserved_ * options_.resize());
+      add_panel(newreserved > reserved_ ? newreserved - reserved_ : 1);
     }
-    ptr_.get()[length_] = datum;
+    ptr_.get()[length_ - ptr_start_] = datum;
     length_++;
   }
 
   template <typename T>
   T
   GrowableBuffer<T>::getitem_at_nowrap(int64_t at) const {
-    return ptr_.get()[at];
+    size_t i = (size_t)at;
+    if (i >= ptr_start_) {
+      return ptr_.get()[i - ptr_start_];
+    }
+    for (size_t j = 0;  j < panels_.size();  j++) {
+      if (i < panel_lengths_[j]) {
+        return panels_[j].get()[i];
+      }
+      i -= panel_lengths_[j];
+    }
+    return ptr_.get()[i];
+  }
+
+  template <typename T>
+  void
+  GrowableBuffer<T>::add_panel(size_t reserve) {
+    panel_lengths_.push_back(length_ - ptr_start_);
+    panels_.push_back(std::move(ptr_));
+    ptr_ = UniquePtr(reinterpret_cast<T*>(awkward_malloc((int64_t)(reserve*sizeof(T)))));
+    ptr_start_ = length_;
+    reserved_ += reserve;
+  }
+
+  template <typename T>
+  void
+  GrowableBuffer<T>::concatenate() const {
+    if (panels_.empty()) {
+      return;
+    }
+    UniquePtr ptr(reinterpret_cast<T*>(awkward_malloc((int64_t)(reserved_*sizeof(T)))));
+    T* rawptr = ptr.get();
+    for (size_t j = 0;  j < panels_.size();  j++) {
+      memcpy(rawptr, panels_[j].get(), panel_lengths_[j] * sizeof(T));
+      rawptr += panel_lengths_[j];
+      panels_[j].reset();
+    }
+    memcpy(rawptr, ptr_.get(), (length_ - ptr_start_) * sizeof(T));
+    panels_.clear();
+    panel_lengths_.clear();
+    ptr_ = std::move(ptr);
+    ptr_start_ = 0;
   }
 
   template class EXPORT_TEMPLATE_INST GrowableBuffer<bool>;
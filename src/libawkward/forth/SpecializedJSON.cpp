@@ -4,6 +4,7 @@
 
 #include <stdexcept>
 #include <sstream>
+#include <vector>
 
 #include "rapidjson/document.h"
 #include "rapidjson/reader.h"
@@ -738,13 +739,65 @@ namespace awkward {
     return json_position_;
   }
 
+  template <typename STREAM>
   bool
-  SpecializedJSON::parse_string(const char* source) noexcept {
-    reset();
+  parse_values(SpecializedJSON* specializedjson,
+               STREAM& stream,
+               bool one_per_line) {
     rj::Reader reader;
+    SpecializedJSONHandler handler(specializedjson);
+    if (!one_per_line) {
+      return reader.Parse<rj::kParseDefaultFlags>(stream, handler);
+    }
+
+    int64_t number = 0;
+    while (true) {
+      while (stream.Peek() == ' '  ||  stream.Peek() == '\t'  ||
+             stream.Peek() == '\n'  ||  stream.Peek() == '\r') {
+        stream.Take();
+      }
+      if (stream.Peek() == 0) {
+        break;
+      }
+      if (!reader.Parse<rj::kParseStopWhenDoneFlag>(stream, handler)) {
+        return false;
+      }
+      number++;
+      while (stream.Peek() == ' '  ||  stream.Peek() == '\t') {
+        stream.Take();
+      }
+      if (stream.Peek() != 0  &&
+          stream.Peek() != '\n'  &&
+          stream.Peek() != '\r') {
+        return false;
+      }
+    }
+    specializedjson->set_length(number);
+    return true;
+  }
+
+  bool
+  SpecializedJSON::parse_string(const char* source, bool one_per_line) noexcept {
+    reset();
     rj::StringStream stream(source);
-    SpecializedJSONHandler handler(this);
-    bool out = reader.Parse<rj::kParseDefaultFlags>(stream, handler);
+    bool out = parse_values(this, stream, one_per_line);
+    json_position_ = stream.Tell();
+    return out;
+  }
+
+  bool
+  SpecializedJSON::parse_stream(const ReadFunction& read,
+                                int64_t buffersize,
+                                bool one_per_line) {
+    if (buffersize < 1) {
+      throw std::invalid_argument(
+        std::string("buffersize must be at least 1")
+        + FILENAME(__LINE__));
+    }
+    reset();
+    std::vector<char> buffer((size_t)buffersize);
+    ReadFunctionStream stream(read, buffer.data(), (size_t)buffersize);
+    bool out = parse_values(this, stream, one_per_line);
     json_position_ = stream.Tell();
     return out;
   }
@@ -769,7 +769,10 @@ namespace awkward {
 
   template<typename HANDLER, typename STREAM>
   const int64_t
-  do_parse(HANDLER& handler, rj::Reader& reader, STREAM& stream) {
+  do_parse(HANDLER& handler,
+           rj::Reader& reader,
+           STREAM& stream,
+           bool one_per_line) {
     int64_t number = 0;
     while (stream.Peek() != 0) {
       handler.reset_moved();
@@ -791,6 +794,21 @@ namespace awkward {
         }
         else {
           number++;
+          if (one_per_line) {
+            while (stream.Peek() == ' '  ||  stream.Peek() == '\t') {
+              stream.Take();
+            }
+            if (stream.Peek() != 0  &&
+                stream.Peek() != '\n'  &&
+                stream.Peek() != '\r') {
+              throw std::invalid_argument(
+                std::string("extra data after a JSON value at char ")
+                + std::to_string(stream.Tell())
+                + std::string(": multiple JSON values must be separated by "
+                              "newlines")
+                + FILENAME(__LINE__));
+            }
+          }
         }
       }
       else if (stream.Peek() != 0) {
@@ -810,14 +828,15 @@ namespace awkward {
                  ArrayBuilder& builder,
                  const char* nan_string,
                  const char* infinity_string,
-                 const char* minus_infinity_string) {
+                 const char* minus_infinity_string,
+                 bool one_per_line) {
     rj::Reader reader;
     rj::StringStream stream(source);
     Handler handler(builder,
                     nan_string,
                     infinity_string,
                     minus_infinity_string);
-    return do_parse(handler, reader, stream);
+    return do_parse(handler, reader, stream, one_per_line);
   }
 
   int64_t
@@ -826,7 +845,8 @@ namespace awkward {
                int64_t buffersize,
                const char* nan_string,
                const char* infinity_string,
-               const char* minus_infinity_string) {
+               const char* minus_infinity_string,
+               bool one_per_line) {
     rj::Reader reader;
     std::shared_ptr<char> buffer = kernel::malloc<char>(kernel::lib::cpu, buffersize);
     rj::FileReadStream stream(source,
@@ -836,6 +856,103 @@ namespace awkward {
                     nan_string,
                     infinity_string,
                     minus_infinity_string);
-    return do_parse(handler, reader, stream);
+    return do_parse(handler, reader, stream, one_per_line);
+  }
+
+  ReadFunctionStream::ReadFunctionStream(const ReadFunction& read,
+                                         char* buffer,
+                                         size_t buffersize)
+      : read_(read)
+      , buffer_(buffer)
+      , buffersize_(buffersize)
+      , current_(buffer)
+      , last_(buffer)
+      , count_(0)
+      , eof_(false) {
+    Read();
+  }
+
+  ReadFunctionStream::Ch
+  ReadFunctionStream::Take() {
+    Ch c = *current_;
+    if (current_ + 1 < last_) {
+      ++current_;
+    }
+    else if (!eof_) {
+      Read();
+    }
+    return c;
+  }
+
+  void
+  ReadFunctionStream::Put(Ch) {
+    RAPIDJSON_ASSERT(false);
+  }
+
+  void
+  ReadFunctionStream::Flush() {
+    RAPIDJSON_ASSERT(false);
+  }
+
+  ReadFunctionStream::Ch*
+  ReadFunctionStream::PutBegin() {
+    RAPIDJSON_ASSERT(false);
+    return 0;
+  }
+
+  size_t
+  ReadFunctionStream::PutEnd(Ch*) {
+    RAPIDJSON_ASSERT(false);
+    return 0;
+  }
+
+  const ReadFunctionStream::Ch*
+  ReadFunctionStream::Peek4() const {
+    return (current_ + 4 <= last_) ? current_ : 0;
+  }
+
+  void
+  ReadFunctionStream::Read() {
+    count_ += static_cast<size_t>(last_ - buffer_);
+    // a short read is not the end of the stream; only an empty one is
+    int64_t readcount = read_(buffer_, (int64_t)buffersize_);
+    if (readcount < 0  ||  readcount > (int64_t)buffersize_) {
+      throw std::invalid_argument(
+        std::string("JSON stream read ") + std::to_string(readcount)
+        + std::string(" bytes into a buffer of ")
+        + std::to_string(buffersize_)
+        + FILENAME(__LINE__));
+    }
+    current_ = buffer_;
+    last_ = buffer_ + readcount;
+    if (readcount == 0) {
+      buffer_[0] = '\0';
+      eof_ = true;
+    }
+  }
+
+  int64_t
+  FromJsonStream(const ReadFunction& read,
+                 ArrayBuilder& builder,
+                 int64_t buffersize,
+                 const char* nan_string,
+                 const char* infinity_string,
+                 const char* minus_infinity_string,
+                 bool one_per_line) {
+    if (buffersize < 1) {
+      throw std::invalid_argument(
+        std::string("buffersize must be at least 1")
+        + FILENAME(__LINE__));
+    }
+    rj::Reader reader;
+    std::shared_ptr<char> buffer = kernel::malloc<char>(kernel::lib::cpu, buffersize);
+    ReadFunctionStream stream(read,
+                              buffer.get(),
+                              (size_t)buffersize);
+    Handler handler(builder,
+                    nan_string,
+                    infinity_string,
+                    minus_infinity_string);
+    return do_parse(handler, reader, stream, one_per_line);
   }
 }
@@ -9,6 +9,7 @@
 #include "awkward/python/util.h"
 #include "awkward/python/content.h"
 #include "awkward/python/forth.h"
+#include "awkward/python/io.h"
 
 template <typename T, typename I>
 py::object maybe_throw(const ak::ForthMachineOf<T, I>& self,
@@ -512,12 +513,24 @@ make_SpecializedJSON(const py::handle& m, const std::string& name) {
           py::arg("jsonassembly"),
           py::arg("output_initial_size") = 1024,
           py::arg("output_resize_factor") = 1.5)
-          .def("parse_string", [](ak::SpecializedJSON& self, const std::string& source) -> bool {
+          .def("parse_string", [](ak::SpecializedJSON& self,
+                                  const std::string& source,
+                                  bool one_per_line) -> bool {
             py::gil_scoped_release release;
-            bool out = self.parse_string(source.c_str());
+            bool out = self.parse_string(source.c_str(), one_per_line);
             py::gil_scoped_acquire acquire;
             return out;
-          })
+          }, py::arg("source"), py::arg("one_per_line") = false)
+          .def("parse_stream", [](ak::SpecializedJSON& self,
+                                  const py::object& source,
+                                  int64_t buffersize,
+                                  bool one_per_line) -> bool {
+            // source.read needs the GIL, so it is not released
+            ak::ReadFunction read = PyReadFunction(source);
+            return self.parse_stream(read, buffersize, one_per_line);
+          }, py::arg("source"),
+             py::arg("buffersize") = 65536,
+             py::arg("one_per_line") = false)
           .def_property_readonly("json_position", &ak::SpecializedJSON::json_position)
           .def("__len__", &ak::SpecializedJSON::length)
           .def("__getitem__", [](py::object self, const std::string& key) -> py::object {
@@ -3,6 +3,8 @@
 #define FILENAME(line) FILENAME_FOR_EXCEPTIONS("src/python/io.cpp", line)
 
 #include <pybind11/numpy.h>
+#include <algorithm>
+#include <cstring>
 #include <string>
 
 #include "awkward/builder/ArrayBuilderOptions.h"
@@ -13,6 +15,33 @@
 
 namespace ak = awkward;
 
+////////// PyReadFunction
+
+PyReadFunction::PyReadFunction(const py::object& source)
+    : read_(source.attr("read"))
+    , start_(0) { }
+
+int64_t
+PyReadFunction::operator()(char* buffer, int64_t size) {
+  if (start_ == pending_.size()) {
+    py::object data = read_(size);
+    if (py::isinstance<py::bytes>(data)  ||  py::isinstance<py::str>(data)) {
+      pending_ = data.cast<std::string>();
+    }
+    else {
+      throw std::invalid_argument(
+        std::string("source.read must return str or bytes, not ")
+        + py::repr(data).cast<std::string>()
+        + FILENAME(__LINE__));
+    }
+    start_ = 0;
+  }
+  size_t count = std::min((size_t)size, pending_.size() - start_);
+  std::memcpy(buffer, pending_.data() + start_, count);
+  start_ += count;
+  return (int64_t)count;
+}
+
 ////////// fromjson
 
 void
@@ -23,18 +52,21 @@ make_fromjson(py::module& m, const std::string& name) {
            const char* nan_string,
            const char* infinity_string,
            const char* minus_infinity_string,
-           int64_t buffersize) -> int64_t {
+           int64_t buffersize,
+           bool one_per_line) -> int64_t {
     return ak::FromJsonString(source.c_str(),
                               builder,
                               nan_string,
                               infinity_string,
-                              minus_infinity_string);
+                              minus_infinity_string,
+                              one_per_line);
   }, py::arg("source"),
      py::arg("builder"),
      py::arg("nan_string") = nullptr,
      py::arg("infinity_string") = nullptr,
      py::arg("minus_infinity_string") = nullptr,
-     py::arg("buffersize") = 65536);
+     py::arg("buffersize") = 65536,
+     py::arg("one_per_line") = false);
 }
 
 void
@@ -45,7 +77,8 @@ make_fromjsonfile(py::module& m, const std::string& name) {
            const char* nan_string,
            const char* infinity_string,
            const char* minus_infinity_string,
-           int64_t buffersize) -> int64_t {
+           int64_t buffersize,
+           bool one_per_line) -> int64_t {
 #ifdef _MSC_VER
       FILE* file;
       if (fopen_s(&file, source.c_str(), "rb") != 0) {
@@ -65,7 +98,8 @@ make_fromjsonfile(py::module& m, const std::string& name) {
                          buffersize,
                          nan_string,
                          infinity_string,
-                         minus_infinity_string);
+                         minus_infinity_string,
+                         one_per_line);
       }
       catch (...) {
         fclose(file);
@@ -79,7 +113,35 @@ make_fromjsonfile(py::module& m, const std::string& name) {
      py::arg("nan_string") = nullptr,
      py::arg("infinity_string") = nullptr,
      py::arg("minus_infinity_string") = nullptr,
-     py::arg("buffersize") = 65536);
+     py::arg("buffersize") = 65536,
+     py::arg("one_per_line") = false);
+}
+
+void
+make_fromjsonobj(py::module& m, const std::string& name) {
+  m.def(name.c_str(),
+        [](const py::object& source,
+           ak::ArrayBuilder& builder,
+           const char* nan_string,
+           const char* infinity_string,
+           const char* minus_infinity_string,
+           int64_t buffersize,
+           bool one_per_line) -> int64_t {
+      ak::ReadFunction read = PyReadFunction(source);
+      return ak::FromJsonStream(read,
+                                builder,
+                                buffersize,
+                                nan_string,
+                                infinity_string,
+                                minus_infinity_string,
+                                one_per_line);
+  }, py::arg("source"),
+     py::arg("builder"),
+     py::arg("nan_string") = nullptr,
+     py::arg("infinity_string") = nullptr,
+     py::arg("minus_infinity_string") = nullptr,
+     py::arg("buffersize") = 65536,
+     py::arg("one_per_line") = false);
 }
 
 ////////// Uproot connector
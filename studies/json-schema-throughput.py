@@ -0,0 +1,65 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Throughput of ak._v2.from_json with and without a JSONSchema on records of lists.
+#
+#     python studies/json-schema-throughput.py [number of records]
+
+import json
+import sys
+import time
+
+import numpy as np
+import awkward as ak
+
+num_records = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+rng = np.random.default_rng(12345)
+records = []
+for _ in range(num_records):
+    n = int(rng.poisson(3))
+    records.append(
+        {
+            "x": float(rng.normal()),
+            "y": [int(v) for v in rng.integers(0, 100, n)],
+            "z": [float(v) for v in rng.normal(size=n)],
+        }
+    )
+text = json.dumps(records)
+
+schema = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "x": {"type": "number"},
+            "y": {"type": "array", "items": {"type": "integer"}},
+            "z": {"type": "array", "items": {"type": "number"}},
+        },
+    },
+}
+
+candidates = [
+    ("json.loads + from_iter", lambda: ak._v2.from_iter(json.loads(text))),
+    ("from_json (untyped)", lambda: ak._v2.from_json(text)),
+    ("from_json (schema)", lambda: ak._v2.from_json(text, schema=schema)),
+]
+
+expected = str(candidates[-1][1]().type)
+
+megabytes = len(text) / 1e6
+print(f"{num_records} records, {megabytes:.1f} MB of JSON")
+for name, function in candidates:
+    assert str(function().type) == expected
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:24s} {megabytes / best:8.1f} MB/s")
+
+# On a single core (x86_64), one run gave
+#
+#     200000 records, 23.1 MB of JSON
+#     json.loads + from_iter        6.9 MB/s
+#     from_json (untyped)         129.8 MB/s
+#     from_json (schema)          220.5 MB/s
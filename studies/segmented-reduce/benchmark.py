@@ -0,0 +1,32 @@
+import time
+
+import numpy as np
+import awkward as ak
+
+# compares the reducer kernels (with a parents array) to ufunc.reduceat on
+# the offsets, for lists of different average lengths
+ak._v2._reducers.segmented_min_mean_length = 0
+
+total = 6000000
+for mean in [2, 4, 8, 16, 32, 128]:
+    np.random.seed(12345)
+    counts = np.random.poisson(mean, total // mean)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    content = np.random.random(offsets[-1])
+    array = ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+    )
+
+    for reducer in ["sum", "prod", "min", "max", "any", "count"]:
+        function = getattr(array, reducer)
+        times = []
+        for segmented in [False, True]:
+            ak._v2._reducers.segmented = segmented
+            begintime = time.time()
+            function(axis=-1)
+            times.append(time.time() - begintime)
+        print(
+            "mean {0:3d} {1:6s} kernels {2:.3f} s  reduceat {3:.3f} s  ({4:.2f}x)".format(
+                mean, reducer, times[0], times[1], times[0] / times[1]
+            )
+        )
@@ -0,0 +1,46 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+# Speed of ak._v2 to_list on strings, compared with decoding them one at a time.
+#
+#     python studies/vectorized-to_list.py [number of strings]
+
+import sys
+import time
+
+import awkward as ak
+
+num_strings = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+
+strings = ["x" * (i % 10) for i in range(num_strings)]
+layout = ak._v2.operations.convert.from_iter(strings, highlevel=False)
+
+
+def per_item(layout):
+    offsets = layout.offsets.data
+    content = ak._v2._util.tobytes(layout.content.data)
+    out = [None] * layout.length
+    for i in range(layout.length):
+        out[i] = content[offsets[i] : offsets[i + 1]].decode(errors="surrogateescape")
+    return out
+
+
+candidates = [
+    ("per item", lambda: per_item(layout)),
+    ("to_list", lambda: layout.to_list()),
+]
+
+print(f"{num_strings} strings")
+for name, function in candidates:
+    assert function() == strings
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:10s} {best * 1e3:8.1f} ms")
+
+# On a single core (x86_64), one run gave
+#
+#     200000 strings
+#     per item       97.9 ms
+#     to_list        34.6 ms
@@ -1,6 +1,10 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
 
+import os
+import subprocess
+import sys
+
 import pytest  # noqa: F401
 import numpy as np  # noqa: F401
 import awkward as ak  # noqa: F401
@@ -51,3 +55,81 @@ def test():
         [{"x": 6, "y": 6.6, "z": "six"}],
         [{"x": 7, "y": 7.7, "z": None}, {"x": 8, "y": 8.8, "z": None}],
     ]
+
+
+@pytest.mark.parametrize("initial,resize", [(1, 1.5), (4, 2.0), (1024, 1.5)])
+def test_many_panels(initial, resize):
+    # small initial sizes make every GrowableBuffer grow through many panels
+    builder = ak.ArrayBuilder(initial=initial, resize=resize)
+    for i in range(1000):
+        with builder.list():
+            for j in range(i % 5):
+                with builder.record():
+                    builder.field("x").integer(i)
+                    builder.field("y").real(j + 0.5)
+                    builder.field("z").string("a" * j)
+        if i % 300 == 0:
+            # snapshots concatenate the panels; appending must resume after
+            assert len(builder.snapshot()) == i + 1
+    array = builder.snapshot()
+    assert len(array) == 1000
+    assert ak.to_list(array[997]) == [
+        {"x": 997, "y": 0.5, "z": ""},
+        {"x": 997, "y": 1.5, "z": "a"},
+    ]
+    assert ak.to_list(ak.num(array)) == [i % 5 for i in range(1000)]
+    assert ak.sum(array.x) == sum(i * (i % 5) for i in range(1000))
+    assert ak.to_list(ak.flatten(array.z)[-4:]) == ["", "a", "aa", "aaa"]
+
+
+_peak_memory_script = """
+import sys
+import awkward as ak
+
+def status(key):
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith(key + ":"):
+                return int(line.split()[1])
+
+builder = ak.layout.ArrayBuilder(initial=int(sys.argv[2]), resize=1.5)
+with open("/proc/self/clear_refs", "w") as file:
+    file.write("5")  # resets the peak (VmHWM) to the current RSS
+before = status("VmRSS")
+ak._ext.fromjsonfile(sys.argv[1], builder, buffersize=65536)
+assert len(builder) == int(sys.argv[3])
+print(status("VmHWM") - before)
+"""
+
+
+@pytest.mark.skipif(
+    not os.path.exists("/proc/self/clear_refs"),
+    reason="peak RSS is measured through Linux's /proc",
+)
+def test_numbers_peak_memory(tmp_path):
+    # 32 MB of int64, appended in C++ (from a file, so that the JSON text
+    # isn't in memory) by a builder that grows from 1024 slots and by one
+    # that is preallocated and never grows
+    n = 4000000
+    filename = os.path.join(tmp_path, "numbers.json")
+    with open(filename, "w") as file:
+        file.write("1\n" * n)
+
+    def peak(initial):
+        result = subprocess.run(
+            [sys.executable, "-c", _peak_memory_script, filename, str(initial), str(n)],
+            stdout=subprocess.PIPE,
+            check=True,
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        )
+        return int(result.stdout)
+
+    preallocated = peak(n)
+    grown = peak(1024)
+
+    # reallocating and copying would hold the old and the new buffer at the
+    # last resize, at least (1 + 1/1.5) times the final data; panels are
+    # never copied while appending, so growing costs no more than
+    # preallocating
+    assert preallocated > 0.9 * n * 8 / 1024
+    assert grown < 1.15 * preallocated
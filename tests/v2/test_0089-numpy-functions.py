@@ -357,9 +357,6 @@ def test_where():
     )
 
 
-@pytest.mark.skip(
-    reason=" TypeError: no numpy.equal overloads for custom types: string, string"
-)
 def test_string_equal():
     one = ak._v2.highlevel.Array(["one", "two", "three"], check_valid=True)
     two = ak._v2.highlevel.Array(["ONE", "two", "four"], check_valid=True)
@@ -199,7 +199,6 @@ def test_subranges_equal():
     # assert array.sort(axis=-1).content._subranges_equal(starts, stops, 15) is True
 
 
-@pytest.mark.skip("FIXME: highlevel v2 to_categorical not defined")
 def test_categorical():
     array = ak._v2.highlevel.Array(["1chchc", "1chchc", "2sss", "3", "4", "5"])
     categorical = ak._v2.behaviors.categorical.to_categorical(array)
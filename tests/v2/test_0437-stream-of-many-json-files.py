@@ -4,8 +4,9 @@
 import pytest  # noqa: F401
 import numpy as np  # noqa: F401
 import awkward as ak  # noqa: F401
-import json
 
+import io
+import json
 import os
 from pathlib import Path
 
@@ -62,22 +63,22 @@ def test_unfinished_fragment_exception():
 def test_two_arrays():
 
     str = """{"one": 1, "two": 2.2}{"one": 10, "two": 22}"""
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json(str)
         assert str(err.value).startswith("Extra data")
 
     str = """{"one": 1, "two": 2.2}     {"one": 10, "two": 22}"""
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json(str)
         assert str(err.value).startswith("Extra data")
 
     str = """{"one": 1, \t "two": 2.2}{"one": 10, "two": 22}"""
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json(str)
         assert str(err.value).startswith("Extra data")
 
     str = """{"one": 1, "two": 2.2}  \t   {"one": 10, "two": 22}"""
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json(str)
         assert str(err.value).startswith("Extra data")
 
@@ -263,6 +264,87 @@ def test_fromstring():
     ]
 
 
+def test_fromfilelike():
+    # read multiple json fragments from a file-like object, a few bytes at a time
+    lines = [f'{{"x": {i}.5, "y": {list(range(i % 4))}}}' for i in range(100)]
+    expectation = [{"x": i + 0.5, "y": list(range(i % 4))} for i in range(100)]
+
+    array = ak._v2.operations.convert.from_json(
+        io.StringIO("\n".join(lines)), buffersize=64
+    )
+    assert array.tolist() == expectation
+
+    array = ak._v2.operations.convert.from_json(
+        io.BytesIO("\n".join(lines).encode()), buffersize=64
+    )
+    assert array.tolist() == expectation
+
+    array = ak._v2.operations.convert.from_json(
+        io.BytesIO(b'1.1\n"inf"\n2.2\n"-inf"'),
+        infinity_string="inf",
+        minus_infinity_string="-inf",
+        buffersize=4,
+    )
+    assert array.tolist() == [1.1, float("inf"), 2.2, float("-inf")]
+
+
+def test_fromfilelike_values_larger_than_buffersize():
+    # a value that spans many chunks, and multibyte characters split by them
+    text = json.dumps({"x": list(range(50000))}, indent=1)
+    assert len(text) > 65536
+
+    record = ak._v2.operations.convert.from_json(io.StringIO(text))
+    assert record.tolist() == {"x": list(range(50000))}
+    record = ak._v2.operations.convert.from_json(io.BytesIO(text.encode()))
+    assert record.tolist() == {"x": list(range(50000))}
+
+    text = json.dumps({"x": "αβγ" * 10}, ensure_ascii=False, indent=1)
+    text = text + "\n" + text
+    expectation = [{"x": "αβγ" * 10}] * 2
+    for buffersize in [1, 2, 5, 64]:
+        array = ak._v2.operations.convert.from_json(
+            io.StringIO(text), buffersize=buffersize
+        )
+        assert array.tolist() == expectation
+        array = ak._v2.operations.convert.from_json(
+            io.BytesIO(text.encode()), buffersize=buffersize
+        )
+        assert array.tolist() == expectation
+
+    with pytest.raises(ValueError, match="incomplete JSON object"):
+        ak._v2.operations.convert.from_json(io.StringIO(text[:-1]), buffersize=7)
+
+
+def test_values_on_the_same_line(tmp_path):
+    # a newline elsewhere doesn't allow two values on one line
+    for text in ["1 2\n3", '{"x": 1} {"x": 2}\n', "1\n[\n2\n] 3", "1\n2 3"]:
+        with pytest.raises(ValueError, match="separated by newlines"):
+            ak._v2.operations.convert.from_json(text)
+        with pytest.raises(ValueError, match="separated by newlines"):
+            ak._v2.operations.convert.from_json(io.StringIO(text))
+        with pytest.raises(ValueError, match="separated by newlines"):
+            ak._v2.operations.convert.from_json(text.encode())
+
+        filename = os.path.join(tmp_path, "values.json")
+        with open(filename, "w") as file:
+            file.write(text)
+        with pytest.raises(ValueError, match="separated by newlines"):
+            ak._v2.operations.io.from_json_file(filename)
+
+    # but one value may span several lines
+    text = '[\n1,\n2\n]  \n{"x": "} {"}\n\n3'
+    assert ak._v2.operations.convert.from_json(text).tolist() == [
+        [1, 2],
+        {"x": "} {"},
+        3,
+    ]
+    assert ak._v2.operations.convert.from_json(io.StringIO(text)).tolist() == [
+        [1, 2],
+        {"x": "} {"},
+        3,
+    ]
+
+
 def test_array_tojson():
     # convert float 'nan' and 'inf' to user-defined strings
     array = ak._v2.contents.NumpyArray(
@@ -574,36 +656,36 @@ def test_jpivarski():
         "y": [1, 2, 3],
     }
 
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json(
             '{"x": 1, "y": [1, 2, 3]} {"x": 2, "y": []}'
         )
         assert str(err.value).startswith("Extra data")
 
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json('{"x": 1, "y": [1, 2, 3]} 123')
         assert str(err.value).startswith("Extra data")
 
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json('{"x": 1, "y": [1, 2, 3]} [1, 2, 3, 4, 5]')
         assert str(err.value).startswith("Extra data")
 
     assert ak._v2.operations.convert.from_json("123") == 123
 
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json("123 456")
         assert str(err.value).startswith("Extra data")
 
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json('123 {"x": 1, "y": [1, 2, 3]}')
         assert str(err.value).startswith("Extra data")
 
     assert ak._v2.operations.convert.from_json("null") is None
 
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json("null 123")
         assert str(err.value).startswith("Extra data")
 
-    with pytest.raises(json.decoder.JSONDecodeError) as err:
+    with pytest.raises(ValueError) as err:
         ak._v2.operations.convert.from_json("123 null")
         assert str(err.value).startswith("Extra data")
@@ -27,16 +27,19 @@ def test():
 
         return getattr(ufunc, method)(*nextinputs, **kwargs)
 
+    original = ak._v2.behavior.get((np.ufunc, "categorical"))
     ak._v2.behavior[np.ufunc, "categorical"] = _apply_ufunc
-
-    array = ak._v2.highlevel.Array(
-        ak._v2.contents.IndexedArray(
-            ak._v2.index.Index64(np.array([0, 1, 2, 1, 3, 1, 4])),
-            ak._v2.contents.NumpyArray(np.array([321, 1.1, 123, 999, 2])),
-            parameters={"__array__": "categorical"},
+    try:
+        array = ak._v2.highlevel.Array(
+            ak._v2.contents.IndexedArray(
+                ak._v2.index.Index64(np.array([0, 1, 2, 1, 3, 1, 4])),
+                ak._v2.contents.NumpyArray(np.array([321, 1.1, 123, 999, 2])),
+                parameters={"__array__": "categorical"},
+            )
         )
-    )
-    assert to_list(array * 10) == [3210, 11, 1230, 11, 9990, 11, 20]
+        assert to_list(array * 10) == [3210, 11, 1230, 11, 9990, 11, 20]
+    finally:
+        ak._v2.behavior[np.ufunc, "categorical"] = original
 
     array = ak._v2.highlevel.Array(["HAL"])
     with pytest.raises(TypeError):
@@ -98,9 +98,6 @@ def test_localindex():
     assert ak._v2.operations.structure.local_index(empty, axis=2).tolist() == []
 
 
-@pytest.mark.skip(
-    reason="FIXME: ak._v2.operations.structure.combinations must be merged"
-)
 def test_combinations():
     assert ak._v2.operations.structure.combinations(empty, 2, axis=0).tolist() == []
     assert ak._v2.operations.structure.combinations(empty, 2, axis=1).tolist() == []
@@ -115,3 +112,16 @@ def test_getitem():
 
     jagged = ak._v2.highlevel.Array([[]])[0:0]
     assert empty[jagged].tolist() == []
+
+
+def test_broadcast_with_size_one():
+    # as in NumPy, size 1 broadcasts to size 0
+    zero = ak._v2.operations.structure.to_regular(
+        ak._v2.highlevel.Array([[], []]), axis=1
+    )
+    one = ak._v2.operations.structure.to_regular(
+        ak._v2.highlevel.Array([[1], [2]]), axis=1
+    )
+    assert (zero + one).tolist() == [[], []]
+    assert (one + zero).tolist() == [[], []]
+    assert (one + one).tolist() == [[2], [4]]
@@ -1,6 +1,8 @@
 # BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
 
 
+import io
+
 import pytest  # noqa: F401
 import numpy as np  # noqa: F401
 import awkward as ak  # noqa: F401
@@ -306,3 +308,98 @@ def test_top_record():
         },
     )
     assert result.tolist() == {"x": 1, "y": 1.1}
+
+
+def test_option_string_mask_key():
+    result = ak._v2.operations.convert.from_json_schema(
+        ' [ "one", null, "three" ] ',
+        {"type": "array", "items": {"type": ["null", "string"]}},
+    )
+    assert result.tolist() == ["one", None, "three"]
+    assert str(result.type) == "3 * option[string]"
+
+
+def test_from_json_with_schema():
+    schema = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {
+                "x": {"type": "number"},
+                "y": {"type": "array", "items": {"type": "integer"}},
+            },
+        },
+    }
+    text = '[{"x": 1.1, "y": []}, {"x": 2.2, "y": [1, 2]}]'
+
+    result = ak._v2.operations.convert.from_json(text, schema=schema)
+    assert result.tolist() == ak._v2.operations.convert.from_json(text).tolist()
+    assert str(result.type) == "2 * {x: float64, y: var * int64}"
+
+    result = ak._v2.operations.convert.from_json(
+        io.StringIO(text), schema=schema, highlevel=False
+    )
+    assert isinstance(result, ak._v2.contents.RecordArray)
+    assert result.length == 2
+
+    result = ak._v2.operations.convert.from_json(
+        '{"x": 1.1, "y": [1, 2, 3]}', schema=schema["items"]
+    )
+    assert isinstance(result, ak._v2.highlevel.Record)
+    assert result.tolist() == {"x": 1.1, "y": [1, 2, 3]}
+
+
+def test_from_json_with_schema_one_per_line():
+    schema = {
+        "type": "object",
+        "properties": {
+            "x": {"type": "integer"},
+            "y": {"type": "array", "items": {"type": "string"}},
+        },
+    }
+    expectation = [{"x": 1, "y": ["a"]}, {"x": 2, "y": []}, {"x": 3, "y": ["bc"]}]
+    text = '{"x": 1, "y": ["a"]}\n{"x": 2,\n "y": []}\n\n  {"x": 3, "y": ["bc"]}\n'
+
+    for source in [text, text.encode()]:
+        result = ak._v2.operations.convert.from_json(source, schema=schema)
+        assert result.tolist() == expectation
+        assert str(result.type) == "3 * {x: int64, y: var * string}"
+        result = ak._v2.operations.convert.from_json_schema(source, schema)
+        assert result.tolist() == expectation
+
+    result = ak._v2.operations.convert.from_json_schema("", schema)
+    assert result.tolist() == []
+
+    with pytest.raises(ValueError, match="does not fit schema at position 9"):
+        ak._v2.operations.convert.from_json('{"x": 1} {"x": 2}', schema=schema)
+
+    # only one array for a schema with an array at its root
+    with pytest.raises(ValueError, match="does not fit schema at position 5"):
+        ak._v2.operations.convert.from_json(
+            "[{}]\n[{}]", schema={"type": "array", "items": schema}
+        )
+
+
+def test_from_json_with_schema_file_like():
+    schema = {
+        "type": "object",
+        "properties": {"x": {"type": "array", "items": {"type": "integer"}}},
+    }
+
+    # a value larger than the chunks it is read in
+    text = '{"x": [' + ", ".join(str(i) for i in range(50000)) + "]}"
+    assert len(text) > 65536
+    result = ak._v2.operations.convert.from_json(io.StringIO(text), schema=schema)
+    assert isinstance(result, ak._v2.highlevel.Record)
+    assert result.x.tolist() == list(range(50000))
+
+    text = '{"x": [1, 2]}\n{"x": []}\n{"x": [3]}'
+    for buffersize in [1, 4, 65536]:
+        for source in [io.StringIO(text), io.BytesIO(text.encode())]:
+            result = ak._v2.operations.convert.from_json_schema(
+                source, schema, buffersize=buffersize
+            )
+            assert result.tolist() == [{"x": [1, 2]}, {"x": []}, {"x": [3]}]
+
+    with pytest.raises(ValueError, match="does not fit schema at position 10"):
+        ak._v2.operations.convert.from_json(io.StringIO('{"x": ["a"]}'), schema=schema)
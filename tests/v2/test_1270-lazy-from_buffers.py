@@ -0,0 +1,111 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+ak_to_buffers = ak._v2.operations.convert.to_buffers
+ak_from_buffers = ak._v2.operations.convert.from_buffers
+
+to_list = ak._v2.operations.convert.to_list
+
+
+class Tracker:
+    def __init__(self, container):
+        self.container = container
+        self.pulled = []
+
+    def __getitem__(self, key):
+        self.pulled.append(key)
+        return self.container[key]
+
+
+array = ak._v2.Array(
+    [
+        {"x": 1.1, "y": [1, 2, 3], "z": "one", "w": None, "v": [[1.1], []]},
+        {"x": 2.2, "y": [], "z": "two", "w": 2, "v": []},
+        {"x": 3.3, "y": [4, 5], "z": "three", "w": 3, "v": [[2.2, 3.3]]},
+    ]
+)
+
+
+def test_roundtrip():
+    form, length, container = ak_to_buffers(array)
+    lazy = ak_from_buffers(form, length, container, lazy=True)
+    assert to_list(lazy) == to_list(array)
+    assert str(lazy.type) == str(array.type)
+
+    unionarray = ak._v2.contents.UnionArray(
+        ak._v2.index.Index8(np.array([1, 1, 0, 0, 1, 0, 1], np.int8)),
+        ak._v2.index.Index64(np.array([4, 3, 0, 1, 2, 2, 4, 100], np.int64)),
+        [
+            ak._v2.contents.RegularArray(
+                ak._v2.contents.NumpyArray(np.array([1, 2, 3, 4, 5, 6], np.int64)),
+                2,
+            ),
+            ak._v2.contents.NumpyArray(np.array([1.1, 2.2, 3.3, 4.4, 5.5])),
+        ],
+    )
+    assert to_list(ak_from_buffers(*ak_to_buffers(unionarray), lazy=True)) == to_list(
+        unionarray
+    )
+
+    bitmaskedarray = ak._v2.contents.BitMaskedArray(
+        ak._v2.index.IndexU8(np.array([40, 34], np.uint8)),
+        ak._v2.contents.NumpyArray(np.arange(26 * 2, dtype=np.int32).reshape(-1, 2)),
+        valid_when=False,
+        length=9,
+        lsb_order=True,
+    )
+    assert to_list(
+        ak_from_buffers(*ak_to_buffers(bitmaskedarray), lazy=True)
+    ) == to_list(bitmaskedarray)
+
+
+def test_only_touched_buffers():
+    form, length, container = ak_to_buffers(array)
+    tracker = Tracker(container)
+    lazy = ak_from_buffers(form, length, tracker, lazy=True)
+    assert tracker.pulled == []
+
+    assert to_list(lazy.x) == [1.1, 2.2, 3.3]
+    assert len(tracker.pulled) == 1
+
+    assert to_list(lazy.y) == [[1, 2, 3], [], [4, 5]]
+    assert len(tracker.pulled) == 3
+
+    assert lazy.layout.content("v").content.content.is_deferred
+    assert to_list(lazy.w) == [None, 2, 3]
+    assert lazy.layout.content("v").content.content.is_deferred
+
+    assert len(set(tracker.pulled)) == len(tracker.pulled)
+
+
+def test_form_and_typetracer_do_not_pull():
+    form, length, container = ak_to_buffers(array)
+    tracker = Tracker(container)
+    lazy = ak_from_buffers(form, length, tracker, lazy=True, highlevel=False)
+
+    assert lazy.form.type == array.layout.form.type
+    assert lazy.typetracer.form.type == array.layout.form.type
+    assert lazy.length == 3
+    assert tracker.pulled == []
+
+
+def test_callable_values():
+    form, length, container = ak_to_buffers(array)
+    called = []
+
+    def make(key):
+        def generate():
+            called.append(key)
+            return container[key]
+
+        return generate
+
+    lazy = ak_from_buffers(form, length, {k: make(k) for k in container}, lazy=True)
+    assert called == []
+    assert to_list(lazy.z) == ["one", "two", "three"]
+    assert len(called) == 2
+    assert to_list(lazy) == to_list(array)
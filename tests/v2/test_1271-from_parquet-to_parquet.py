@@ -0,0 +1,115 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pyarrow = pytest.importorskip("pyarrow")
+pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+to_list = ak._v2.operations.convert.to_list
+
+array = ak._v2.Array(
+    [
+        {"run": 1, "muons": [{"pt": 1.1, "eta": 0.1}, {"pt": 2.2, "eta": 0.2}]},
+        {"run": 2, "muons": []},
+        {"run": 3, "muons": [{"pt": 3.3, "eta": 0.3}], "name": "three"},
+        {"run": 4, "muons": [{"pt": 4.4, "eta": 0.4}], "name": None},
+    ]
+)
+
+
+@pytest.mark.parametrize("use_threads", [False, True])
+def test_round_trip(tmp_path, use_threads):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    ak._v2.operations.io.to_parquet(array, filename, row_group_size=1)
+    assert pyarrow_parquet.ParquetFile(filename).num_row_groups == 4
+
+    out = ak._v2.operations.io.from_parquet(filename, use_threads=use_threads)
+    assert to_list(out) == to_list(array)
+    assert out.type == array.type
+
+    out = ak._v2.operations.io.from_parquet(
+        filename, row_groups=[3, 1], use_threads=use_threads
+    )
+    assert to_list(out) == [to_list(array[3]), to_list(array[1])]
+
+    out = ak._v2.operations.io.from_parquet(filename, row_groups=[])
+    assert len(out) == 0
+    assert out.type.content == array.type.content
+
+
+def test_not_records(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    lists = ak._v2.Array([[1, 2, 3], [], [4, 5], None])
+    ak._v2.operations.io.to_parquet(lists, filename)
+    out = ak._v2.operations.io.from_parquet(filename)
+    assert to_list(out) == to_list(lists)
+    assert out.type == lists.type
+
+
+@pytest.mark.parametrize("use_threads", [False, True])
+def test_nested_projection(tmp_path, use_threads):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    ak._v2.operations.io.to_parquet(array, filename, row_group_size=2)
+
+    out = ak._v2.operations.io.from_parquet(
+        filename, columns=["muons.pt", "run"], use_threads=use_threads
+    )
+    assert out.fields == ["run", "muons"]
+    assert to_list(out.muons.pt) == to_list(array.muons.pt)
+    assert str(out.type) == "4 * {run: int64, muons: var * {pt: float64}}"
+
+    out = ak._v2.operations.io.from_parquet(filename, columns="muons.eta")
+    assert to_list(out.muons) == to_list(array.muons[["eta"]])
+
+    with open(filename, "rb") as file:
+        out = ak._v2.operations.io.from_parquet(file, columns=["muons.pt"])
+    assert to_list(out.muons.pt) == to_list(array.muons.pt)
+
+    with pytest.raises(ValueError):
+        ak._v2.operations.io.from_parquet(filename, columns=["muons.phi"])
+
+    # the full types still come back after a projected read
+    out = ak._v2.operations.io.from_parquet(filename)
+    assert out.type == array.type
+
+
+def test_nested_projection_keeps_extension_type(tmp_path):
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    ak._v2.operations.io.to_parquet(
+        array, filename, row_group_size=2, use_compliant_nested_type=True
+    )
+
+    out = ak._v2.operations.io.from_parquet(filename, columns=["muons.pt", "run"])
+    assert to_list(out.muons.pt) == to_list(array.muons.pt)
+    assert str(out.type) == "4 * {run: int64, muons: var * {pt: float64}}"
+
+    muons = pyarrow_parquet.read_table(filename).schema.field("muons")
+    assert isinstance(muons.type, pyarrow.ExtensionType)
+
+
+@pytest.mark.parametrize("use_threads", [False, True])
+def test_nested_projection_of_whole_columns(tmp_path, monkeypatch, use_threads):
+    import awkward._v2.operations.io.ak_from_parquet as module
+
+    filename = os.path.join(tmp_path, "whatever.parquet")
+    ak._v2.operations.io.to_parquet(array, filename, row_group_size=2)
+
+    # a footer that can't be reproduced: the whole columns are projected
+    monkeypatch.setattr(module, "_storage_metadata", lambda *args: None)
+
+    out = ak._v2.operations.io.from_parquet(
+        filename, columns=["muons.pt", "run"], use_threads=use_threads
+    )
+    assert out.fields == ["run", "muons"]
+    assert to_list(out.muons.pt) == to_list(array.muons.pt)
+    assert str(out.type) == "4 * {run: int64, muons: var * {pt: float64}}"
+
+    out = ak._v2.operations.io.from_parquet(
+        filename, columns="muons.eta", row_groups=[1]
+    )
+    assert to_list(out.muons) == to_list(array.muons[["eta"]][2:])
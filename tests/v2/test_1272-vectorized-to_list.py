@@ -0,0 +1,94 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+to_json = ak._v2.operations.convert.to_json
+
+
+def test_strings():
+    array = ak._v2.Array(["one", "", "three", "fünf", "☃ snow"])
+    assert to_list(array) == ["one", "", "three", "fünf", "☃ snow"]
+    assert to_list(array[1:4]) == ["", "three", "fünf"]
+    assert to_list(array[[4, 0]]) == ["☃ snow", "one"]
+
+    bytestrings = ak._v2.Array([b"one", b"", b"\xff\xfe"])
+    assert to_list(bytestrings) == [b"one", b"", b"\xff\xfe"]
+
+    ascii = ak._v2.Array(["one", "two", "three"])
+    assert to_list(ascii) == ["one", "two", "three"]
+    assert to_json(ascii) == '["one","two","three"]'
+
+    # invalid UTF-8 is still escaped, not an error
+    layout = ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(np.array([0, 2, 3], np.int64)),
+        ak._v2.contents.NumpyArray(
+            np.array([104, 105, 255], np.uint8), parameters={"__array__": "char"}
+        ),
+        parameters={"__array__": "string"},
+    )
+    assert to_list(layout) == ["hi", "\udcff"]
+
+
+def test_regular():
+    content = ak._v2.contents.NumpyArray(np.arange(6))
+    regular = ak._v2.contents.RegularArray(content, 3)
+    assert to_list(regular) == [[0, 1, 2], [3, 4, 5]]
+
+    empty = ak._v2.contents.RegularArray(content, 0, zeros_length=4)
+    assert to_list(empty) == [[], [], [], []]
+
+    strings = ak._v2.contents.RegularArray(
+        ak._v2.contents.NumpyArray(
+            np.frombuffer(b"abcdef", np.uint8), parameters={"__array__": "char"}
+        ),
+        2,
+        parameters={"__array__": "string"},
+    )
+    assert to_list(strings) == ["ab", "cd", "ef"]
+    assert to_json(strings) == '["ab","cd","ef"]'
+
+
+def test_records_and_options():
+    array = ak._v2.Array(
+        [
+            {"x": 1, "y": [1.1], "z": "one"},
+            None,
+            {"x": 3, "y": [], "z": None},
+        ]
+    )
+    assert to_list(array) == [
+        {"x": 1, "y": [1.1], "z": "one"},
+        None,
+        {"x": 3, "y": [], "z": None},
+    ]
+    assert to_list(array[[2, 0]]) == [
+        {"x": 3, "y": [], "z": None},
+        {"x": 1, "y": [1.1], "z": "one"},
+    ]
+
+    tuples = ak._v2.Array([(1, "a"), (2, "b")])
+    assert to_list(tuples) == [(1, "a"), (2, "b")]
+    assert to_json(tuples) == '[{"0":1,"1":"a"},{"0":2,"1":"b"}]'
+
+    empty = ak._v2.contents.RecordArray([], [], length=3)
+    assert to_list(empty) == [{}, {}, {}]
+
+    union = ak._v2.Array([1, "two", [3], None])
+    assert to_list(union) == [1, "two", [3], None]
+
+    bytemasked = ak._v2.contents.ByteMaskedArray(
+        ak._v2.index.Index8(np.array([1, 0, 1], np.int8)),
+        ak._v2.contents.NumpyArray(np.array([1.1, 2.2, 3.3, 4.4])),
+        valid_when=True,
+    )
+    assert to_list(bytemasked) == [1.1, None, 3.3]
+
+
+def test_many_strings():
+    strings = ["x" * (i % 10) for i in range(200000)]
+    layout = ak._v2.operations.convert.from_iter(strings, highlevel=False)
+    assert layout.to_list() == strings
@@ -0,0 +1,76 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+import threading
+
+to_list = ak._v2.operations.convert.to_list
+
+
+def test_cached():
+    nplike = ak.nplike.Numpy.instance()
+    key = ("awkward_ListOffsetArray_compact_offsets", np.int64, np.int64)
+    assert nplike[key] is nplike[key]
+    assert ak.nplike.Numpy()[key] is nplike[key]
+
+
+def test_call():
+    nplike = ak.nplike.Numpy.instance()
+    key = ("awkward_ListOffsetArray_compact_offsets", np.int64, np.int64)
+    fromoffsets = np.array([3, 5, 5, 9], np.int64)
+    tooffsets = np.full(4, 999, np.int64)
+    error = nplike[key](tooffsets, fromoffsets, 3)
+    assert error.str is None
+    assert tooffsets.tolist() == [0, 2, 2, 6]
+
+    # offset views are passed by the address of their first element
+    tooffsets = np.full(3, 999, np.int64)
+    nplike[key](tooffsets, fromoffsets[1:], 2)
+    assert tooffsets.tolist() == [0, 0, 4]
+
+
+def test_stats():
+    nplike = ak.nplike.Numpy.instance()
+    nplike.reset_kernel_stats()
+    assert nplike.kernel_stats() == {}
+
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    assert to_list(array[[2, 0]]) == [[4, 5], [1, 2, 3]]
+
+    stats = nplike.kernel_stats()
+    assert len(stats) > 0
+    for (name, *_types), (calls, seconds) in stats.items():
+        assert name.startswith("awkward_")
+        assert calls >= 1
+        assert seconds >= 0
+
+    nplike.reset_kernel_stats()
+    assert nplike.kernel_stats() == {}
+
+
+def test_stats_from_threads():
+    nplike = ak.nplike.Numpy.instance()
+    key = ("awkward_ListOffsetArray_compact_offsets", np.int64, np.int64)
+    fromoffsets = np.array([3, 5, 5, 9], np.int64)
+
+    def run():
+        tooffsets = np.empty(4, np.int64)
+        for _ in range(100):
+            nplike[key](tooffsets, fromoffsets, 3)
+
+    nplike.reset_kernel_stats()
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    calls, seconds = nplike.kernel_stats()[key]
+    assert calls == 400
+    assert seconds > 0
+
+    nplike.reset_kernel_stats()
+    assert key not in nplike.kernel_stats()
@@ -0,0 +1,84 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import json
+import os
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+
+KernelProfiler = ak._v2._profiling.KernelProfiler
+
+
+def test_events():
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+
+    with KernelProfiler() as profiler:
+        assert to_list(array[1:, 1:]) == [[], [5]]
+
+    assert ak.nplike._profilers == []
+    assert len(profiler.events) > 0
+    for event in profiler.events:
+        assert event.name.startswith("awkward_")
+        assert all(isinstance(x, str) for x in event.types)
+        assert event.duration >= 0
+        assert event.nbytes >= 0
+    assert any(event.node == "ListArray" for event in profiler.events)
+
+    # nothing is recorded after the profiler exits
+    count = len(profiler.events)
+    to_list(array[1:, 1:])
+    assert len(profiler.events) == count
+
+
+def test_error():
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+
+    with KernelProfiler() as profiler:
+        with pytest.raises(ValueError):
+            array[[[0, 5], [], []]]
+
+    errors = [event for event in profiler.events if event.error is not None]
+    assert len(errors) == 1
+    assert "index out of range" in errors[0].error
+
+
+def test_nested():
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+
+    with KernelProfiler() as outer:
+        to_list(array[1:, 1:])
+        with KernelProfiler() as inner:
+            to_list(array[:, :1])
+
+    assert 0 < len(inner.events) < len(outer.events)
+
+
+def test_summary_and_chrome_trace(tmp_path):
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+
+    with KernelProfiler() as profiler:
+        to_list(array[1:, 1:])
+        to_list(array[[[0], [], [1]]])
+
+    totals = profiler.totals()
+    assert sum(x["calls"] for x in totals) == len(profiler.events)
+    assert [x["time"] for x in totals] == sorted(
+        [x["time"] for x in totals], reverse=True
+    )
+
+    summary = profiler.summary()
+    assert summary.splitlines()[0].startswith("kernel")
+    assert len(summary.splitlines()) == len(totals) + 2
+    assert len(profiler.summary(limit=1).splitlines()) == 3
+
+    filename = os.path.join(tmp_path, "trace.json")
+    trace = profiler.to_chrome_trace(filename)
+    with open(filename) as file:
+        assert json.load(file) == trace
+    assert len(trace["traceEvents"]) == len(profiler.events)
+    assert all(x["ph"] == "X" for x in trace["traceEvents"])
+    assert all(x["ts"] >= 0 for x in trace["traceEvents"])
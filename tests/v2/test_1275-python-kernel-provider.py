@@ -0,0 +1,85 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pytest.importorskip("awkward._kernel_definitions")
+
+to_list = ak._v2.operations.convert.to_list
+
+
+@pytest.fixture
+def provider(request):
+    nplike = ak.nplike.Numpy.instance()
+    nplike.kernel_provider = request.param
+    yield request.param
+    nplike.kernel_provider = "cpu"
+
+
+def run_everything():
+    array = ak._v2.Array(
+        [[{"x": 1.1, "y": [1]}, None], [], [{"x": 3.3, "y": [1, 2, 3]}]]
+    )
+    return (
+        to_list(array[1:, :1]),
+        to_list(array[[[0, 1], [], [0]]]),
+        to_list(array.y[:, :, 1:]),
+        to_list(ak._v2.operations.reducers.sum(array.x, axis=1)),
+        to_list(ak._v2.operations.reducers.count(array.y, axis=-1)),
+        to_list(ak._v2.operations.structure.flatten(array.y, axis=None)),
+    )
+
+
+@pytest.mark.parametrize("provider", ["python", "numba"], indirect=True)
+def test_same_results(provider):
+    if provider == "numba":
+        pytest.importorskip("numba")
+
+    nplike = ak.nplike.Numpy.instance()
+    out = run_everything()
+
+    assert any(
+        isinstance(kernel, ak.nplike.PythonKernel)
+        for kernel in nplike._kernels[provider].values()
+    )
+
+    nplike.kernel_provider = "cpu"
+    assert run_everything() == out
+
+
+@pytest.mark.parametrize("provider", ["python", "numba"], indirect=True)
+def test_errors(provider):
+    if provider == "numba":
+        pytest.importorskip("numba")
+
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    with pytest.raises(ValueError, match="index out of range"):
+        array[[[0, 5], [], []]]
+
+
+@pytest.mark.parametrize("provider", ["python"], indirect=True)
+def test_reinterpreted_dtypes(provider):
+    array = ak._v2.Array(
+        [[np.datetime64("2020-01-01"), np.datetime64("2020-01-03")], []]
+    )
+    assert to_list(ak._v2.operations.reducers.min(array, axis=1)) == [
+        np.datetime64("2020-01-01"),
+        None,
+    ]
+
+
+@pytest.mark.parametrize("provider", ["python"], indirect=True)
+def test_fallback(provider):
+    # sorting kernels have no Python definition
+    kernel = ak.nplike.Numpy.instance()[
+        "awkward_sort", np.float64, np.float64, np.int64
+    ]
+    assert isinstance(kernel, ak.nplike.NumpyKernel)
+
+
+def test_bad_provider():
+    with pytest.raises(ValueError):
+        ak.nplike.Numpy.instance().kernel_provider = "fortran"
+    assert ak.nplike.Numpy.instance().kernel_provider == "cpu"
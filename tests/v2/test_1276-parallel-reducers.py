@@ -0,0 +1,87 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+
+
+@pytest.fixture
+def parallel():
+    old = dict(ak._v2._reducers.parallel)
+    ak._v2._reducers.parallel.update(threads=4, min_length=1)
+    yield ak._v2._reducers.parallel
+    ak._v2._reducers.parallel.update(old)
+
+
+def serial(function):
+    old = dict(ak._v2._reducers.parallel)
+    ak._v2._reducers.parallel["threads"] = 1
+    try:
+        return to_list(function())
+    finally:
+        ak._v2._reducers.parallel.update(old)
+
+
+def jagged(dtype):
+    np.random.seed(12345)
+    counts = np.random.poisson(2, 1000)
+    counts[100:150] = 0
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    content = (np.random.random(offsets[-1]) * 100).astype(dtype)
+    return ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.int32, np.bool_, np.complex128])
+@pytest.mark.parametrize(
+    "reducer",
+    ["sum", "prod", "min", "max", "argmin", "argmax", "count", "count_nonzero"],
+)
+def test_same_as_serial(parallel, dtype, reducer):
+    array = jagged(dtype)
+    if dtype == np.complex128 and reducer in ("argmin", "argmax", "count_nonzero"):
+        pytest.skip("not implemented for complex numbers")
+    if dtype == np.bool_ and reducer in ("argmin", "argmax"):
+        pytest.skip("not implemented for booleans")
+    function = getattr(array, reducer)
+
+    for axis in (-1, 0):
+        np.testing.assert_equal(
+            to_list(function(axis=axis)),
+            serial(lambda function=function, axis=axis: function(axis=axis)),
+        )
+
+
+def test_any_all_keepdims(parallel):
+    array = jagged(np.int64)
+    for reducer in ("any", "all"):
+        function = getattr(array, reducer)
+        assert to_list(function(axis=-1, keepdims=True)) == serial(
+            lambda function=function: function(axis=-1, keepdims=True)
+        )
+
+
+def test_chunks(parallel):
+    parents = np.array([0, 0, 0, 2, 2, 2, 2, 3, 5, 5], np.int64)
+    chunks = ak._v2._reducers._parallel_chunks(
+        ak.nplike.Numpy.instance(), parents, 7, 3
+    )
+    assert chunks is not None
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(parents)
+    assert chunks[0][2] == 0 and chunks[-1][3] == 7
+    for (start, stop, outstart, outstop), after in zip(chunks, chunks[1:] + [None]):
+        if after is not None:
+            assert stop == after[0] and outstop == after[2]
+        # no output element is shared between chunks
+        assert all(outstart <= x < outstop for x in parents[start:stop])
+
+    # unsorted parents can't be split
+    unsorted = np.array([0, 1, 0, 1], np.int64)
+    assert (
+        ak._v2._reducers._parallel_chunks(ak.nplike.Numpy.instance(), unsorted, 2, 2)
+        is None
+    )
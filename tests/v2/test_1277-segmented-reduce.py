@@ -0,0 +1,124 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+
+
+@pytest.fixture(autouse=True)
+def short_lists():
+    old = ak._v2._reducers.segmented_min_mean_length
+    ak._v2._reducers.segmented_min_mean_length = 0
+    yield
+    ak._v2._reducers.segmented_min_mean_length = old
+
+
+def with_kernels(function):
+    ak._v2._reducers.segmented = False
+    try:
+        return function()
+    finally:
+        ak._v2._reducers.segmented = True
+
+
+def rounded(data):
+    # ufunc.reduceat may sum in a different order than the kernels
+    if isinstance(data, list):
+        return [rounded(x) for x in data]
+    elif isinstance(data, float):
+        return round(data, 10)
+    else:
+        return data
+
+
+def jagged(dtype):
+    np.random.seed(12345)
+    counts = np.random.poisson(2, 200)
+    counts[10:20] = 0
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    content = (np.random.random(offsets[-1] + 5) * 20 - 10).astype(dtype)
+    if dtype == np.float64:
+        content[::7] = np.nan
+    return ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(content)
+    )
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.int32, np.uint8, np.bool_])
+@pytest.mark.parametrize(
+    "reducer", ["sum", "prod", "min", "max", "any", "all", "count", "count_nonzero"]
+)
+@pytest.mark.parametrize("mask", [False, True])
+@pytest.mark.parametrize("keepdims", [False, True])
+def test_same_as_kernels(dtype, reducer, mask, keepdims):
+    array = jagged(dtype)
+    function = getattr(array, reducer)
+    kwargs = {"mask": mask, "keepdims": keepdims}
+
+    nplike = ak.nplike.Numpy.instance()
+    nplike.reset_kernel_stats()
+    out = function(axis=-1, **kwargs)
+    # booleans have no fmin/fmax identity and reduceat is no faster for
+    # count_nonzero, so these still use the kernels
+    assert (
+        (dtype == np.bool_ and reducer in ("min", "max"))
+        or reducer == "count_nonzero"
+        or not any(
+            name == "awkward_ListOffsetArray_reduce_local_nextparents_64"
+            or name.startswith("awkward_reduce_")
+            for name, *_ in nplike.kernel_stats()
+        )
+    )
+
+    expected = with_kernels(lambda: function(axis=-1, **kwargs))
+    assert out.form == expected.form
+    np.testing.assert_equal(rounded(to_list(out)), rounded(to_list(expected)))
+
+
+@pytest.mark.parametrize("reducer", ["min", "max"])
+def test_initial(reducer):
+    array = jagged(np.float64)
+    function = getattr(array, reducer)
+    out = function(axis=-1, initial=0.5)
+    expected = with_kernels(lambda: function(axis=-1, initial=0.5))
+    np.testing.assert_equal(to_list(out), to_list(expected))
+
+
+def test_nested_and_highlevel():
+    array = ak._v2.Array([[[1, 2, 3], []], [], [[4, 5]]])
+    assert to_list(ak._v2.operations.reducers.sum(array, axis=-1)) == [[6, 0], [], [9]]
+    assert to_list(ak._v2.operations.reducers.max(array, axis=-1)) == [
+        [3, None],
+        [],
+        [5],
+    ]
+
+    empty = ak._v2.Array([[], []])
+    assert to_list(ak._v2.operations.reducers.sum(empty, axis=-1)) == [0, 0]
+
+
+def test_unsupported_falls_back():
+    # complex numbers and positions still go through the kernels
+    array = ak._v2.Array([[1 + 1j, 2], [], [3j]])
+    assert to_list(ak._v2.operations.reducers.sum(array, axis=-1)) == [3 + 1j, 0, 3j]
+    array = ak._v2.Array([[1, 3, 2], [], [4]])
+    assert to_list(ak._v2.operations.reducers.argmax(array, axis=-1)) == [1, None, 0]
+
+
+def test_short_lists_use_kernels():
+    ak._v2._reducers.segmented_min_mean_length = 16
+    nplike = ak.nplike.Numpy.instance()
+    array = jagged(np.float64)
+
+    nplike.reset_kernel_stats()
+    array.sum(axis=-1)
+    assert any(name.startswith("awkward_reduce_") for name, *_ in nplike.kernel_stats())
+
+    nplike.reset_kernel_stats()
+    array.count(axis=-1)
+    assert not any(
+        name.startswith("awkward_reduce_") for name, *_ in nplike.kernel_stats()
+    )
@@ -0,0 +1,221 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+PartitionedArray = ak._v2.partition.PartitionedArray
+
+
+@pytest.fixture(params=[1, 3])
+def threads(request):
+    return request.param
+
+
+def data():
+    return ak._v2.Array(
+        [[1, 2, 3], [], [4, 5], [6], [7, 8, 9, 10], [], [11, 12], [13], [14]]
+    )
+
+
+def test_construction(threads):
+    array = data()
+    partitioned = PartitionedArray.from_content(array, [2, 2, 5, 9], threads=threads)
+    # empty partitions are dropped
+    assert partitioned.stops == [2, 5, 9]
+    assert partitioned.lengths == [2, 3, 4]
+    assert len(partitioned) == 9
+    assert partitioned.form.type == array.layout.form.type
+    assert to_list(partitioned) == to_list(array)
+    assert to_list(partitioned.to_content()) == to_list(array)
+
+    repartitioned = partitioned.repartition([1, 4, 9])
+    assert repartitioned.stops == [1, 4, 9]
+    assert to_list(repartitioned) == to_list(array)
+
+    with pytest.raises(ValueError):
+        PartitionedArray.from_content(array, [2, 5])
+    with pytest.raises(ValueError):
+        PartitionedArray([array.layout, ak._v2.Array([1.1, 2.2]).layout])
+
+
+def test_getitem(threads):
+    array = data()
+    partitioned = PartitionedArray.from_content(array, [2, 5, 9], threads=threads)
+
+    for i in range(-9, 9):
+        assert to_list(partitioned[i]) == to_list(array[i])
+    with pytest.raises(IndexError):
+        partitioned[9]
+
+    for where in [
+        slice(None),
+        slice(1, 7),
+        slice(3, 4),
+        slice(None, None, 2),
+        slice(1, None, 3),
+        slice(None, None, -1),
+        slice(7, 7),
+    ]:
+        assert to_list(partitioned[where]) == to_list(array[where])
+
+    assert to_list(partitioned[1:, :1]) == to_list(array[1:, :1])
+    assert to_list(partitioned[4, 2]) == to_list(array[4, 2])
+    assert to_list(partitioned[[8, 0, 4]]) == to_list(array[[8, 0, 4]])
+    assert to_list(partitioned[array > 4]) == to_list(array[array > 4])
+
+    mask = ak._v2.operations.structure.num(array) > 1
+    out = partitioned[mask]
+    assert isinstance(out, PartitionedArray)
+    assert to_list(out) == to_list(array[mask])
+
+    jagged = PartitionedArray.from_content(array % 2 == 0, [4, 9])
+    assert to_list(partitioned[jagged]) == to_list(array[array % 2 == 0])
+
+
+def test_fields(threads):
+    array = ak._v2.Array([{"x": 1, "y": [1]}, {"x": 2, "y": []}, {"x": 3, "y": [3, 4]}])
+    partitioned = PartitionedArray.from_content(array, [1, 3], threads=threads)
+    assert to_list(partitioned["x"]) == [1, 2, 3]
+    assert to_list(partitioned[1:, "y"]) == [[], [3, 4]]
+    assert to_list(partitioned[["y"]]) == [{"y": [1]}, {"y": []}, {"y": [3, 4]}]
+
+
+def test_ufuncs(threads):
+    array = data()
+    partitioned = PartitionedArray.from_content(array, [2, 5, 9], threads=threads)
+
+    out = np.sqrt(partitioned)
+    assert isinstance(out, PartitionedArray)
+    assert out.stops == partitioned.stops
+    assert to_list(out) == to_list(np.sqrt(array))
+
+    assert to_list(partitioned * 2 + 1) == to_list(array * 2 + 1)
+
+    # differently partitioned and unpartitioned arrays are aligned
+    flat = ak._v2.Array(np.arange(9) * 1.5)
+    other = PartitionedArray.from_content(flat, [4, 9])
+    assert to_list(partitioned + other) == to_list(array + flat)
+    assert to_list(array + other) == to_list(array + flat)
+    assert to_list(partitioned + flat) == to_list(array + flat)
+
+
+def test_broadcast_and_apply(threads):
+    array = data()
+    partitioned = PartitionedArray.from_content(array, [2, 5, 9], threads=threads)
+
+    def action(inputs, **ignore):
+        if isinstance(inputs[0], ak._v2.contents.NumpyArray):
+            return (ak._v2.contents.NumpyArray(inputs[0].data * inputs[1]),)
+
+    out = ak._v2._broadcasting.broadcast_and_apply([partitioned, 10], action, None)
+    assert isinstance(out, tuple) and len(out) == 1
+    assert isinstance(out[0], PartitionedArray)
+    assert to_list(out[0]) == to_list(array * 10)
+
+
+@pytest.mark.parametrize(
+    "reducer",
+    ["count", "count_nonzero", "sum", "prod", "any", "all", "min", "max"],
+)
+@pytest.mark.parametrize("axis", [0, 1, -1])
+@pytest.mark.parametrize("mask", [False, True])
+@pytest.mark.parametrize("keepdims", [False, True])
+def test_reducers(threads, reducer, axis, mask, keepdims):
+    layout = data().layout
+    partitioned = PartitionedArray.from_content(layout, [2, 5, 9], threads=threads)
+
+    out = getattr(partitioned, reducer)(axis=axis, mask=mask, keepdims=keepdims)
+    expected = getattr(layout, reducer)(axis=axis, mask=mask, keepdims=keepdims)
+    if axis != 0:
+        assert isinstance(out, PartitionedArray)
+        assert out.stops == partitioned.stops
+    assert to_list(out) == to_list(expected)
+
+
+def test_reducers_nested(threads):
+    layout = ak._v2.Array(
+        [[[1, 2], []], [[3]], [], [[4, 5, 6], [7], [8, 9]], [[10]]]
+    ).layout
+    partitioned = PartitionedArray.from_content(layout, [2, 4, 5], threads=threads)
+    for axis in (0, 1, 2, -1, -2, -3):
+        assert to_list(partitioned.sum(axis=axis)) == to_list(layout.sum(axis=axis))
+        assert to_list(partitioned.argmax(axis=axis)) == to_list(
+            layout.argmax(axis=axis)
+        )
+
+    flat = ak._v2.Array([3.3, 1.1, 5.5, 2.2]).layout
+    partitioned = PartitionedArray.from_content(flat, [2, 4], threads=threads)
+    assert partitioned.sum(axis=0) == pytest.approx(12.1)
+    assert partitioned.min(axis=0) == 1.1
+    assert partitioned.argmin(axis=0) == 1
+    assert partitioned.max(axis=0, initial=10) == 10
+
+
+def test_compact_partitions(threads):
+    array = data()
+    partitioned = PartitionedArray.from_content(array, [2, 5, 9], threads=threads)
+
+    def content_lengths(partitioned):
+        return [x.content.length for x in partitioned.partitions]
+
+    # each partition holds only its own list contents, so that operations on
+    # the partitions process every item once
+    assert content_lengths(partitioned) == [3, 7, 4]
+    assert content_lengths(partitioned + 1) == [3, 7, 4]
+    assert to_list(partitioned + 1) == to_list(array + 1)
+
+    repartitioned = partitioned.repartition([1, 4, 9])
+    assert content_lengths(repartitioned) == [3, 3, 8]
+    assert to_list(repartitioned) == to_list(array)
+
+    other = ak._v2.Array([[1], [2], [3], [4], [5], [6], [7], [8], [9]])
+    rows = ak._v2.partition.partition_as(partitioned, [other])
+    assert [len(x.layout.content) for (x,) in rows] == [2, 3, 4]
+    assert [to_list(x) for (x,) in rows] == [
+        to_list(other[:2]),
+        to_list(other[2:5]),
+        to_list(other[5:]),
+    ]
+
+
+@pytest.mark.parametrize(
+    "reducer",
+    [
+        "count",
+        "count_nonzero",
+        "sum",
+        "prod",
+        "any",
+        "all",
+        "min",
+        "max",
+        "argmin",
+        "argmax",
+    ],
+)
+def test_reducers_axis_none(threads, reducer):
+    array = ak._v2.Array([[3, 1, None], [], [4, 0], None, [2, 9, 9], [], [5], [7, 2]])
+    partitioned = PartitionedArray.from_content(array, [2, 4, 5, 8], threads=threads)
+
+    function = getattr(ak._v2.operations.reducers, reducer)
+    assert getattr(partitioned, reducer)(axis=None) == function(array, axis=None)
+
+    # partitions whose values are all missing
+    partitioned = PartitionedArray.from_content(array[1:4], [1, 3], threads=threads)
+    assert getattr(partitioned, reducer)(axis=None) == function(array[1:4], axis=None)
+
+
+def test_min_max_axis_none(threads):
+    array = ak._v2.Array([[3.3, 1.1], [], [5.5], [], [2.2]])
+    partitioned = PartitionedArray.from_content(array, [2, 4, 5], threads=threads)
+    assert partitioned.min(axis=None) == 1.1
+    assert partitioned.max(axis=None) == 5.5
+    assert partitioned.min(axis=None, initial=0) == 0
+    assert partitioned.max(axis=None, initial=10) == 10
+
+    empty = PartitionedArray.from_content(array[1:2], [1], threads=threads)
+    assert empty.min(axis=None) is None
+    assert empty.max(axis=None, initial=10) == 10
@@ -0,0 +1,169 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+
+form = {"class": "ListOffsetArray", "offsets": "i64", "content": "float64"}
+
+
+class Generator:
+    def __init__(self, data):
+        self.data = data
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return ak._v2.Array(self.data)
+
+
+def test_deferred():
+    generate = Generator([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    cache = ak._v2._lazy.ArrayCache()
+    array = ak._v2.operations.structure.virtual(
+        generate, form=form, length=3, cache=cache
+    )
+
+    sliced = array[1:]
+    assert len(sliced) == 2
+    assert str(sliced.type) == "2 * var * float64"
+    assert generate.calls == 0
+    assert cache.stats["misses"] == 0
+
+    assert to_list(sliced[1]) == [4.4, 5.5]
+    assert generate.calls == 1
+    assert cache.stats["misses"] == 1
+    # one item per buffer
+    assert len(cache) == 2
+    assert cache.nbytes == 4 * 8 + 5 * 8
+
+    assert to_list(ak._v2.operations.reducers.sum(array, axis=-1)) == [6.6, 0, 9.9]
+    assert to_list(array * 2) == [[2.2, 4.4, 6.6], [], [8.8, 11.0]]
+    assert generate.calls == 1
+    assert cache.stats["hits"] > 0
+
+
+def test_eviction():
+    cache = ak._v2._lazy.ArrayCache(limit=100)
+    generators = [Generator((np.arange(10) * i).tolist()) for i in range(3)]
+    arrays = [
+        ak._v2.operations.structure.virtual(
+            generate, form="int64", length=10, cache=cache
+        )
+        for generate in generators
+    ]
+
+    for array in arrays:
+        assert array[1] == array[1]
+    # each one is 80 bytes, so only the last one fits
+    assert cache.stats["evictions"] == 2
+    assert cache.nbytes == 80
+    assert [x.calls for x in generators] == [1, 1, 1]
+
+    # the arrays don't hold onto evicted buffers; they're regenerated
+    assert to_list(arrays[0]) == [0] * 10
+    assert [x.calls for x in generators] == [2, 1, 1]
+    assert cache.stats["evictions"] == 3
+
+    # the most recently used one is kept
+    bigger = ak._v2._lazy.ArrayCache(limit=160)
+    bigger["a"] = np.zeros(10)
+    bigger["b"] = np.zeros(10)
+    bigger["a"]
+    bigger["c"] = np.zeros(10)
+    assert set(bigger) == {"a", "c"}
+    assert bigger.stats == {
+        "hits": 1,
+        "misses": 0,
+        "evictions": 1,
+        "items": 2,
+        "nbytes": 160,
+    }
+    with pytest.raises(KeyError):
+        bigger["b"]
+    assert bigger.misses == 1
+    bigger.reset_stats()
+    assert bigger.hits == bigger.misses == bigger.evictions == 0
+
+
+@pytest.mark.parametrize("limit", [1000, None])
+def test_generated_once_per_buffer(limit):
+    fields = [f"x{i}" for i in range(20)]
+    generate = Generator({x: list(range(10)) for x in fields})
+    recordform = {"class": "RecordArray", "contents": {x: "int64" for x in fields}}
+    cache = ak._v2._lazy.ArrayCache(limit=limit)
+    array = ak._v2.operations.structure.virtual(
+        generate, form=recordform, length=10, cache=cache
+    )
+
+    # 20 buffers of 80 bytes, each looked up in the cache once
+    assert array.tolist() == [{x: i for x in fields} for i in range(10)]
+    assert cache.stats["hits"] + cache.stats["misses"] == 20
+    if limit is None:
+        assert generate.calls == 1
+        assert cache.nbytes == 1600
+    else:
+        # only 12 fit, so one more call gets the rest
+        assert generate.calls == 2
+        assert cache.nbytes == 960
+
+    # nothing but the cache holds the data: evicted buffers are regenerated
+    generate.calls = 0
+    cache.reset_stats()
+    assert to_list(array.x0) == list(range(10))
+    assert generate.calls == (0 if limit is None else 1)
+    assert cache.nbytes <= (1600 if limit is None else 1000)
+
+
+def test_no_cache():
+    generate = Generator([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    array = ak._v2.operations.structure.virtual(
+        generate, form=form, length=3, cache=None, highlevel=False
+    )
+    assert array.offsets.is_deferred and array.content.is_deferred
+    assert to_list(array) == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+    assert to_list(array) == [[1.1, 2.2, 3.3], [], [4.4, 5.5]]
+    assert generate.calls == 1
+    assert not array.offsets.is_deferred and not array.content.is_deferred
+
+
+def test_records():
+    generate = Generator([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    record = ak._v2.Array(
+        {
+            "x": ak._v2.operations.structure.virtual(generate, form=form, length=3),
+            "y": [1, 2, 3],
+        }
+    )
+    assert to_list(record.y) == [1, 2, 3]
+    assert generate.calls == 0
+    assert to_list(record.x[-1]) == [4.4, 5.5]
+    assert generate.calls == 1
+
+    recordform = {
+        "class": "RecordArray",
+        "contents": {"y": "int64", "x": form},
+    }
+    generate = Generator([{"x": [1.1], "y": 1}, {"x": [], "y": 2}])
+    array = ak._v2.operations.structure.virtual(generate, form=recordform, length=2)
+    assert to_list(array.x) == [[1.1], []]
+    assert to_list(array.y) == [1, 2]
+
+
+def test_errors():
+    generate = Generator([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    array = ak._v2.operations.structure.virtual(generate, form=form, length=4)
+    with pytest.raises(ValueError, match="length"):
+        to_list(array)
+
+    array = ak._v2.operations.structure.virtual(generate, form="float64", length=3)
+    with pytest.raises(ValueError, match="Form"):
+        to_list(array)
+
+    with pytest.raises(TypeError):
+        ak._v2.operations.structure.virtual(generate, form=form)
+    with pytest.raises(TypeError):
+        ak._v2.operations.structure.virtual(generate, length=3)
@@ -0,0 +1,165 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+numba = pytest.importorskip("numba")
+
+ak._v2.numba.register_and_check()
+
+to_list = ak._v2.operations.convert.to_list
+
+
+@numba.njit
+def fill_numbers(builder, n):
+    for i in range(n):
+        builder.append(i)
+
+
+def test_numpy():
+    builder = ak._v2.numba.layout_builder("float64", initial=4)
+    fill_numbers(builder, 10)
+    assert len(builder) == 10
+    assert to_list(builder.snapshot()) == [float(i) for i in range(10)]
+
+    builder = ak._v2.numba.layout_builder("bool", initial=1)
+    fill_numbers(builder, 3)
+    assert to_list(builder.snapshot()) == [False, True, True]
+
+
+def test_snapshot_is_not_a_copy():
+    builder = ak._v2.numba.layout_builder("int64", initial=16)
+    fill_numbers(builder, 10)
+    layout = builder.snapshot(highlevel=False)
+    buffer = ak._v2._connect.numba.layoutbuilder._data(builder)
+    assert layout.data.ctypes.data == buffer.ctypes.data
+
+    # appending more, even if it reallocates, does not change the snapshot
+    fill_numbers(builder, 100)
+    assert len(builder) == 110
+    assert to_list(layout) == list(range(10))
+
+
+def test_nested():
+    form = {
+        "class": "ListOffsetArray",
+        "offsets": "i64",
+        "content": {
+            "class": "RecordArray",
+            "contents": {
+                "x": "float64",
+                "y": {
+                    "class": "IndexedOptionArray",
+                    "index": "i64",
+                    "content": "int32",
+                },
+            },
+        },
+    }
+    builder = ak._v2.numba.layout_builder(form, initial=2)
+
+    @numba.njit
+    def fill(builder, n):
+        for i in range(n):
+            records = builder.begin_list()
+            for j in range(i % 3):
+                records.content("x").append(j * 1.5)
+                if j % 2 == 0:
+                    records.content("y").append_valid().append(j)
+                else:
+                    records.content(1).append_null()
+                records.end_record()
+            builder.end_list()
+        return builder.length, builder.content.length
+
+    assert fill(builder, 6) == (6, 6)
+    array = builder.snapshot()
+    assert str(array.type) == "6 * var * {x: float64, y: ?int32}"
+    assert to_list(array) == [
+        [],
+        [{"x": 0.0, "y": 0}],
+        [{"x": 0.0, "y": 0}, {"x": 1.5, "y": None}],
+        [],
+        [{"x": 0.0, "y": 0}],
+        [{"x": 0.0, "y": 0}, {"x": 1.5, "y": None}],
+    ]
+    assert to_list(builder.content.content("x").snapshot()) == [0, 0, 1.5, 0, 0, 1.5]
+
+
+def test_regular_tuple():
+    form = {
+        "class": "RegularArray",
+        "size": 2,
+        "content": {"class": "RecordArray", "contents": ["int64", "float32"]},
+    }
+    builder = ak._v2.numba.layout_builder(form)
+
+    @numba.njit
+    def fill(builder, n):
+        for i in range(n):
+            pairs = builder.begin_list()
+            for j in range(2):
+                pairs.content(0).append(i)
+                pairs.content(1).append(j + 0.5)
+                pairs.end_record()
+            builder.end_list()
+
+    fill(builder, 2)
+    assert to_list(builder.snapshot()) == [
+        [(0, 0.5), (0, 1.5)],
+        [(1, 0.5), (1, 1.5)],
+    ]
+
+
+def test_parameters():
+    form = {
+        "class": "ListOffsetArray",
+        "offsets": "i32",
+        "content": {
+            "class": "NumpyArray",
+            "primitive": "uint8",
+            "parameters": {"__array__": "char"},
+        },
+        "parameters": {"__array__": "string"},
+    }
+    builder = ak._v2.numba.layout_builder(form)
+
+    @numba.njit
+    def fill(builder, words):
+        for word in words:
+            chars = builder.begin_list()
+            for char in word:
+                chars.append(char)
+            builder.end_list()
+
+    fill(builder, tuple(np.frombuffer(x, np.uint8) for x in [b"one", b"", b"three"]))
+    assert to_list(builder.snapshot()) == ["one", "", "three"]
+
+
+def test_errors():
+    with pytest.raises(TypeError):
+        ak._v2.numba.layout_builder(
+            {"class": "ListArray", "starts": "i64", "stops": "i64", "content": "int64"}
+        )
+    with pytest.raises(TypeError):
+        ak._v2.numba.layout_builder("int64", initial=0)
+
+    builder = ak._v2.numba.layout_builder(
+        {"class": "RecordArray", "contents": {"x": "int64"}}
+    )
+
+    @numba.njit
+    def wrong_field(builder):
+        builder.content("z").append(1)
+
+    with pytest.raises(numba.core.errors.TypingError):
+        wrong_field(builder)
+
+    @numba.njit
+    def wrong_method(builder):
+        builder.append(1)
+
+    with pytest.raises(numba.core.errors.TypingError):
+        wrong_method(builder)
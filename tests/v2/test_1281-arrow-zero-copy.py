@@ -0,0 +1,120 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+pyarrow = pytest.importorskip("pyarrow")
+
+to_list = ak._v2.operations.convert.to_list
+
+
+def address(array):
+    return array.ctypes.data
+
+
+def test_sliced_validity():
+    paarray = pyarrow.array([1, None, 3, None, 5, 6, None, 8, 9, 10])
+    for start in range(10):
+        assert (
+            to_list(ak._v2.from_arrow(paarray.slice(start)))
+            == paarray.slice(start).to_pylist()
+        )
+
+    paarray = pyarrow.array([[1], None, [2, 3], None, [4], [5], None, [], [6], [7]])
+    assert to_list(ak._v2.from_arrow(paarray.slice(3))) == paarray.slice(3).to_pylist()
+
+    paarray = pyarrow.array([{"x": 1}, None, {"x": 2}, None, {"x": None}] * 3)
+    for start in (3, 8):
+        assert (
+            to_list(ak._v2.from_arrow(paarray.slice(start)))
+            == paarray.slice(start).to_pylist()
+        )
+
+
+def test_from_arrow():
+    paarray = pyarrow.array([[1.1, None, 3.3], None, [], [4.4, 5.5]] * 4).slice(8)
+    layout = ak._v2.from_arrow(paarray, zero_copy=True, highlevel=False)
+    assert to_list(layout) == paarray.to_pylist()
+
+    validbits, offsets, contentbits, content = paarray.buffers()
+    assert address(layout.mask.data) == validbits.address + 1
+    assert address(layout.content.offsets.data) == offsets.address + 8 * 4
+    assert layout.content.offsets[0] != 0
+    assert address(layout.content.content.mask.data) == contentbits.address
+    assert address(layout.content.content.content.data) == content.address
+
+    strings = pyarrow.array(["one", "two", None, "three"])
+    layout = ak._v2.from_arrow(strings, zero_copy=True, highlevel=False)
+    assert to_list(layout) == ["one", "two", None, "three"]
+    assert address(layout.content.content.data) == strings.buffers()[2].address
+
+
+def test_to_arrow():
+    layout = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]]).layout[1:]
+    paarray = ak._v2.to_arrow(layout, zero_copy=True)
+    assert paarray.to_pylist() == [[], [4.4, 5.5]]
+    assert paarray.buffers()[1].address == address(layout.offsets.data)
+    assert paarray.buffers()[3].address == address(layout.content.data)
+
+    # the same sliced list works without zero_copy, too
+    assert ak._v2.to_arrow(layout).to_pylist() == [[], [4.4, 5.5]]
+
+    mask = np.packbits([1, 0, 1, 1, 0, 0, 0, 0], bitorder="little")
+    layout = ak._v2.contents.BitMaskedArray(
+        ak._v2.index.IndexU8(mask),
+        ak._v2.contents.NumpyArray(np.arange(5, dtype=np.int32)),
+        valid_when=True,
+        length=5,
+        lsb_order=True,
+    )
+    paarray = ak._v2.to_arrow(layout, zero_copy=True)
+    assert paarray.to_pylist() == [0, None, 2, 3, None]
+    assert paarray.null_count == 2
+    assert paarray.buffers()[0].address == address(mask)
+    assert paarray.buffers()[1].address == address(layout.content.data)
+
+    # and back again
+    roundtrip = ak._v2.from_arrow(paarray, zero_copy=True, highlevel=False)
+    assert address(roundtrip.mask.data) == address(mask)
+    assert address(roundtrip.content.data) == address(layout.content.data)
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="bool"):
+        ak._v2.from_arrow(pyarrow.array([True, False]), zero_copy=True)
+    with pytest.raises(ValueError, match="multiple of 8"):
+        ak._v2.from_arrow(pyarrow.array([1, None, 3]).slice(1), zero_copy=True)
+    with pytest.raises(ValueError, match="ChunkedArray"):
+        ak._v2.from_arrow(pyarrow.chunked_array([[1, 2], [3]]), zero_copy=True)
+    assert to_list(ak._v2.from_arrow(pyarrow.chunked_array([[1, 2], [3]]))) == [
+        1,
+        2,
+        3,
+    ]
+
+    with pytest.raises(ValueError, match="NumpyArray"):
+        ak._v2.to_arrow(ak._v2.Array([True, False]), zero_copy=True)
+    with pytest.raises(ValueError, match="IndexedOptionArray"):
+        ak._v2.to_arrow(ak._v2.Array([1, None, 3]), zero_copy=True)
+    with pytest.raises(ValueError, match="ListArray"):
+        ak._v2.to_arrow(
+            ak._v2.contents.ListArray(
+                ak._v2.index.Index64(np.array([0, 1])),
+                ak._v2.index.Index64(np.array([1, 2])),
+                ak._v2.contents.NumpyArray(np.arange(2)),
+            ),
+            zero_copy=True,
+        )
+
+    strided = ak._v2.contents.NumpyArray(np.arange(10)[::2])
+    with pytest.raises(ValueError, match="contiguous"):
+        ak._v2.to_arrow(strided, zero_copy=True)
+    assert ak._v2.to_arrow(strided).to_pylist() == [0, 2, 4, 6, 8]
+
+
+def test_positional_highlevel():
+    layout = ak._v2.from_arrow(pyarrow.array([1, 2, 3]), False)
+    assert isinstance(layout, ak._v2.contents.Content)
+    assert to_list(layout) == [1, 2, 3]
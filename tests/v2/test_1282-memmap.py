@@ -0,0 +1,63 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+
+
+def is_memmapped(array):
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def test_roundtrip(tmp_path):
+    filename = str(tmp_path / "array.awkward")
+    array = ak._v2.Array(
+        [
+            [{"x": 1.1, "y": [1]}, {"x": 2.2, "y": []}],
+            [],
+            None,
+            [{"x": 3.3, "y": [2, 3]}],
+        ]
+    )
+    ak._v2.to_memmap(array[1:], filename)
+    result = ak._v2.from_memmap(filename)
+    assert to_list(result) == to_list(array[1:])
+    assert str(result.type) == str(array[1:].type)
+
+    layout = ak._v2.from_memmap(filename, highlevel=False)
+    data = layout.content.content["x"].data
+    assert is_memmapped(data)
+    assert not data.flags.writeable
+    assert data.ctypes.data % 4096 == 0
+
+
+def test_types(tmp_path):
+    filename = str(tmp_path / "array.awkward")
+    arrays = [
+        ak._v2.Array(np.arange(12, dtype=np.int16).reshape(3, 4)),
+        ak._v2.Array(["one", "two", "three"]),
+        ak._v2.Array(np.array(["2022-01-01", "2022-02-02"], dtype="M8[D]")),
+        ak._v2.Array([1, 2.2, [3]]),
+        ak._v2.Array([]),
+    ]
+    for array in arrays:
+        ak._v2.to_memmap(array, filename, alignment=8)
+        assert to_list(ak._v2.from_memmap(filename)) == to_list(array)
+
+
+def test_errors(tmp_path):
+    filename = str(tmp_path / "not-awkward")
+    with open(filename, "wb") as file:
+        file.write(b"something else entirely")
+    with pytest.raises(ValueError):
+        ak._v2.from_memmap(filename)
+
+    with pytest.raises(TypeError):
+        ak._v2.to_memmap([1, 2, 3], filename, alignment=0)
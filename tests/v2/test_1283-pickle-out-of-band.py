@@ -0,0 +1,49 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pickle
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+
+
+def test_is_packed():
+    array = ak._v2.Array([[{"x": 1.1, "y": [1]}], [], None, [{"x": 2.2, "y": []}]])
+    assert array.layout.is_packed
+    assert not array[1:].layout.is_packed
+    assert ak._v2.packed(array[1:], highlevel=False).is_packed
+    assert not ak._v2.Array([[1, 2, 3], [4]]).layout[[1, 0]].is_packed
+    assert ak._v2.Array([{"x": 1, "y": [1.1]}])[0].layout.is_packed
+    assert not array[3, 0].layout.is_packed
+
+
+def test_out_of_band():
+    array = ak._v2.Array([[{"x": 1.1, "y": [1]}], [], None, [{"x": 2.2, "y": []}]])
+    buffers = []
+    serialized = pickle.dumps(array, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == len(ak._v2.to_buffers(array)[2])
+
+    result = pickle.loads(serialized, buffers=buffers)
+    assert to_list(result) == to_list(array)
+
+    # nothing was packed or copied
+    x = array.layout.content.content["x"].data
+    assert result.layout.content.content["x"].data.ctypes.data == x.ctypes.data
+
+
+def test_protocols():
+    array = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert to_list(pickle.loads(pickle.dumps(array, protocol))) == to_list(array)
+        assert to_list(pickle.loads(pickle.dumps(array[1:], protocol))) == [
+            [],
+            [4.4, 5.5],
+        ]
+
+    record = ak._v2.Array([{"x": 1, "y": [1.1]}, {"x": 2, "y": []}])[1]
+    buffers = []
+    serialized = pickle.dumps(record, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 3
+    assert to_list(pickle.loads(serialized, buffers=buffers)) == {"x": 2, "y": []}
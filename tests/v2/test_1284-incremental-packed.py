@@ -0,0 +1,76 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+
+
+def test_already_packed():
+    layout = ak._v2.Array(
+        [[{"x": 1.1, "y": [1]}], [], None, [{"x": 2.2, "y": []}]]
+    ).layout
+    assert ak._v2.packed(layout, highlevel=False) is layout
+
+    record = ak._v2.Array([{"x": 1, "y": [1.1]}])[0].layout
+    assert ak._v2.packed(record, highlevel=False) is record
+
+
+def test_only_unpacked_subtrees():
+    packed_field = ak._v2.Array([[1, 2, 3], [], [4, 5], [6]]).layout
+    unpacked_field = ak._v2.Array([[1.1], [2.2, 3.3], [], [4.4]]).layout[[3, 2, 1, 0]]
+    layout = ak._v2.contents.RecordArray([packed_field, unpacked_field], ["x", "y"])
+    assert not layout.is_packed
+
+    result = ak._v2.packed(layout, highlevel=False)
+    assert result.is_packed
+    assert result.content("x") is packed_field
+    assert isinstance(result.content("y"), ak._v2.contents.ListOffsetArray)
+    assert to_list(result) == to_list(layout)
+
+    # only the offsets of the outer list need to be converted
+    outer = ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index32(np.array([0, 1, 4], np.int32)), packed_field
+    )
+    result = ak._v2.packed(outer, highlevel=False)
+    assert result.offsets.dtype == np.dtype(np.int64)
+    assert result.content is packed_field
+    assert to_list(result) == [[[1, 2, 3]], [[], [4, 5], [6]]]
+
+
+def test_repeated_index():
+    layout = ak._v2.contents.IndexedOptionArray(
+        ak._v2.index.Index64(np.array([0, 0, -1], np.int64)),
+        ak._v2.contents.NumpyArray(np.array([1.0, 2.0])),
+    )
+    assert not layout.is_packed
+    result = ak._v2.packed(layout, highlevel=False)
+    assert result.is_packed
+    assert result.content.length == 2
+    assert to_list(result.content) == [1.0, 1.0]
+    assert to_list(result) == [1.0, 1.0, None]
+
+    # permuted, but every item is used once
+    layout = ak._v2.contents.IndexedOptionArray(
+        ak._v2.index.Index64(np.array([1, -1, 0], np.int64)),
+        ak._v2.contents.NumpyArray(np.array([1.0, 2.0])),
+    )
+    assert not layout.is_packed
+    assert to_list(ak._v2.packed(layout, highlevel=False).content) == [2.0, 1.0]
+
+    layout = ak._v2.contents.UnionArray(
+        ak._v2.index.Index8(np.array([0, 0, 1], np.int8)),
+        ak._v2.index.Index64(np.array([1, 1, 0], np.int64)),
+        [
+            ak._v2.contents.NumpyArray(np.array([1.0, 2.0])),
+            ak._v2.contents.NumpyArray(np.array([3, 4], np.int64)),
+        ],
+    )
+    assert not layout.is_packed
+    result = ak._v2.packed(layout, highlevel=False)
+    assert result.is_packed
+    assert to_list(result.content(0)) == [2.0, 2.0]
+    assert to_list(result.content(1)) == [3]
+    assert to_list(result) == [2.0, 2.0, 3]
@@ -0,0 +1,70 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+
+
+def record_of_lists(offsets, content, n):
+    # every field's offsets are a different view of the same memory
+    return ak._v2.contents.RecordArray(
+        [
+            ak._v2.contents.ListOffsetArray(
+                ak._v2.index.Index64(offsets[:]),
+                ak._v2.contents.NumpyArray(content * (i + 1)),
+            )
+            for i in range(n)
+        ],
+        [f"x{i}" for i in range(n)],
+    )
+
+
+@pytest.fixture
+def array_equal_calls(monkeypatch):
+    calls = []
+    original = ak.nplike.Numpy.array_equal
+
+    def array_equal(self, *args, **kwargs):
+        calls.append(args)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ak.nplike.Numpy, "array_equal", array_equal)
+    return calls
+
+
+def test_one_comparison_per_offsets(array_equal_calls):
+    offsets = np.array([0, 3, 3, 5], dtype=np.int64)
+    content = np.array([1.1, 2.2, 3.3, 4.4, 5.5])
+    one = ak._v2.Array(record_of_lists(offsets, content, 10))
+    two = ak._v2.Array(record_of_lists(offsets.copy(), content, 10))
+
+    def action(inputs, **ignore):
+        if all(isinstance(x, ak._v2.contents.NumpyArray) for x in inputs):
+            return (ak._v2.contents.NumpyArray(inputs[0].data + inputs[1].data),)
+
+    (result,) = ak._v2._broadcasting.broadcast_and_apply(
+        [one.layout, two.layout], action, None
+    )
+    result = ak._v2.Array(result)
+    assert to_list(result.x0) == [[2.2, 4.4, 6.6], [], [8.8, 11.0]]
+    assert to_list(result.x9) == to_list(one.x9 * 2)
+    assert len(array_equal_calls) == 1
+
+
+def test_same_index(array_equal_calls):
+    array = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    zipped = ak._v2.zip({"x": array, "y": array * 10})
+    assert to_list(zipped.x + zipped.y) == [[11, 22, 33], [], [44, 55]]
+    assert len(array_equal_calls) == 0
+
+
+def test_different_offsets():
+    one = ak._v2.Array([[1, 2, 3], [], [4, 5]])
+    two = ak._v2.Array([[1], [2, 3], [4, 5]])
+    with pytest.raises(ValueError):
+        one + two
+    three = ak._v2.Array([[1, 2, 3], [], [4, 5]]).layout
+    assert to_list(one + ak._v2.Array(three)) == [[2, 4, 6], [], [8, 10]]
@@ -0,0 +1,40 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+numexpr = pytest.importorskip("numexpr")
+
+to_list = ak._v2.operations.convert.to_list
+
+
+def test_evaluate():
+    a = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    b = np.array([100, 200, 300])  # noqa: F841
+    result = ak._v2.numexpr.evaluate("a + b")
+    assert isinstance(result, ak._v2.Array)
+    assert to_list(result[0]) == pytest.approx([101.1, 102.2, 103.3])
+    assert to_list(result[1]) == []
+    assert to_list(result[2]) == pytest.approx([304.4, 305.5])
+
+    a = ak._v2.Array([1, 2, 3])
+    assert to_list(ak._v2.numexpr.re_evaluate()) == [101, 202, 303]
+
+    assert to_list(ak._v2.numexpr.evaluate("a * 2", local_dict={"a": a})) == [2, 4, 6]
+
+
+def test_fused():
+    px = ak._v2.Array([[1.1, 2.2, 3.3], [], [4.4, 5.5]])
+    py = ak._v2.Array([[0.1, 0.2, 0.3], [], [0.4, 0.5]])
+    weight = ak._v2.Array([1, 2, 3])
+    result = ak._v2.numexpr.evaluate("sqrt(px**2 + py**2) * weight")
+    expected = np.sqrt(px**2 + py**2) * weight
+    assert to_list(result[1]) == []
+    assert to_list(result[0]) == pytest.approx(to_list(expected[0]))
+    assert to_list(result[2]) == pytest.approx(to_list(expected[2]))
+
+    records = ak._v2.Array([{"x": 1}, {"x": 2}])  # noqa: F841
+    with pytest.raises(ValueError):
+        ak._v2.numexpr.evaluate("records + 1")
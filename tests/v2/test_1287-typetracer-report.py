@@ -0,0 +1,147 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+from awkward._v2._typetracer import touch_data, typetracer_with_report
+
+to_list = ak._v2.operations.convert.to_list
+
+array = ak._v2.Array(
+    [
+        [{"x": 1.1, "y": [1, 2], "z": "one"}],
+        [],
+        [{"x": 2.2, "y": [3], "z": "two"}, {"x": 3.3, "y": [], "z": "three"}],
+    ]
+)
+form = array.layout.form_with_key()
+
+# node0: outer offsets, node2: x, node3/node4: y offsets/data, node5/node6: z
+
+
+def test_report():
+    layout, report = typetracer_with_report(form)
+    assert isinstance(layout.nplike, ak._v2._typetracer.TypeTracer)
+    assert layout.form.type == array.layout.form.type
+    assert report.data_touched == []
+
+    tracer = ak._v2.Array(layout)
+    out = tracer.x[tracer.x > 2]
+    assert out.layout.form.type == array.x[array.x > 2].layout.form.type
+    assert set(report.data_touched) == {"node0", "node2"}
+
+    layout, report = typetracer_with_report(form.to_json())
+    tracer = ak._v2.Array(layout)
+    out = ak._v2.sum(tracer.y, axis=-1)
+    assert str(out.layout.form.type) == "var * int64"
+    assert set(report.data_touched) == {"node0", "node3", "node4"}
+
+
+def test_passed_through():
+    layout, report = typetracer_with_report(form)
+    tracer = ak._v2.Array(layout)
+
+    out = ak._v2.zip({"x": tracer.x, "z": tracer.z}, depth_limit=1)
+    assert report.data_touched == []
+
+    touch_data(out)
+    assert set(report.data_touched) == {"node0", "node2", "node5", "node6"}
+
+
+def test_forms():
+    arrays = [
+        ak._v2.Array([[1, 2, 3], None, [4, 5]]),
+        ak._v2.Array([1, "two", [3]]),
+        ak._v2.Array(np.arange(12).reshape(3, 4)),
+        ak._v2.Array([(1, 1.1), (2, 2.2)]),
+        ak._v2.Array([[], []]),
+        ak._v2.Array(
+            ak._v2.contents.BitMaskedArray(
+                ak._v2.index.IndexU8(np.array([5], np.uint8)),
+                ak._v2.contents.NumpyArray(np.arange(3.0)),
+                True,
+                3,
+                True,
+            )
+        ),
+        ak._v2.Array(
+            ak._v2.contents.ListArray(
+                ak._v2.index.Index64(np.array([2, 0])),
+                ak._v2.index.Index64(np.array([3, 2])),
+                ak._v2.contents.UnmaskedArray(
+                    ak._v2.contents.NumpyArray(np.arange(3.0))
+                ),
+            )
+        ),
+    ]
+    for array in arrays:
+        form, length, container = ak._v2.to_buffers(array)
+        layout, report = typetracer_with_report(form)
+        assert layout.form.type == array.layout.form.type
+
+        touch_data(layout)
+        assert set(report.data_touched) == {key.split("-")[0] for key in container}
+
+
+def test_nplike():
+    tt = ak._v2._typetracer.TypeTracer.instance()
+    x = ak._v2._typetracer.TypeTracerArray(np.int32, (3, 4))
+    assert tt.sum(x).dtype == np.dtype(np.int64)
+    assert tt.sum(x, axis=1).shape[1:] == ()
+    assert tt.max(x, axis=0, keepdims=True).shape[1:] == (4,)
+    assert tt.add(x, 1.5).dtype == np.dtype(np.float64)
+    assert tt.isclose(x, x).dtype == np.dtype(np.bool_)
+    assert tt.zeros_like(x).shape[1:] == (4,)
+    assert tt.arange(5).dtype == np.dtype(np.int64)
+    assert tt.searchsorted(x[:, 0], x[:, 1]).dtype == np.dtype(np.int64)
+    assert tt.isscalar(ak._v2._typetracer.UnknownScalar(np.dtype(np.float64)))
+    assert not tt.isscalar(x)
+
+
+def test_operations():
+    tracer = ak._v2.Array(array.layout.typetracer)
+    for function in [
+        lambda a: ak._v2.flatten(a.x, axis=None),
+        lambda a: ak._v2.ravel(a.x),
+        lambda a: ak._v2.is_none(a.x, axis=1),
+        lambda a: ak._v2.where(a.x > 2, a.x, 0),
+        lambda a: ak._v2.concatenate([a.x, a.y], axis=1),
+        lambda a: ak._v2.mask(a, ak._v2.num(a) > 0),
+        lambda a: ak._v2.isclose(a.x, a.x),
+    ]:
+        assert function(tracer).layout.form.type == function(array).layout.form.type
+
+    out = ak._v2.sum(tracer.x, axis=None)
+    assert out == ak._v2._typetracer.UnknownScalar(np.dtype(np.float64))
+
+    optional = ak._v2.Array([[1.1, None, 2.2], None, [3.3]])
+    tracer = ak._v2.Array(optional.layout.typetracer)
+    for function in [
+        lambda a: ak._v2.fill_none(a, 0),
+        lambda a: ak._v2.fill_none(a, [1, 2]),
+        lambda a: ak._v2.packed(a),
+    ]:
+        assert function(tracer).layout.form.type == function(optional).layout.form.type
+
+
+def test_group_by():
+    for array, axis in [
+        (ak._v2.Array([[3, 1, 3], [], [5, 5]]), -1),
+        (ak._v2.Array([1, 2, 1]), 0),
+        (ak._v2.Array([["a", "b", "a"], []]), 1),
+        (ak._v2.Array([[1, None, 1], None, [2]]), -1),
+        (ak._v2.Array([[[1, 2], [1]], [[3]]]), 1),
+    ]:
+        expected = ak._v2.group_by(array, axis=axis)
+        layout, report = typetracer_with_report(array.layout.form_with_key())
+        out = ak._v2.group_by(ak._v2.Array(layout), axis=axis)
+        assert [x.layout.form for x in out] == [x.layout.form for x in expected]
+        assert len(report.data_touched) > 0
+
+    # only the keys and their lists' offsets are read
+    layout, report = typetracer_with_report(form)
+    out = ak._v2.group_by(ak._v2.Array(layout).x, axis=1)
+    assert str(out[0].layout.form.type) == "var * float64"
+    assert set(report.data_touched) == {"node0", "node2"}
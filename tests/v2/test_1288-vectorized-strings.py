@@ -0,0 +1,123 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import operator
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+
+
+@pytest.mark.parametrize(
+    "op",
+    [
+        operator.eq,
+        operator.ne,
+        operator.lt,
+        operator.le,
+        operator.gt,
+        operator.ge,
+    ],
+)
+def test_comparisons(op):
+    one = ["", "a", "ab", "abc", "b", "ba", None, "abd", "é", "x"]
+    two = ["a", "", "ab", "abd", "a", "b", "x", "abc", "e", "é"]
+    expectation = [None if x is None else op(x, y) for x, y in zip(one, two)]
+    assert (
+        to_list(op(ak._v2.highlevel.Array(one), ak._v2.highlevel.Array(two)))
+        == expectation
+    )
+
+    one, two = zip(*[(x.encode(), y.encode()) for x, y in zip(one, two) if x])
+    expectation = [op(x, y) for x, y in zip(one, two)]
+    assert (
+        to_list(op(ak._v2.highlevel.Array(one), ak._v2.highlevel.Array(two)))
+        == expectation
+    )
+
+
+def test_constant():
+    array = ak._v2.highlevel.Array([["one", "two", "three"], [], ["two", "four"]])
+    assert to_list(array < "one") == [[False, False, False], [], [False, True]]
+    assert to_list(array >= "three") == [[False, True, True], [], [True, False]]
+    assert to_list(array[array != "two"]) == [["one", "three"], [], ["four"]]
+
+    # a constant's offsets may equal a list's offsets, and arrays may be empty
+    assert to_list(ak._v2.highlevel.Array([[["c"]]]) != "b") == [[[True]]]
+    assert to_list(ak._v2.highlevel.Array([["c"]])[:0] != "b") == []
+
+    # lists of strings against strings with the same offsets as the lists
+    one = ak._v2.highlevel.Array([["x", "y"], ["z"]])
+    two = ak._v2.highlevel.Array(["ab", "c"])
+    assert to_list(one == two) == [[False, False], [False]]
+    assert to_list(one != ak._v2.highlevel.Array(["x", "z"])) == [
+        [False, True],
+        [False],
+    ]
+
+
+def test_typetracer():
+    array = ak._v2.highlevel.Array(["one", "two", "three"])
+    typetracer = ak._v2.highlevel.Array(array.layout.typetracer)
+    assert (typetracer == "two").layout.form == (array == "two").layout.form
+
+    array = ak._v2.highlevel.Array([["one", "two"], [], ["three"]])
+    typetracer = ak._v2.highlevel.Array(array.layout.typetracer)
+    assert (typetracer == "one").layout.form == (array == "one").layout.form
+    strings = ak._v2.highlevel.Array(["one", "two", "three"])
+    assert (typetracer == strings).layout.form == (array == strings).layout.form
+
+
+def test_hash():
+    array = ak._v2.highlevel.Array(["one", "two", "", "one", "onf", "", "tw"])
+    hashes = ak._v2.behaviors.string._string_hash(array.layout)
+    assert hashes.dtype == np.dtype(np.uint64)
+    assert hashes[0] == hashes[3]
+    assert hashes[2] == hashes[5]
+    assert len(set(hashes[[0, 1, 2, 4, 6]].tolist())) == 5
+
+    # the same strings hash the same way in any layout
+    sliced = array.layout[::-1]
+    assert (
+        ak._v2.behaviors.string._string_hash(sliced).tolist() == hashes[::-1].tolist()
+    )
+
+    bytestrings = ak._v2.highlevel.Array([b"\x00", b"", b"\x00\x00", b"\x01"])
+    assert len(set(ak._v2.behaviors.string._string_hash(bytestrings.layout))) == 4
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+def test_chunks(monkeypatch, chunk_size):
+    # rows are compared and hashed in chunks, some longer than a chunk
+    one = ["abcdefghij", "", "b", "abcdefghik", "xy", "", "abc", "x" * 20]
+    two = ["abcdefghij", "a", "", "abcdefghij", "xz", "", "abd", "x" * 20]
+    array1, array2 = ak._v2.highlevel.Array(one), ak._v2.highlevel.Array(two)
+    hashes = ak._v2.behaviors.string._string_hash(array1.layout).tolist()
+
+    monkeypatch.setattr(ak._v2.behaviors.string, "_string_chunk_size", chunk_size)
+    assert to_list(array1 == array2) == [x == y for x, y in zip(one, two)]
+    assert to_list(array1 < array2) == [x < y for x, y in zip(one, two)]
+    assert to_list(array1 >= "abcdefghij") == [x >= "abcdefghij" for x in one]
+    assert ak._v2.behaviors.string._string_hash(array1.layout).tolist() == hashes
+
+
+def test_sort():
+    array = ak._v2.highlevel.Array([["two", "one", "three"], [], ["b", "a", "ba"]])
+    assert to_list(ak._v2.operations.structure.sort(array)) == [
+        ["one", "three", "two"],
+        [],
+        ["a", "b", "ba"],
+    ]
+    assert to_list(ak._v2.operations.structure.sort(array, ascending=False)) == [
+        ["two", "three", "one"],
+        [],
+        ["ba", "b", "a"],
+    ]
+    index = ak._v2.operations.structure.argsort(array)
+    assert to_list(index) == [[1, 2, 0], [], [1, 0, 2]]
+    assert to_list(array[index]) == to_list(ak._v2.operations.structure.sort(array))
+
+    assert to_list(
+        ak._v2.operations.structure.argsort(ak._v2.highlevel.Array(["b", "a", "c"]))
+    ) == [1, 0, 2]
@@ -0,0 +1,107 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+categorical = ak._v2.behaviors.categorical
+
+
+def test_strings():
+    array = ak._v2.highlevel.Array(
+        [["one", "two", "three"], [], ["three", "two"], None, ["one", None]]
+    )
+    result = categorical.to_categorical(array)
+    assert to_list(result) == to_list(array)
+    assert categorical.is_categorical(result)
+    assert not categorical.is_categorical(array)
+    assert to_list(categorical.categories(result)) == ["one", "two", "three"]
+    assert str(result.type) == str(array.type)
+    assert ak._v2.operations.describe.is_valid(result)
+
+    uncategorical = categorical.from_categorical(result)
+    assert not categorical.is_categorical(uncategorical)
+    assert to_list(uncategorical) == to_list(array)
+
+
+def test_numbers():
+    array = ak._v2.highlevel.Array([1.1, 2.2, -0.0, 0.0, np.nan, 1.1, np.nan, 2.2])
+    result = categorical.to_categorical(array)
+    assert np.asarray(result.layout.index).tolist() == [0, 1, 2, 2, 3, 0, 3, 1]
+    assert to_list(categorical.categories(result))[:3] == [1.1, 2.2, 0.0]
+
+    array = ak._v2.highlevel.Array(np.arange(100000) % 997)
+    result = categorical.to_categorical(array)
+    assert to_list(categorical.categories(result)) == list(range(997))
+    assert np.asarray(result.layout.index).tolist() == to_list(array)
+
+    array = ak._v2.highlevel.Array([True, False, None, True])
+    result = categorical.to_categorical(array)
+    assert np.asarray(result.layout.index).tolist() == [0, 1, -1, 0]
+
+
+def test_first_appearance():
+    data = np.random.default_rng(12345).integers(0, 1000, 100000)
+    mapping, firsts = categorical._categorize(ak._v2.contents.NumpyArray(data))
+    _, expected = np.unique(data, return_index=True)
+    assert firsts.tolist() == sorted(expected.tolist())
+    assert data[firsts][mapping].tolist() == data.tolist()
+
+
+@pytest.mark.skipif(
+    not hasattr(np, "float128") or np.dtype(np.longdouble).itemsize <= 8,
+    reason="no float128 on this platform",
+)
+def test_wide_numbers():
+    data = np.array([1.5, 2.5, 1.5, 3.5], np.float128)
+    array = ak._v2.highlevel.Array(ak._v2.contents.NumpyArray(data))
+    result = categorical.to_categorical(array)
+    assert np.asarray(result.layout.index).tolist() == [0, 1, 0, 2]
+
+
+def test_records():
+    array = ak._v2.highlevel.Array(
+        [{"x": 1, "y": "one"}, {"x": 2, "y": "two"}, {"x": 1, "y": "one"}]
+    )
+    result = categorical.to_categorical(array)
+    assert np.asarray(result.layout.index).tolist() == [0, 1, 0]
+    assert to_list(result) == to_list(array)
+
+
+def test_collisions(monkeypatch):
+    real_string_hash = ak._v2.behaviors.string._string_hash
+
+    def string_hash(layout, seed=0):
+        # every string collides with every other for the first seed
+        if seed == 0:
+            return layout.nplike.zeros(layout.length, np.uint64)
+        else:
+            return real_string_hash(layout, seed)
+
+    monkeypatch.setattr(ak._v2.behaviors.string, "_string_hash", string_hash)
+
+    array = ak._v2.highlevel.Array(["one", "two", "one", "three"])
+    result = categorical.to_categorical(array)
+    assert np.asarray(result.layout.index).tolist() == [0, 1, 0, 2]
+    assert to_list(categorical.categories(result)) == ["one", "two", "three"]
+
+
+def test_ufuncs():
+    array = ak._v2.highlevel.Array(["one", "two", None, "three", "two", "one"])
+    result = categorical.to_categorical(array)
+    assert to_list(result == "two") == [False, True, None, False, True, False]
+    assert to_list(result != "two") == [True, False, None, True, False, True]
+    assert to_list(result[result == "one"]) == ["one", None, "one"]
+
+    numbers = categorical.to_categorical(ak._v2.highlevel.Array([1, 2, 1, 3]))
+    assert to_list(numbers * 10) == [10, 20, 10, 30]
+    assert to_list(numbers + ak._v2.highlevel.Array([1, 1, 2, 2])) == [2, 3, 3, 5]
+
+
+def test_categorical_equal():
+    one = categorical.to_categorical(ak._v2.highlevel.Array(["a", "b", "c", "a"]))
+    two = categorical.to_categorical(ak._v2.highlevel.Array(["b", "b", "c", "c"]))
+    assert to_list(one == two) == [False, True, True, False]
+    assert to_list(one != two) == [True, False, False, True]
+    assert to_list(one == one) == [True, True, True, True]
@@ -0,0 +1,99 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+group_by = ak._v2.operations.structure.group_by
+
+
+def test_numbers():
+    array = ak._v2.highlevel.Array([[3, 1, 3, 2, 1, 3], [], [5, 5], [1]])
+    keys, counts, index = group_by(array)
+    assert to_list(keys) == [[3, 1, 2], [], [5], [1]]
+    assert to_list(counts) == [[3, 2, 1], [], [2], [1]]
+    assert to_list(index) == [[[0, 2, 5], [1, 4], [3]], [], [[0, 1]], [[0]]]
+    flat = ak._v2.operations.structure.flatten(index, axis=-1)
+    assert to_list(array[flat]) == [[3, 3, 3, 1, 1, 2], [], [5, 5], [1]]
+
+    array = ak._v2.highlevel.Array([[1.1, np.nan, -0.0, 0.0, np.nan]])
+    keys, counts, index = group_by(array)
+    assert to_list(counts) == [[1, 2, 2]]
+    assert to_list(index) == [[[0], [1, 4], [2, 3]]]
+
+
+def test_sorted():
+    array = ak._v2.highlevel.Array([[1, 1, 2], [2, 3, 3], [], [0.0, -0.0]])
+    keys, counts, index = group_by(array)
+    assert to_list(keys) == [[1, 2], [2, 3], [], [0.0]]
+    assert to_list(counts) == [[2, 1], [1, 2], [], [2]]
+    assert to_list(index) == [[[0, 1], [2]], [[0], [1, 2]], [], [[0, 1]]]
+
+
+def test_random():
+    np.random.seed(1290)
+    counts = np.random.poisson(10, 1000)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    data = np.random.randint(0, 20, offsets[-1])
+    layout = ak._v2.contents.ListOffsetArray(
+        ak._v2.index.Index64(offsets), ak._v2.contents.NumpyArray(data)
+    )
+    keys, counts, index = group_by(layout, highlevel=False)
+
+    for i in range(len(offsets) - 1):
+        sublist = data[offsets[i] : offsets[i + 1]].tolist()
+        expected = list(dict.fromkeys(sublist))
+        assert to_list(keys[i]) == expected
+        assert to_list(counts[i]) == [sublist.count(x) for x in expected]
+        assert to_list(index[i]) == [
+            [j for j, y in enumerate(sublist) if y == x] for x in expected
+        ]
+
+
+def test_strings_and_options():
+    array = ak._v2.highlevel.Array([["a", "b", "a"], [None, "b", None], []])
+    keys, counts, index = group_by(array)
+    assert to_list(keys) == [["a", "b"], [None, "b"], []]
+    assert to_list(counts) == [[2, 1], [2, 1], []]
+    assert to_list(index) == [[[0, 2], [1]], [[0, 2], [1]], []]
+
+    categorical = ak._v2.behaviors.categorical.to_categorical(array)
+    keys, counts, index = group_by(categorical)
+    assert to_list(keys) == [["a", "b"], [None, "b"], []]
+    assert to_list(counts) == [[2, 1], [2, 1], []]
+
+
+def test_records():
+    array = ak._v2.highlevel.Array(
+        [[{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}, {"x": 1, "y": 1.1}]]
+    )
+    keys, counts, index = group_by(array)
+    assert to_list(keys) == [[{"x": 1, "y": 1.1}, {"x": 2, "y": 2.2}]]
+    assert to_list(counts) == [[2, 1]]
+
+    keys, counts, index = group_by(array.x)
+    flat = ak._v2.operations.structure.flatten(index, axis=-1)
+    assert to_list(array.y[flat]) == [[1.1, 1.1, 2.2]]
+
+    with pytest.raises(NotImplementedError):
+        group_by(ak._v2.highlevel.Array([{"x": [1, 2]}]), axis=1)
+
+
+def test_axis():
+    array = ak._v2.highlevel.Array([[[1, 2, 1]], [[2, 2], [2, 2]]])
+    keys, counts, index = group_by(array, axis=1)
+    assert to_list(keys) == [[[1, 2, 1]], [[2, 2]]]
+    assert to_list(counts) == [[1], [2]]
+    assert to_list(group_by(array, axis=-1)[1]) == [[[2, 1]], [[2], [2]]]
+
+    keys, counts, index = group_by(ak._v2.highlevel.Array([3, 1, 3]), axis=0)
+    assert to_list(keys) == [3, 1]
+    assert to_list(counts) == [2, 1]
+    assert to_list(index) == [[0, 2], [1]]
+
+    regular = ak._v2.highlevel.Array(np.array([[1, 2, 1], [3, 3, 3]]))
+    assert to_list(group_by(regular)[1]) == [[2, 1], [3]]
+
+    with pytest.raises(np.AxisError):
+        group_by(ak._v2.highlevel.Array([[1, 2]]), axis=2)
@@ -0,0 +1,115 @@
+# BSD 3-Clause License; see https://github.com/scikit-hep/awkward-1.0/blob/main/LICENSE
+
+import pytest  # noqa: F401
+import numpy as np  # noqa: F401
+import awkward as ak  # noqa: F401
+
+to_list = ak._v2.operations.convert.to_list
+
+
+def test_cartesian():
+    one = ak._v2.highlevel.Array([[1, 2, 3], [], [4, 5], [6]])
+    two = ak._v2.highlevel.Array([["a", "b"], ["c"], ["d"], ["e", "f"]])
+    assert to_list(ak._v2.operations.structure.cartesian([one, two])) == [
+        [(1, "a"), (1, "b"), (2, "a"), (2, "b"), (3, "a"), (3, "b")],
+        [],
+        [(4, "d"), (5, "d")],
+        [(6, "e"), (6, "f")],
+    ]
+    assert to_list(ak._v2.operations.structure.cartesian([one, two], nested=True)) == [
+        [[(1, "a"), (1, "b")], [(2, "a"), (2, "b")], [(3, "a"), (3, "b")]],
+        [],
+        [[(4, "d")], [(5, "d")]],
+        [[(6, "e"), (6, "f")]],
+    ]
+    assert to_list(ak._v2.operations.structure.argcartesian({"x": one, "y": two})) == [
+        [
+            {"x": 0, "y": 0},
+            {"x": 0, "y": 1},
+            {"x": 1, "y": 0},
+            {"x": 1, "y": 1},
+            {"x": 2, "y": 0},
+            {"x": 2, "y": 1},
+        ],
+        [],
+        [{"x": 0, "y": 0}, {"x": 1, "y": 0}],
+        [{"x": 0, "y": 0}, {"x": 0, "y": 1}],
+    ]
+
+    one = ak._v2.highlevel.Array([1, 2, 3])
+    two = ak._v2.highlevel.Array(["a", "b"])
+    assert to_list(ak._v2.operations.structure.cartesian([one, two], axis=0)) == [
+        (1, "a"),
+        (1, "b"),
+        (2, "a"),
+        (2, "b"),
+        (3, "a"),
+        (3, "b"),
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 10, 1000])
+def test_iter_combinations(chunk_size):
+    array = ak._v2.highlevel.Array(
+        [[1, 2, 3, 4], [], None, [5, 6], [7, 8, 9], [10], [11, 12, 13, 14, 15]]
+    )
+    expected = to_list(ak._v2.operations.structure.combinations(array, 3))
+
+    chunks = list(
+        ak._v2.operations.structure.iter_combinations(array, 3, chunk_size=chunk_size)
+    )
+    assert sum([to_list(x) for x in chunks], []) == expected
+    for chunk in chunks:
+        sizes = [len(x) for x in to_list(chunk) if x is not None]
+        assert sum(sizes) <= chunk_size or len(sizes) == 1
+
+    chunks = ak._v2.operations.structure.iter_combinations(
+        array, 2, chunk_size=chunk_size, where=lambda pairs: pairs["1"] - pairs["0"] > 1
+    )
+    assert sum([to_list(x) for x in chunks], []) == [
+        [(1, 3), (1, 4), (2, 4)],
+        [],
+        None,
+        [],
+        [(7, 9)],
+        [],
+        [(11, 13), (11, 14), (11, 15), (12, 14), (12, 15), (13, 15)],
+    ]
+
+
+def test_iter_combinations_axis2():
+    array = ak._v2.highlevel.Array([[[1, 2], [3]], [], [[4], [5, 6, 7]]])
+    chunks = list(
+        ak._v2.operations.structure.iter_combinations(
+            array, 2, axis=2, replacement=True, chunk_size=3
+        )
+    )
+    assert len(chunks) == 3
+    assert sum([to_list(x) for x in chunks], []) == to_list(
+        ak._v2.operations.structure.combinations(array, 2, axis=2, replacement=True)
+    )
+
+    with pytest.raises(ValueError):
+        next(ak._v2.operations.structure.iter_combinations(array, 2, axis=0))
+
+
+def test_iter_cartesian():
+    one = ak._v2.highlevel.Array([[1, 2, 3], [], [4, 5], [6]])
+    two = ak._v2.highlevel.Array([["a", "b"], ["c"], ["d"], ["e", "f"]])
+    chunks = list(
+        ak._v2.operations.structure.iter_cartesian({"x": one, "y": two}, chunk_size=6)
+    )
+    assert [len(x) for x in chunks] == [2, 2]
+    assert sum([to_list(x) for x in chunks], []) == to_list(
+        ak._v2.operations.structure.cartesian({"x": one, "y": two})
+    )
+
+    chunks = ak._v2.operations.structure.iter_cartesian(
+        [one, two], nested=True, chunk_size=1, where=lambda pairs: pairs["0"] % 2 == 1
+    )
+    assert sum([to_list(x) for x in chunks], []) == [
+        [[(1, "a"), (1, "b")], [], [(3, "a"), (3, "b")]],
+        [],
+        [[], [(5, "d")]],
+        [[]],
+    ]